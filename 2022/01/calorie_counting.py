@@ -1,27 +1,36 @@
+from aoc_common.io import Buffer, mapped
+from aoc_common.parse import parse_ints
 
 
-def calories_per_elf():
+def parse_elves(data: Buffer | str) -> list[list[int]]:
+    # each elf's items are on consecutive lines, with a blank line between
+    # elves, which shows up as a line without any numbers on it
+    elves = []
     current_elf = []
-    with open("input", "r") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                current_elf.append(int(line))
-            elif current_elf:
-                yield current_elf
-                current_elf = []
+    for line in parse_ints(data, lines=True):
+        if len(line):
+            current_elf.append(int(line[0]))
+        elif current_elf:
+            elves.append(current_elf)
+            current_elf = []
 
     if current_elf:
-        yield current_elf
+        elves.append(current_elf)
+    return elves
+
 
+def calories_per_elf():
+    with mapped() as buf:
+        return parse_elves(buf)
 
-def most_calories():
-    return max(sum(e) for e in calories_per_elf())
 
+def most_calories(elves):
+    return max(sum(e) for e in elves)
 
-def total_top_three():
+
+def total_top_three(elves):
     top_three = [0, 0, 0]
-    for e in calories_per_elf():
+    for e in elves:
         top_three.append(sum(e))
         top_three.sort(reverse=True)
         top_three.pop()
@@ -29,7 +38,19 @@ def total_top_three():
     return sum(top_three)
 
 
+def solve(text: str):
+    elves = parse_elves(text)
+    return most_calories(elves), total_top_three(elves)
+
+
+def part1():
+    return most_calories(calories_per_elf())
+
+
+def part2():
+    return total_top_three(calories_per_elf())
+
 
 if __name__ == "__main__":
-    print(f"Max calories carried by one elf: {most_calories()}")
-    print(f"Total calories carried by the top three: {total_top_three()}")
+    print(f"Max calories carried by one elf: {part1()}")
+    print(f"Total calories carried by the top three: {part2()}")
@@ -1,4 +1,7 @@
 
+from aoc_common import input_path
+
+
 rock = 1
 paper = 2
 scissors = 3
@@ -31,15 +34,36 @@ scores_by_strategy = {
     "C Z": rock+win,
 }
 
-def ideal_score(scores):
+def parse_rounds(text: str) -> list[str]:
+    return [line.strip() for line in text.splitlines()]
+
+
+def load_input():
+    with open(input_path(), "r") as f:
+        return parse_rounds(f.read())
+
+
+def ideal_score(rounds, scores):
     total_score = 0
-    with open("input", "r") as f:
-        for line in f:
-            total_score += scores.get(line.strip(), 0)
+    for r in rounds:
+        total_score += scores.get(r, 0)
 
     return total_score
 
 
+def solve(text: str):
+    rounds = parse_rounds(text)
+    return ideal_score(rounds, scores_by_response), ideal_score(rounds, scores_by_strategy)
+
+
+def part1():
+    return ideal_score(load_input(), scores_by_response)
+
+
+def part2():
+    return ideal_score(load_input(), scores_by_strategy)
+
+
 if __name__ == "__main__":
-    print(ideal_score(scores_by_response))
-    print(ideal_score(scores_by_strategy))
\ No newline at end of file
+    print(part1())
+    print(part2())
@@ -1,27 +1,34 @@
+from aoc_common import input_path
+
+
+def parse_pairs(text: str) -> list[tuple[range, range]]:
+    pairs = []
+    for line in text.splitlines():
+        line = line.strip()
+        e1, e2 = line.split(",")
+        e11, e12 = (int(n) for n in e1.split("-"))
+        e21, e22 = (int(n) for n in e2.split("-"))
+        pairs.append((range(e11, e12+1), range(e21, e22+1)))
+    return pairs
 
 
 def parse_input():
-    with open("input", "r") as f:
-        for line in f:
-            line = line.strip()
-            e1, e2 = line.split(",")
-            e11, e12 = (int(n) for n in e1.split("-"))
-            e21, e22 = (int(n) for n in e2.split("-"))
-            yield (range(e11, e12+1), range(e21, e22+1))
+    with open(input_path(), "r") as f:
+        return parse_pairs(f.read())
 
 
-def fully_contained():
+def fully_contained(pairs):
     contained = 0
-    for range1, range2 in parse_input():
+    for range1, range2 in pairs:
         if (range1.start in range2 and range1[-1] in range2) or (range2.start in range1 and range2[-1] in range1):
             contained += 1
 
     return contained
 
 
-def overlapping():
+def overlapping(pairs):
     overlap = 0
-    for range1, range2 in parse_input():
+    for range1, range2 in pairs:
         if range1.start > range2.start:
             range1, range2 = range2, range1
         if range1.stop > range2.start:
@@ -30,6 +37,19 @@ def overlapping():
     return overlap
 
 
+def solve(text: str):
+    pairs = parse_pairs(text)
+    return fully_contained(pairs), overlapping(pairs)
+
+
+def part1():
+    return fully_contained(parse_input())
+
+
+def part2():
+    return overlapping(parse_input())
+
+
 if __name__ == "__main__":
-    print(f"fully contained pairs: {fully_contained()}")
-    print(f"overlapping pairs: {overlapping()}")
+    print(f"fully contained pairs: {part1()}")
+    print(f"overlapping pairs: {part2()}")
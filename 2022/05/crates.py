@@ -1,9 +1,10 @@
 import re
 
+from aoc_common import input_path
 
-def parse_input():
-    f = open("input", "r")
-    lines = iter(f)
+
+def parse_crates(text: str):
+    lines = iter(text.splitlines())
     stacklines = []
     for line in lines:
         line = line.rstrip()
@@ -17,19 +18,21 @@ def parse_input():
     stackoffsets = [m.start() for m in re.finditer(r"\d", stacklines.pop(0))]
     stacks = [[line[off] for line in stacklines if off < len(line) and line[off] != " "] for off in stackoffsets]
 
-    def instructions():
-        instr_re = re.compile(r"move (\d+) from (\d+) to (\d+)")
-        for line in lines:
-            match = instr_re.search(line)
-            yield (int(match.group(1)), int(match.group(2))-1, int(match.group(3))-1)
+    instr_re = re.compile(r"move (\d+) from (\d+) to (\d+)")
+    instructions = []
+    for line in lines:
+        match = instr_re.search(line)
+        instructions.append((int(match.group(1)), int(match.group(2))-1, int(match.group(3))-1))
 
-        f.close()
+    return stacks, instructions
 
-    return stacks, instructions()
+
+def parse_input():
+    with open(input_path(), "r") as f:
+        return parse_crates(f.read())
 
 
-def top_crate_one_by_one():
-    stacks, instrs = parse_input()
+def top_crate_one_by_one(stacks, instrs):
     for num, from_stack, to_stack in instrs:
         for _ in range(num):
             stacks[to_stack].append(stacks[from_stack].pop())
@@ -37,16 +40,27 @@ def top_crate_one_by_one():
     return "".join(stack[-1] for stack in stacks)
 
 
-def top_crate_bulk():
-    stacks, instrs = parse_input()
+def top_crate_bulk(stacks, instrs):
     for num, from_stack, to_stack in instrs:
         stacks[to_stack].extend(stacks[from_stack][-num:])
         stacks[from_stack][-num:] = []
 
     return "".join(stack[-1] for stack in stacks)
 
+def solve(text: str):
+    # both parts move the crates around in place, so each needs its own
+    # copy of the stacks
+    return top_crate_one_by_one(*parse_crates(text)), top_crate_bulk(*parse_crates(text))
+
+
+def part1():
+    return top_crate_one_by_one(*parse_input())
+
+
+def part2():
+    return top_crate_bulk(*parse_input())
 
 
 if __name__ == "__main__":
-    print(f"Moving one by one: {top_crate_one_by_one()}")
-    print(f"Moving in bulk: {top_crate_bulk()}")
\ No newline at end of file
+    print(f"Moving one by one: {part1()}")
+    print(f"Moving in bulk: {part2()}")
@@ -1,14 +1,43 @@
+from aoc_common.io import lines, mapped
 
 
-def first_marker(num_chars):
-    with open("input", "r") as f:
-        data = f.read().strip()
+def parse_datastream(text: str) -> bytes:
+    # the datastream is the first line, as bytes
+    return next(iter(text.splitlines()), "").encode()
 
-    for i in range(num_chars, len(data)+1):
-        if len(set(data[i-num_chars:i])) == num_chars:
-            return i
+
+def read_input() -> bytes:
+    with mapped() as buf:
+        return bytes(next(lines(buf), b""))
+
+
+def first_marker(data: bytes, num_chars):
+    # slide a window along, keeping track of where each character was
+    # last seen - if the new character is already in the window, the
+    # window has to start just after its last occurrence
+    last_seen = {}
+    start = 0
+    for i, c in enumerate(data):
+        if last_seen.get(c, -1) >= start:
+            start = last_seen[c] + 1
+        last_seen[c] = i
+        if i + 1 - start == num_chars:
+            return i + 1
+
+
+def solve(text: str):
+    data = parse_datastream(text)
+    return first_marker(data, 4), first_marker(data, 14)
+
+
+def part1():
+    return first_marker(read_input(), 4)
+
+
+def part2():
+    return first_marker(read_input(), 14)
 
 
 if __name__ == "__main__":
-    print(f"First marker: {first_marker(4)}")
-    print(f"First message marker: {first_marker(14)}")
\ No newline at end of file
+    print(f"First marker: {part1()}")
+    print(f"First message marker: {part2()}")
@@ -1,44 +1,73 @@
 from bisect import bisect_left
 
+from aoc_common import input_path
 
-def build_tree():
+
+def parse_tree(text: str) -> dict[tuple[str, ...], int]:
     # initial state = just the root directory with zero size
     tree = {("/",): 0}
     cwd = ("/",)
 
-    with open("input", "r") as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith("$ cd "):
-                newdir = line[5:]
-                if newdir == "/":
-                    cwd = ("/",)
-                elif newdir == "..":
-                    cwd = cwd[0:-1]
-                else:
-                    cwd = cwd + (newdir,)
-            elif line.startswith("dir "):
-                # directory entry
-                tree[cwd + (line[4:],)] = 0
-            elif not line.startswith("$"):
-                # file entry
-                size, name = line.split(maxsplit=1)
-                size = int(size)
-                # add the size to all directories up the tree from the current one
-                for i in range(len(cwd)):
-                    tree[cwd[0:i+1]] += size
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith("$ cd "):
+            newdir = line[5:]
+            if newdir == "/":
+                cwd = ("/",)
+            elif newdir == "..":
+                cwd = cwd[0:-1]
+            else:
+                cwd = cwd + (newdir,)
+        elif line.startswith("dir "):
+            # directory entry
+            tree[cwd + (line[4:],)] = 0
+        elif not line.startswith("$"):
+            # file entry
+            size, name = line.split(maxsplit=1)
+            size = int(size)
+            # add the size to all directories up the tree from the current one
+            for i in range(len(cwd)):
+                tree[cwd[0:i+1]] += size
 
     return tree
 
 
-if __name__ == "__main__":
-    tree = build_tree()
-    total_under_100k = sum(v for v in tree.values() if v <= 100_000)
-    print(f"Total size of dirs under 100k: {total_under_100k}")
+def build_tree():
+    with open(input_path(), "r") as f:
+        return parse_tree(f.read())
 
+
+def small_dirs_total(tree):
+    return sum(v for v in tree.values() if v <= 100_000)
+
+
+def need_to_free(tree):
     available_space = 70000000 - tree[("/",)]
-    print(f"Current available space: {available_space}")
-    need_to_free = 30000000 - available_space
-    print(f"Need to free up {need_to_free}")
+    return 30000000 - available_space
+
+
+def smallest_big_enough(tree, size):
     dir_sizes = sorted(tree.values())
-    print(f"Smallest directory size >= {need_to_free} == {dir_sizes[bisect_left(dir_sizes, need_to_free)]}")
+    return dir_sizes[bisect_left(dir_sizes, size)]
+
+
+def solve(text: str):
+    tree = parse_tree(text)
+    return small_dirs_total(tree), smallest_big_enough(tree, need_to_free(tree))
+
+
+def part1():
+    return small_dirs_total(build_tree())
+
+
+def part2():
+    tree = build_tree()
+    print(f"Current available space: {70000000 - tree[('/',)]}")
+    size = need_to_free(tree)
+    print(f"Need to free up {size}")
+    return smallest_big_enough(tree, size)
+
+
+if __name__ == "__main__":
+    print(f"Total size of dirs under 100k: {part1()}")
+    print(f"Smallest directory size big enough to delete: {part2()}")
@@ -1,99 +1,89 @@
-from itertools import chain
+import numpy as np
 
+from aoc_common.grid import Grid
+from aoc_common.profile import phase
 
-def parse_input():
-    with open("input", "r") as f:
-        # Represent each tree as 2^height, i.e. exactly one bit set
-        return [[1 << ord(c)-48 for c in line.strip()] for line in f]
 
+def heights(grid: Grid) -> np.ndarray:
+    # the tree heights as an int array - no padding, the edges are handled
+    # by the accumulations below
+    return grid.view.astype(np.int16) - ord("0")
 
-def update_visibility(r, get_tree, set_viz):
-    bitmap = 0
-    for i in r:
-        val = get_tree(i)
-        if val > bitmap:
-            set_viz(i, True)
-        bitmap |= val
 
+def parse_trees(text: str) -> np.ndarray:
+    return heights(Grid.from_lines(text.splitlines(), pad=0))
 
-def visible_trees():
-    trees = parse_input()
-    visibility = [[False for _ in row] for row in trees]
 
-    # looking across the rows
-    for i, (row_trees, row_viz) in enumerate(zip(trees, visibility)):
-        # left to right
-        update_visibility(range(len(row_trees)), row_trees.__getitem__, row_viz.__setitem__)
-        # right to left
-        update_visibility(range(len(row_trees) - 1, -1, -1), row_trees.__getitem__, row_viz.__setitem__)
+@phase("parse")
+def parse_input() -> np.ndarray:
+    return heights(Grid.from_file(pad=0))
 
-    # looking up and down the columns
-    for j in range(len(trees[0])):
-        def get_tree(i):
-            return trees[i][j]
 
-        def set_viz(i, val):
-            visibility[i][j] = val
+def visible_from_left(trees: np.ndarray) -> np.ndarray:
+    """
+    Which trees can be seen from the left hand edge - those taller than
+    every tree to their left in the same row.
+    """
+    tallest_so_far = np.maximum.accumulate(trees, axis=1)
+    # the tallest tree strictly to the left of each tree, or -1 at the edge
+    tallest_before = np.full_like(trees, -1)
+    tallest_before[:, 1:] = tallest_so_far[:, :-1]
+    return trees > tallest_before
 
-        # top to bottom
-        update_visibility(range(len(trees)), get_tree, set_viz)
-        # bottom to top
-        update_visibility(range(len(trees) - 1, -1, -1), get_tree, set_viz)
 
-    # pretty picture
-    num_visible = 0
-    for row in visibility:
-        num_visible += row.count(True)
-        print("".join('#' if t else "." for t in row))
+def views_to_left(trees: np.ndarray) -> np.ndarray:
+    """
+    How many trees each tree can see looking left - up to and including the
+    first one at least as tall as itself, or to the edge if there isn't one.
+    """
+    cols = np.broadcast_to(np.arange(trees.shape[1]), trees.shape)
+    views = np.zeros_like(trees)
+    # Heights only go from 0 to 9, so rather than walk from every tree, for
+    # each height find the nearest tree at least that tall to the left of
+    # every position, and use that for the trees of that height
+    for height in range(10):
+        # column of the nearest blocker at or left of each position - a view
+        # that isn't blocked runs to the edge, i.e. to column 0
+        blockers = np.maximum.accumulate(np.where(trees >= height, cols, 0), axis=1)
+        # the blocker must be strictly to the left
+        nearest = np.zeros_like(trees)
+        nearest[:, 1:] = blockers[:, :-1]
+        views = np.where(trees == height, cols - nearest, views)
+    return views
 
-    return num_visible
 
+def from_all_sides(trees: np.ndarray, looking_left, combine):
+    """
+    Apply ``looking_left`` from each of the four edges in turn by rotating
+    the grid so that edge is on the left, and ``combine`` the results.
+    """
+    results = [np.rot90(looking_left(np.rot90(trees, k)), -k) for k in range(4)]
+    return combine.reduce(results)
 
-def update_scenic(r, get_tree, set_scenic):
-    for x, i in enumerate(r):
-        tree_i = get_tree(i)
-        view = 0
-        for j in r[x+1:]:
-            view += 1
-            if get_tree(j) >= tree_i:
-                break
-        set_scenic(i, view)
 
+def visible_trees(trees):
+    return int(np.count_nonzero(from_all_sides(trees, visible_from_left, np.logical_or)))
 
-def scenic_scores():
-    trees = parse_input()
-    scenic_score = [[1 for _ in row] for row in trees]
-    scenic_score[0] = [0 for _ in range(len(scenic_score[0]))]
-    scenic_score[-1] = [0 for _ in range(len(scenic_score[-1]))]
-    for row in scenic_score:
-        row[0] = 0
-        row[-1] = 0
 
-    # looking across the rows
-    for i, (row_trees, row_scenic) in enumerate(zip(trees, scenic_score)):
-        def set_scenic(j, val):
-            row_scenic[j] *= val
-        update_scenic(range(len(row_trees)), row_trees.__getitem__, set_scenic)
-        update_scenic(range(len(row_trees) - 1, -1, -1), row_trees.__getitem__, set_scenic)
+def scenic_scores(trees):
+    # the trees on the edge see nothing in at least one direction, and the
+    # views_to_left of 0 there makes their scores 0 as they should be
+    return int(from_all_sides(trees.astype(np.int64), views_to_left, np.multiply).max())
 
-    # looking along the columns
-    for j in range(len(trees[0])):
-        def get_tree(i):
-            return trees[i][j]
 
-        def set_scenic_col(i, val):
-            scenic_score[i][j] *= val
+def solve(text: str):
+    trees = parse_trees(text)
+    return visible_trees(trees), scenic_scores(trees)
 
-        # top to bottom
-        update_scenic(range(len(trees)), get_tree, set_scenic_col)
-        # bottom to top
-        update_scenic(range(len(trees) - 1, -1, -1), get_tree, set_scenic_col)
 
-    print(scenic_score)
+def part1():
+    return visible_trees(parse_input())
 
-    return max(chain(*scenic_score))
+
+def part2():
+    return scenic_scores(parse_input())
 
 
 if __name__ == "__main__":
-    print(f"Total number of visible trees: {visible_trees()}")
-    print(f"Maximum scenic score: {scenic_scores()}")
\ No newline at end of file
+    print(f"Total number of visible trees: {part1()}")
+    print(f"Maximum scenic score: {part2()}")
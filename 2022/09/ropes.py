@@ -1,4 +1,7 @@
 from collections import namedtuple
+
+from aoc_common import input_path
+
 Pos = namedtuple("Pos", ["x", "y"])
 
 # direction label to move co-ordinates - X is left to right, Y is bottom to top
@@ -18,20 +21,30 @@ def sub(p1, p2):
     return Pos(p1.x - p2.x, p1.y - p2.y)
 
 
-def generate_steps():
-    with open("input", "r") as f:
-        for line in f:
-            direction, distance = line.split()
-            distance = int(distance)
-            for _ in range(distance):
-                yield moves[direction]
+def parse_motions(text: str) -> list[tuple[str, int]]:
+    motions = []
+    for line in text.splitlines():
+        direction, distance = line.split()
+        motions.append((direction, int(distance)))
+    return motions
+
+
+def load_input():
+    with open(input_path(), "r") as f:
+        return parse_motions(f.read())
+
+
+def generate_steps(motions):
+    for direction, distance in motions:
+        for _ in range(distance):
+            yield moves[direction]
 
 
-def chase_tail_simple():
+def chase_tail_simple(motions):
     head_pos = Pos(0, 0)
     tail_pos = Pos(0, 0)
     visited = {tail_pos}
-    for step in generate_steps():
+    for step in generate_steps(motions):
         head_pos = add(head_pos, step)
         diff = sub(head_pos, tail_pos)
         # print(f"{step=}, new {head_pos=}, old {tail_pos=}, {diff=}")
@@ -46,11 +59,11 @@ def chase_tail_simple():
     return len(visited)
 
 
-def chase_tail_general(num_knots):
+def chase_tail_general(motions, num_knots):
     knots = [Pos(0, 0)] * num_knots
     visited = {knots[-1]}
 
-    for step in generate_steps():
+    for step in generate_steps(motions):
         # move the head as instructed
         knots[0] = add(knots[0], step)
         # now move each trailing knot relative to the previous one
@@ -72,8 +85,21 @@ def chase_tail_general(num_knots):
     return len(visited)
 
 
+def solve(text: str):
+    motions = parse_motions(text)
+    return chase_tail_simple(motions), chase_tail_general(motions, 10)
+
+
+def part1():
+    return chase_tail_simple(load_input())
+
+
+def part2():
+    return chase_tail_general(load_input(), 10)
+
 
 if __name__ == "__main__":
-    print(f"2 knots - tail visited {chase_tail_simple()} locations")
-    print(f"2 knots using general algorithm - tail visited {chase_tail_general(2)} locations")
-    print(f"10 knots - tail visited {chase_tail_general(10)} locations")
+    print(f"2 knots - tail visited {part1()} locations")
+    print(f"2 knots using general algorithm - tail visited {chase_tail_general(load_input(), 2)} locations")
+    print(f"10 knots - tail visited {part2()} locations")
+
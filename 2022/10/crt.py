@@ -1,31 +1,39 @@
 from itertools import repeat, cycle, count
 
+from aoc_common import input_path
 
-def register_values():
+
+def parse_program(text: str) -> list[str]:
+    return [line.strip() for line in text.splitlines()]
+
+
+def load_input():
+    with open(input_path(), "r") as f:
+        return parse_program(f.read())
+
+
+def register_values(program):
     x = 1
     yield x  # x during the first cycle, before any instructions have been run
-    with open("input", "r") as f:
-        for line in f:
-            line = line.strip()
-            if line == "noop":
-                yield x
-            else:  # it's an addx
-                add = int(line[5:])
-                # addx takes two cycles, x has the old value after cycle 1
-                yield x
-                # and the new value after cycle 2
-                x += add
-                yield x
+    for line in program:
+        if line == "noop":
+            yield x
+        else:  # it's an addx
+            add = int(line[5:])
+            # addx takes two cycles, x has the old value after cycle 1
+            yield x
+            # and the new value after cycle 2
+            x += add
+            yield x
 
     # No more instructions, so keep yielding the same x for ever
     yield from repeat(x)
 
 
-def signal_strength():
+def signal_strength(program):
     interesting_strength = 0
     # Signal strength is cycle number * register value _during_ that cycle.
-    for cycle_number, x in zip(count(1), register_values()):
-        print(f"{cycle_number=}, {x=}")
+    for cycle_number, x in zip(count(1), register_values(program)):
         if cycle_number > 240:
             break
 
@@ -35,20 +43,39 @@ def signal_strength():
     return interesting_strength
 
 
-def pretty_picture():
-    for cycle_number, col, x in zip(count(1), cycle(range(40)), register_values()):
+def pretty_picture(program):
+    """
+    What the CRT shows, as six lines of 40 pixels.
+    """
+    pixels = []
+    for cycle_number, col, x in zip(count(1), cycle(range(40)), register_values(program)):
         if cycle_number > 240:
             break
 
-        if col == 0:
+        if col == 0 and pixels:
             # move to next line
-            print("")
+            pixels.append("\n")
         if abs(x-col) <= 1:
-            print("█", end="")
+            pixels.append("█")
         else:
-            print(".", end="")
+            pixels.append(".")
+
+    return "".join(pixels)
+
+
+def solve(text: str):
+    program = parse_program(text)
+    return signal_strength(program), pretty_picture(program)
+
+
+def part1():
+    return signal_strength(load_input())
+
+
+def part2():
+    return pretty_picture(load_input())
 
 
 if __name__ == "__main__":
-    print(f"Sum of interesting strengths: {signal_strength()}")
-    pretty_picture()
+    print(f"Sum of interesting strengths: {part1()}")
+    print(part2())
@@ -1,14 +1,8 @@
 from functools import partial
+from math import prod
 
-
-monkeys = []
-modulus = 1
-debug = False
-
-
-def dbg(*args):
-    if debug:
-        print(*args)
+from aoc_common import input_path
+from aoc_common.profile import phase
 
 
 class Monkey:
@@ -20,34 +14,26 @@ class Monkey:
         self.target_false = target_false
         self.inspections = 0
 
-    def take_turn(self, divide_worry=1):
-        dbg(f"I have {self.items}")
+    def take_turn(self, monkeys, modulus, divide_worry=1):
         while self.items:
             item = self.items.pop(0)
             self.inspections += 1
             worry = item
-            dbg(f"Initial worry: {worry}")
             # Monkey inspects item
             worry = self.op(worry)
-            dbg(f"After inspection {worry}")
             # Phew, they didn't damage it
             worry = worry // divide_worry
-            dbg(f"After relief {worry}")
             # Keep the worry levels from escalating too far - the input has been designed
             # so that the "divisible by" numbers for each monkey are all co-prime (in fact
             # all prime) so we can safely work modulo their product without changing the
             # result.
             worry = worry % modulus
-            dbg(f"After modulo {worry}")
             # Where to throw it next
             divisible = (worry % self.divisor == 0)
             if divisible:
-                dbg(f"Divisible by {self.divisor} - throwing to {self.target_true}")
                 monkeys[self.target_true].catch(worry)
             else:
-                dbg(f"Not divisible by {self.divisor} - throwing to {self.target_false}")
                 monkeys[self.target_false].catch(worry)
-        dbg(f"Turn complete, total inspections now {self.inspections}")
 
     def catch(self, item):
         self.items.append(item)
@@ -61,60 +47,84 @@ def mult(x, y):
     return x * y
 
 
+def parse_monkeys(text: str) -> list[Monkey]:
+    monkeys = []
+    itr = iter(text.splitlines())
+    for line in itr:
+        if not line:
+            continue
+        if line.startswith("Monkey"):
+            items = [int(i) for i in next(itr).strip()[len("Starting items: "):].split(", ")]
+
+            op_line = next(itr).strip()[len("Operation: new = old "):]
+            operator, operand = op_line.split(maxsplit=1)
+            if operand == "old":
+                if operator == "*":
+                    op = lambda w: w * w
+                else:  # +
+                    op = lambda w: w + w
+            else:
+                delta = int(operand)
+                if operator == "*":
+                    op = partial(mult, delta)
+                else:  # +
+                    op = partial(add, delta)
+
+            divisor = int(next(itr).strip()[len("Test: divisible by "):])
+            target_true = int(next(itr).strip()[len("If true: throw to monkey "):])
+            target_false = int(next(itr).strip()[len("If false: throw to monkey "):])
+            monkeys.append(Monkey(items, op, divisor, target_true, target_false))
+
+    return monkeys
+
+
 def parse_input():
-    global modulus
-    with open("input", "r") as f:
-        itr = iter(f)
-        for line in itr:
-            if not line:
-                continue
-            if line.startswith("Monkey"):
-                items = [int(i) for i in next(itr).strip()[len("Starting items: "):].split(", ")]
-
-                op_line = next(itr).strip()[len("Operation: new = old "):]
-                operator, operand = op_line.split(maxsplit=1)
-                if operand == "old":
-                    if operator == "*":
-                        op = lambda w: w * w
-                    else:  # +
-                        op = lambda w: w + w
-                else:
-                    delta = int(operand)
-                    if operator == "*":
-                        op = partial(mult, delta)
-                    else:  # +
-                        op = partial(add, delta)
-
-                divisor = int(next(itr).strip()[len("Test: divisible by "):])
-                target_true = int(next(itr).strip()[len("If true: throw to monkey "):])
-                target_false = int(next(itr).strip()[len("If false: throw to monkey "):])
-                monkeys.append(Monkey(items, op, divisor, target_true, target_false))
-
-                # Keep the worry levels from escalating too far - the input has been designed
-                # so that the "divisible by" numbers for each monkey are all co-prime (in fact
-                # all prime) so we can safely work modulo their product without changing the
-                # result.
-                modulus *= divisor
+    with open(input_path(), "r") as f:
+        return parse_monkeys(f.read())
 
 
-def run(iterations, divide_worry):
-    parse_input()
-    dbg(monkeys)
+def most_inspections(monkeys, iterations, divide_worry) -> list[int]:
+    """
+    Play the given number of rounds, and return the numbers of items each
+    monkey inspected, most first.
+    """
+    # the worry levels are kept modulo the product of the divisors, see take_turn
+    modulus = prod(m.divisor for m in monkeys)
 
-    for i in range(iterations):
-        for j, monkey in enumerate(monkeys):
-            dbg(f"Round {i} monkey {j}")
-            monkey.take_turn(divide_worry)
+    with phase("rounds"):
+        for _ in range(iterations):
+            for monkey in monkeys:
+                monkey.take_turn(monkeys, modulus, divide_worry)
 
     # order monkeys by number of inspections
-    sorted_monkeys = sorted(monkeys, key=lambda m: m.inspections, reverse=True)
-    print(f"Top two monkeys inspected {sorted_monkeys[0].inspections} and {sorted_monkeys[1].inspections} items")
-    print(f"Monkey business = {sorted_monkeys[0].inspections * sorted_monkeys[1].inspections}")
+    return sorted((m.inspections for m in monkeys), reverse=True)
 
 
-if __name__ == "__main__":
-    run(20, 3)
+def run(iterations, divide_worry):
+    with phase("parse"):
+        monkeys = parse_input()
 
-    monkeys = []
-    modulus = 1
-    run(10000, 1)
+    inspections = most_inspections(monkeys, iterations, divide_worry)
+    print(f"Top two monkeys inspected {inspections[0]} and {inspections[1]} items")
+    return inspections[0] * inspections[1]
+
+
+def solve(text: str):
+    # the monkeys' items change as they're thrown around, so each part
+    # starts again from a freshly parsed set
+    first = most_inspections(parse_monkeys(text), 20, 3)
+    second = most_inspections(parse_monkeys(text), 10000, 1)
+    return first[0] * first[1], second[0] * second[1]
+
+
+def part1():
+    return run(20, 3)
+
+
+def part2():
+    return run(10000, 1)
+
+
+if __name__ == "__main__":
+    print(f"Monkey business = {part1()}")
+    print(f"Monkey business = {part2()}")
@@ -1,18 +1,17 @@
 import json
 
+from aoc_common import input_path
 
-def load_data():
-    pairs = []
-    with open("input", "r") as f:
-        while True:
-            p1 = json.loads(f.readline())
-            p2 = json.loads(f.readline())
-            pairs.append((p1, p2))
 
-            if not f.readline():
-                break
+def parse_packets(text: str) -> list[tuple]:
+    # pairs of packets on consecutive lines, with a blank line between pairs
+    packets = [json.loads(line) for line in text.splitlines() if line.strip()]
+    return list(zip(packets[::2], packets[1::2]))
+
 
-    return pairs
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_packets(f.read())
 
 
 def lte(p1, p2):
@@ -33,19 +32,15 @@ def lte(p1, p2):
         return lendiff < 0
 
 
-def part1():
-    pairs = load_data()
-
+def ordered_pairs(pairs) -> int:
     result = 0
     for i, (p1, p2) in enumerate(pairs):
         if lte(p1, p2) is not False:
             result += i+1
-
-    print(f"Sum of indices of correctly-ordered pairs: {result}")
+    return result
 
 
-def part2():
-    pairs = load_data()
+def decoder_key(pairs) -> int:
     div1 = [[2]]
     div2 = [[6]]
     lte_div1 = 0
@@ -62,7 +57,24 @@ def part2():
     # one-based indexing)
     # Index of div2 is the number of packets that are lte [[6]], plus one (because
     # one-based index), plus another one for the div1 packet
-    print(f"Decoder key: {(lte_div1 + 1) * (lte_div2 + 2)}")
+    return (lte_div1 + 1) * (lte_div2 + 2)
+
+
+def solve(text: str):
+    pairs = parse_packets(text)
+    return ordered_pairs(pairs), decoder_key(pairs)
+
+
+def part1():
+    result = ordered_pairs(load_data())
+    print(f"Sum of indices of correctly-ordered pairs: {result}")
+    return result
+
+
+def part2():
+    key = decoder_key(load_data())
+    print(f"Decoder key: {key}")
+    return key
 
 
 if __name__ == "__main__":
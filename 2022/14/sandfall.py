@@ -1,35 +1,38 @@
 from itertools import pairwise
 
+from aoc_common import input_path
 from aoc_common.grid import Cell, Direction
 
 
-def load_data():
+def parse_rocks(text: str) -> set[Cell]:
     blocked: set[Cell] = set()
-    with open("input", "r") as f:
-        for path in f:
-            path = path.strip()
-            corners = []
-            for corner in path.split(" -> "):
-                c, r = corner.split(",")
-                corners.append(Cell(int(r), int(c)))
-            for a, b in pairwise(corners):
-                a_to_b = b - a
-                if a_to_b.col == 0:
-                    vec = a_to_b // (abs(a_to_b.row))
-                else:
-                    vec = a_to_b // abs(a_to_b.col)
+    for path in text.splitlines():
+        path = path.strip()
+        corners = []
+        for corner in path.split(" -> "):
+            c, r = corner.split(",")
+            corners.append(Cell(int(r), int(c)))
+        for a, b in pairwise(corners):
+            a_to_b = b - a
+            if a_to_b.col == 0:
+                vec = a_to_b // (abs(a_to_b.row))
+            else:
+                vec = a_to_b // abs(a_to_b.col)
 
+            blocked.add(a)
+            while a != b:
+                a += vec
                 blocked.add(a)
-                while a != b:
-                    a += vec
-                    blocked.add(a)
 
     return blocked
 
 
-def part1():
-    blocked = load_data()
-    walls = blocked.copy()
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_rocks(f.read())
+
+
+def sand_into_void(blocked: set[Cell]) -> int:
     bottom_row = max(r for (r, c) in blocked)
 
     units_of_sand = 0
@@ -50,19 +53,10 @@ def part1():
                 units_of_sand += 1
                 break
 
-    min_col = min(c for r, c in blocked)
-    max_col = max(c for r, c in blocked)
-
-    for r in range(bottom_row + 2):
-        print("".join("#" if Cell(r, c) in walls else "o" if Cell(r, c) in blocked else "." for c in range(min_col-2, max_col+3)))
-
-
-    print(f"Units of sand that can come to rest: {units_of_sand}")
+    return units_of_sand
 
 
-def part2():
-    blocked = load_data()
-    walls = blocked.copy()
+def sand_onto_floor(blocked: set[Cell]) -> int:
     floor = max(r for (r, c) in blocked) + 2
 
     def is_free(c: Cell):
@@ -84,14 +78,26 @@ def part2():
                 units_of_sand += 1
                 break
 
-    min_col = min(c for r, c in blocked)
-    max_col = max(c for r, c in blocked)
+    return units_of_sand
 
-    for r in range(floor + 1):
-        print("".join("#" if (r == floor or Cell(r, c) in walls) else "o" if Cell(r, c) in blocked else "." for c in range(min_col-2, max_col+3)))
 
-    print(f"Units of sand that can come to rest (part 2): {units_of_sand}")
+def solve(text: str):
+    # the sand piles up in the set of blocked cells, so each part needs its
+    # own copy of it
+    rocks = parse_rocks(text)
+    return sand_into_void(set(rocks)), sand_onto_floor(rocks)
+
 
+def part1():
+    units_of_sand = sand_into_void(load_data())
+    print(f"Units of sand that can come to rest: {units_of_sand}")
+    return units_of_sand
+
+
+def part2():
+    units_of_sand = sand_onto_floor(load_data())
+    print(f"Units of sand that can come to rest (part 2): {units_of_sand}")
+    return units_of_sand
 
 
 if __name__ == "__main__":
@@ -1,114 +1,97 @@
 import re
-from operator import attrgetter
 
+import numpy as np
+
+from aoc_common import input_path
 from aoc_common.grid import Cell
+from aoc_common.intervals import IntervalSet, first_uncovered
 
 
-def load_data():
+def parse_sensors(text: str) -> list[tuple[Cell, Cell]]:
     regex = re.compile(r"Sensor at x=([0-9-]+), y=([0-9-]+): closest beacon is at x=([0-9-]+), y=([0-9-]+)")
 
-    with open("input", "r") as f:
-        # list of sensor/beacon tuples
-        pairs = []
-        for line in f:
-            match = regex.search(line)
-            if match:
-                pairs.append((Cell(int(match.group(2)), int(match.group(1))), Cell(int(match.group(4)), int(match.group(3)))))
+    # list of sensor/beacon tuples
+    pairs = []
+    for line in text.splitlines():
+        match = regex.search(line)
+        if match:
+            pairs.append((Cell(int(match.group(2)), int(match.group(1))), Cell(int(match.group(4)), int(match.group(3)))))
 
     return pairs
 
 
-def cells_within_range(row: int, sensor: Cell, beacon: Cell) -> range | None:
-    beacon_distance = abs(beacon.row - sensor.row) + abs(beacon.col - sensor.col)
-    # number of rows above or below the sensor that we are asking about
-    row_offset = abs(row - sensor.row)
-    # number of columns to the left or right of the sensor that fall within the
-    # beacon distance on the target row
-    col_offset = beacon_distance - row_offset
-
-    first_non_beacon = sensor.col - col_offset
-    last_non_beacon = sensor.col + col_offset
-
-    nbr = range(first_non_beacon, last_non_beacon + 1)
-    if len(nbr) == 0:
-        return None
-
-    return nbr
-
-
-def part1(pairs, row):
-    ranges = []
-    beacons = set()
-    for sensor, beacon in pairs:
-        r = cells_within_range(row, sensor, beacon)
-        if r is not None:
-            ranges.append(r)
-        # also track any beacons that are actually in this row - a
-        # cell that we know contains a beacon is by definition *not*
-        # a "cell that cannot contain beacons"
-        if beacon.row == row:
-            beacons.add(beacon.col)
-
-    print(f"{len(beacons)} cells in row {row} known to be beacons")
-
-    ranges.sort(key=attrgetter("start"))
-    print(ranges)
-
-    cur_range = ranges[0]
-    not_beacons = 0
-    for r in ranges[1:]:
-        if cur_range.stop < r.start:
-            not_beacons += len(cur_range)
-            print(f"no beacons in {cur_range}")
-            cur_range = r
-        elif cur_range.stop < r.stop:
-            cur_range = range(cur_range.start, r.stop)
-        # else r is wholly contained within cur_range
-
-    if len(cur_range) > 0:
-        not_beacons += len(cur_range)
-        print(f"no beacons in {cur_range}")
-
-    print(f"Number of cells in row {row} that cannot be beacons: {not_beacons - len(beacons)}")
-
-
-def part2(pairs):
-    for row in range(4000001):
-        if row % 100000 == 0:
-            print(f"{row}")
-        ranges = []
-        for sensor, beacon in pairs:
-            r = cells_within_range(row, sensor, beacon)
-            if r is not None:
-                s = max(r.start, 0)
-                e = min(r.stop, 4000001)
-                if s < e:
-                    ranges.append(r)
-
-        ranges.sort(key=attrgetter("start"))
-        # first edge case - if there's a gap at the start of this row
-        # then that's the target
-        if ranges[0].start > 0:
-            return Cell(row, 0)
-        cur_range = ranges[0]
-        for r in ranges[1:]:
-            if cur_range.stop < r.start:
-                # we've found the only possible place for the missing beacon
-                return Cell(row, cur_range.stop)
-            elif cur_range.stop < r.stop:
-                cur_range = range(cur_range.start, r.stop)
-            # else r is wholly contained within cur_range
-
-        # second edge case - if there's a gap at the end of this row
-        # then that's the target
-        if cur_range.stop < 4000001:
-            return Cell(row, 400000)
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_sensors(f.read())
+
+
+def sensor_arrays(pairs) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Row, column and beacon distance of every sensor, as parallel arrays.
+    """
+    rows = np.array([sensor.row for sensor, _ in pairs], dtype=np.int64)
+    cols = np.array([sensor.col for sensor, _ in pairs], dtype=np.int64)
+    radii = np.array([abs(beacon.row - sensor.row) + abs(beacon.col - sensor.col) for sensor, beacon in pairs],
+                     dtype=np.int64)
+    return rows, cols, radii
+
+
+def cells_within_range(row: int, rows: np.ndarray, cols: np.ndarray, radii: np.ndarray) -> IntervalSet:
+    """
+    The cells of the given row that are within range of at least one sensor.
+    """
+    # number of columns to the left or right of each sensor that fall within
+    # its beacon distance on the target row - negative for sensors that don't
+    # reach this row at all, which makes an empty interval
+    col_offsets = radii - np.abs(row - rows)
+    return IntervalSet.from_arrays(cols - col_offsets, cols + col_offsets + 1)
+
+
+def not_beacons(pairs, row):
+    """
+    The number of cells in the given row that cannot contain a beacon.
+    """
+    # track any beacons that are actually in this row - a cell that we know
+    # contains a beacon is by definition *not* a "cell that cannot contain
+    # beacons"
+    beacons = {beacon.col for _, beacon in pairs if beacon.row == row}
+    return cells_within_range(row, *sensor_arrays(pairs)).size - len(beacons)
+
+
+def distress_beacon(pairs, limit=4000000, block=10000):
+    rows, cols, radii = sensor_arrays(pairs)
+    # check a block of rows at a time - one row of the arrays per grid row,
+    # one column per sensor
+    for first_row in range(0, limit + 1, block):
+        row = np.arange(first_row, min(first_row + block, limit + 1))[:, np.newaxis]
+        col_offsets = radii - np.abs(row - rows)
+        gaps = first_uncovered(cols - col_offsets, cols + col_offsets + 1, 0, limit + 1)
+        found = np.flatnonzero(gaps <= limit)
+        if len(found):
+            # we've found the only possible place for the missing beacon
+            return Cell(first_row + int(found[0]), int(gaps[found[0]]))
 
     raise ValueError("No possible place for the missing beacon")
 
 
+def tuning_frequency(pairs):
+    target = distress_beacon(pairs)
+    return target.col * 4000000 + target.row
+
+
+def solve(text: str):
+    pairs = parse_sensors(text)
+    return not_beacons(pairs, 2000000), tuning_frequency(pairs)
+
+
+def part1():
+    return not_beacons(load_data(), 2000000)
+
+
+def part2():
+    return tuning_frequency(load_data())
+
+
 if __name__ == "__main__":
-    sensors_and_beacons = load_data()
-    part1(sensors_and_beacons, 2000000)
-    target = part2(sensors_and_beacons)
-    print(f"Tuning frequency: {target.col * 4000000 + target.row}")
\ No newline at end of file
+    print(f"Number of cells in row 2000000 that cannot be beacons: {part1()}")
+    print(f"Tuning frequency: {part2()}")
\ No newline at end of file
@@ -1,47 +1,58 @@
 import itertools
 import re
 import time
-from functools import cache
 from collections import namedtuple
 
-import networkx as nx
+from aoc_common import input_path
+from aoc_common.lazy import lazy_import
+from aoc_common.memo import memo
+
+nx = lazy_import("networkx")
 
 line_re = re.compile(
     r"^Valve ([A-Z]+) has flow rate=(\d+); tunnels? leads? to valves? (.*)$"
 )
 
 
-def load_data():
+def parse_valves(text: str):
     non_zero_valves = {}
     graph = nx.Graph()
-    with open("input", "r") as f:
-        for l in f:
-            m = line_re.match(l.strip())
-            src = m.group(1)
-            flow = int(m.group(2))
-            targets = m.group(3)
-            if flow > 0:
-                non_zero_valves[src] = flow
-            for t in targets.split(","):
-                graph.add_edge(src, t.strip())
+    for l in text.splitlines():
+        m = line_re.match(l.strip())
+        src = m.group(1)
+        flow = int(m.group(2))
+        targets = m.group(3)
+        if flow > 0:
+            non_zero_valves[src] = flow
+        for t in targets.split(","):
+            graph.add_edge(src, t.strip())
 
     return non_zero_valves, graph
 
 
-def part1():
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_valves(f.read())
+
+
+def valve_distances(non_zero_valves, graph) -> dict[str, dict[str, int]]:
     """
-    My original approach to part 1 was top-down memoized recursion.
+    The distances from AA and each working valve to every working valve.
     """
-    non_zero_valves, graph = load_data()
-
     distances = {}
     for src, dists in nx.all_pairs_shortest_path_length(graph):
         if src in non_zero_valves or src == "AA":
             distances[src] = {
                 dest: dist for dest, dist in dists.items() if dest in non_zero_valves
             }
+    return distances
 
-    @cache
+
+def best_flow_alone(non_zero_valves, distances) -> int:
+    """
+    My original approach to part 1 was top-down memoized recursion.
+    """
+    @memo
     def best_total_flow(time_left: int, cur_node: str, already_open: frozenset[str]):
         dists_from_cur = distances[cur_node]
         possible_answers = set()
@@ -61,36 +72,35 @@ def part1():
 
         return max(possible_answers, default=0)
 
+    return best_total_flow(30, "AA", frozenset())
+
+
+def part1():
+    non_zero_valves, graph = load_data()
+
     start = time.perf_counter()
-    total_flow = best_total_flow(30, "AA", frozenset())
+    total_flow = best_flow_alone(non_zero_valves, valve_distances(non_zero_valves, graph))
     end = time.perf_counter()
     print(f"Part 1: max total flow: {total_flow} (found in {end - start} seconds)")
+    return total_flow
 
 
 Task = namedtuple("Task", ["node", "open", "time_left", "total_flow"])
 
 
-def part2():
+@memo(persist=True)
+def best_totals_per_subset(flows, distances, time_limit: int) -> dict[frozenset[str], int]:
     """
-    For part 2 we need to know what would happen for *all* subsets of the possible
-    valve activations, in order to pick the best combination between me and the
-    elephant, so switched from a top-down depth first recursion to a breadth-first
-    traversal, keeping track of the highest flow rate achievable by a route that
-    opens just the subset of valves we have visited so far.  Once we know this for
-    all possible subsets, then the final answer is the highest sum you get from any
-    pair of *disjoint* subsets (since we can't both open the same valve).
+    The highest total flow achievable in ``time_limit`` minutes by a route
+    from AA that opens exactly each subset of the valves.  This is the
+    expensive part of part 2 and only depends on the valve network, so the
+    results are kept between runs.
     """
-    non_zero_valves, graph = load_data()
-
-    distances = {}
-    for src, dists in nx.all_pairs_shortest_path_length(graph):
-        if src in non_zero_valves or src == "AA":
-            distances[src] = {
-                dest: dist for dest, dist in dists.items() if dest in non_zero_valves
-            }
+    non_zero_valves = dict(flows)
+    distances = {src: dict(dists) for src, dists in distances}
 
     best_total_per_subset = {}
-    tasks = [Task("AA", frozenset(), 26, 0)]
+    tasks = [Task("AA", frozenset(), time_limit, 0)]
     while tasks:
         t = tasks.pop()
         dists_from_cur = distances[t.node]
@@ -110,6 +120,19 @@ def part2():
                     best_total_per_subset[new_task.open] = new_task.total_flow
                 tasks.append(new_task)
 
+    return best_total_per_subset
+
+
+def best_split(best_total_per_subset) -> tuple[int, tuple]:
+    """
+    For part 2 we need to know what would happen for *all* subsets of the possible
+    valve activations, in order to pick the best combination between me and the
+    elephant, so switched from a top-down depth first recursion to a breadth-first
+    traversal, keeping track of the highest flow rate achievable by a route that
+    opens just the subset of valves we have visited so far.  Once we know this for
+    all possible subsets, then the final answer is the highest sum you get from any
+    pair of *disjoint* subsets (since we can't both open the same valve).
+    """
     # now we know the best totals we could achieve by opening any subset of the valves,
     # so consider all the ways we could divide the work up between two actors such that
     # all the valves are open by the end, and see which split gives the highest result
@@ -124,10 +147,34 @@ def part2():
             best_split = (s1, s2)
             best_total = this_total
 
+    return best_total, best_split
+
+
+def subset_totals(non_zero_valves, distances, time_limit: int) -> dict[frozenset[str], int]:
+    # the tables are passed as sorted tuples so they can be part of the memo key
+    return best_totals_per_subset(
+        tuple(sorted(non_zero_valves.items())),
+        tuple(sorted((src, tuple(sorted(dists.items()))) for src, dists in distances.items())),
+        time_limit,
+    )
+
+
+def solve(text: str):
+    non_zero_valves, graph = parse_valves(text)
+    distances = valve_distances(non_zero_valves, graph)
+    best_total, _ = best_split(subset_totals(non_zero_valves, distances, 26))
+    return best_flow_alone(non_zero_valves, distances), best_total
+
+
+def part2():
+    non_zero_valves, graph = load_data()
+    best_total_per_subset = subset_totals(non_zero_valves, valve_distances(non_zero_valves, graph), 26)
+    best_total, split = best_split(best_total_per_subset)
     print(
         f"Part 1: best total for one person in 26 sec: {max(best_total_per_subset.values())}"
     )
-    print(f"Part 2: best total flow: {best_total}, by splitting as {best_split}")
+    print(f"Part 2: best total flow: {best_total}, by splitting as {split}")
+    return best_total
 
 
 if __name__ == "__main__":
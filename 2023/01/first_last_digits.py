@@ -1,19 +1,30 @@
 import re
 import sys
 
+from aoc_common import input_path
+
+
+def input_file():
+    # Input file can be given on the command line, otherwise the usual default
+    return sys.argv[1] if len(sys.argv) > 1 else input_path()
+
+
+def input_lines():
+    with open(input_file(), "r") as f:
+        return f.read().splitlines()
+
 
 # Part 1: find the first and last *digits* in each line, combine them as a
 # two digit number and sum across all lines
 
-def digits_only():
+def digits_only(lines):
     calibration_sum = 0
-    with open(sys.argv[1], "r") as f:
-        for line in f:
-            first_digit = re.search(r"\d", line).group()
-            last_digit = re.search(r"\d", line[::-1]).group()
-            calibration_sum += 10*int(first_digit) + int(last_digit)
+    for line in lines:
+        first_digit = re.search(r"\d", line).group()
+        last_digit = re.search(r"\d", line[::-1]).group()
+        calibration_sum += 10*int(first_digit) + int(last_digit)
 
-    print(f"Sum (digits only) = {calibration_sum}")
+    return calibration_sum
 
 
 # Part 2: as well as digits, look for digit-as-word.  So now the first "digit"
@@ -43,18 +54,30 @@ reverse_digits = {word[::-1]: value for word, value in forward_digits.items()}
 reverse_re = re.compile("|".join(reverse_digits.keys()))
 
 
-def digits_and_words():
+def digits_and_words(lines):
     calibration_sum = 0
-    with open(sys.argv[1], "r") as f:
-        for line in f:
-            first_digit = forward_digits[forward_re.search(line).group()]
-            last_digit = reverse_digits[reverse_re.search(line[::-1]).group()]
+    for line in lines:
+        first_digit = forward_digits[forward_re.search(line).group()]
+        last_digit = reverse_digits[reverse_re.search(line[::-1]).group()]
+
+        calibration_sum += 10*first_digit + last_digit
+
+    return calibration_sum
+
+
+def solve(text: str):
+    lines = text.splitlines()
+    return digits_only(lines), digits_and_words(lines)
+
+
+def part1():
+    return digits_only(input_lines())
 
-            calibration_sum += 10*first_digit + last_digit
 
-    print(f"Sum (digits and words) = {calibration_sum}")
+def part2():
+    return digits_and_words(input_lines())
 
 
 if __name__ == "__main__":
-    digits_only()
-    digits_and_words()
+    print(f"Sum (digits only) = {part1()}")
+    print(f"Sum (digits and words) = {part2()}")
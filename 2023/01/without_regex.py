@@ -1,5 +1,13 @@
 # Alternative implementation using find and rfind rather than regular expressions
 
+from aoc_common import input_path
+
+
+def input_lines():
+    with open(input_path(), "r") as f:
+        return f.read().splitlines()
+
+
 # Part 1 - digits only
 digits = [(str(i), i) for i in range(10)]
 
@@ -17,44 +25,55 @@ digits_and_words = digits + [
 ]
 
 
-def calibration(lookup_table):
+def calibration(lines, lookup_table):
     calibration_sum = 0
-    with open("input", "r") as f:
-        for line in f:
-            # We are searching each line for the furthest left and furthest right positions
-            # at which any "digit" (FSVO digit - depending on the lookup table) occurs, and
-            # using the corresponding value from the table as the integer value of that digit
-            first_digit = -1
-            last_digit = -1
-
-            # Start first_digit_pos to the right of any possible actual positions
-            first_digit_pos = len(line)
-            # Start last_digit_pos to the left of any possible actual positions
-            last_digit_pos = -1
-
-            for digit, value in lookup_table:
-                # Find the first and last indexes (if any) of this digit in the line
-                this_digit_first = line.find(digit)
-                this_digit_last = line.rfind(digit)
-
-                if this_digit_first >= 0 and this_digit_first < first_digit_pos:
-                    # This digit is in the line and is further left than any we've seen so far
-                    first_digit_pos = this_digit_first
-                    first_digit = value
-                if this_digit_last >= 0 and this_digit_last > last_digit_pos:
-                    # This digit is in the line and is further right than any we've seen so far
-                    last_digit_pos = this_digit_last
-                    last_digit = value
-
-            if first_digit >= 0 and last_digit >= 0:
-                calibration_sum += 10*first_digit + last_digit
-            else:
-                print(f"No digits found in '{line}'")
+    for line in lines:
+        # We are searching each line for the furthest left and furthest right positions
+        # at which any "digit" (FSVO digit - depending on the lookup table) occurs, and
+        # using the corresponding value from the table as the integer value of that digit
+        first_digit = -1
+        last_digit = -1
+
+        # Start first_digit_pos to the right of any possible actual positions
+        first_digit_pos = len(line)
+        # Start last_digit_pos to the left of any possible actual positions
+        last_digit_pos = -1
+
+        for digit, value in lookup_table:
+            # Find the first and last indexes (if any) of this digit in the line
+            this_digit_first = line.find(digit)
+            this_digit_last = line.rfind(digit)
+
+            if this_digit_first >= 0 and this_digit_first < first_digit_pos:
+                # This digit is in the line and is further left than any we've seen so far
+                first_digit_pos = this_digit_first
+                first_digit = value
+            if this_digit_last >= 0 and this_digit_last > last_digit_pos:
+                # This digit is in the line and is further right than any we've seen so far
+                last_digit_pos = this_digit_last
+                last_digit = value
+
+        if first_digit >= 0 and last_digit >= 0:
+            calibration_sum += 10*first_digit + last_digit
+        else:
+            print(f"No digits found in '{line}'")
 
     return calibration_sum
 
 
+def solve(text: str):
+    lines = text.splitlines()
+    return calibration(lines, digits), calibration(lines, digits_and_words)
+
+
+def part1():
+    return calibration(input_lines(), digits)
+
+
+def part2():
+    return calibration(input_lines(), digits_and_words)
+
+
 if __name__ == "__main__":
-    # Part 1: digits only
-    print(f"Calibration sum (digits only) = {calibration(digits)}")
-    print(f"Calibration sum (digits and words) = {calibration(digits_and_words)}")
+    print(f"Calibration sum (digits only) = {part1()}")
+    print(f"Calibration sum (digits and words) = {part2()}")
@@ -1,50 +1,75 @@
 import re
 import functools
 
-def possible_games(**bag):
-    id_sum = 0
-    with open("input", "r") as f:
-        for line in f:
-            id_part, game = line.split(":", 1)
-            game_id = int(id_part[5:])
-            for cubes in re.finditer(r"(\d+) +([a-z]+)", game):
-                num, colour = cubes.groups()
-                if colour not in bag or int(num) > bag[colour]:
-                    print(f"Game {game_id} is not possible")
-                    break
-            else:
-                print(f"Game {game_id} *is* possible")
-                id_sum += game_id
-
-    return id_sum
+from aoc_common import input_path
+
+
+def parse_games(text: str) -> list[tuple[int, list[tuple[int, str]]]]:
+    # each game's id, and the number and colour of every handful of cubes
+    games = []
+    for line in text.splitlines():
+        id_part, game = line.split(":", 1)
+        game_id = int(id_part[5:])
+        games.append((game_id, [(int(num), colour) for num, colour in re.findall(r"(\d+) +([a-z]+)", game)]))
+    return games
+
+
+def load_input():
+    with open(input_path(), "r") as f:
+        return parse_games(f.read())
+
+
+def is_possible(cubes, bag) -> bool:
+    return all(colour in bag and num <= bag[colour] for num, colour in cubes)
+
+
+# the cubes in the bag for part 1
+BAG = {"red": 12, "green": 13, "blue": 14}
+
+
+def possible_games(games, bag):
+    return sum(game_id for game_id, cubes in games if is_possible(cubes, bag))
 
 
 def multiply(x, y):
     return x * y
 
 
-def smallest_bag_per_game():
+def smallest_bag_per_game(games):
     total_power = 0
-    with open("input", "r") as f:
-        for line in f:
-            id_part, game = line.split(":", 1)
-            game_id = int(id_part[5:])
-            bag = {}
-            for cubes in re.finditer(r"(\d+) +([a-z]+)", game):
-                num, colour = cubes.groups()
-                if colour not in bag or int(num) > bag[colour]:
-                    bag[colour] = int(num)
-            # we now know the smallest possible bag that works for this game
-            # calculate its power
-            bag_power = functools.reduce(multiply, bag.values(), 1)
-            total_power += bag_power
+    for game_id, cubes in games:
+        bag = {}
+        for num, colour in cubes:
+            if colour not in bag or num > bag[colour]:
+                bag[colour] = num
+        # we now know the smallest possible bag that works for this game
+        # calculate its power
+        bag_power = functools.reduce(multiply, bag.values(), 1)
+        total_power += bag_power
 
     return total_power
 
 
+def solve(text: str):
+    games = parse_games(text)
+    return possible_games(games, BAG), smallest_bag_per_game(games)
+
+
+def part1():
+    games = load_input()
+    for game_id, cubes in games:
+        if is_possible(cubes, BAG):
+            print(f"Game {game_id} *is* possible")
+        else:
+            print(f"Game {game_id} is not possible")
+    return possible_games(games, BAG)
+
+
+def part2():
+    return smallest_bag_per_game(load_input())
 
 
 if __name__ == "__main__":
-    print(possible_games(red=12, green=13, blue=14))
+    print(part1())
 
-    print(f"Total power: {smallest_bag_per_game()}")
+    print(f"Total power: {part2()}")
@@ -1,33 +1,44 @@
 import re
 
+from aoc_common import input_path
+
+
+def parse_cards(text: str) -> list[set[int]]:
+    """
+    My winning numbers on each card.
+    """
+    cards = []
+    for line in text.splitlines():
+        line = line.strip()
+        _, numbers = line.split(":")
+        winning, mine = numbers.split("|")
+        winning_numbers = set(int(m.group()) for m in re.finditer(r"\d+", winning))
+        my_numbers = set(int(m.group()) for m in re.finditer(r"\d+", mine))
+        cards.append(winning_numbers.intersection(my_numbers))
+    return cards
+
 
 def winning_numbers_per_card():
-    with open("input", "r") as f:
-        for line in f:
-            line = line.strip()
-            _, numbers = line.split(":")
-            winning, mine = numbers.split("|")
-            winning_numbers = set(int(m.group()) for m in re.finditer(r"\d+", winning))
-            my_numbers = set(int(m.group()) for m in re.finditer(r"\d+", mine))
-            yield winning_numbers.intersection(my_numbers)
+    with open(input_path(), "r") as f:
+        return parse_cards(f.read())
 
 
-def total_value():
+def total_value(cards):
     total_score = 0
-    for my_winnings in winning_numbers_per_card():
+    for my_winnings in cards:
         if my_winnings:
             total_score += 2 ** (len(my_winnings) - 1)
 
     return total_score
 
 
-def copied_cards():
+def copied_cards(cards):
     total_count = 0
     # if we are currently looking at card N then copies[n] is the number of copies
     # of card N+n we have already accumulated
     copies = [0]
 
-    for my_winnings in winning_numbers_per_card():
+    for my_winnings in cards:
         # Remove this card from the copies stack and add 1 to get the total copies of this card
         this_card_count = 1 + (copies.pop(0) if len(copies) else 0)
         # add the total copies of this card to the running total
@@ -42,6 +53,19 @@ def copied_cards():
     return total_count
 
 
+def solve(text: str):
+    cards = parse_cards(text)
+    return total_value(cards), copied_cards(cards)
+
+
+def part1():
+    return total_value(winning_numbers_per_card())
+
+
+def part2():
+    return copied_cards(winning_numbers_per_card())
+
+
 if __name__ == "__main__":
-    print(f"Total value: {total_value()}")
-    print(f"Total cards including copies: {copied_cards()}")
+    print(f"Total value: {part1()}")
+    print(f"Total cards including copies: {part2()}")
@@ -1,6 +1,10 @@
 import functools
 from bisect import bisect_right
 
+from aoc_common import input_path
+from aoc_common.cache import cached_parse
+from aoc_common.intervals import IntervalSet
+
 
 class MappingRange:
     def __init__(self, line):
@@ -55,97 +59,83 @@ class AlmanacMapping:
     def __repr__(self):
         return f"{self.title} {self.ranges!r}"
 
-    def map_range(self, r: range):
+    def map_intervals(self, values: IntervalSet) -> IntervalSet:
         """
-        Compute the set of ranges denoting possible outputs from this mapping, if it were
-        given inputs from a specified range.
-        :param r: the input range
-        :return: list of one or more ranges that this range transforms to via this mapping.
-        It should always be the case that ``sum(len(out_r) for out_r in output) == len(r)``
+        Compute the set of possible outputs from this mapping, if it were
+        given inputs from a specified set.
+        :param values: the possible inputs
+        :return: the possible outputs - it should always be the case that
+        ``output.size == values.size``, as long as the outputs of the mapping
+        ranges don't overlap
         """
         mapped = []
-        startpoint = 0
-        while len(r) > 0:
-            candidate = bisect_right(self.starts, r.start, startpoint) - 1
-            if candidate < 0 or r.start not in self.ranges[candidate]:
-                # r starts before/after/between our ranges ...
-                if candidate+1 < len(self.ranges) and self.ranges[candidate + 1].start < r.stop:
-                    # ... and ends within the next range
-                    split_point = self.ranges[candidate+1].start
-                else:
-                    # ... and also ends without entering another range
-                    split_point = r.stop
-                mapped.append(range(r.start, split_point))
-            else:
-                # start of r is inside one of our ranges
-                candidate_range = self.ranges[candidate]
-                split_point = min((r.stop, candidate_range.stop))
-                mapped.append(range(candidate_range[r.start], candidate_range[r.start] + split_point - r.start))
-
-            # Replace r with the right hand split - this may be an empty range
-            r = range(split_point, r.stop)
-            # and we know that the new r can't touch the candidate we were previously looking at
-            startpoint = candidate + 1
-
-        return mapped
+        unmapped = values
+        for r in self.ranges:
+            src = IntervalSet([r.src_range])
+            mapped.append((values & src).shift(r.dest_start - r.start))
+            unmapped = unmapped - src
 
+        # anything not covered by any of the ranges uses the identity mapping
+        return functools.reduce(IntervalSet.union, mapped, unmapped)
 
-def parse_input():
+
+@cached_parse
+def parse_almanac(text: str):
     mappings = []
-    with open("input", "r") as f:
-        lines = iter(f)
-        seeds_line = next(lines)
-        _ = next(lines)  # Blank line following "seeds"
-        for block_title in lines:
-            # the first line of each block is the header
-            almanac_mapping = AlmanacMapping(block_title, lines)
-            mappings.append(almanac_mapping)
-            # AlmanacMapping constructor will consume the lines of the block
-            # and the following empty line separating this block from the next,
-            # if we haven't already reached EOF
+    lines = iter(text.splitlines())
+    seeds_line = next(lines)
+    _ = next(lines)  # Blank line following "seeds"
+    for block_title in lines:
+        # the first line of each block is the header
+        almanac_mapping = AlmanacMapping(block_title, lines)
+        mappings.append(almanac_mapping)
+        # AlmanacMapping constructor will consume the lines of the block
+        # and the following empty line separating this block from the next,
+        # if we haven't already reached EOF
 
     seeds = [int(s) for s in seeds_line[7:].split()]  # chop off the header
     return seeds, mappings
 
-def find_min_location():
-    seeds, mappings = parse_input()
+
+def parse_input():
+    with open(input_path(), "r") as f:
+        return parse_almanac(f.read())
+
+
+def find_min_location(seeds, mappings):
     return min(functools.reduce(lambda val, mapping: mapping[val], mappings, seed) for seed in seeds)
 
 
-def find_min_from_ranges():
-    seeds, mappings = parse_input()
+def find_min_from_ranges(seeds, mappings, debug=False):
     # turn each pair of seed numbers into the corresponding range
     itr = iter(seeds)
-    ranges = [range(start, start+length) for start, length in zip(itr, itr)]
-    ranges.sort(key=lambda r: r.start)
+    values = IntervalSet(range(start, start+length) for start, length in zip(itr, itr))
 
-    # loop through the mappings, each time taking the list of ranges
+    # loop through the mappings, each time taking the set of values
     # produced by the previous stage and transforming them through this mapping
     for mapping in mappings:
-        new_ranges = []
-        for r in ranges:
-            new_ranges.extend(mapping.map_range(r))
-        ranges = new_ranges
-        ranges.sort(key=lambda r: r.start)
-
-        # amalgamate adjacent ranges - this isn't strictly necessary to the
-        # algorithm, but it's nice to keep things tidy
-        i = 0
-        while i < len(ranges)-1:
-            if ranges[i].stop == ranges[i+1].start:
-                ranges[i:i+2] = [range(ranges[i].start, ranges[i+1].stop)]
-            else:
-                i += 1
-
-        print(f"{mapping.title} {ranges!r}")
+        values = mapping.map_intervals(values)
+        if debug:
+            print(f"{mapping.title} {values!r}")
 
     # After all the transformations are done, what we care about is the
-    # left edge of the leftmost final range
-    return ranges[0].start
+    # smallest final value
+    return values.min
+
+
+def solve(text: str):
+    seeds, mappings = parse_almanac(text)
+    return find_min_location(seeds, mappings), find_min_from_ranges(seeds, mappings)
+
+
+def part1():
+    return find_min_location(*parse_input())
 
 
+def part2():
+    return find_min_from_ranges(*parse_input(), debug=True)
 
 
 if __name__ == "__main__":
-    print(f"closest location, treating seeds as single numbers: {find_min_location()}")
-    print(f"closest location, treating seeds as ranges: {find_min_from_ranges()}")
\ No newline at end of file
+    print(f"closest location, treating seeds as single numbers: {part1()}")
+    print(f"closest location, treating seeds as ranges: {part2()}")
\ No newline at end of file
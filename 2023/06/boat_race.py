@@ -1,17 +1,24 @@
 import math
 
+from aoc_common import input_path
+
+
+def parse_races(text: str, ignore_spaces) -> list[tuple[int, int]]:
+    time_line, dist_line = (l.split()[1:] for l in text.splitlines())
+    if ignore_spaces:
+        return [(int("".join(time_line)), int("".join(dist_line)))]
+    else:
+        return [(int(t), int(d)) for t, d in zip(time_line, dist_line)]
+
+
 def parse_input(ignore_spaces):
-    with open("input", "r") as f:
-        time_line, dist_line = (l.split()[1:] for l in f)
-        if ignore_spaces:
-            return [(int("".join(time_line)), int("".join(dist_line)))]
-        else:
-            return ((int(t), int(d)) for t, d in zip(time_line, dist_line))
+    with open(input_path(), "r") as f:
+        return parse_races(f.read(), ignore_spaces)
 
 
-def ways_to_win(ignore_spaces):
+def ways_to_win(races, debug=False):
     product = 1
-    for l, best_dist in parse_input(ignore_spaces):
+    for l, best_dist in races:
         # in a race over l ms, holding the button for x ms
         # will result in the boat moving y = (l-x)*x mm.
         # Possible winning times are all the integer x values
@@ -27,15 +34,28 @@ def ways_to_win(ignore_spaces):
         # beaten
         radical = math.sqrt(l**2 - 4*best_dist)  # sqrt(b^2-4ac)
         left, right = ((l - radical)/2, (l + radical)/2)  # (b^2 +- radical)/2a
-        print(f"roots: {left} {right}")
         winning_possibilities = range(int(left)+1, math.ceil(right))
-        print(f"{len(winning_possibilities)} possibilities {winning_possibilities}")
+        if debug:
+            print(f"roots: {left} {right}")
+            print(f"{len(winning_possibilities)} possibilities {winning_possibilities}")
 
         product *= len(winning_possibilities)
 
     return product
 
 
+def solve(text: str):
+    return ways_to_win(parse_races(text, False)), ways_to_win(parse_races(text, True))
+
+
+def part1():
+    return ways_to_win(parse_input(False), debug=True)
+
+
+def part2():
+    return ways_to_win(parse_input(True), debug=True)
+
+
 if __name__ == "__main__":
-    print(f"Possible ways to win many races: {ways_to_win(False)}")
-    print(f"Possible ways to win one race: {ways_to_win(True)}")
+    print(f"Possible ways to win many races: {part1()}")
+    print(f"Possible ways to win one race: {part2()}")
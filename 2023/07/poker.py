@@ -1,4 +1,7 @@
 from collections import namedtuple, Counter
+
+from aoc_common import input_path
+
 Hand = namedtuple("Hand", ["signature", "cards", "bid"])
 
 
@@ -49,23 +52,39 @@ def to_hand(line, j_is_joker):
     return Hand(signature, [values[card] for card in cards], int(bid))
 
 
+def parse_hands(text: str, jokers) -> list[Hand]:
+    return [to_hand(line.strip(), jokers) for line in text.splitlines()]
+
+
 def parse_input(jokers):
-    with open("input", "r") as f:
-        return [to_hand(line.strip(), jokers) for line in f]
+    with open(input_path(), "r") as f:
+        return parse_hands(f.read(), jokers)
 
 
-def total_winnings(jokers):
-    hands = parse_input(jokers)
+def total_winnings(hands, debug=False):
     hands.sort()
     # hands is now ordered from weakest to strongest
     total = 0
     for i, hand in enumerate(hands):
-        print(f"  Rank {i+1:4d}: {hand}")
+        if debug:
+            print(f"  Rank {i+1:4d}: {hand}")
         total += (i+1) * hand.bid
 
     return total
 
 
+def solve(text: str):
+    return total_winnings(parse_hands(text, False)), total_winnings(parse_hands(text, True))
+
+
+def part1():
+    return total_winnings(parse_input(False), debug=True)
+
+
+def part2():
+    return total_winnings(parse_input(True), debug=True)
+
+
 if __name__ == "__main__":
-    print(f"Total winnings (no jokers): {total_winnings(False)}")
-    print(f"Total winnings (with jokers): {total_winnings(True)}")
+    print(f"Total winnings (no jokers): {part1()}")
+    print(f"Total winnings (with jokers): {part2()}")
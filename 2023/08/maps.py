@@ -1,25 +1,32 @@
-import math
+import itertools
 from itertools import cycle
 
-def parse_input():
-    with open("input", "r") as f:
-        itr = iter(f)
-        instructions = next(itr).strip()
-        network = {}
-        for line in itr:
-            line = line.strip()
-            if not line:
-                continue
-
-            # ABC = (DEF, GHI)
-            # 0123456789012345
-            network[line[0:3]] = (line[7:10], line[12:15])
+from aoc_common import input_path
+from aoc_common.cycles import crt, find_cycle
+
+
+def parse_maps(text: str):
+    itr = iter(text.splitlines())
+    instructions = next(itr).strip()
+    network = {}
+    for line in itr:
+        line = line.strip()
+        if not line:
+            continue
+
+        # ABC = (DEF, GHI)
+        # 0123456789012345
+        network[line[0:3]] = (line[7:10], line[12:15])
 
     return instructions, network
 
 
-def follow_route_human():
-    instructions, network = parse_input()
+def parse_input():
+    with open(input_path(), "r") as f:
+        return parse_maps(f.read())
+
+
+def follow_route_human(instructions, network):
     steps = 0
     cur = "AAA"
     for step in cycle(instructions):
@@ -66,39 +73,79 @@ def check_graph_structure():
                     break
 
 
-def follow_route_ghost(instructions, network, start):
-    steps = 0
-    cur = start
-    for step in cycle(instructions):
-        steps += 1
-        node = network[cur]
-        if step == "L":
-            cur = node[0]
-        else:
-            cur = node[1]
-
-        if cur.endswith("Z"):
-            break
-
-    return steps
-
-
-def find_all_zs():
-    # so it seems this puzzle has been carefully engineered so that:
-    # - each A links to exactly one Z
-    # - if it takes N steps to get from the A to the Z and you continue following the instructions
-    #   then you get back to the same Z again in another N steps, 2N steps, etc.
-    # - I've checked this up to 300N which is beyond the length of the input instruction string, so
-    #   it is genuinely the case for all time even if each time round the Z->Z cycle you're starting
-    #   at a different place in the instruction sequence
-    # Therefore the desired result is the LCM of all these Ns for each A node
-    instructions, network = parse_input()
-    start_nodes = [k for k in network if k.endswith("A")]
-    return math.lcm(*(follow_route_ghost(instructions, network, n) for n in start_nodes))
+def ghost_cycle(instructions, network, start):
+    """
+    The ghost's state is its node plus its position in the instructions, so
+    sooner or later it must get back to a state it's been in before and go
+    round the same cycle forever.  Returns that cycle, and the steps at which
+    the ghost is on a Z node up to the end of its first time round the cycle.
+    """
+    def step(state):
+        node, i = state
+        return network[node][instructions[i] == "R"], (i + 1) % len(instructions)
+
+    route = find_cycle((start, 0), step)
+    z_steps = []
+    state = (start, 0)
+    for steps in range(route.start + route.length):
+        if state[0].endswith("Z"):
+            z_steps.append(steps)
+        state = step(state)
+    return route, z_steps
+
+
+def find_all_zs(instructions, network):
+    # The puzzle has been carefully engineered so that each A links to exactly
+    # one Z, and if it takes N steps to get from the A to the Z then you get
+    # back to the same Z again every N steps after that, so the answer is just
+    # the LCM of the Ns.  But rather than relying on that, work out the actual
+    # cycle each ghost ends up in, and when it's on a Z within that cycle.
+    ghosts = [ghost_cycle(instructions, network, n) for n in network if n.endswith("A")]
+
+    def on_z(ghost, steps):
+        route, z_steps = ghost
+        return route.equivalent_step(steps) in z_steps
+
+    # Until every ghost has got into its cycle, just check step by step
+    run_in = max(1, *(route.start for route, _ in ghosts))
+    for steps in range(1, run_in):
+        if all(on_z(ghost, steps) for ghost in ghosts):
+            return steps
+
+    # After that, each ghost is on a Z whenever the number of steps is
+    # congruent to one of its Z steps modulo its cycle length, so try each
+    # combination of Z steps (there's only one for the real puzzle input)
+    # and solve the congruences for the first time they all coincide
+    lengths = [route.length for route, _ in ghosts]
+    best = None
+    for z_steps in itertools.product(*([z for z in zs if z >= route.start] for route, zs in ghosts)):
+        solution = crt(z_steps, lengths)
+        if solution is not None:
+            steps, period = solution
+            if steps < run_in:
+                # move on to the first solution after the run-in
+                steps += -(-(run_in - steps) // period) * period
+            if best is None or steps < best:
+                best = steps
+
+    return best
+
+
+def solve(text: str):
+    instructions, network = parse_maps(text)
+    return follow_route_human(instructions, network), find_all_zs(instructions, network)
+
+
+def part1():
+    return follow_route_human(*parse_input())
+
+
+def part2():
+    return find_all_zs(*parse_input())
 
 
 if __name__ == "__main__":
-    print(f"Human reached ZZZ in {follow_route_human()} steps")
+    print(f"Human reached ZZZ in {part1()} steps")
     #check_graph_structure()
     #
-    print(f"Ghost reached all-Zs in {find_all_zs()} steps")
\ No newline at end of file
+    print(f"Ghost reached all-Zs in {part2()} steps")
\ No newline at end of file
@@ -1,14 +1,17 @@
+from aoc_common.parse import parse_ints, read_ints
+
+
+def parse_sequences(text: str) -> list[list[int]]:
+    return [seq.tolist() for seq in parse_ints(text, lines=True) if len(seq)]
 
 
 def parse_input():
-    with open("input", "r") as f:
-        for line in f:
-            yield [int(val) for val in line.split()]
+    return [seq.tolist() for seq in read_ints(lines=True) if len(seq)]
 
 
-def extrapolate():
+def extrapolate(sequences):
     sum_of_new_values = 0
-    for seq in parse_input():
+    for seq in sequences:
         row = seq
         diffs = []
         all_zero = False
@@ -30,9 +33,9 @@ def extrapolate():
     return sum_of_new_values
 
 
-def extrapolate_back():
+def extrapolate_back(sequences):
     sum_of_new_values = 0
-    for seq in parse_input():
+    for seq in sequences:
         # computing the diffs is the same as part 1
         row = seq
         diffs = []
@@ -55,7 +58,20 @@ def extrapolate_back():
     return sum_of_new_values
 
 
+def solve(text: str):
+    sequences = parse_sequences(text)
+    return extrapolate(sequences), extrapolate_back(sequences)
+
+
+def part1():
+    return extrapolate(parse_input())
+
+
+def part2():
+    return extrapolate_back(parse_input())
+
+
 if __name__ == "__main__":
-    print(f"Sum of extrapolated end values: {extrapolate()}")
-    print(f"Sum of extrapolated start values: {extrapolate_back()}")
+    print(f"Sum of extrapolated end values: {part1()}")
+    print(f"Sum of extrapolated start values: {part2()}")
 
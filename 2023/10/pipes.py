@@ -1,6 +1,11 @@
 from collections import namedtuple
-from typing import TypeVar
-T = TypeVar()
+from typing import Callable, TypeVar
+
+import numpy as np
+
+from aoc_common.grid import Grid
+
+T = TypeVar("T")
 
 
 class Cell(namedtuple("Cell", ["row", "col"])):
@@ -42,62 +47,53 @@ pipe_types = {
 }
 
 
-# Copied from day 3 - same principle of reading a rectangular matrix and surrounding it
-# with a border of dots
-def input_matrix() -> list[str]:
+def input_grid() -> Grid:
     """
     Read the input file, extend any short lines with dots to the length of the longest
     one to make the grid rectangular (this is not actually required for the given
     test data, as that matrix is rectangular to start with), then add a border of dots
     around the outside to avoid any strange edge effects in subsequent analysis.
     """
-    with open("input", "r") as f:
-        # Add leading and trailing dot to each line
-        grid: list[str] = [f".{line.strip()}." for line in f]
+    return Grid.from_file(pad=1, sentinel=".")
 
-    longest_line = max(len(line) for line in grid)
-    for i in range(len(grid)):
-        if len(grid[i]) < longest_line:
-            grid[i] += "." * (longest_line - len(grid[i]))
 
-    # Add "empty" (i.e. all dots) first and last lines to complete the border
-    grid.insert(0, "." * longest_line)
-    grid.append("." * longest_line)
+def parse_pipes(text: str) -> Grid:
+    return Grid.from_lines(text.splitlines(), pad=1, sentinel=".")
 
-    return grid
 
+Links = Callable[[Cell], list[Cell]]
 
-def build_graph(grid: list[str]) -> tuple[list[list[list[Cell]]], Cell]:
+
+def build_graph(grid: list[str]) -> tuple[Links, Cell]:
     """
-    Turn the input representation into a graph where each cell is a list of the coordinates of
-    cells to which it is linked
+    Turn the input representation into a graph, as a function that gives the coordinates
+    of the cells to which a cell is linked.  Only the cells on the loop are ever looked
+    at, so the links are worked out from the symbols as they're needed rather than for
+    the whole grid up front.
     :param grid: the original grid of symbols
-    :return: grid of links
+    :return: the links function, and the start point
     """
-    graph = []
-    start_point = None
-    for r, row in enumerate(grid):
-        graph_row = []
-        graph.append(graph_row)
-        for c, symbol in enumerate(row):
-            cell = Cell(r, c)
-            if symbol == "S":
-                start_point = cell
-            graph_row.append([cell + offset for offset in pipe_types.get(symbol, [])])
-
+    start_point = next((Cell(r, row.find("S")) for r, row in enumerate(grid) if "S" in row), None)
     if not start_point:
         raise Exception("No S found in grid")
 
+    def pipe_links(cell: Cell) -> list[Cell]:
+        return [cell + offset for offset in pipe_types.get(cell.of(grid), [])]
+
     # fix up the start cell - look at the four cells around it and determine which ones connect to it
-    for neighbour in [Cell(0, -1), Cell(-1, 0), Cell(0, 1), Cell(1, 0)]:
-        neighbour_links = (start_point + neighbour).of(graph)
-        if start_point in neighbour_links:
-            start_point.of(graph).append(start_point + neighbour)
+    start_links = [
+        start_point + neighbour
+        for neighbour in [Cell(0, -1), Cell(-1, 0), Cell(0, 1), Cell(1, 0)]
+        if start_point in pipe_links(start_point + neighbour)
+    ]
+
+    def links(cell: Cell) -> list[Cell]:
+        return start_links if cell == start_point else pipe_links(cell)
 
-    return graph, start_point
+    return links, start_point
 
 
-def find_loop(graph: list[list[list[Cell]]], start_point: Cell) -> list[Cell]:
+def find_loop(links: Links, start_point: Cell, max_length: int) -> list[Cell]:
     """
     Find the list of cells that make up the pipe loop from the given start point
     """
@@ -105,20 +101,18 @@ def find_loop(graph: list[list[list[Cell]]], start_point: Cell) -> list[Cell]:
     loop_nodes = [start_point]
     finished = False
     cur_point = start_point
-    #print(f"{start_point=}")
     # the last way we moved - we can traverse the loop in either direction so pick one arbitrary
     # entry point to begin
-    prev_point = start_point.of(graph)[0]
-    while guard < len(graph) * len(graph[0]):
+    prev_point = links(start_point)[0]
+    while guard < max_length:
         # possible moves from here are all the outgoing links from cur_point _except_ the one we
         # came in on
-        possible_moves = [dest for dest in cur_point.of(graph) if dest != prev_point]
+        possible_moves = [dest for dest in links(cur_point) if dest != prev_point]
         if not possible_moves:
             raise Exception(f"No legal exit from {cur_point} except by backtracking to {prev_point}")
 
         prev_point = cur_point
         cur_point = possible_moves[0]
-        #print(f"{cur_point=}")
 
         if cur_point == start_point:
             finished = True
@@ -131,43 +125,52 @@ def find_loop(graph: list[list[list[Cell]]], start_point: Cell) -> list[Cell]:
         raise Exception("We've covered the whole grid without getting back to where we started...")
 
 
-def loop_length() -> int:
-    graph, start_point = build_graph(input_matrix())
-    return len(find_loop(graph, start_point))
+def loop_length(grid: Grid) -> int:
+    links, start_point = build_graph(grid.lines(padded=True))
+    return len(find_loop(links, start_point, grid.data.size))
 
 
-def inside_area() -> int:
-    grid = input_matrix()
-    # print("\n".join(grid))
-    graph, start_point = build_graph(grid)
-    loop = set(find_loop(graph, start_point))
+def inside_area(grid: Grid) -> int:
+    links, start_point = build_graph(grid.lines(padded=True))
+    loop = np.zeros(grid.data.shape, dtype=bool)
+    loop[tuple(zip(*find_loop(links, start_point, grid.data.size)))] = True
 
     # A point is "inside" the loop if any straight line that you draw to it from a point on the edge of
     # the grid crosses the loop an odd number of times.  This is true whatever direction you draw
     # the line, so for simplicity I'll consider the line starting from the beginning of this point's
-    # row, so we can process the whole grid element-wise from the top left.
+    # row, which lets the crossings be counted for the whole grid at once by a running total along
+    # each row.
     #
     # We imagine we are walking along the bottom edge of each grid cell, which means that you "cross"
     # the loop whenever you hit any loop cell that has a link to it's neighbour in the next row
     # (i.e. it's either a |, F or 7, or the start point S if it was inferred to be one of those types)
-    inside_points = 0
-    for r, row in enumerate(graph):
-        num_crossings = 0
-        for c, neighbours in enumerate(row):
-            if Cell(r, c) in loop:
-                if Cell(r+1, c) in neighbours:
-                    num_crossings += 1
-            else:
-                # This is not a loop cell, so see whether it's inside or outside
-                if num_crossings % 2 == 1:
-                    inside_points += 1
+    links_down = np.isin(grid.data, np.frombuffer(b"|F7", dtype=np.uint8))
+    links_down[start_point] = start_point + Cell(1, 0) in links(start_point)
+    num_crossings = np.cumsum(loop & links_down, axis=1)
+    # loop cells themselves are never inside
+    return int(np.count_nonzero(~loop & (num_crossings % 2 == 1)))
 
-    return inside_points
 
-
-if __name__ == "__main__":
+def furthest_point(grid: Grid) -> int:
     # loop is always an even number of steps since to get back to where you started, for every row you
     # go up you must come back down, and for every column you step right you must step left.  So the
     # furthest point is always half the total length of the loop
-    print(f"Furthest point of the loop from start is {loop_length()//2}")
-    print(f"Number of cells inside the loop: {inside_area()}")
+    return loop_length(grid) // 2
+
+
+def solve(text: str):
+    grid = parse_pipes(text)
+    return furthest_point(grid), inside_area(grid)
+
+
+def part1() -> int:
+    return furthest_point(input_grid())
+
+
+def part2() -> int:
+    return inside_area(input_grid())
+
+
+if __name__ == "__main__":
+    print(f"Furthest point of the loop from start is {part1()}")
+    print(f"Number of cells inside the loop: {part2()}")
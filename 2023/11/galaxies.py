@@ -1,13 +1,15 @@
 from collections import namedtuple
 from bisect import bisect
+
+from aoc_common import input_path
+
 Cell = namedtuple("Cell", ["row", "col"])
 
 
-def parse_input():
+def parse_galaxies(text: str):
     # Rather than build the entire matrix, all we really care about is (a) where the galaxies are
     # and (b) which rows or columns of the original matrix are completely empty.
-    with open("input", "r") as f:
-        galaxies = [Cell(r, c) for r, row in enumerate(f) for c, col in enumerate(row) if col == "#"]
+    galaxies = [Cell(r, c) for r, row in enumerate(text.splitlines()) for c, col in enumerate(row) if col == "#"]
 
     max_col = max(col for row, col in galaxies)
     max_row = max(row for row, col in galaxies)
@@ -24,8 +26,12 @@ def parse_input():
     return galaxies, empty_rows, empty_cols
 
 
-def shortest_paths(empty_multiplier):
-    galaxies, empty_rows, empty_cols = parse_input()
+def parse_input():
+    with open(input_path(), "r") as f:
+        return parse_galaxies(f.read())
+
+
+def shortest_paths(galaxies, empty_rows, empty_cols, empty_multiplier):
 
     total_distance = 0
     for i, g_a in enumerate(galaxies):
@@ -44,6 +50,19 @@ def shortest_paths(empty_multiplier):
     return total_distance
 
 
+def solve(text: str):
+    universe = parse_galaxies(text)
+    return shortest_paths(*universe, 2), shortest_paths(*universe, 1_000_000)
+
+
+def part1():
+    return shortest_paths(*parse_input(), 2)
+
+
+def part2():
+    return shortest_paths(*parse_input(), 1_000_000)
+
+
 if __name__ == "__main__":
-    print(f"Total distance between all pairs - small universe = {shortest_paths(2)}")
-    print(f"Total distance between all pairs - biiiig universe = {shortest_paths(1_000_000)}")
+    print(f"Total distance between all pairs - small universe = {part1()}")
+    print(f"Total distance between all pairs - biiiig universe = {part2()}")
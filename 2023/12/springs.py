@@ -1,25 +1,19 @@
-from functools import cache
+import functools
+from typing import Optional
 
+from aoc_common.memo import memo
+from aoc_common.parallel import map_reduce
 
-debugging = False
 
-def dbg(*args):
-    if debugging:
-        print(*args)
+def parse_line(line, replicate=1):
+    pattern, runs_str = line.split()
+    pattern = "?".join(pattern for _ in range(replicate))
+    runs_str = ",".join(runs_str for _ in range(replicate))
+    # Add a working spring to the end of the line to avoid edge cases
+    pattern += "."
+    runs = tuple(int(x) for x in runs_str.split(","))
 
-
-def input_lines(replicate=1):
-    with open("input", "r") as f:
-        for line in f:
-            line = line.strip()
-            pattern, runs_str = line.split()
-            pattern = "?".join(pattern for _ in range(replicate))
-            runs_str = ",".join(runs_str for _ in range(replicate))
-            # Add a working spring to the end of the line to avoid edge cases
-            pattern += "."
-            runs = tuple(int(x) for x in runs_str.split(","))
-
-            yield pattern, runs
+    return pattern, runs
 
 
 calls = 0
@@ -29,7 +23,19 @@ calls = 0
 # a couple of seconds by effectively turning the recursive algorithm into a dynamic programming one.
 # Without @cache the "small world" version required 222754 total calls to count_possibilities,
 # *with* @cache that fell to 51614.  Two or more repetitions didn't complete at all without @cache.
-@cache
+#
+# Within a single line, every pattern we recurse on is one character ("#", "." or "?") followed by
+# a suffix of the original pattern, and every required_runs is a suffix of the original runs, so
+# the lengths identify them - the cache key uses those rather than holding on to every slice of
+# the pattern.  That means the cache is only valid for one line at a time, so line_possibilities
+# clears it before each line.
+#
+# That changes what the call counts mean: the original cache was shared by every line and every
+# number of repetitions, so calls it had already seen for an earlier line (or for fewer
+# repetitions) weren't counted again.  Now each line starts with an empty cache, so the counts are
+# the calls each line needs on its own, added up - bigger than the numbers above for the same
+# input, and the same whether the lines are run in one process or spread across several.
+@memo(key=lambda pattern, required_runs, cur_run=0: (len(pattern), pattern[:1], len(required_runs), cur_run))
 def count_possibilities(pattern, required_runs, cur_run=0):
     global calls
     calls += 1
@@ -63,19 +69,42 @@ def count_possibilities(pattern, required_runs, cur_run=0):
     # we've run out of pattern characters
     if required_runs:
         # but we're still looking for another run - fail
-        dbg(f"Fail - still need runs of {required_runs}")
         return 0
     else:
         # out of characters _and_ finished all runs - success
-        dbg("Success")
         return 1
 
 
-def all_possibilities(replicate=1):
-    return sum(count_possibilities(pattern, runs) for pattern, runs in input_lines(replicate))
+def line_possibilities(line, replicate=1):
+    """
+    The number of possible arrangements for one line, and the number of
+    calls to count_possibilities it took to work that out.
+    """
+    global calls
+    before = calls
+    count_possibilities.cache_clear()
+    return count_possibilities(*parse_line(line, replicate)), calls - before
+
+
+def all_possibilities(replicate=1, text: Optional[str] = None):
+    # the lines are independent of each other, so we can work them out in
+    # parallel and add up the results
+    return map_reduce(functools.partial(line_possibilities, replicate=replicate), text, initial=(0, 0))
+
+
+def solve(text: str):
+    return all_possibilities(1, text)[0], all_possibilities(5, text)[0]
+
+
+def part1():
+    return all_possibilities(1)[0]
+
+
+def part2():
+    return all_possibilities(5)[0]
 
 
 if __name__ == "__main__":
     for i in range(1, 6):
-        calls = 0
-        print(f"Total possibilities ({i}): {all_possibilities(i)} (took {calls} calls)")
+        total, calls = all_possibilities(i)
+        print(f"Total possibilities ({i}): {total} (took {calls} calls, counting each line separately)")
@@ -1,21 +1,29 @@
 from bitarray import bitarray
 
+from aoc_common import input_path
 
-def input_patterns():
+
+def parse_patterns(text: str) -> list[list[bitarray]]:
+    patterns = []
     cur_pattern = []
-    with open("input", "r") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                cur_pattern.append(bitarray(1 if c == '#' else 0 for c in line))
-            else:
-                if cur_pattern:
-                    yield cur_pattern
-                cur_pattern = []
-
-    # yield the last pattern, if any
+    for line in text.splitlines():
+        line = line.strip()
+        if line:
+            cur_pattern.append(bitarray(1 if c == '#' else 0 for c in line))
+        else:
+            if cur_pattern:
+                patterns.append(cur_pattern)
+            cur_pattern = []
+
+    # add the last pattern, if any
     if cur_pattern:
-        yield cur_pattern
+        patterns.append(cur_pattern)
+    return patterns
+
+
+def input_patterns():
+    with open(input_path(), "r") as f:
+        return parse_patterns(f.read())
 
 
 # Original list-based implementation of part 1
@@ -32,15 +40,16 @@ def find_mirror(pattern):
     return 0
 
 
-def total_reflection():
+def total_reflection(patterns, debug=False):
     total = 0
-    for i, pattern in enumerate(input_patterns()):
+    for i, pattern in enumerate(patterns):
         h_mirror = find_mirror(pattern)
         total += 100 * h_mirror
         transpose = [bitarray(c) for c in zip(*pattern)]
         v_mirror = find_mirror(transpose)
         total += v_mirror
-        print(f"Pattern {i} ({len(pattern)}x{len(pattern[0])}) mirrored at column {v_mirror}, row {h_mirror}")
+        if debug:
+            print(f"Pattern {i} ({len(pattern)}x{len(pattern[0])}) mirrored at column {v_mirror}, row {h_mirror}")
 
     return total
 
@@ -67,9 +76,9 @@ def find_smudged_mirror(pattern, smudges):
     return 0
 
 
-def total_reflections_with_smudges(smudges):
+def total_reflections_with_smudges(patterns, smudges):
     total = 0
-    for i, pattern in enumerate(input_patterns()):
+    for i, pattern in enumerate(patterns):
         h_mirror = find_smudged_mirror(pattern, smudges)
         total += 100 * h_mirror
         transpose = [bitarray(c) for c in zip(*pattern)]
@@ -79,9 +88,21 @@ def total_reflections_with_smudges(smudges):
     return total
 
 
+def solve(text: str):
+    patterns = parse_patterns(text)
+    return total_reflection(patterns), total_reflections_with_smudges(patterns, 1)
+
+
+def part1():
+    return total_reflection(input_patterns(), debug=True)
+
+
+def part2():
+    return total_reflections_with_smudges(input_patterns(), 1)
+
 
 if __name__ == "__main__":
-    print(f"Reflection summary {total_reflection()}")
-    print(f"With one smudge: {total_reflections_with_smudges(1)}")
-    print(f"With no smudges, using general algorithm: {total_reflections_with_smudges(0)}")
+    print(f"Reflection summary {part1()}")
+    print(f"With one smudge: {part2()}")
+    print(f"With no smudges, using general algorithm: {total_reflections_with_smudges(input_patterns(), 0)}")
 
@@ -1,13 +1,22 @@
 
+from aoc_common import input_path
+from aoc_common.bitgrid import BitGrid
+from aoc_common.cycles import fast_forward
+from aoc_common.grid import Cell, Direction
+
+
+def parse_platform(text: str) -> list[list[str]]:
+    # Add a blocker to the end of each row as it avoids the edge effect for part 2
+    return [[c for c in line.strip() + "#"] for line in text.splitlines()]
+
+
 def parse_input():
-    with open("input", "r") as f:
-        # Add a blocker to the end of each row as it avoids the edge effect for part 2
-        return [[c for c in line.strip() + "#"] for line in f]
+    with open(input_path(), "r") as f:
+        return parse_platform(f.read())
 
 
 # part 1
-def total_load():
-    matrix = parse_input()
+def total_load(matrix):
     rows = len(matrix)
     load = 0
     # Keep track for each column index of the number of spaces (.) above that column of the
@@ -28,126 +37,51 @@ def total_load():
     return load
 
 
-def elt_from_north(m, r, c, value=None):
-    """Return or set an element in m in normal orientation (with origin at the north west)
-    with rows top to bottom and columns from left to right"""
-    if value is None:
-        return m[r][c]
-    else:
-        m[r][c] = value
+def tilt(rocks: BitGrid, walls: BitGrid, direction: Cell) -> BitGrid:
+    """
+    Roll all the rocks as far as they'll go in the given direction.  Every
+    rock with an empty space next to it in that direction moves into it at
+    the same time, and this repeats until none of them can move any more.
+    """
+    back = -direction
+    while True:
+        empty = ~(rocks | walls)
+        moving = rocks & empty.shifted(back)
+        if not moving:
+            return rocks
+        rocks = (rocks - moving) | moving.shifted(direction)
 
 
-def elt_from_west(m, r, c, value=None):
-    """Return or set an element in m rotated 90 degrees right, so "rows" are the columns
-    of the real matrix from left to right and "columns" are the rows from bottom to top
-    (origin is the south west corner)"""
-    if value is None:
-        return m[-c-1][r]
-    else:
-        m[-c-1][r] = value
+def total_load_after(matrix, spins):
+    lines = ["".join(row) for row in matrix]
+    rocks = BitGrid.from_lines(lines, "O")
+    walls = BitGrid.from_lines(lines, "#")
 
+    def spin(rocks):
+        for direction in (Direction.NORTH, Direction.WEST, Direction.SOUTH, Direction.EAST):
+            rocks = tilt(rocks, walls, direction)
+        return rocks
 
-def elt_from_south(m, r, c, value=None):
-    """Return or set an element in m rotated 180 degrees, so rows are rows but count from
-    bottom to top and columns are columns but count from right to left (origin is in the
-    south east corner)"""
-    if value is None:
-        return m[-r-1][-c-1]
-    else:
-        m[-r-1][-c-1] = value
+    # the spin cycle means we only actually have to do as many spins as it
+    # takes to get into the cycle and once round it - the rock positions are
+    # a single int, so comparing states is cheap
+    rocks = fast_forward(rocks, spin, spins)
+    return sum((rocks.rows - i) * n for i, n in enumerate(rocks.row_counts()))
 
 
-def elt_from_east(m, r, c, value=None):
-    """Return or set an element in m rotated 90 degrees left, so "rows" are the original columns
-    from right to left and "columns" are the original rows from top to bottom (origin is the
-    north east corner)"""
-    if value is None:
-        return m[c][-r-1]
-    else:
-        m[c][-r-1] = value
+def solve(text: str):
+    matrix = parse_platform(text)
+    return total_load(matrix), total_load_after(matrix, 1_000_000_000)
 
 
-def tilt(matrix, elt, rows, columns):
-    # Keep track for each column index of the number of spaces (.) above that column of the
-    # current row until the next # or the top edge.  This is the number of places each O in
-    # the current row must be displaced north to tilt the platform that way.
-    spaces_above = [0 for _ in range(len(matrix[0]))]
-    for i in range(rows):
-        for j in range(columns):
-            c = elt(matrix, i, j)
-            if c == ".":
-                spaces_above[j] += 1
-            elif c == "#":
-                spaces_above[j] = 0
-            else:  # c == "O"
-                # Move this rock as far as it can go
-                tmp = elt(matrix, i - spaces_above[j], j)
-                elt(matrix, i - spaces_above[j], j, c)
-                elt(matrix, i, j, tmp)
+def part1():
+    return total_load(parse_input())
 
 
-def spin(matrix):
-    rows = len(matrix)
-    cols = len(matrix[0])
-    tilt(matrix, elt_from_north, rows, cols)
-    tilt(matrix, elt_from_west, cols, rows)
-    tilt(matrix, elt_from_south, rows, cols)
-    tilt(matrix, elt_from_east, cols, rows)
-
-    # After the spin is complete, calculate a "signature" for the current state
-    # of the matrix, consisting of a list of lists, one for each row, containing
-    # the number of Os stacked up against each # in that row.
-    rocks = 0
-    signature = []
-    for row in matrix:
-        row_sig = []
-        signature.append(row_sig)
-        for c in row:
-            if c == "O":
-                rocks += 1
-            elif c == "#":
-                row_sig.append(rocks)
-                rocks = 0
-
-    # freeze the list of lists as a tuple of tuples, so it can be used
-    # as a dict key
-    return tuple(tuple(row) for row in signature)
-
-
-def total_load_after(spins):
-    matrix = parse_input()
-    spin_sigs = {}
-    i = 0
-    while True:
-        i += 1
-        sig = spin(matrix)
-        if sig in spin_sigs:
-            # we have found the cycle
-            cycle_start = spin_sigs[sig]
-            cycle_length = i - cycle_start
-            print(f"State {cycle_start} repeats at {i} - cycle length {cycle_length}")
-            break
-
-        spin_sigs[sig] = i
-
-    # the matrix is now at the beginning of a cycle, how much further do we need to go?
-    # subtract the cycle start
-    spins_after_cycle_start = spins - cycle_start
-    # and take the remainder modulo cycle_length
-    overflow_spins = spins_after_cycle_start % cycle_length
-    print(f"{spins} spins made up of {cycle_start} initial spins plus "
-          f"{spins_after_cycle_start // cycle_length} complete cycles of {cycle_length} plus "
-          f"{overflow_spins} additional spins")
-
-    # Do that many more cycles
-    for _ in range(overflow_spins):
-        sig = spin(matrix)
-
-    # and calculate the load from the final signature, where each row conveniently sums to the number of
-    # O elements in that row of the matrix
-    return sum((len(matrix)-i) * sum(r) for i, r in enumerate(sig))
+def part2():
+    return total_load_after(parse_input(), 1_000_000_000)
 
 
 if __name__ == "__main__":
-    print(f"Total load tilted north: {total_load()}")
-    print(f"Total load after 1,000,000,000 cycles: {total_load_after(1_000_000_000)}")
+    print(f"Total load tilted north: {part1()}")
+    print(f"Total load after 1,000,000,000 cycles: {part2()}")
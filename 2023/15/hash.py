@@ -1,26 +1,30 @@
 import re
 from functools import reduce
 
+from aoc_common import input_path
+
+
+def parse_steps(text: str) -> list[str]:
+    return "".join(line.strip() for line in text.splitlines()).split(",")
+
 
 def parse_input():
-    with open("input", "r") as f:
-        return "".join(line.strip() for line in f).split(",")
+    with open(input_path(), "r") as f:
+        return parse_steps(f.read())
 
 
 def hash_of(seq):
     return reduce(lambda val, char: ((val + ord(char)) * 17) % 256, seq, 0)
 
 
-def calculate_hash():
-    steps = parse_input()
+def calculate_hash(steps):
     return sum(hash_of(step) for step in steps)
 
 
 step_re = re.compile(r"^([a-z]+)([=-])(\d?)$")
 
 
-def lens_power():
-    steps = parse_input()
+def lens_power(steps):
     # list of boxes, where each box is a list of (label, focal_length) tuples
     boxes: list[list[tuple[str, int]]] = [[] for _ in range(256)]
     for step in steps:
@@ -45,6 +49,19 @@ def lens_power():
     return sum((i + 1) * (j + 1) * int(fl) for i, box in enumerate(boxes) for j, (_, fl) in enumerate(box))
 
 
+def solve(text: str):
+    steps = parse_steps(text)
+    return calculate_hash(steps), lens_power(steps)
+
+
+def part1():
+    return calculate_hash(parse_input())
+
+
+def part2():
+    return lens_power(parse_input())
+
+
 if __name__ == "__main__":
-    print(f"Part 1: sum of instruction hashes = {calculate_hash()}")
-    print(f"Total lens power: {lens_power()}")
+    print(f"Part 1: sum of instruction hashes = {part1()}")
+    print(f"Total lens power: {part2()}")
@@ -1,47 +1,49 @@
 from collections import namedtuple
 
+from aoc_common import input_path
+
 # Constants for the directions
 R, D, L, U = range(4)
 
-with open("input", "r") as f:
-    LINES = [line.strip() for line in f]
-ROWS = len(LINES)
-COLS = len(LINES[0])
+
+def parse_contraption(text: str) -> list[str]:
+    return [line.strip() for line in text.splitlines()]
+
+
+def load_input():
+    with open(input_path(), "r") as f:
+        return parse_contraption(f.read())
 
 
 class Cell(namedtuple("Cell", ["row", "col"])):
     """
     Methods to return neighbour nodes in each direction (assuming the beam will be travelling
-    in that direction once it arrives at the neighbour), but only if we are not already at the
-    relevant edge of the grid.  E.g. if you try to go right from the right edge the method will
-    return None instead of a new node
+    in that direction once it arrives at the neighbour).  A cell doesn't know how big the grid
+    is, so it's up to the caller to drop any neighbours that are off the edge.
     """
     def right(self):
-        if self.col < COLS - 1:
-            return Cell(self.row, self.col+1), R
+        return Cell(self.row, self.col+1), R
 
     def down(self):
-        if self.row < ROWS - 1:
-            return Cell(self.row+1, self.col), D
+        return Cell(self.row+1, self.col), D
 
     def left(self):
-        if self.col > 0:
-            return Cell(self.row, self.col-1), L
+        return Cell(self.row, self.col-1), L
 
     def up(self):
-        if self.row > 0:
-            return Cell(self.row-1, self.col), U
+        return Cell(self.row-1, self.col), U
 
 
-def drop_none(*seq):
-    """
-    Returns a list of all the non-None positional arguments passed in.
-    If all arguments are None the resulting list will be empty.
-    """
-    return [item for item in seq if item is not None]
-
+def build_graph(lines: list[str]):
+    rows = len(lines)
+    cols = len(lines[0])
 
-def build_graph():
+    def on_grid(*seq):
+        """
+        Returns a list of the (cell, direction) positional arguments whose cells are
+        inside the grid.  If they're all off the edge the resulting list will be empty.
+        """
+        return [(cell, d) for cell, d in seq if 0 <= cell.row < rows and 0 <= cell.col < cols]
 
     # This is a graph traversal problem to find all the visited nodes from each start point.
     # The twist is that each cell in the input matrix actually corresponds to *four* nodes
@@ -51,39 +53,39 @@ def build_graph():
     # the beam goes and the direction it will be travelling when it gets there.
     graph: dict[tuple[Cell, int], list[tuple[Cell, int]]] = {}
 
-    for r, row in enumerate(LINES):
+    for r, row in enumerate(lines):
         for c, char in enumerate(row):
             cell = Cell(r, c)
             if char == ".":
                 # continue in the same direction
-                graph[(cell, R)] = drop_none(cell.right())
-                graph[(cell, D)] = drop_none(cell.down())
-                graph[(cell, L)] = drop_none(cell.left())
-                graph[(cell, U)] = drop_none(cell.up())
+                graph[(cell, R)] = on_grid(cell.right())
+                graph[(cell, D)] = on_grid(cell.down())
+                graph[(cell, L)] = on_grid(cell.left())
+                graph[(cell, U)] = on_grid(cell.up())
             elif char == "/":
                 # turn 90 degrees
-                graph[(cell, R)] = drop_none(cell.up())
-                graph[(cell, D)] = drop_none(cell.left())
-                graph[(cell, L)] = drop_none(cell.down())
-                graph[(cell, U)] = drop_none(cell.right())
+                graph[(cell, R)] = on_grid(cell.up())
+                graph[(cell, D)] = on_grid(cell.left())
+                graph[(cell, L)] = on_grid(cell.down())
+                graph[(cell, U)] = on_grid(cell.right())
             elif char == "\\":
                 # turn 90 degrees
-                graph[(cell, R)] = drop_none(cell.down())
-                graph[(cell, D)] = drop_none(cell.right())
-                graph[(cell, L)] = drop_none(cell.up())
-                graph[(cell, U)] = drop_none(cell.left())
+                graph[(cell, R)] = on_grid(cell.down())
+                graph[(cell, D)] = on_grid(cell.right())
+                graph[(cell, L)] = on_grid(cell.up())
+                graph[(cell, U)] = on_grid(cell.left())
             elif char == "-":
                 # left <-> right straight through, U/D go both L & R
-                graph[(cell, R)] = drop_none(cell.right())
-                graph[(cell, D)] = drop_none(cell.left(), cell.right())
-                graph[(cell, L)] = drop_none(cell.left())
-                graph[(cell, U)] = drop_none(cell.left(), cell.right())
+                graph[(cell, R)] = on_grid(cell.right())
+                graph[(cell, D)] = on_grid(cell.left(), cell.right())
+                graph[(cell, L)] = on_grid(cell.left())
+                graph[(cell, U)] = on_grid(cell.left(), cell.right())
             elif char == "|":
                 # up <-> down straight through, L/R go both U & D
-                graph[(cell, R)] = drop_none(cell.up(), cell.down())
-                graph[(cell, D)] = drop_none(cell.down())
-                graph[(cell, L)] = drop_none(cell.up(), cell.down())
-                graph[(cell, U)] = drop_none(cell.up())
+                graph[(cell, R)] = on_grid(cell.up(), cell.down())
+                graph[(cell, D)] = on_grid(cell.down())
+                graph[(cell, L)] = on_grid(cell.up(), cell.down())
+                graph[(cell, U)] = on_grid(cell.up())
             else:
                 raise ValueError("Unexpected character in grid")
 
@@ -107,21 +109,36 @@ def energized_tiles(graph, start_pos):
     return len(set(c for c, _ in seen_nodes))
 
 
-def max_energized(*start_pos):
-    graph = build_graph()
+def max_energized(lines, *start_pos):
+    graph = build_graph(lines)
+    rows = len(lines)
+    cols = len(lines[0])
     if not start_pos:
         # No start_pos specified, try all the possible edge nodes in their
         # respective directions
         start_pos = []
-        start_pos.extend((Cell(r, 0), R) for r in range(ROWS))
-        start_pos.extend((Cell(r, COLS-1), L) for r in range(ROWS))
-        start_pos.extend((Cell(0, c), D) for c in range(COLS))
-        start_pos.extend((Cell(ROWS-1, c), U) for c in range(COLS))
+        start_pos.extend((Cell(r, 0), R) for r in range(rows))
+        start_pos.extend((Cell(r, cols-1), L) for r in range(rows))
+        start_pos.extend((Cell(0, c), D) for c in range(cols))
+        start_pos.extend((Cell(rows-1, c), U) for c in range(cols))
 
     return max(((pos, energized_tiles(graph, pos)) for pos in start_pos), key=lambda i: i[1])
 
 
+def solve(text: str):
+    lines = parse_contraption(text)
+    return max_energized(lines, (Cell(0, 0), R))[1], max_energized(lines)[1]
+
+
+def part1():
+    return max_energized(load_input(), (Cell(0, 0), R))[1]
+
+
+def part2():
+    return max_energized(load_input())[1]
+
+
 if __name__ == "__main__":
-    print(f"Count of energized tiles from (0, 0) -> R: {max_energized((Cell(0, 0), R))[1]}")
-    max_pos, max_val = max_energized()
+    print(f"Count of energized tiles from (0, 0) -> R: {part1()}")
+    max_pos, max_val = max_energized(load_input())
     print(f"Maximum energized tiles overall is {max_val} starting from {max_pos}")
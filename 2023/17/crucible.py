@@ -1,12 +1,15 @@
-from aoc_common.heapdict import heapdict
+from aoc_common import input_path
+from aoc_common.search import shortest_paths
 from collections import namedtuple
 
 
-with open("input", "r") as f:
-    MATRIX = [[int(i) for i in line.strip()] for line in f]
+def parse_city(text: str) -> list[list[int]]:
+    return [[int(i) for i in line.strip()] for line in text.splitlines()]
 
-ROWS = len(MATRIX)
-COLS = len(MATRIX[0])
+
+def load_input():
+    with open(input_path(), "r") as f:
+        return parse_city(f.read())
 
 # Constants for axes
 EW, NS = 0, 1
@@ -18,15 +21,17 @@ class Node(namedtuple("Node", ["row", "col", "axis"])):
     the cell was approached - the next move must be on the other axis
     """
 
-    def neighbours(self, minsteps, maxsteps):
+    def neighbours(self, matrix, minsteps, maxsteps):
         """
         Generate all possible neighbour nodes of this one, along with their respective costs.
         A "neighbour" is a node between minsteps and maxsteps (inclusive) cells away from this
         one in each direction on the other axis, and the associated cost is the sum of the
         costs of all cells between this one and the neighbour.
         """
-        if self.row == ROWS-1 and self.col == COLS-1:
-            yield END, 0
+        rows = len(matrix)
+        cols = len(matrix[0])
+        if self.row == rows-1 and self.col == cols-1:
+            yield end_node(matrix), 0
             return
 
         for n in range(minsteps, maxsteps+1):
@@ -36,68 +41,87 @@ class Node(namedtuple("Node", ["row", "col", "axis"])):
                 if self.row >= n:  # Don't go beyond the edge of the matrix
                     yield (
                         Node(self.row-n, self.col, NS),
-                        sum(MATRIX[r][self.col] for r in range(self.row-n, self.row))
+                        sum(matrix[r][self.col] for r in range(self.row-n, self.row))
                     )
-                if self.row < ROWS-n:
+                if self.row < rows-n:
                     yield (
                         Node(self.row+n, self.col, NS),
-                        sum(MATRIX[r][self.col] for r in range(self.row+1, self.row+n+1))
+                        sum(matrix[r][self.col] for r in range(self.row+1, self.row+n+1))
                     )
 
             if self.axis != EW:
                 if self.col >= n:
                     yield (
                         Node(self.row, self.col-n, EW),
-                        sum(MATRIX[self.row][c] for c in range(self.col-n, self.col))
+                        sum(matrix[self.row][c] for c in range(self.col-n, self.col))
                     )
-                if self.col < COLS-n:
+                if self.col < cols-n:
                     yield (
                         Node(self.row, self.col+n, EW),
-                        sum(MATRIX[self.row][c] for c in range(self.col+1, self.col+n+1))
+                        sum(matrix[self.row][c] for c in range(self.col+1, self.col+n+1))
                     )
 
 
 # Special node representing the origin, with None for its axis so it can have neighbours both ways
 START = Node(0, 0, None)
 
-# Special END node representing the destination, that is zero cost away from both of the bottom
-# right corner nodes (one for the approach from above, one for the approach from the left)
-END = Node(ROWS, COLS, None)
+
+def end_node(matrix) -> Node:
+    # Special END node representing the destination, that is zero cost away from both of the bottom
+    # right corner nodes (one for the approach from above, one for the approach from the left)
+    return Node(len(matrix), len(matrix[0]), None)
+
+
+def cheapest_path(matrix, minsteps: int, maxsteps: int, queue: str = None):
+    """
+    A* search for the cheapest path from START to END.  ``queue`` picks the
+    open list implementation, see ``aoc_common.pq.QUEUE_TYPES`` - all the costs
+    are small ints and the heuristic is consistent, so the default "bucket"
+    queue and "radix" are both valid here.
+    """
+    end = end_node(matrix)
+
+    def heuristic(node: Node) -> int:
+        # Use manhattan distance to the bottom right cell as heuristic
+        # function (zero for END itself, which is zero cost from that
+        # cell) - this keeps the heuristic consistent, so f values
+        # never decrease along a path
+        if node == end:
+            return 0
+        return end.row - 1 - node.row + end.col - 1 - node.col
+
+    result = shortest_paths(
+        START,
+        lambda node: node.neighbours(matrix, minsteps, maxsteps),
+        goal=end,
+        weights="int",
+        heuristic=heuristic,
+        queue=queue,
+    )
+
+    if result.goal is None:
+        # we never found a path to the goal
+        raise ValueError(f"No path from {START} to {end}")
+
+    return result.costs[end]
 
 
-def cheapest_path(minsteps: int, maxsteps: int):
-    open_list = heapdict()
-    closed_list: set[Node] = set()
-    f = {}
-    g = {}
-    open_list[START] = 0
-    f[START] = 0
-    g[START] = 0
+def solve(text: str):
+    matrix = parse_city(text)
+    return cheapest_path(matrix, 1, 3), cheapest_path(matrix, 4, 10)
 
-    while len(open_list):
-        node, f_node = open_list.popitem()
-        closed_list.add(node)
 
-        if node == END:
-            # Reached the goal - return the cost of the shortest path
-            return g[node]
+def part1():
+    return cheapest_path(load_input(), 1, 3)
 
-        for child, cost in node.neighbours(minsteps, maxsteps):
-            if child in closed_list:
-                continue
-            child_g = g[node] + cost
-            if child not in g or child_g < g[child]:
-                g[child] = child_g
-                # Use manhattan distance to goal as heuristic function
-                f[child] = child_g + END.row - child.row + END.col - child.col
-                open_list[child] = f[child]
 
-    # If we reach here we never found a path to the goal
-    raise ValueError(f"No path from {START} to {END}")
+def part2():
+    return cheapest_path(load_input(), 4, 10)
 
 
 if __name__ == "__main__":
+    END = end_node(load_input())
     print(f"Cheapest path from {START} to {END} for small crucibles (1-3 steps) "
-          f"costs {cheapest_path(1, 3)}")
+          f"costs {part1()}")
     print(f"Cheapest path from {START} to {END} for ultra crucibles (4-10 steps) "
-          f"costs {cheapest_path(4, 10)}")
+          f"costs {part2()}")
@@ -1,38 +1,45 @@
 # Naïve algorithm for part 1
 
 from collections import namedtuple
+
+from aoc_common import input_path
+
 Cell = namedtuple("Cell", ["row", "col"])
 
 
-def dig_trench():
+def dig_trench(lines: list[str]):
     turtle = Cell(0, 0)
     trench = {turtle: []}
-    with open("input", "r") as f:
-        for line in f:
-            direction, dist, rgb = line.strip().split(' ', 2)
-            if direction == "U":
-                step = Cell(-1, 0)
-            elif direction == "D":
-                step = Cell(1, 0)
-            elif direction == "L":
-                step = Cell(0, -1)
-            elif direction == "R":
-                step = Cell(0, 1)
-            reverse_step = Cell(-step.row, -step.col)
-
-            for n in range(int(dist)):
-                # Record that the previous visited cell has a link of the step we just made
-                trench[turtle].append(step)
-                turtle = Cell(turtle.row + step.row, turtle.col + step.col)
-                # Record that this new cell has a link back to the one we last visited
-                this_cell = trench.setdefault(turtle, [])
-                this_cell.append(reverse_step)
+    for line in lines:
+        direction, dist, rgb = line.strip().split(' ', 2)
+        if direction == "U":
+            step = Cell(-1, 0)
+        elif direction == "D":
+            step = Cell(1, 0)
+        elif direction == "L":
+            step = Cell(0, -1)
+        elif direction == "R":
+            step = Cell(0, 1)
+        reverse_step = Cell(-step.row, -step.col)
+
+        for n in range(int(dist)):
+            # Record that the previous visited cell has a link of the step we just made
+            trench[turtle].append(step)
+            turtle = Cell(turtle.row + step.row, turtle.col + step.col)
+            # Record that this new cell has a link back to the one we last visited
+            this_cell = trench.setdefault(turtle, [])
+            this_cell.append(reverse_step)
 
     return trench
 
 
-def lagoon_size():
-    trench = dig_trench()
+def input_lines():
+    with open(input_path(), "r") as f:
+        return f.read().splitlines()
+
+
+def lagoon_size(lines):
+    trench = dig_trench(lines)
     min_col = min(c.col for c in trench)
     max_col = max(c.col for c in trench)
     min_row = min(c.row for c in trench)
@@ -51,5 +58,13 @@ def lagoon_size():
     return total_area
 
 
+def solve(text: str):
+    return (lagoon_size(text.splitlines()),)
+
+
+def part1():
+    return lagoon_size(input_lines())
+
+
 if __name__ == "__main__":
-    print(f"Total lagoon size: {lagoon_size()}")
+    print(f"Total lagoon size: {part1()}")
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from collections import namedtuple
 
+from aoc_common import input_path
+from aoc_common.cache import cached_parse
+
 
 # The overall approach is to "compile" the set of workflows into a binary decision tree.
 # Each node in the tree is either a "Leaf" node that either accepts or rejects all input,
@@ -70,36 +73,39 @@ class Workflow:
     steps: list[Step]
 
 
-def parse_input():
-    parts = []
+@cached_parse
+def parse_workflows(text: str, debug=False):
+    def log(message):
+        if debug:
+            print(message)
 
-    with open("input", "r") as f:
-        workflows = {}
-        itr = iter(f)
+    parts = []
+    workflows = {}
+    itr = iter(text.splitlines())
+    line = next(itr).strip()
+    while line:
+        name, _, rest = line.partition("{")
+        steps_text = rest[:-1].split(",")
+        steps = []
+        for s in steps_text:
+            if ":" in s:
+                expr, tgt = s.split(":", 1)
+                steps.append(Step(expr[0], expr[1], int(expr[2:]), tgt))
+            else:
+                steps.append(Step(None, None, None, s))
+        workflows[name] = Workflow(name, steps)
         line = next(itr).strip()
-        while line:
-            name, _, rest = line.partition("{")
-            steps_text = rest[:-1].split(",")
-            steps = []
-            for s in steps_text:
-                if ":" in s:
-                    expr, tgt = s.split(":", 1)
-                    steps.append(Step(expr[0], expr[1], int(expr[2:]), tgt))
-                else:
-                    steps.append(Step(None, None, None, s))
-            workflows[name] = Workflow(name, steps)
-            line = next(itr).strip()
-
-        # remaining lines are parts
-        for line in itr:
-            line = line.strip()
-            part = {}
-            for item in line[1:-1].split(","):
-                k, v = item.split("=", maxsplit=1)
-                part[k] = int(v)
-            parts.append(part)
-
-    print(f"Before simplification, {len(workflows)} workflows")
+
+    # remaining lines are parts
+    for line in itr:
+        line = line.strip()
+        part = {}
+        for item in line[1:-1].split(","):
+            k, v = item.split("=", maxsplit=1)
+            part[k] = int(v)
+        parts.append(part)
+
+    log(f"Before simplification, {len(workflows)} workflows")
     # Simplify as follows, repeatedly until nothing changes:
     state = "\n".join([repr(w) for w in workflows])
     last_state = None
@@ -115,12 +121,12 @@ def parse_input():
                 w.steps.pop(-2)
             if changed_w:
                 simplified_workflows += 1
-        print(f"Simplified {simplified_workflows} workflows")
+        log(f"Simplified {simplified_workflows} workflows")
 
         # if any workflow reduces down to a single step (e.g. xyz{R}, abc{A} or def{ghi}) then
         # replace its call site(s) with that single step
         trivial_workflows = {k: w.steps[0].target for k, w in workflows.items() if len(w.steps) == 1}
-        print(f"Removed {len(trivial_workflows)} trivial workflows")
+        log(f"Removed {len(trivial_workflows)} trivial workflows")
         for k in trivial_workflows:
             del workflows[k]
         for w in workflows.values():
@@ -138,14 +144,14 @@ def parse_input():
             if last_step_target not in ("A", "R"):
                 joined_workflows += 1
                 w.steps[-1:] = workflows[last_step_target].steps
-        print(f"Joined {joined_workflows} step lists")
+        log(f"Joined {joined_workflows} step lists")
 
         last_state = state
         state = "\n".join([repr(w) for w in workflows.values()])
 
-    print(f"After simplification, {len(workflows)} workflows")
+    log(f"After simplification, {len(workflows)} workflows")
 
-    print("Building graph")
+    log("Building graph")
 
     def node_for_target(target, parent, ranges):
         if target == "A":
@@ -209,8 +215,12 @@ def parse_input():
     return root, parts
 
 
-def total_value():
-    root, parts = parse_input()
+def parse_input():
+    with open(input_path(), "r") as f:
+        return parse_workflows(f.read(), debug=True)
+
+
+def total_value(root, parts):
     total = 0
     for part in parts:
         if root.test(part):
@@ -219,8 +229,7 @@ def total_value():
     return total
 
 
-def possible_combinations():
-    root, _ = parse_input()
+def possible_combinations(root):
     combinations = 0
 
     def acceptors(node):
@@ -237,6 +246,20 @@ def possible_combinations():
     return combinations
 
 
+def solve(text: str):
+    root, parts = parse_workflows(text)
+    return total_value(root, parts), possible_combinations(root)
+
+
+def part1():
+    return total_value(*parse_input())
+
+
+def part2():
+    root, _ = parse_input()
+    return possible_combinations(root)
+
+
 if __name__ == "__main__":
-    print(f"Total value of parts: {total_value()}")
-    print(f"Total possible combinations: {possible_combinations()}")
+    print(f"Total value of parts: {part1()}")
+    print(f"Total possible combinations: {part2()}")
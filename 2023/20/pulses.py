@@ -1,4 +1,7 @@
 from collections import namedtuple
+
+from aoc_common import input_path
+
 Signal = namedtuple("Signal", ["level", "dest"])
 
 
@@ -105,40 +108,43 @@ class BroadcastModule(Module):
         yield from self.send(level)
 
 
-MODULES: dict[str, Module] = {}
-
-
-def parse_input():
+def parse_modules(text: str) -> dict[str, Module]:
+    modules: dict[str, Module] = {}
     used_outputs = set()
-    with open("input", "r") as f:
-        for line in f:
-            line = line.strip()
-            mod, _, outputs = line.partition(" -> ")
-            outputs = outputs.split(", ")
-            used_outputs.update(outputs)
-            if mod == "broadcaster":
-                MODULES[mod] = BroadcastModule(mod, outputs)
-            elif mod.startswith("%"):
-                mod = mod[1:]
-                MODULES[mod] = FlipFlopModule(mod, outputs)
-            elif mod.startswith("&"):
-                mod = mod[1:]
-                MODULES[mod] = ConjunctionModule(mod, outputs)
+    for line in text.splitlines():
+        line = line.strip()
+        mod, _, outputs = line.partition(" -> ")
+        outputs = outputs.split(", ")
+        used_outputs.update(outputs)
+        if mod == "broadcaster":
+            modules[mod] = BroadcastModule(mod, outputs)
+        elif mod.startswith("%"):
+            mod = mod[1:]
+            modules[mod] = FlipFlopModule(mod, outputs)
+        elif mod.startswith("&"):
+            mod = mod[1:]
+            modules[mod] = ConjunctionModule(mod, outputs)
 
     # add undeclared output modules
     for module in used_outputs:
-        if module not in MODULES:
-            MODULES[module] = Module(module, [])
+        if module not in modules:
+            modules[module] = Module(module, [])
 
     # link the modules together
-    for name, module in MODULES.items():
+    for name, module in modules.items():
         for child in module.children:
-            MODULES[child].connect_from(name)
+            modules[child].connect_from(name)
+
+    # print(modules)
+    return modules
 
-    # print(MODULES)
+
+def parse_input():
+    with open(input_path(), "r") as f:
+        return parse_modules(f.read())
 
 
-def press_button():
+def press_button(modules: dict[str, Module]):
     num_low = 1
     num_high = 0
     # button sends a low to the broadcaster
@@ -146,7 +152,7 @@ def press_button():
     while len(signals) > 0:
         this_src, this_signal = signals.pop(0)
         # print(f"Handling {this_src} -> {this_signal}")
-        for new_signal in MODULES[this_signal.dest].handle_pulse(this_signal.level, this_src):
+        for new_signal in modules[this_signal.dest].handle_pulse(this_signal.level, this_src):
             if new_signal.level:
                 num_high += 1
             else:
@@ -156,20 +162,30 @@ def press_button():
     return num_high, num_low
 
 
-def push_many_times(n):
+def push_many_times(modules: dict[str, Module], n):
     total_high = 0
     total_low = 0
     for i in range(n):
-        high, low = press_button()
+        high, low = press_button(modules)
         # debugging for part 2 - dump representation of flipflop states in binary
-        # print(f"{i+1:4d} {''.join('1' if x.state else '0' for x in MODULES.values() if isinstance(x, FlipFlopModule))}")
+        # print(f"{i+1:4d} {''.join('1' if x.state else '0' for x in modules.values() if isinstance(x, FlipFlopModule))}")
         total_high += high
         total_low += low
 
+    return total_high, total_low
+
+
+def solve(text: str):
+    total_high, total_low = push_many_times(parse_modules(text), 1000)
+    return (total_high * total_low,)
+
+
+def part1():
+    # start from a fresh set of modules, all in their initial states
+    total_high, total_low = push_many_times(parse_input(), 1000)
     print(total_high, total_low)
     return total_high * total_low
 
 
 if __name__ == "__main__":
-    parse_input()
-    print(f"Pulses sent after 1000 pushes: {push_many_times(1000)}")
+    print(f"Pulses sent after 1000 pushes: {part1()}")
@@ -1,43 +1,53 @@
 from collections import namedtuple
+
+from aoc_common import input_path
+from aoc_common.bitgrid import BitGrid
+
 Cell = namedtuple("Cell", ["row", "col"])
 
 
-def parse_input():
-    with open("input", "r") as f:
-        matrix = [l.strip() for l in f]
+def parse_garden(text: str):
+    matrix = [l.strip() for l in text.splitlines()]
 
     r = ["S" in line for line in matrix].index(True)
     c = matrix[r].index("S")
     return matrix, Cell(r, c)
 
 
-def one_step_from(matrix, points):
-    new_points = set()
+def parse_input():
+    with open(input_path(), "r") as f:
+        return parse_garden(f.read())
+
+
+def n_steps(matrix, start, n, debug=False):
     rows = len(matrix)
     cols = len(matrix[0])
-    for p in points:
-        if matrix[(p.row-1) % rows][p.col % cols] != "#":
-            new_points.add(Cell(p.row-1, p.col))
-        if matrix[p.row % rows][(p.col-1) % cols] != "#":
-            new_points.add(Cell(p.row, p.col-1))
-        if matrix[(p.row+1) % rows][p.col % cols] != "#":
-            new_points.add(Cell(p.row+1, p.col))
-        if matrix[p.row % rows][(p.col+1) % cols] != "#":
-            new_points.add(Cell(p.row, p.col+1))
-
-    return new_points
-
-
-def n_steps(n):
-    matrix, start = parse_input()
-    points = {start}
+    # The garden repeats forever in every direction, so lay out enough copies
+    # of it around the one we start in that n steps can't reach the edge
+    copies = 2 * (n // min(rows, cols) + 1) + 1
+    garden = ~BitGrid.from_lines(matrix, "#").tile(copies, copies)
+    middle = copies // 2
+    points = BitGrid.from_cells(garden.rows, garden.cols, [(start.row + middle * rows, start.col + middle * cols)])
     for i in range(n):
-        points = one_step_from(matrix, points)
-        print(f"{i+1}\t{len(points)}")
+        # every point moves one step in each direction, as long as it doesn't
+        # hit a rock
+        points = points.spread() & garden
+        if debug:
+            print(f"{i+1}\t{points.count()}")
+
+    return points.count()
+
+
+def solve(text: str):
+    return (n_steps(*parse_garden(text), 64),)
+
+
+def part1():
+    return n_steps(*parse_input(), 64, debug=True)
 
 
 if __name__ == "__main__":
-    n_steps(64)
+    part1()
 
 # Part 2: so the way the input has been constructed, after 65 steps we can reach every . square
 # within the grid for which the sum of its x and y offsets from S is an odd number <= 65, except
@@ -5,10 +5,10 @@ from collections import namedtuple
 from bitarray import frozenbitarray
 from bitarray.util import zeros
 
+from aoc_common import input_path
+
 Cell = namedtuple("Cell", ["x", "y", "z"])
 ZERO_FP = frozenbitarray(zeros(100))
-BRICKS = None
-LAYERS = []
 
 
 def print_fp(footprint, caption):
@@ -42,28 +42,34 @@ class Brick:
             return ZERO_FP
 
 
-def parse_input():
-    global BRICKS
-    global LAYERS
-    BRICKS = []
-    with open("input", "r") as f:
-        for line in f:
-            ends = line.split("~", 1)
-            end_a = Cell(*(int(c) for c in ends[0].split(",")))
-            end_b = Cell(*(int(c) for c in ends[1].split(",")))
-            BRICKS.append(Brick(end_a, end_b))
-
-    # Sort BRICKS in order of their bottom Z co-ordinate, lowest first
-    BRICKS.sort(key=operator.attrgetter("bottom"))
-
-    # index BRICKS by layer - make a list of LAYERS where each layer is the list of
-    # BRICKS that have one or more of their cubes somewhere in that layer
-    LAYERS = [[] for z in range(max(b.top for b in BRICKS)+1)]
-    for b in BRICKS:
-        for layer in LAYERS[b.bottom:b.top+1]:
+def parse_bricks(text: str) -> tuple[list[Brick], list[list[Brick]]]:
+    """
+    The bricks, and the bricks in each layer, once they've all settled.
+    """
+    bricks = []
+    for line in text.splitlines():
+        ends = line.split("~", 1)
+        end_a = Cell(*(int(c) for c in ends[0].split(",")))
+        end_b = Cell(*(int(c) for c in ends[1].split(",")))
+        bricks.append(Brick(end_a, end_b))
+
+    # Sort bricks in order of their bottom Z co-ordinate, lowest first
+    bricks.sort(key=operator.attrgetter("bottom"))
+
+    # index bricks by layer - make a list of layers where each layer is the list of
+    # bricks that have one or more of their cubes somewhere in that layer
+    layers = [[] for z in range(max(b.top for b in bricks)+1)]
+    for b in bricks:
+        for layer in layers[b.bottom:b.top+1]:
             layer.append(b)
 
-    settle(BRICKS, LAYERS)
+    settle(bricks, layers)
+    return bricks, layers
+
+
+def parse_input():
+    with open(input_path(), "r") as f:
+        return parse_bricks(f.read())
 
 
 def layer_footprint(layer):
@@ -98,17 +104,17 @@ def settle(bricks, layers):
         i -= 1
 
 
-def count_disintegrable():
+def count_disintegrable(layers):
     disintegrable = 0
     # Consider each layer in turn.  For each brick B1 whose top end is in that layer, compute the
     # layer's footprint with (L+) and without (L-) the given brick.  B1 is disintegrable if there
     # is no brick B2 in the layer above whose footprint overlaps L+ but not L-
-    for i in range(len(LAYERS)-1):
-        layer_i_fp = layer_footprint(LAYERS[i])
-        for b in LAYERS[i]:
+    for i in range(len(layers)-1):
+        layer_i_fp = layer_footprint(layers[i])
+        for b in layers[i]:
             if b.top == i:
                 footprint_without_b = layer_i_fp & ~b.footprint
-                for b2 in LAYERS[i+1]:
+                for b2 in layers[i+1]:
                     if not (b2.footprint & footprint_without_b).any():
                         # we've found a brick above for which b is the sole support
                         break
@@ -118,29 +124,30 @@ def count_disintegrable():
 
     # also any blocks in the topmost layer are automatically disintegrable without disturbing
     # anything else
-    disintegrable += len(LAYERS[-1])
+    disintegrable += len(layers[-1])
 
     return disintegrable
 
 
-def sole_support(layernum, support):
+def sole_support(layers, layernum, support):
     """
     Return the number of bricks whose bottom end is at or above layernum and which are only supported
     by the given footprint in the layer below layernum (or by any of those bricks recursively)
+    :param layers: the bricks in each layer
     :param layernum: the layer number
     :param support: current supporting footprint from the next layer down
     """
-    if layernum >= len(LAYERS):
+    if layernum >= len(layers):
         return 0
 
     brick_count = 0
     # start with the full footprint of the next layer down
-    supporting_layer_fp = layer_footprint(LAYERS[layernum-1])
+    supporting_layer_fp = layer_footprint(layers[layernum-1])
     # remove the specified supporting points
     layer_without_support = supporting_layer_fp & ~support
 
     next_layer_support = ZERO_FP
-    for b in LAYERS[layernum]:
+    for b in layers[layernum]:
         if not (b.footprint & layer_without_support).any():
             # if support were removed, this brick b would be unsupported, therefore anything above it
             # that is solely supported by b would also end up unsupported when b falls
@@ -155,23 +162,39 @@ def sole_support(layernum, support):
 
     if next_layer_support.any():
         # at least one brick in this layer had its sole support from the previous footprint
-        return brick_count + sole_support(layernum + 1, next_layer_support)
+        return brick_count + sole_support(layers, layernum + 1, next_layer_support)
     else:
         # no unsupported bricks at this layer, so we know there can be no further unsupported bricks
         # in the higher layers either.
         return 0
 
 
-if __name__ == "__main__":
-    parse_input()
-
-    print(f"Number of independently disintegrable bricks: {count_disintegrable()}")
-
+def total_falling(bricks, layers):
     total_to_move = 0
-    for b in BRICKS:
-        supported_by_b = sole_support(b.bottom+1, b.footprint)
+    for b in bricks:
+        supported_by_b = sole_support(layers, b.bottom+1, b.footprint)
         total_to_move += supported_by_b
         # print(f"{supported_by_b} bricks would fall if {b} were removed")
 
+    return total_to_move
+
+
+def solve(text: str):
+    bricks, layers = parse_bricks(text)
+    return count_disintegrable(layers), total_falling(bricks, layers)
+
+
+def part1():
+    _, layers = parse_input()
+    return count_disintegrable(layers)
+
+
+def part2():
+    return total_falling(*parse_input())
+
+
+if __name__ == "__main__":
+    print(f"Number of independently disintegrable bricks: {part1()}")
+
     print("Sum over all bricks of the number of other bricks that would fall if that brick were removed:",
-          total_to_move)
\ No newline at end of file
+          part2())
\ No newline at end of file
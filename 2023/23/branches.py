@@ -1,6 +1,9 @@
 # Quick script to highlight all the junctions ("decision points") and slopes in the input
 
-with open("input", "r") as f:
+from aoc_common import input_path
+
+
+with open(input_path(), "r") as f:
     matrix = [l.strip() for l in f]
 
 print(matrix[0])  # first row has nothing to highlight
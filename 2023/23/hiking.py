@@ -1,5 +1,7 @@
 from collections import namedtuple
 
+from aoc_common import input_path
+
 # Part 1 - downhill only
 E_NBR = [".", ">"]
 S_NBR = [".", "v"]
@@ -28,9 +30,9 @@ class Cell(namedtuple("Cell", ["row", "col"])):
         return nbr
 
 
-def parse_input():
+def parse_trails(text: str, debug=False):
     """
-    Parse the input file to build a graph structure.  The nodes in the graph are:
+    Parse the input to build a graph structure.  The nodes in the graph are:
     - the start cell
     - the end cell
     - each "decision" point, i.e. any cell that is not a # and has *more than two*
@@ -39,11 +41,11 @@ def parse_input():
     The edges link nodes that are reachable by a linear path that does not pass through
     any other junctions, and the weight of each edge is the number of steps along that path.
 
+    :param debug: print out the graph in Mermaid format as well
     :return: a tuple of (list of nodes, dict of edges, start node, end node)
     """
 
-    with open("input", "r") as f:
-        matrix = [l.strip() for l in f]
+    matrix = [l.strip() for l in text.splitlines()]
 
     # special properties of the input:
     # 1. the paths are linear (albeit folded) up to a decision point - no 2x2 or larger tiles
@@ -73,9 +75,10 @@ def parse_input():
                 nodes.append(Cell(r, c))
 
     # print out the graph in Mermaid format so I can easily visualise it on draw.io
-    print("graph LR")
-    for node in nodes:
-        print(f"    {node.row}_{node.col}[{node.row}, {node.col}]")
+    if debug:
+        print("graph LR")
+        for node in nodes:
+            print(f"    {node.row}_{node.col}[{node.row}, {node.col}]")
 
     # to find the edges, start from each node and find each available outgoing direction (either a dot
     # or a downhill slope), and follow that way until we hit either an un-traversable slope (in which
@@ -115,15 +118,20 @@ def parse_input():
 
         edges[node] = out_edges
 
-    for n, out in edges.items():
-        for dest, weight in out:
-            print(f"    {n.row}_{n.col} -- {weight} --> {dest.row}_{dest.col}")
+    if debug:
+        for n, out in edges.items():
+            for dest, weight in out:
+                print(f"    {n.row}_{n.col} -- {weight} --> {dest.row}_{dest.col}")
 
     return nodes, edges, start, end
 
 
-def find_longest_path():
-    nodes, edges, start, end = parse_input()
+def parse_input():
+    with open(input_path(), "r") as f:
+        return parse_trails(f.read(), debug=True)
+
+
+def find_longest_path(nodes, edges, start, end):
 
     def find_longest(cur_weight: int, cur_path: list[Cell]) -> tuple[int, list[Cell]]:
         """
@@ -156,5 +164,15 @@ def find_longest_path():
     return find_longest(0, [start])
 
 
+def solve(text: str):
+    weight, _ = find_longest_path(*parse_trails(text))
+    return (weight,)
+
+
+def part1():
+    weight, _ = find_longest_path(*parse_input())
+    return weight
+
+
 if __name__ == "__main__":
-    print(f"max path weights: {find_longest_path()}")
+    print(f"max path weights: {find_longest_path(*parse_input())}")
@@ -30,6 +30,12 @@
 
 from collections import namedtuple
 
+from aoc_common.lazy import lazy_import
+from aoc_common.parse import parse_ints, read_ints
+
+# only needed for part 2
+sympy = lazy_import("sympy")
+
 
 class Particle(namedtuple("Particle", ["x0", "y0", "z0", "dx", "dy", "dz"])):
     def time_within_2d(self, coord_min, coord_max):
@@ -68,7 +74,7 @@ class Particle(namedtuple("Particle", ["x0", "y0", "z0", "dx", "dy", "dz"])):
     def y_at_x(self, x):
         return self.y0 + (x - self.x0) * self.dy / self.dx
 
-    def intersects_2d(self, other, coord_min, coord_max):
+    def intersects_2d(self, other, coord_min, coord_max, debug=False):
         my_box_left, my_box_right = self.box_crossing_2d(coord_min, coord_max)
         other_box_left, other_box_right = other.box_crossing_2d(coord_min, coord_max)
         if my_box_left is None or other_box_left is None:
@@ -93,28 +99,29 @@ class Particle(namedtuple("Particle", ["x0", "y0", "z0", "dx", "dy", "dz"])):
         # There's a collision if the left and right differences have opposite sign
         # (counting zero as positive)
         if (ydiff_left < 0) != (ydiff_right < 0):
-            print(f"crossing within X range {intersection_left} to {intersection_right}")
-            print(f"Y values left: me={self.y_at_x(intersection_left)} other={other.y_at_x(intersection_left)}")
-            print(f"Y values at right: me={self.y_at_x(intersection_right)} other={other.y_at_x(intersection_right)}")
+            if debug:
+                print(f"crossing within X range {intersection_left} to {intersection_right}")
+                print(f"Y values left: me={self.y_at_x(intersection_left)} other={other.y_at_x(intersection_left)}")
+                print(f"Y values at right: me={self.y_at_x(intersection_right)} other={other.y_at_x(intersection_right)}")
             return True
         return False
 
 
-def parse_input():
-    particles = []
-    with open("input", "r") as f:
-        for line in f:
-            particles.append(Particle(*(int(x) for x in line.strip().replace(',', '').replace('@', '').split())))
+# The coordinates are 15 digits, so products of them overflow int64 -
+# .tolist() gives Python ints for the arithmetic
+def parse_hailstones(text: str) -> list[Particle]:
+    return [Particle(*row) for row in parse_ints(text, columns=6).tolist()]
+
 
-    return particles
+def parse_input():
+    return [Particle(*row) for row in read_ints(columns=6).tolist()]
 
 
-def intersecting_traces(coord_min, coord_max):
-    particles = parse_input()
+def intersecting_traces(particles, coord_min, coord_max, debug=False):
     crossing = 0
     for i in range(1, len(particles)):
         for j in range(i):
-            if particles[i].intersects_2d(particles[j], coord_min, coord_max):
+            if particles[i].intersects_2d(particles[j], coord_min, coord_max, debug):
                 crossing += 1
 
     return crossing
@@ -155,17 +162,15 @@ def intersecting_traces(coord_min, coord_max):
 # and substitute back in to find z
 
 
-from sympy import solve, symbols
-
-def rock():
-    particles = parse_input()
-    x, y, dx, dy = symbols("x y dx dy")
+def rock(particles, debug=False):
+    x, y, dx, dy = sympy.symbols("x y dx dy")
     equations = []
     for p1, p2 in ((particles[2*i], particles[2*i+1]) for i in range(6)):
         equations.append((p1.y0 - p2.y0) + (x-p1.x0) * (p1.dy-dy)/(p1.dx-dx) - (x-p2.x0) * (p2.dy-dy)/(p2.dx-dx))
 
-    print(f"Solving {equations}")
-    solutions = solve(equations, [x, dx, dy], dict=True)
+    if debug:
+        print(f"Solving {equations}")
+    solutions = sympy.solve(equations, [x, dx, dy], dict=True)
     if not(solutions):
         raise ValueError("No solution found for x, dx and dy")
 
@@ -178,17 +183,34 @@ def rock():
     yr = p0.y0 + (xr-p0.x0) * (p0.dy-dyr) / (p0.dx-dxr)
 
     # Now for z
-    dz = symbols("dz")
+    dz = sympy.symbols("dz")
     equation = p0.z0 + (xr-p0.x0) * (p0.dz-dz)/(p0.dx-dxr) - p1.z0 - (xr-p1.x0) * (p1.dz-dz)/(p1.dx-dxr)
-    solutions = solve(equation, dz, dict=True)
+    solutions = sympy.solve(equation, dz, dict=True)
     dzr = solutions[0][dz]
     zr = p0.z0 + (xr-p0.x0) * (p0.dz-dzr) / (p0.dx-dxr)
     return Particle(xr, yr, zr, dxr, dyr, dzr)
 
 
+def rock_throw(rock_particle):
+    return int(rock_particle.x0 + rock_particle.y0 + rock_particle.z0)
+
+
+def solve(text: str):
+    particles = parse_hailstones(text)
+    return intersecting_traces(particles, 200000000000000, 400000000000000), rock_throw(rock(particles))
+
+
+def part1():
+    return intersecting_traces(parse_input(), 200000000000000, 400000000000000, debug=True)
+
+
+def part2():
+    rock_particle = rock(parse_input(), debug=True)
+    print(f"Rock is {rock_particle}")
+    return rock_throw(rock_particle)
+
+
 if __name__ == "__main__":
-    print(f"{intersecting_traces(200000000000000, 400000000000000)} intersecting traces")
+    print(f"{part1()} intersecting traces")
     # print(f"{intersecting_traces(7, 27)} intersecting traces")
-    rock_particle = rock()
-    print(f"Rock is {rock_particle}")
-    print(f"part 2 answer = {rock_particle.x0 + rock_particle.y0 + rock_particle.z0}")
\ No newline at end of file
+    print(f"part 2 answer = {part2()}")
\ No newline at end of file
@@ -1,6 +1,7 @@
+from aoc_common import input_path
 
 
-with open("input", "r") as f:
+with open(input_path(), "r") as f:
     print("graph {")
     for line in f:
         line = line.strip()
@@ -1,30 +1,24 @@
 from collections import Counter
 
+from aoc_common.parse import parse_ints, read_ints
 
-def load_lists():
-    # There's probably a more pythonic way to do this with zip etc. but
-    # given that I need everything as lists I can sort rather than immutable
-    # tuples I'll go with this
-    with open("input", "r") as f:
-        list1 = []
-        list2 = []
-        for line in f:
-            v1, v2 = (int(v) for v in line.split())
-            list1.append(v1)
-            list2.append(v2)
+
+def parse_lists(text: str):
+    # Both columns at once, as lists
+    list1, list2 = parse_ints(text, columns=2).T.tolist()
     return list1, list2
 
 
-def min_distance():
-    list1, list2 = load_lists()
-    list1.sort()
-    list2.sort()
+def load_lists():
+    list1, list2 = read_ints(columns=2).T.tolist()
+    return list1, list2
+
 
-    print(f"Min distance: {sum(abs(v1-v2) for v1, v2 in zip(list1, list2))}")
+def min_distance(list1, list2):
+    return sum(abs(v1-v2) for v1, v2 in zip(sorted(list1), sorted(list2)))
 
 
-def similarity():
-    list1, list2 = load_lists()
+def similarity(list1, list2):
     # Counter gives you a mapping from value to number-of-occurrences
     count1 = Counter(list1)
     count2 = Counter(list2)
@@ -32,9 +26,22 @@ def similarity():
     # The similarity score for each _distinct_ entry N in list 1 is N times the
     # count of Ns in list 2, then we need to multiply by the number of times that
     # number was seen in list 1.
-    print(f"Similarity: {sum(n1 * cnt1 * count2[n1] for n1, cnt1 in count1.items())}")
+    return sum(n1 * cnt1 * count2[n1] for n1, cnt1 in count1.items())
+
+
+def solve(text: str):
+    lists = parse_lists(text)
+    return min_distance(*lists), similarity(*lists)
+
+
+def part1():
+    return min_distance(*load_lists())
+
+
+def part2():
+    return similarity(*load_lists())
 
 
 if __name__ == "__main__":
-    min_distance()
-    similarity()
+    print(f"Min distance: {part1()}")
+    print(f"Similarity: {part2()}")
@@ -1,10 +1,7 @@
 from itertools import pairwise, compress
-from typing import Iterable
+from typing import Iterable, Optional
 
-
-def load_reports() -> list[list[int]]:
-    with open("input", "r") as f:
-        return [[int(v) for v in line.split()] for line in f]
+from aoc_common.parallel import map_reduce
 
 
 def is_safe(report: Iterable[int]) -> bool:
@@ -21,32 +18,41 @@ def is_safe(report: Iterable[int]) -> bool:
     return False
 
 
-def count_safe_simple():
-    reports = load_reports()
-    num_safe = 0
+def report_safety(line: str) -> tuple[int, int]:
+    """
+    Whether the report on this line is safe without and with the problem
+    dampener, as 1 or 0 for each so they can be added up.
+    """
+    report = [int(v) for v in line.split()]
+    if is_safe(report):
+        return 1, 1
+
+    indexes = range(len(report))
+    # This is kind of brute force, I'm literally checking whether any of the
+    # leave-one-out subsequences are safe
+    return 0, int(any(is_safe(compress(report, (j != i for j in indexes))) for i in indexes))
+
+
+def count_safe(text: Optional[str] = None) -> tuple[int, int]:
+    # the reports are all independent, so check them in parallel
+    return map_reduce(report_safety, text, initial=(0, 0))
 
-    for report in reports:
-        if is_safe(report):
-            num_safe += 1
 
-    print(f"Safe reports (simple): {num_safe}")
+def solve(text: str):
+    return count_safe(text)
 
 
-def count_safe_damped():
-    reports = load_reports()
-    num_safe = 0
+def part1() -> int:
+    simple, _ = count_safe()
+    return simple
 
-    for report in reports:
-        indexes = range(len(report))
-        # This is kind of brute force, I'm literally checking whether the original
-        # report is safe, or failing that whether any of the leave-one-out
-        # subsequences are safe
-        if is_safe(report) or any(is_safe(compress(report, (j != i for j in indexes))) for i in indexes):
-            num_safe += 1
 
-    print(f"Safe reports (damped): {num_safe}")
+def part2() -> int:
+    _, damped = count_safe()
+    return damped
 
 
 if __name__ == "__main__":
-    count_safe_simple()
-    count_safe_damped()
+    simple, damped = count_safe()
+    print(f"Safe reports (simple): {simple}")
+    print(f"Safe reports (damped): {damped}")
@@ -1,38 +1,50 @@
 import re
 
+from aoc_common.io import Buffer, mapped
 
-def all_muls():
-    with open("input", "r") as f:
-        program = f.read()
 
-    pattern = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)")
-    total = sum(int(m[1]) * int(m[2]) for m in pattern.finditer(program))
-    print(f"All mul instructions: {total}")
+def all_muls(program: Buffer):
+    # scan the bytes directly (the mapped file, for the parts) - the groups
+    # come out as bytes, which int() is happy to take
+    pattern = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)")
+    return sum(int(m[1]) * int(m[2]) for m in pattern.finditer(program))
 
 
-def enabled_only():
-    with open("input", "r") as f:
-        program = f.read()
-
-    pattern = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)|(do)(n't)?\(\)")
+def enabled_only(program: Buffer):
+    pattern = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|(do)(n't)?\(\)")
     total = 0
     enabled = True
     for m in pattern.finditer(program):
-        # we can find the three cases by structural pattern matching on the
-        # groups tuple
+        # we can find the three cases by structural pattern matching on
+        # the groups tuple
         match m.groups():
-            case (None, None, "do", None):
+            case (None, None, b"do", None):
                 enabled = True
-            case (None, None, "do", "n't"):
+            case (None, None, b"do", b"n't"):
                 enabled = False
             case (x, y, None, None):
                 # only the first and second groups matched -> mul()
                 if enabled:
                     total += int(x) * int(y)
 
-    print(f"Enabled muls only: {total}")
+    return total
+
+
+def solve(text: str):
+    program = text.encode()
+    return all_muls(program), enabled_only(program)
+
+
+def part1():
+    with mapped() as program:
+        return all_muls(program)
+
+
+def part2():
+    with mapped() as program:
+        return enabled_only(program)
 
 
 if __name__ == "__main__":
-    all_muls()
-    enabled_only()
+    print(f"All mul instructions: {part1()}")
+    print(f"Enabled muls only: {part2()}")
@@ -1,68 +1,74 @@
+import numpy as np
+
+from aoc_common.grid import Cell, Direction, Grid
+
+
 def load_data():
-    with open("input", "r") as f:
-        return [l.strip() for l in f]
+    # A border of three dots means every cell up to three steps from the
+    # grid can be looked at, so no word has to be checked against the edges
+    return Grid.from_file(pad=3, sentinel=".")
+
+
+def parse_wordsearch(text: str) -> Grid:
+    return Grid.from_lines(text.splitlines(), pad=3, sentinel=".")
 
 
-# (row, column) differences that move you one step in each of the eight
-# directions E, SE, S, SW, W, NW, N, NE
-DIRECTIONS = [(0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1)]
 XMAS = "XMAS"
 
 
-def num_xmas_from(lines: list[str], r: int, c: int) -> int:
+def at(grid: Grid, offset: Cell) -> np.ndarray:
     """
-    Count the number of "XMAS" words that start from the given row/column location
-    radiating in any of the eight directions.
+    For every cell of the grid, the character ``offset`` away from it.
     """
-    if lines[r][c] != "X":
-        return 0
-
-    num = 0
-    for dr, dc in DIRECTIONS:
-        if r + (3 * dr) not in range(len(lines)) or c + (3 * dc) not in range(len(lines[0])):
-            continue
+    return grid.shift(-offset)
 
-        if any(lines[r + n * dr][c + n * dc] != XMAS[n] for n in range(1, 4)):
-            continue
 
-        num += 1
+def num_xmas(grid: Grid) -> int:
+    """
+    Count the number of "XMAS" words radiating from every X in any of the
+    eight directions, one whole-grid comparison per letter and direction.
+    """
+    num = 0
+    for d in Direction.DIAGONAL:
+        found = grid.mask("X")
+        for n in range(1, 4):
+            found &= at(grid, n * d) == ord(XMAS[n])
+        num += np.count_nonzero(found)
 
     return num
 
 
-MS_SM = ("MS", "SM")
+def is_ms_pair(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # the two ends of a MAS, one way round or the other
+    return ((a == ord("M")) & (b == ord("S"))) | ((a == ord("S")) & (b == ord("M")))
 
 
-def num_crossing_mas_from(lines: list[str], r: int, c: int) -> int:
+def num_crossing_mas(grid: Grid) -> int:
     """
-    Determine whether the given location is the A at the centre of two crossing "MAS"
+    Count the number of As that are at the centre of two crossing "MAS"
     words.
-
-    :return: 1 if it is, 0 if not
     """
-    if lines[r][c] != "A":
-        return 0
-
-    if r < 1 or c < 1 or r > len(lines) - 2 or c > len(lines[0]) - 2:
-        return 0
+    crossing = (
+        grid.mask("A")
+        & is_ms_pair(at(grid, Direction.NW), at(grid, Direction.SE))
+        & is_ms_pair(at(grid, Direction.SW), at(grid, Direction.NE))
+    )
+    return np.count_nonzero(crossing)
 
-    if (lines[r - 1][c - 1] + lines[r + 1][c + 1]) in MS_SM and (lines[r + 1][c - 1] + lines[r - 1][c + 1]) in MS_SM:
-        return 1
 
-    return 0
+def solve(text: str):
+    grid = parse_wordsearch(text)
+    return num_xmas(grid), num_crossing_mas(grid)
 
 
-def find_words():
-    lines = load_data()
-    rows = len(lines)
-    cols = len(lines[0])
+def part1():
+    return num_xmas(load_data())
 
-    total_xmas = sum(num_xmas_from(lines, r, c) for r in range(rows) for c in range(cols))
-    print(f"Total number of XMAS words: {total_xmas}")
 
-    total_crossing = sum(num_crossing_mas_from(lines, r, c) for r in range(rows) for c in range(cols))
-    print(f"Total crossing MAS: {total_crossing}")
+def part2():
+    return num_crossing_mas(load_data())
 
 
 if __name__ == "__main__":
-    find_words()
+    print(f"Total number of XMAS words: {part1()}")
+    print(f"Total crossing MAS: {part2()}")
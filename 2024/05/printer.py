@@ -1,23 +1,32 @@
 from itertools import combinations
 
+from aoc_common import input_path
+from aoc_common.cache import cached_parse
 
-def load_data():
-    with open("input", "r") as f:
-        rules = set()
-        for line in f:
-            line = line.strip()
-            if line == "":
-                break
-            rules.add(tuple(line.split("|")))
-
-        orderings = []
-        for line in f:
-            line = line.strip()
-            orderings.append(line.split(","))
+
+@cached_parse
+def parse_rules(text: str):
+    lines = iter(text.splitlines())
+    rules = set()
+    for line in lines:
+        line = line.strip()
+        if line == "":
+            break
+        rules.add(tuple(line.split("|")))
+
+    orderings = []
+    for line in lines:
+        line = line.strip()
+        orderings.append(line.split(","))
 
     return rules, orderings
 
 
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_rules(f.read())
+
+
 def is_valid(rules, ordering):
     for i in range(1, len(ordering)):
         if any((ordering[i], x) in rules for x in ordering[:i]):
@@ -26,18 +35,16 @@ def is_valid(rules, ordering):
     return True
 
 
-def valid_orderings():
-    rules, orderings = load_data()
+def valid_orderings(rules, orderings):
     total_middles = 0
     for ordering in orderings:
         if is_valid(rules, ordering):
             total_middles += int(ordering[len(ordering) // 2])
 
-    print(f"Total of middle values: {total_middles}")
+    return total_middles
 
 
-def fix_invalid():
-    rules, orderings = load_data()
+def fix_invalid(rules, orderings):
     total_middles = 0
     for ordering in orderings:
         if not is_valid(rules, ordering):
@@ -49,7 +56,7 @@ def fix_invalid():
 
             total_middles += int(ordering[len(ordering) // 2])
 
-    print(f"Total middle values of invalid-but-fixed orderings: {total_middles}")
+    return total_middles
 
 
 def are_rules_total():
@@ -70,7 +77,21 @@ def are_rules_total():
     )
 
 
+def solve(text: str):
+    # fix_invalid sorts the orderings in place, so it has to go second
+    rules, orderings = parse_rules(text)
+    return valid_orderings(rules, orderings), fix_invalid(rules, orderings)
+
+
+def part1():
+    return valid_orderings(*load_data())
+
+
+def part2():
+    return fix_invalid(*load_data())
+
+
 if __name__ == "__main__":
     are_rules_total()
-    valid_orderings()
-    fix_invalid()
+    print(f"Total of middle values: {part1()}")
+    print(f"Total middle values of invalid-but-fixed orderings: {part2()}")
@@ -1,5 +1,7 @@
 import numpy as np
 
+from aoc_common import input_path
+
 # We will represent the state of each grid square by a bitmap representing
 # which directions the guard has ever been facing on that square.  I've chosen
 # the mask so that turning right from any direction is a right rotation of the
@@ -13,29 +15,33 @@ NORTH = 1
 BLOCKED = -1
 
 
-def load_data():
+def parse_lab(text: str):
     start_row = -1
     start_col = -1
     grid = []
-    with open("input", "r") as f:
-        for nrow, line in enumerate(f):
-            line = line.strip()
-            row = []
-            for ncol, ch in enumerate(line):
-                match ch:
-                    case "#":
-                        row.append(BLOCKED)
-                    case "^":
-                        start_row, start_col = nrow, ncol
-                        # This square has already been visited facing north
-                        row.append(NORTH)
-                    case _:
-                        row.append(0)
-
-            grid.append(row)
+    for nrow, line in enumerate(text.splitlines()):
+        line = line.strip()
+        row = []
+        for ncol, ch in enumerate(line):
+            match ch:
+                case "#":
+                    row.append(BLOCKED)
+                case "^":
+                    start_row, start_col = nrow, ncol
+                    # This square has already been visited facing north
+                    row.append(NORTH)
+                case _:
+                    row.append(0)
+
+        grid.append(row)
     return np.array(grid, np.int8), start_row, start_col
 
 
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_lab(f.read())
+
+
 def turn_right(dir: int) -> int:
     """
     Turn 90 degrees right from the given direction.
@@ -72,14 +78,16 @@ def walk(grid: np.ndarray, test_loop: bool, row, col, direction):
     :param test_loop: if true, at every point where the walk proceeds ahead
     into a previously unvisited cell, make a clone of the grid with that
     unvisited cell replaced by an obstruction and recursively walk that clone
-    to determine whether adding an obstruction there would cause a loop.  Print
-    the total number of such cells at the end.
+    to determine whether adding an obstruction there would cause a loop, and
+    count such cells.
     :param row: the row position at which the walk starts
     :param col: the column position at which the walk starts
     :param direction: the direction the guard is facing at the start of the walk
     :return: True if the walk results in a loop (arriving at a cell that has
     already been visited while travelling in the current direction), False if it
-    ends by walking off the side of the grid.
+    ends by walking off the side of the grid.  If test_loop is true, the walk
+    must end off the side of the grid, and the return value is instead the
+    number of cells where an obstruction would have caused a loop.
     """
     valid_rows = range(grid.shape[0])
     valid_cols = range(grid.shape[1])
@@ -116,15 +124,13 @@ def walk(grid: np.ndarray, test_loop: bool, row, col, direction):
             row, col = new_row, new_col
 
     if test_loop:
-        print(f"Number of obstructions that would create a loop: {loop_obstructions}")
+        return loop_obstructions
 
     return False
 
 
-def covered_area():
-    grid, start_row, start_col = load_data()
-
-    walk(grid, True, start_row, start_col, NORTH)
+def covered_area(grid, start_row, start_col):
+    loop_obstructions = walk(grid, True, start_row, start_col, NORTH)
 
     # At the end of the walk, visited cells are those whose value is not 0 (empty)
     # or -1 (obstructed)
@@ -133,8 +139,19 @@ def covered_area():
     # debug - print the grid with obstructions as # and visited cells as X
     # print("\n".join("".join("X" if cell > 0 else "#" if cell < 0 else " " for cell in row) for row in grid))
 
+    return num_visited, loop_obstructions
+
+
+def solve(text: str):
+    return covered_area(*parse_lab(text))
+
+
+def main():
+    num_visited, loop_obstructions = covered_area(*load_data())
+    print(f"Number of obstructions that would create a loop: {loop_obstructions}")
     print(f"Part 1: number of cells visited {num_visited}")
+    return num_visited, loop_obstructions
 
 
 if __name__ == "__main__":
-    covered_area()
+    main()
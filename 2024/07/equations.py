@@ -1,54 +1,55 @@
+import functools
 import math
 import operator
 import time
 from collections import namedtuple
-from typing import Callable
+from typing import Callable, Optional
+
+from aoc_common.parallel import map_reduce
 
 Problem: type[tuple[int, list[int]]] = namedtuple("Problem", ["result", "numbers"])
 
 
-def load_data() -> list[Problem]:
-    with open("input", "r") as f:
-        problems = []
-        for line in f:
-            result, colon, args = line.strip().partition(": ")
-            problems.append(Problem(int(result), [int(n.strip()) for n in args.split()]))
-
-    return problems
-
-
-def solvable(*operators: Callable[[int, int], int]):
-    problems = load_data()
-    total_calibration = 0
-
-    for problem in problems:
-        # candidate totals from the last iteration (initially just the first number
-        # itself, since there's been no operations yet)
-        candidates = [problem.numbers[0]]
-        for n in problem.numbers[1:]:
-            # for each number, build a new candidates list by applying all the
-            # available operators to every candidate from the previous iteration,
-            # but prune any answers that exceed the final expected result (since
-            # all the operators we're using have the property that op(a, b) is
-            # guaranteed to be greater than both a and b)
-            new_candidates = []
-            for c in candidates:
-                for op in operators:
-                    val = op(c, n)
-                    if val <= problem.result:
-                        new_candidates.append(val)
-            candidates = new_candidates
-            if not candidates:
-                # this equation is not satisfiable
-                break  # skips the else below
-        else:
-            # if we get here then there was at least one candidate answer
-            # that is <= problem.result, we need to check that there's one
-            # that is _exactly_ equal
-            if any(c == problem.result for c in candidates):
-                total_calibration += problem.result
-
-    print(f"Total value of satisfiable equations: {total_calibration}")
+def parse_problem(line: str) -> Problem:
+    result, colon, args = line.strip().partition(": ")
+    return Problem(int(result), [int(n.strip()) for n in args.split()])
+
+
+def calibration_value(line: str, operators: tuple[Callable[[int, int], int], ...]) -> int:
+    """
+    The result of the equation on this line if it can be satisfied using the
+    given operators, otherwise zero.
+    """
+    problem = parse_problem(line)
+    # candidate totals from the last iteration (initially just the first number
+    # itself, since there's been no operations yet)
+    candidates = [problem.numbers[0]]
+    for n in problem.numbers[1:]:
+        # for each number, build a new candidates list by applying all the
+        # available operators to every candidate from the previous iteration,
+        # but prune any answers that exceed the final expected result (since
+        # all the operators we're using have the property that op(a, b) is
+        # guaranteed to be greater than both a and b)
+        new_candidates = []
+        for c in candidates:
+            for op in operators:
+                val = op(c, n)
+                if val <= problem.result:
+                    new_candidates.append(val)
+        candidates = new_candidates
+        if not candidates:
+            # this equation is not satisfiable
+            return 0
+
+    # if we get here then there was at least one candidate answer that is
+    # <= problem.result, we need to check that there's one that is _exactly_
+    # equal
+    return problem.result if any(c == problem.result for c in candidates) else 0
+
+
+def solvable(*operators: Callable[[int, int], int], text: Optional[str] = None) -> int:
+    # the equations are independent of each other, so check them in parallel
+    return map_reduce(functools.partial(calibration_value, operators=operators), text, initial=0)
 
 
 # The brute-force implementation of cat_digits, just turning both numbers
@@ -65,10 +66,22 @@ def cat_digits_with_log(a: int, b: int) -> int:
     return a * (10 ** (math.floor(math.log10(b)) + 1)) + b
 
 
+def solve(text: str):
+    return solvable(operator.add, operator.mul, text=text), solvable(operator.add, operator.mul, cat_digits, text=text)
+
+
+def part1():
+    return solvable(operator.add, operator.mul)
+
+
+def part2():
+    return solvable(operator.add, operator.mul, cat_digits)
+
+
 if __name__ == "__main__":
     print("Part 1")
-    solvable(operator.add, operator.mul)
+    print(f"Total value of satisfiable equations: {part1()}")
     print("Part 2")
     start = time.perf_counter()
-    solvable(operator.add, operator.mul, cat_digits)
+    print(f"Total value of satisfiable equations: {part2()}")
     print(f"{time.perf_counter() - start} seconds")
@@ -18,20 +18,26 @@ import time
 from collections import namedtuple
 from typing import Callable
 
+from aoc_common import input_path
+
 Problem: type[tuple[int, int, list[int]]] = namedtuple("Problem", ["total", "initial", "numbers"])
 
 
-def load_data() -> list[Problem]:
-    with open("input", "r") as f:
-        problems = []
-        for line in f:
-            result, colon, args = line.strip().partition(": ")
-            split_args = [int(n.strip()) for n in args.split()]
-            problems.append(Problem(int(result), split_args.pop(0), list(reversed(split_args))))
+def parse_problems(text: str) -> list[Problem]:
+    problems = []
+    for line in text.splitlines():
+        result, colon, args = line.strip().partition(": ")
+        split_args = [int(n.strip()) for n in args.split()]
+        problems.append(Problem(int(result), split_args.pop(0), list(reversed(split_args))))
 
     return problems
 
 
+def load_data() -> list[Problem]:
+    with open(input_path(), "r") as f:
+        return parse_problems(f.read())
+
+
 def op_add(cur_total: int, number: int) -> tuple[bool, int]:
     return number <= cur_total, cur_total - number
 
@@ -52,8 +58,7 @@ def op_concat(cur_total: int, number: int) -> tuple[bool, int]:
     return True, cur_total
 
 
-def solvable(*operators: Callable[[int, int], tuple[bool, int]]):
-    problems = load_data()
+def solvable(problems: list[Problem], *operators: Callable[[int, int], tuple[bool, int]]):
     total_calibration = 0
 
     for problem in problems:
@@ -83,13 +88,26 @@ def solvable(*operators: Callable[[int, int], tuple[bool, int]]):
             if any(c == problem.initial for c in candidates):
                 total_calibration += problem.total
 
-    print(f"Total value of satisfiable equations: {total_calibration}")
+    return total_calibration
 
 
-if __name__ == "__main__":
+def solve(text: str):
+    problems = parse_problems(text)
+    return solvable(problems, op_add, op_mult), solvable(problems, op_add, op_mult, op_concat)
+
+
+def main():
+    problems = load_data()
     print("Part 1")
-    solvable(op_add, op_mult)
+    part1 = solvable(problems, op_add, op_mult)
+    print(f"Total value of satisfiable equations: {part1}")
     print("Part 2")
     start = time.perf_counter()
-    solvable(op_add, op_mult, op_concat)
+    part2 = solvable(problems, op_add, op_mult, op_concat)
+    print(f"Total value of satisfiable equations: {part2}")
     print(f"{time.perf_counter() - start} seconds")
+    return part1, part2
+
+
+if __name__ == "__main__":
+    main()
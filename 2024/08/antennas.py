@@ -3,6 +3,7 @@ from collections import namedtuple, defaultdict
 from itertools import combinations
 
 import numpy as np
+from aoc_common import input_path
 from aoc_common.grid import Cell
 
 
@@ -11,9 +12,8 @@ from aoc_common.grid import Cell
 ANTENNA_TYPES = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
 
 
-def load_data():
-    with open("input", "r") as f:
-        lines = [l.strip() for l in f]
+def parse_antennas(text: str):
+    lines = [l.strip() for l in text.splitlines()]
 
     antennas = defaultdict(set)
 
@@ -26,8 +26,12 @@ def load_data():
     return antennas, nodes
 
 
-def anti_nodes_simple():
-    antennas, nodes = load_data()
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_antennas(f.read())
+
+
+def anti_nodes_simple(antennas, nodes):
     valid_rows = range(nodes.shape[0])
     valid_cols = range(nodes.shape[1])
 
@@ -39,11 +43,10 @@ def anti_nodes_simple():
                 if node.row in valid_rows and node.col in valid_cols:
                     nodes[node] |= freq
 
-    print(f"Number of anti-nodes: {np.count_nonzero(nodes)}")
+    return np.count_nonzero(nodes)
 
 
-def anti_nodes_all():
-    antennas, nodes = load_data()
+def anti_nodes_all(antennas, nodes):
     valid_rows = range(nodes.shape[0])
     valid_cols = range(nodes.shape[1])
 
@@ -77,9 +80,23 @@ def anti_nodes_all():
                         keep_going = True
                         nodes[node] |= freq
 
-    print(f"Number of anti-nodes with harmonics: {np.count_nonzero(nodes)}")
+    return np.count_nonzero(nodes)
+
+
+def solve(text: str):
+    # the antinodes are marked on the nodes array, so each part needs its own
+    antennas, nodes = parse_antennas(text)
+    return anti_nodes_simple(antennas, nodes.copy()), anti_nodes_all(antennas, nodes)
+
+
+def part1():
+    return anti_nodes_simple(*load_data())
+
+
+def part2():
+    return anti_nodes_all(*load_data())
 
 
 if __name__ == "__main__":
-    anti_nodes_simple()
-    anti_nodes_all()
\ No newline at end of file
+    print(f"Number of anti-nodes: {part1()}")
+    print(f"Number of anti-nodes with harmonics: {part2()}")
\ No newline at end of file
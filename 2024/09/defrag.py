@@ -2,6 +2,8 @@ from dataclasses import dataclass
 
 from sortedcontainers import SortedKeyList
 
+from aoc_common import input_path
+
 
 @dataclass(slots=True)
 class Chunk:
@@ -58,9 +60,8 @@ class Chunk:
         return new_chunk
 
 
-def load_data() -> tuple[Chunk, Chunk]:
-    with open("input", "r") as f:
-        diskmap = f.read().strip()
+def parse_diskmap(text: str) -> tuple[Chunk, Chunk]:
+    diskmap = text.strip()
 
     head = None
     cur = None
@@ -76,6 +77,11 @@ def load_data() -> tuple[Chunk, Chunk]:
     return head, cur
 
 
+def load_data() -> tuple[Chunk, Chunk]:
+    with open(input_path(), "r") as f:
+        return parse_diskmap(f.read())
+
+
 def print_chain(head):
     print("--------")
     while True:
@@ -103,9 +109,7 @@ def checksum(head: Chunk) -> int:
     return checksum
 
 
-def defragment():
-    orig_head, tail = load_data()
-
+def defragment(orig_head: Chunk, tail: Chunk):
     head = orig_head
 
     # Find the first gap
@@ -135,16 +139,14 @@ def defragment():
 
     # We've met in the middle so list is fully defragmented
 
-    print(f"Disk checksum - packing all spaces: {checksum(orig_head)}")
+    return checksum(orig_head)
 
 
 def gap_key(gap: Chunk):
     return gap.start
 
 
-def move_files():
-    orig_head, tail = load_data()
-
+def move_files(orig_head: Chunk, tail: Chunk):
     head = orig_head
     files: list[Chunk] = []
     gaps = SortedKeyList(key=gap_key)
@@ -204,9 +206,22 @@ def move_files():
                     new_gap.prev.next = None
 
     # all files processed, calculate the checksum
-    print(f"Disk checksum - moving whole files: {checksum(files[0])}")
+    return checksum(files[0])
+
+
+def solve(text: str):
+    # both parts rearrange the chain in place, so each gets its own copy
+    return defragment(*parse_diskmap(text)), move_files(*parse_diskmap(text))
+
+
+def part1():
+    return defragment(*load_data())
+
+
+def part2():
+    return move_files(*load_data())
 
 
 if __name__ == "__main__":
-    defragment()
-    move_files()
\ No newline at end of file
+    print(f"Disk checksum - packing all spaces: {part1()}")
+    print(f"Disk checksum - moving whole files: {part2()}")
\ No newline at end of file
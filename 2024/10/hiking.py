@@ -1,51 +1,57 @@
-from aoc_common.grid import Cell
+from aoc_common.grid import Grid
+
+
+def parse_map(text: str) -> Grid:
+    # The sentinel "." isn't a height, so the border never looks like a step
+    # up or down from any cell
+    return Grid.from_lines(text.splitlines(), pad=1, sentinel=".")
 
 
 def load_data():
-    with open("input", "r") as f:
-        return [[int(c) for c in l.strip()] for l in f]
+    return Grid.from_file(pad=1, sentinel=".")
 
 
-def trails():
-    grid = load_data()
+def trails(grid: Grid):
+    # Work in flat int positions rather than Cells - ints are much cheaper to
+    # add and hash than tuples, and the border means neighbours need no
+    # bounds checks (see aoc_common.grid.FlatIndex).  The heights are compared
+    # as character codes, which go up and down in step with the digits.
+    index = grid.flat_index
+    heights = grid.flat_bytes()
 
     # build a directed graph where the nodes are grid cells and the edges link
     # cell A to any neighbouring cell B which is one unit *downhill*.  So 9s
     # link to adjacent 8s, 8s to 7s, etc.
-    links: list[list[set[Cell]]] = [[set() for _ in row] for row in grid]
+    links: dict[int, list[int]] = {}
 
     # Also track which cells contain a 9 and which contain a 0, as we'll need
     # those later
     zeros = []
     nines = []
 
-    valid_rows = range(len(grid))
-    valid_cols = range(len(grid[0]))
-    for c in (Cell(r, c) for r in valid_rows for c in valid_cols):
-        val = c.of(grid)
-        if val == 9:
+    for c in index.all_cells():
+        val = heights[c]
+        if val == ord("9"):
             nines.append(c)
-        if val == 0:
+        if val == ord("0"):
             zeros.append(c)
-        c.of(links).update(n for n in c.neighbours(valid_rows, valid_cols) if n.of(grid) == val - 1)
+        links[c] = [n for n in index.neighbours(c) if heights[n] == val - 1]
 
     # part 1 - sum up how many nines are reachable (in any way) from each zero.
     # reachable_nines will contain, for each cell, the set of distinct "9" cells
     # from which this cell can be reached by a path through the graph.  Initially
     # this is a singleton set of the cell itself if the cell value is 9, otherwise
     # an empty set.
-    reachable_nines: list[list[set[Cell]]] = [
-        [({Cell(row, col)} if Cell(row, col).of(grid) == 9 else set()) for col in valid_cols] for row in valid_rows
-    ]
+    reachable_nines: dict[int, set[int]] = {c: ({c} if heights[c] == ord("9") else set()) for c in links}
     # part 2 - find the number of distinct paths from each zero to each nine
     # routes_to_nine will contain, for each cell, the set of distinct paths
     # between that cell and a cell containing 9.  Each path is represented as
-    # a tuple of Cells, starting with this cell and running uphill to a 9.
+    # a tuple of positions, starting with this cell and running uphill to a 9.
     # Initially this is a singleton set of a one-step path to this cell if the
     # cell value is 9, else an empty set
-    routes_to_nine: list[list[set[tuple[Cell]]]] = [
-        [({(Cell(row, col),)} if Cell(row, col).of(grid) == 9 else set()) for col in valid_cols] for row in valid_rows
-    ]
+    routes_to_nine: dict[int, set[tuple[int, ...]]] = {
+        c: ({(c,)} if heights[c] == ord("9") else set()) for c in links
+    }
 
     # start from the nines
     frontier = set(nines)
@@ -55,16 +61,26 @@ def trails():
     while frontier:
         c = frontier.pop()
         # for each adjacent (downhill) cell
-        for n in c.of(links):
+        for n in links[c]:
             # the downhill cell has a path to each nine reachable from the node we came from
-            n.of(reachable_nines).update(c.of(reachable_nines))
-            n.of(routes_to_nine).update((n, *route) for route in c.of(routes_to_nine))
+            reachable_nines[n].update(reachable_nines[c])
+            routes_to_nine[n].update((n, *route) for route in routes_to_nine[c])
             # continue searching from this node
             frontier.add(n)
 
-    print(f"Trail total score: {sum(len(c.of(reachable_nines)) for c in zeros)}")
-    print(f"Trail total rating: {sum(len(c.of(routes_to_nine)) for c in zeros)}")
+    return sum(len(reachable_nines[c]) for c in zeros), sum(len(routes_to_nine[c]) for c in zeros)
+
+
+def solve(text: str):
+    return trails(parse_map(text))
+
+
+def main():
+    score, rating = trails(load_data())
+    print(f"Trail total score: {score}")
+    print(f"Trail total rating: {rating}")
+    return score, rating
 
 
 if __name__ == "__main__":
-    trails()
+    main()
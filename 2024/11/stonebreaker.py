@@ -1,14 +1,21 @@
-from functools import cache
 from math import floor, log10
 
+from aoc_common import input_path
+from aoc_common.memo import memo
+
+
+def parse_stones(text: str) -> list[int]:
+    return [int(n) for n in text.split()]
+
 
 def load_data():
-    with open("input", "r") as f:
-        data = f.read().strip()
-        return [int(n) for n in data.split()]
+    with open(input_path(), "r") as f:
+        return parse_stones(f.read())
 
 
-@cache
+# The table of stone counts doesn't depend on the input at all, so it's kept
+# between runs
+@memo(persist=True)
 def num_stones(start: int, iterations: int) -> int:
     if iterations == 0:
         return 1
@@ -22,11 +29,23 @@ def num_stones(start: int, iterations: int) -> int:
     return num_stones(start * 2024, iterations - 1)
 
 
+def stones_after(data: list[int], iterations: int) -> int:
+    return sum(num_stones(d, iterations) for d in data)
+
+
+def solve(text: str):
+    data = parse_stones(text)
+    return stones_after(data, 25), stones_after(data, 75)
+
+
 def main():
     data = load_data()
 
-    print(f"Part 1: {sum(num_stones(d, 25) for d in data)}")
-    print(f"Part 2: {sum(num_stones(d, 75) for d in data)}")
+    part1 = stones_after(data, 25)
+    print(f"Part 1: {part1}")
+    part2 = stones_after(data, 75)
+    print(f"Part 2: {part2}")
+    return part1, part2
 
 
 if __name__ == "__main__":
@@ -1,13 +1,16 @@
-from aoc_common.grid import Cell, Direction
+import numpy as np
+
+from aoc_common.grid import Cell, Direction, Grid
+from aoc_common.unionfind import DisjointSet
 
 
 def load_data():
-    with open("input", "r") as f:
-        lines = ["." + l.strip() + "." for l in f]
-        lines.insert(0, "." * len(lines[0]))
-        lines.append("." * len(lines[0]))
+    # surround the garden with a border of dots, which never match a plot
+    return Grid.from_file(pad=1, sentinel=".")
+
 
-    return lines
+def parse_garden(text: str) -> Grid:
+    return Grid.from_lines(text.splitlines(), pad=1, sentinel=".")
 
 
 CORNER_DIRECTIONS = (
@@ -18,12 +21,12 @@ CORNER_DIRECTIONS = (
 )
 
 
-def is_corner(label, straight_a, diag, straight_b):
+def is_corner(same_a, same_diag, same_b):
     """
     If I am facing the corner of a cell and point 45 degrees to my left and right,
-    considering the labels of the cell I'm standing on, the two I'm pointing at,
-    and the one in between them (so diagonally across the corner), determine whether
-    I am looking at the corner of a fence.  There are two cases:
+    considering whether the two cells I'm pointing at, and the one in between them
+    (so diagonally across the corner), have the same label as the cell I'm standing
+    on, determine whether I am looking at the corner of a fence.  There are two cases:
 
     1. if neither of the directly adjacent cells has the same label as me, then
        there must be fences between me and each of the adjacent cells, so I'm
@@ -31,66 +34,80 @@ def is_corner(label, straight_a, diag, straight_b):
     2. if the directly adjacent cells both have the same label as me, but the
        diagonal cell is labelled differently, then I must be looking at the
        270-degree exterior angle of a fence corner.
+
+    This works on whole boolean arrays at once, one element per cell.
     """
     return (
         # interior angle
-        (straight_a != label and straight_b != label)
-        or
+        (~same_a & ~same_b)
+        |
         # exterior angle
-        (straight_a == label and straight_b == label and diag != label)
+        (same_a & same_b & ~same_diag)
     )
 
 
-def fences():
-    grid = load_data()
-
-    valid_rows = range(len(grid))
-    valid_cols = range(len(grid[0]))
-    visited = [[ch == "." for ch in row] for row in grid]
-
-    total_cost_perimeter = 0
-    total_cost_sides = 0
-
-    while (
-        start_cell := next((Cell(r, c) for r in valid_rows for c in valid_cols if not visited[r][c]), None)
-    ) is not None:
-        frontier = {start_cell}
-        label = start_cell.of(grid)
-        area = 0
-        perimeter = 0
-        corners = 0
-        while frontier:
-            cell = frontier.pop()
-            cell.set(visited, True)
-            area += 1
-            for nbr in cell.neighbours():
-                if nbr.of(grid) != label:
-                    perimeter += 1
-                elif not nbr.of(visited):
-                    frontier.add(nbr)
-
-            # check the four corners of this cell to see how many of them are 90 or 270 degree fence corners
-            for s1, d, s2 in CORNER_DIRECTIONS:
-                if is_corner(label, (cell + s1).of(grid), (cell + d).of(grid), (cell + s2).of(grid)):
-                    corners += 1
-
-        # Finished the DFS for this connected component
-
-        # part 1 cost is area times perimeter
-        cost_part1 = area * perimeter
-        # part 2 cost is area times number of sides, which by definition equals the
-        # number of corners
-        cost_part2 = area * corners
-
-        print(
-            f"Component with label {label} starting from {start_cell}: {area=}, {perimeter=}, {corners=}, {cost_part1=}, {cost_part2=}"
-        )
-        total_cost_perimeter += cost_part1
-        total_cost_sides += cost_part2
+def flat_positions(grid: Grid, mask: np.ndarray) -> np.ndarray:
+    """
+    The flat indices into the padded grid of the cells where ``mask`` (the
+    shape of the unpadded grid) is set, in row-major order.
+    """
+    r, c = np.nonzero(mask)
+    return (r + grid.pad) * grid.stride + c + grid.pad
+
 
+def fences(grid: Grid) -> tuple[int, int]:
+    """
+    The total cost of fencing every region, by perimeter and by number of
+    sides.
+    """
+    labels = grid.shift(Cell(0, 0))
+    plots = labels != ord(".")
+
+    # For each direction, a boolean array of whether each cell's neighbour in
+    # that direction has the same label (shift moves the grid *towards* the
+    # direction, so shift the opposite way to line up the neighbours)
+    same = {d: grid.shift(Cell(-d.row, -d.col)) == labels for d in Direction.DIAGONAL}
+
+    # part 1 needs the fence lengths around each cell, part 2 the number of
+    # fence corners, which by definition equals the number of sides
+    perimeter = 4 - sum(same[d].astype(np.int64) for d in Direction.STRAIGHT)
+    corners = sum(is_corner(same[s1], same[d], same[s2]).astype(np.int64) for s1, d, s2 in CORNER_DIRECTIONS)
+
+    # Connected components of same-labelled cells, by flat index into the
+    # padded grid - join every plot to the neighbours to its east and south
+    # with the same label, which covers every adjacent pair once.  Finding
+    # the components is the one thing left that has to go cell by cell.
+    regions = DisjointSet(grid.flat_index.size)
+    for d in (Direction.EAST, Direction.SOUTH):
+        step = grid.flat_index.offset(d)
+        for i in flat_positions(grid, same[d] & plots).tolist():
+            regions.union(i, i + step)
+
+    # Number the regions 0, 1, 2, ... by their roots, and total up the area,
+    # perimeter and corners of each one
+    roots = [regions.find(i) for i in flat_positions(grid, plots).tolist()]
+    _, region = np.unique(roots, return_inverse=True)
+    areas = np.bincount(region)
+    perimeters = np.bincount(region, weights=perimeter[plots])
+    sides = np.bincount(region, weights=corners[plots])
+
+    # part 1 cost is area times perimeter, part 2 cost is area times number of
+    # sides
+    total_cost_perimeter = int(np.dot(areas, perimeters))
+    total_cost_sides = int(np.dot(areas, sides))
+    return total_cost_perimeter, total_cost_sides
+
+
+def solve(text: str):
+    return fences(parse_garden(text))
+
+
+def main():
+    total_cost_perimeter, total_cost_sides = fences(load_data())
     print(f"Total cost of fences based on perimeter: {total_cost_perimeter}")
     print(f"Total cost baed on number of sides: {total_cost_sides}")
+    return total_cost_perimeter, total_cost_sides
 
 
 if __name__ == "__main__":
-    fences()
+    main()
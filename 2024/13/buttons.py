@@ -1,6 +1,8 @@
 from collections import namedtuple
 import re
 
+from aoc_common import input_path
+
 COORDINATE = re.compile("[=+](\d+)")
 
 Vector = namedtuple("Vector", ["x", "y"])
@@ -10,18 +12,15 @@ def to_vector(line):
     return Vector(*(int(m.group(1)) for m in COORDINATE.finditer(line)))
 
 
-def load_data():
-    with open("input", "r") as f:
-        machines = []
-        while a := f.readline():
-            a = a.strip()
-            b = f.readline().strip()
-            prize = f.readline().strip()
-            gap = f.readline()
+def parse_machines(text: str) -> list[Machine]:
+    lines = [l.strip() for l in text.splitlines() if l.strip()]
+    # each machine is three lines, button A, button B and the prize
+    return [Machine(*(to_vector(l) for l in lines[i:i + 3])) for i in range(0, len(lines), 3)]
 
-            machines.append(Machine(to_vector(a), to_vector(b), to_vector(prize)))
 
-    return machines
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_machines(f.read())
 
 
 # Verify none of the machines have their a/b vectors parallel
@@ -48,8 +47,7 @@ def load_data():
 # and substitute in to find A - game is winnable if and only if A and B are
 # both integers
 
-def winnable_games(prize_delta=0):
-    machines = load_data()
+def winnable_games(machines: list[Machine], prize_delta=0):
     cost = 0
     for i, (a, b, prize) in enumerate(machines):
         if prize_delta > 0:
@@ -66,9 +64,22 @@ def winnable_games(prize_delta=0):
         # print(f"Machine {i} is winnable with {big_a} As and {big_b} Bs, costing {m_cost}")
         cost += m_cost
 
-    print(f"Total cost {cost}")
+    return cost
+
+
+def solve(text: str):
+    machines = parse_machines(text)
+    return winnable_games(machines, 0), winnable_games(machines, 10000000000000)
+
+
+def part1():
+    return winnable_games(load_data(), 0)
+
+
+def part2():
+    return winnable_games(load_data(), 10000000000000)
 
 
 if __name__ == "__main__":
-    winnable_games(0)
-    winnable_games(10000000000000)
\ No newline at end of file
+    print(f"Total cost {part1()}")
+    print(f"Total cost {part2()}")
\ No newline at end of file
@@ -1,67 +1,104 @@
-import re
 from functools import reduce
 from operator import mul
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from aoc_common.cycles import crt
 from aoc_common.grid import Cell
+from aoc_common.parse import parse_ints, read_ints
 
-def load_data():
-    digits = re.compile(r"-?\d+")
-    with open("input", "r") as f:
-        robots = []
-        for line in f:
-            line = line.strip()
-            px, py, vx, vy = (int(m.group()) for m in digits.finditer(line))
-            robots.append([Cell(py, px), Cell(vy, vx)])
-    return robots
+ROWS = 103
+COLS = 101
+
+
+def to_robots(values: np.ndarray) -> list[list[Cell]]:
+    return [[Cell(py, px), Cell(vy, vx)] for px, py, vx, vy in values.tolist()]
 
 
-def one_hundred_steps():
-    robots = load_data()
+def parse_robots(text: str) -> list[list[Cell]]:
+    return to_robots(parse_ints(text, columns=4))
+
+
+def load_data():
+    return to_robots(read_ints(columns=4))
+
 
+def one_hundred_steps(robots: list[list[Cell]]):
     quadrants = [0, 0, 0, 0]
     for p, v in robots:
-        new_x = (p.col + (100*v.col)) % 101
-        new_y = (p.row + (100*v.row)) % 103
-        if new_x == 50 or new_y == 51:
+        new_x = (p.col + (100*v.col)) % COLS
+        new_y = (p.row + (100*v.row)) % ROWS
+        if new_x == COLS // 2 or new_y == ROWS // 2:
             continue
-        quadrants[int(new_x > 50) + 2*int(new_y > 51)] +=1
+        quadrants[int(new_x > COLS // 2) + 2*int(new_y > ROWS // 2)] +=1
 
-    print(f"safety: {reduce(mul, quadrants, 1)}")
+    return reduce(mul, quadrants, 1)
 
 
 def matrix(occupied: set[Cell], rows: range, cols: range) -> str:
     return "\n".join("".join("#" if Cell(r, c) in occupied else "." for c in cols) for r in rows)
 
 
-def easter_egg():
+def occupied_after(positions: np.ndarray, velocities: np.ndarray, moves: int) -> np.ndarray:
+    occupied = np.zeros((ROWS, COLS), dtype=bool)
+    occupied[tuple(((positions + moves * velocities) % (ROWS, COLS)).T)] = True
+    return occupied
+
+
+def is_tree(occupied: np.ndarray) -> bool:
+    # Having that many robots in adjacent spaces is probably not a co-incidence
+    return bool(sliding_window_view(occupied, 13, axis=1).all(axis=2).any())
+
+
+def easter_egg(robots: list[list[Cell]]):
     # It's not an Easter egg, it's a Christmas tree...
-    robots = load_data()
-    rows = range(103)
-    cols = range(101)
-    moves = 0
+    positions = np.array([p for p, _ in robots])
+    velocities = np.array([v for _, v in robots])
+
+    # Every robot's row repeats itself every 103 moves and its column every
+    # 101 moves, so rather than simulate the whole lcm(103, 101) moves until
+    # the picture repeats, look at the rows and the columns separately: the
+    # robots in the picture bunch up, so the spread of the rows is smallest
+    # at the point in the rows' cycle where the tree appears, and the same
+    # for the columns.  The tree then appears at the step that's at the right
+    # point of both cycles.
+    steps = np.arange(max(ROWS, COLS))[:, np.newaxis]
+    spreads = []
+    for axis, size in enumerate((ROWS, COLS)):
+        coords = (positions[:, axis] + steps[:size] * velocities[:, axis]) % size
+        spreads.append(int(np.argmin(coords.var(axis=1))))
+    moves, period = crt(spreads, (ROWS, COLS))
+    if is_tree(occupied_after(positions, velocities, moves)):
+        return moves
+
+    # no obvious clustering, so fall back on checking every step until the
+    # picture repeats - if there's no tree by then, there never will be
+    for moves in range(period):
+        if is_tree(occupied_after(positions, velocities, moves)):
+            return moves
+
+    return None
+
 
-    mat = matrix(set(r[0] for r in robots), rows, cols)
-    print(mat)
+def solve(text: str):
+    robots = parse_robots(text)
+    return one_hundred_steps(robots), easter_egg(robots)
 
-    while True:
-        mat = matrix(set(r[0] for r in robots), rows, cols)
-        if "#############" in mat:
-            # Having that many robots in adjacent spaces is probably not a co-incidence
-            print(f"-------------- {moves} moves ---------------")
-            print(mat)
-            if input("Keep going? ") == "n":
-                break
 
-        # make one move
-        moves += 1
-        for r in robots:
-            p, v = r
-            r[0] = Cell((p.row + v.row) % 103, (p.col + v.col) % 101)
+def part1():
+    return one_hundred_steps(load_data())
 
-        if (moves % 100) == 0:
-            print(moves)
 
+def part2():
+    return easter_egg(load_data())
 
 
 if __name__ == "__main__":
-    one_hundred_steps()
-    easter_egg()
\ No newline at end of file
+    print(f"safety: {part1()}")
+    moves = part2()
+    if moves is not None:
+        robots = load_data()
+        occupied = occupied_after(np.array([p for p, _ in robots]), np.array([v for _, v in robots]), moves)
+        print(matrix({Cell(*p) for p in np.argwhere(occupied).tolist()}, range(ROWS), range(COLS)))
+    print(f"Christmas tree after {moves} moves")
@@ -1,36 +1,42 @@
 import operator
 
+from aoc_common import input_path
 from aoc_common.grid import Cell, Direction
 
 GET_ROW = operator.attrgetter("row")
 
 
-def load_data():
-    with open("input", "r") as f:
-        grid = []
-        start_pos = None
-        for row, line in enumerate(f):
-            line = (
-                line.strip()
-                .replace("#", "##")
-                .replace(".", "..")
-                .replace("O", "[]")
-                .replace("@", "@.")
-            )
-            if line == "":
-                break
-            if (col := line.find("@")) >= 0:
-                line = line.replace("@", ".")
-                start_pos = Cell(row, col)
-
-            grid.append([ch for ch in line])
-
-        # rest of the file is the moves
-        moves = "".join(line.strip() for line in f)
+def parse_warehouse(text: str):
+    lines = iter(text.splitlines())
+    grid = []
+    start_pos = None
+    for row, line in enumerate(lines):
+        line = (
+            line.strip()
+            .replace("#", "##")
+            .replace(".", "..")
+            .replace("O", "[]")
+            .replace("@", "@.")
+        )
+        if line == "":
+            break
+        if (col := line.find("@")) >= 0:
+            line = line.replace("@", ".")
+            start_pos = Cell(row, col)
+
+        grid.append([ch for ch in line])
+
+    # rest of the file is the moves
+    moves = "".join(line.strip() for line in lines)
 
     return grid, start_pos, moves
 
 
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_warehouse(f.read())
+
+
 def try_move_horizontal(grid: list[list[str]], direction: Cell, start: Cell) -> bool:
     """
     Try and move one step in an E/W direction in the grid, pushing any boxes that can
@@ -129,22 +135,30 @@ MOVE = {
 }
 
 
-def predict_position():
-    grid, robot_pos, moves = load_data()
+def predict_position(grid: list[list[str]], robot_pos: Cell, moves: str, debug=False):
     for m in moves:
         d, try_move = MOVE[m]
         if try_move(grid, d, robot_pos):
             robot_pos += d
 
-    print("\n".join("".join(c for c in line) for line in grid))
+    if debug:
+        print("\n".join("".join(c for c in line) for line in grid))
 
     total = sum(
         (100 * r + c) if grid[r][c] == "[" else 0
         for r in range(len(grid))
         for c in range(len(grid[0]))
     )
-    print(f"Sum of box coords: {total}")
+    return total
+
+
+def solve(text: str):
+    return (predict_position(*parse_warehouse(text)),)
+
+
+def part2():
+    return predict_position(*load_data(), debug=True)
 
 
 if __name__ == "__main__":
-    predict_position()
+    print(f"Sum of box coords: {part2()}")
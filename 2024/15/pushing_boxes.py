@@ -1,26 +1,32 @@
+from aoc_common import input_path
 from aoc_common.grid import Cell, Direction
 
 
-def load_data():
-    with open("input", "r") as f:
-        grid = []
-        start_pos = None
-        for row, line in enumerate(f):
-            line = line.strip()
-            if line == "":
-                break
-            if (col := line.find("@")) >= 0:
-                line = line.replace("@", ".")
-                start_pos = Cell(row, col)
-
-            grid.append([ch for ch in line])
-
-        # rest of the file is the moves
-        moves = "".join(line.strip() for line in f)
+def parse_warehouse(text: str):
+    lines = iter(text.splitlines())
+    grid = []
+    start_pos = None
+    for row, line in enumerate(lines):
+        line = line.strip()
+        if line == "":
+            break
+        if (col := line.find("@")) >= 0:
+            line = line.replace("@", ".")
+            start_pos = Cell(row, col)
+
+        grid.append([ch for ch in line])
+
+    # rest of the file is the moves
+    moves = "".join(line.strip() for line in lines)
 
     return grid, start_pos, moves
 
 
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_warehouse(f.read())
+
+
 MOVE_DIRECTIONS = {
     ">": Direction.EAST,
     "v": Direction.SOUTH,
@@ -61,22 +67,30 @@ def try_move(grid: list[list[str]], direction: Cell, start: Cell) -> bool:
     return True
 
 
-def predict_position():
-    grid, robot_pos, moves = load_data()
+def predict_position(grid: list[list[str]], robot_pos: Cell, moves: str, debug=False):
     for m in moves:
         d = MOVE_DIRECTIONS[m]
         if try_move(grid, d, robot_pos):
             robot_pos += d
 
-    print("\n".join("".join(c for c in line) for line in grid))
+    if debug:
+        print("\n".join("".join(c for c in line) for line in grid))
 
     total = sum(
         (100 * r + c) if grid[r][c] == "O" else 0
         for r in range(len(grid))
         for c in range(len(grid[0]))
     )
-    print(f"Sum of box coords: {total}")
+    return total
+
+
+def solve(text: str):
+    return (predict_position(*parse_warehouse(text)),)
+
+
+def part1():
+    return predict_position(*load_data(), debug=True)
 
 
 if __name__ == "__main__":
-    predict_position()
+    print(f"Sum of box coords: {part1()}")
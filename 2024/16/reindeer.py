@@ -1,7 +1,8 @@
 from collections import namedtuple, defaultdict
 
+from aoc_common import input_path
 from aoc_common.grid import Cell, Direction
-from aoc_common.heapdict import heapdict
+from aoc_common.search import shortest_paths
 
 # Each cell in our grid maps to _two_ nodes in the graph, one for
 # when the cell is approached from the north or south ("vertical")
@@ -15,24 +16,23 @@ from aoc_common.heapdict import heapdict
 Node = namedtuple("Node", ["c", "axis"])
 
 
-def load_data():
-    # parse the input file, converting the S and E to dots but remembering
+def parse_maze(text: str):
+    # parse the input, converting the S and E to dots but remembering
     # their locations
-    with open("input", "r") as f:
-        grid = []
-        for r, l in enumerate(f):
-            l = l.strip()
-            s = l.find("S")
-            if s >= 0:
-                start_node = Node(Cell(r, s), "h")
-                l = l[:s] + "." + l[s + 1 :]
-
-            e = l.find("E")
-            if e >= 0:
-                end_cell = Cell(r, e)
-                l = l[:e] + "." + l[e + 1 :]
-
-            grid.append(l)
+    grid = []
+    for r, l in enumerate(text.splitlines()):
+        l = l.strip()
+        s = l.find("S")
+        if s >= 0:
+            start_node = Node(Cell(r, s), "h")
+            l = l[:s] + "." + l[s + 1 :]
+
+        e = l.find("E")
+        if e >= 0:
+            end_cell = Cell(r, e)
+            l = l[:e] + "." + l[e + 1 :]
+
+        grid.append(l)
 
     nodes: set[Node] = set()
     # neighbours maps each Node to its set of (neighbour-node, cost) tuples
@@ -108,57 +108,37 @@ def load_data():
     return grid, start_node, end_node, neighbours
 
 
-def cheapest_path():
-    grid, start_node, end_node, neighbours = load_data()
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_maze(f.read())
+
 
-    # Dijkstra to find all the shortest paths from start_node to... well,
-    # anywhere, but we only care about paths to the end node
+def cheapest_path(grid, start_node, end_node, neighbours, queue: str = None, debug=False):
+    """
+    Returns the cost of the cheapest path and the number of tiles on any
+    cheapest path, for the maze from ``parse_maze``.  ``queue`` picks the
+    open list implementation, see ``aoc_common.pq.QUEUE_TYPES``.
+    """
 
-    # Use a heapdict for the unvisited list so the next node to be processed
-    # is always the one with the lowest cost path from the start
-    open_list = heapdict()
-    # closed_list is the set of nodes we have completely visited
-    closed_list: set[Node] = set()
-    # for each node visited, track the set of its lowest-cost immediate
+    # Dijkstra to find all the shortest paths from start_node to end_node.
+    # For each node visited, track the set of its lowest-cost immediate
     # predecessors in the path from start - most of the time this will
     # be one node, but it might be more than one if there are multiple
-    # paths to this node via different but equally cheap routes
-    predecessors: dict[Node, set[Node]] = {}
-    # costs is the total cost of the cheapest path so far found to each node
-    # (including the fully visited ones)
-    costs: dict[Node, int] = {}
-
-    # Initial conditions - we're starting from the start node, and its
-    # distance from the start node is (obviously) zero
-    open_list[start_node] = 0
-    costs[start_node] = 0
-
-    while len(open_list):
-        node, dist_node = open_list.popitem()
-        closed_list.add(node)
-
-        for child, cost in neighbours[node]:
-            if child in closed_list:
-                continue
-            child_cost = costs[node] + cost
-            if child_cost <= costs.get(child, 10000000000000):
-                if child_cost == costs.get(child):
-                    # an alternative path to this child that is the same cost as
-                    # the cheapest we've found so far
-                    predecessors[child].add(node)
-                else:
-                    # either a cheaper path than we previously found, or a node
-                    # we've not seen before
-                    costs[child] = child_cost
-                    predecessors[child] = {node}
-                open_list[child] = costs.get(child, 10000000000000)
-
-    if end_node not in costs:
+    # paths to this node via different but equally cheap routes.  The
+    # edge costs are all ints, so by default this uses a bucket queue.
+    result = shortest_paths(
+        start_node,
+        neighbours.__getitem__,
+        goal=end_node,
+        weights="int",
+        all_predecessors=True,
+        queue=queue,
+    )
+
+    if result.goal is None:
         # we never found a path to the goal
         raise ValueError(f"No path from {start_node} to {end_node}")
 
-    print(f"Cheapest path cost = {costs[end_node]}")
-
     # now walk back along the predecessor chain from the end node and record
     # all the cells that any of the cheapest paths touch
     frontier = {end_node}
@@ -166,7 +146,7 @@ def cheapest_path():
     while frontier:
         n = frontier.pop()
         covered_cells.add(n.c)
-        for p in predecessors.get(n, ()):
+        for p in result.predecessors.get(n, ()):
             frontier.add(p)
             # vector is the offset to move from the cell of node n to the
             # cell of node p - vector.row and vector.col cannot both be
@@ -182,19 +162,31 @@ def cheapest_path():
                 for i in range(delta, vector.col, delta):
                     covered_cells.add(Cell(n.c.row, n.c.col + i))
 
-    # Draw all the cheapest paths, for sanity check
-    print(
-        "\n".join(
-            "".join(
-                ("x" if Cell(r, c) in covered_cells else ch)
-                for c, ch in enumerate(line)
+    if debug:
+        # Draw all the cheapest paths, for sanity check
+        print(
+            "\n".join(
+                "".join(
+                    ("x" if Cell(r, c) in covered_cells else ch)
+                    for c, ch in enumerate(line)
+                )
+                for r, line in enumerate(grid)
             )
-            for r, line in enumerate(grid)
         )
-    )
 
-    print(f"Tiles touched by a cheapest path: {len(covered_cells)}")
+    return result.costs[end_node], len(covered_cells)
+
+
+def solve(text: str):
+    return cheapest_path(*parse_maze(text))
+
+
+def main():
+    cost, tiles = cheapest_path(*load_data(), debug=True)
+    print(f"Cheapest path cost = {cost}")
+    print(f"Tiles touched by a cheapest path: {tiles}")
+    return cost, tiles
 
 
 if __name__ == "__main__":
-    cheapest_path()
+    main()
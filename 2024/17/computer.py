@@ -2,6 +2,8 @@ from collections import namedtuple
 from dataclasses import dataclass, field
 from typing import Optional
 
+from aoc_common import input_path
+
 
 class BitPattern(namedtuple("BitPattern", ["mask", "pattern"])):
     def merge(self, other: "BitPattern") -> Optional["BitPattern"]:
@@ -159,13 +161,13 @@ def generate_base_patterns(machine: Machine) -> list[set[BitPattern]]:
 
 
 # See README for explanation
-def quine(machine: Machine):
+def quine(machine: Machine, debug=False):
     base_patterns = generate_base_patterns(machine)
-    # Debug base patterns
-    print("Base patterns:")
-    for n, pats in enumerate(base_patterns):
-        print(n)
-        print(*pats, sep="\n")
+    if debug:
+        print("Base patterns:")
+        for n, pats in enumerate(base_patterns):
+            print(n)
+            print(*pats, sep="\n")
 
     candidates = set(base_patterns[machine.program[0]])
     for i in range(1, len(machine.program)):
@@ -186,7 +188,8 @@ def quine(machine: Machine):
             raise ValueError("This program cannot generate itself")
 
         candidates = new_candidates
-        print(f"{len(candidates)} candidates remain after iteration {i}")
+        if debug:
+            print(f"{len(candidates)} candidates remain after iteration {i}")
 
     # we now have all the patterns that could match an initial "a" register,
     # the smallest number that could match any of these patterns happens to be
@@ -196,29 +199,42 @@ def quine(machine: Machine):
     return min(p.pattern for p in candidates)
 
 
-def load_data():
-    with open("input", "r") as f:
-        r_a = int(f.readline()[12:])
-        r_b = int(f.readline()[12:])
-        r_c = int(f.readline()[12:])
+def parse_machine(text: str) -> Machine:
+    lines = text.splitlines()
+    r_a = int(lines[0][12:])
+    r_b = int(lines[1][12:])
+    r_c = int(lines[2][12:])
 
-        # skip blank line
-        f.readline()
-        program_str = f.readline()[9:]
+    # lines[3] is blank
+    program_str = lines[4][9:]
 
     return Machine(
         program=[int(i) for i in program_str.split(",")], a=r_a, b=r_b, c=r_c
     )
 
 
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_machine(f.read())
+
+
+def solve(text: str):
+    m = parse_machine(text)
+    m.run()
+    return ",".join(str(i) for i in m.output), quine(m)
+
+
 def main():
     m = load_data()
     # part 1
     m.run(debug=True)
     print("Output:", "".join(str(i) for i in m.output))
+    output = ",".join(str(i) for i in m.output)
 
     # part 2
-    print(f"Minimum quine seed: {quine(m)}")
+    seed = quine(m, debug=True)
+    print(f"Minimum quine seed: {seed}")
+    return output, seed
 
 
 if __name__ == "__main__":
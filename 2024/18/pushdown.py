@@ -1,124 +1,116 @@
 import itertools
-from typing import Callable
+from typing import Callable, Union
 
-from aoc_common.grid import Cell
-from aoc_common.heapdict import heapdict
+import numpy as np
+
+from aoc_common import input_path
+from aoc_common.grid import Cell, FlatIndex, grid_adjacency
+from aoc_common.search import CSR, shortest_paths
 
 
 valid_rows = valid_cols = range(71)
+# Flat int encoding of the cells, matching the layout of the CSR adjacency
+INDEX = FlatIndex(len(valid_rows), len(valid_cols))
+# Timestep used for cells that never have a byte dropped on them
+NEVER = np.iinfo(np.int32).max
 
 
-def load_data():
+def parse_droptimes(text: str) -> dict[Cell, int]:
     droptimes: dict[Cell, int] = {}
-    with open("input", "r") as f:
-        for i, line in enumerate(f):
-            line = line.strip()
-            if not line:
-                break
-            col, row = (int(v) for v in line.split(","))
-            droptimes[Cell(row, col)] = i
+    for i, line in enumerate(text.splitlines()):
+        line = line.strip()
+        if not line:
+            break
+        col, row = (int(v) for v in line.split(","))
+        droptimes[Cell(row, col)] = i
 
     return droptimes
 
 
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_droptimes(f.read())
+
+
+def droptime_grid(droptimes: dict[Cell, int]) -> np.ndarray:
+    """
+    The droptimes as an array over the whole grid, with ``NEVER`` for cells
+    where no byte drops.
+    """
+    grid = np.full((len(valid_rows), len(valid_cols)), NEVER, dtype=np.int32)
+    for cell, timestep in droptimes.items():
+        grid[cell] = timestep
+    return grid
+
+
 def shortest_path(
-    start: Cell,
-    end: Cell,
-    neighbours: Callable[[Cell], list[Cell]],
+    start,
+    end,
+    neighbours: Union[Callable, CSR],
+    queue: str = None,
 ):
     """
-    A* shortest path algorithm, where all edges are equal weight (1).
+    Shortest path search, where all edges are equal weight (1), so by
+    default this is a plain breadth-first search.
 
     :param start: the start node, typically top left in the grid
     :param end: the end node, bottom right in the grid
-    :param neighbours: function that takes a Cell and returns its eligible neighbours
+    :param neighbours: function that takes a node and returns its eligible
+      neighbours, or a precomputed ``CSR`` adjacency
+    :param queue: if given, do a Dijkstra search using this priority queue
+      implementation instead (see ``aoc_common.pq.QUEUE_TYPES``)
     :return: the set of nodes making up a shortest path from start to end
     :raises ValueError: if no path exists from start to end
     """
-    open_list = heapdict()
-    closed_list: set[Cell] = set()
-    f = {}
-    g = {}
-    pred = {}
-    open_list[start] = 0
-    f[start] = 0
-    g[start] = 0
-
-    while len(open_list):
-        node, f_node = open_list.popitem()
-        closed_list.add(node)
-
-        if node == end:
-            # Reached the goal - trace back through pred links to find the
-            # nodes that are part of the shortest path
-            path = {node}
-            while node in pred:
-                node = pred[node]
-                path.add(node)
-            return path
-
-        for child in neighbours(node):
-            if child in closed_list:
-                continue
-            child_g = g[node] + 1
-            if child not in g or child_g < g[child]:
-                g[child] = child_g
-                pred[child] = node
-                # Use manhattan distance to end as heuristic function - we use the
-                # fact that the end position is bottom right so we don't need to
-                # take any absolute values, end.row-child.row and end.col-child.col
-                # are both always >= 0
-                f[child] = child_g + end.row - child.row + end.col - child.col
-                open_list[child] = f[child]
-
-    # If we reach here we never found a path to the goal
-    raise ValueError(f"No path found")
-
-
-def find_path(droptimes: dict[Cell, int], timestep: int) -> set[Cell]:
+    result = shortest_paths(start, neighbours, goal=end, weights="unit", queue=queue)
+
+    if result.goal is None:
+        # we never found a path to the goal
+        raise ValueError(f"No path found")
+
+    # trace back through predecessor links to find the nodes that are part
+    # of the shortest path
+    return set(result.path())
+
+
+def find_path(drop_grid: np.ndarray, timestep: int) -> set[Cell]:
     """
     Find a shortest path through the graph as it looks after the given timestep.
     The ``timestep`` is zero based, the first byte drops at timestep zero, the
     second at timestep 1, etc. so the graph we are searching **includes** the
     byte that dropped at ``timestep``.
-    :param droptimes: mapping from byte Cell to the timestep on which that byte dropped
+    :param drop_grid: array giving the timestep on which a byte drops on each cell
     :param timestep: the timestep at which we are simulating
     :return: the ``set`` of cells that are part of the path (we only care later
     on about whether or not a given cell is in the path, not where it was in the order)
     """
 
-    def nbr(node: Cell):
-        """
-        The valid neighbours of a given cell are those cells that either will never
-        contain a dropped byte, or where that byte will drop **after** the target
-        timestep
-        """
-        return [
-            c
-            for c in node.neighbours(valid_rows, valid_cols)
-            if c not in droptimes or droptimes[c] > timestep
-        ]
-
-    return shortest_path(Cell(0, 0), Cell(70, 70), nbr)
+    # The passable cells are those that either will never contain a dropped
+    # byte, or where that byte will drop **after** the target timestep.  Build
+    # the whole adjacency for this timestep in one go with numpy, rather than
+    # working out the neighbours of each cell as the search reaches it
+    adjacency = grid_adjacency(drop_grid > timestep, INDEX.pad)
+    path = shortest_path(INDEX.encode(Cell(0, 0)), INDEX.encode(Cell(70, 70)), adjacency)
+    return {INDEX.decode(pos) for pos in path}
 
 
-def part1():
+def first_kilobyte(droptimes: dict[Cell, int]) -> int:
     """
     Find shortest path through the graph whose nodes are the **non-blocked** spaces
     and whose edges are cardinal N/S/E/W directions, starting at the top left and
     finishing at the bottom right.
     """
-    droptimes = load_data()
+    drop_grid = droptime_grid(droptimes)
 
     # "Simulate the first kilobyte" means we want the state of the graph after
     # zero-based timestep 1023
-    path = find_path(droptimes, 1023)
+    path = find_path(drop_grid, 1023)
     # returned path is the cells, including the start and end, so number of _steps_
     # is one fewer
-    print(f"Shortest path in graph after 1024 ns: {len(path) - 1}")
+    return len(path) - 1
 
 
-def part2():
+def first_blocker(droptimes: dict[Cell, int], debug=False) -> str:
     """
     Starting from the 1023 path (which we know exists, given part 1), keep dropping
     blockers one by one.  Whenever a blocker falls on a cell that is part of the
@@ -126,20 +118,38 @@ def part2():
     at the first timestep where it is no longer possible to find any path from
     start to end.
     """
-    droptimes = load_data()
-    path = find_path(droptimes, 1023)
+    drop_grid = droptime_grid(droptimes)
+    path = find_path(drop_grid, 1023)
     # I'm making use here of the fact that python dict iteration is guaranteed to
     # be insertion order, so we will definitely step through the items in the same
     # order as they appeared in the input file
     for blocker, timestep in itertools.islice(droptimes.items(), 1024, None):
         if blocker in path:
             try:
-                path = find_path(droptimes, timestep)
+                path = find_path(drop_grid, timestep)
             except ValueError:
                 # No possible path - we are done
                 break
 
-    print(f"Found blocking path after {timestep} ns, final blocker at {blocker}")
+    if debug:
+        print(f"Found blocking path after {timestep} ns, final blocker at {blocker}")
+    # the answer is the blocker's coordinates as they appear in the input
+    return f"{blocker.col},{blocker.row}"
+
+
+def solve(text: str):
+    droptimes = parse_droptimes(text)
+    return first_kilobyte(droptimes), first_blocker(droptimes)
+
+
+def part1():
+    steps = first_kilobyte(load_data())
+    print(f"Shortest path in graph after 1024 ns: {steps}")
+    return steps
+
+
+def part2():
+    return first_blocker(load_data(), debug=True)
 
 
 if __name__ == "__main__":
@@ -1,60 +1,99 @@
 import re
-from functools import cache
+from typing import Optional
 
+from aoc_common.io import Buffer, lines, mapped
+from aoc_common.memo import memo
+from aoc_common.parallel import map_reduce
 
-def load_data():
-    with open("input", "r") as f:
-        towels = f.readline().strip().split(", ")
+# The available towels, and a regex that matches any pattern that can be made
+# from them - set up once in each worker process by use_towels
+towels: list[str] = []
+towelpattern: re.Pattern = re.compile("")
 
-        # Skip blank
-        f.readline()
 
-        patterns = [l.strip() for l in f]
+def parse_towels(buf: Buffer):
+    """
+    The towels from the first line of the input, and the offset at which the
+    patterns start (after the blank line).
+    """
+    first = next(lines(buf))
+    towel_list = bytes(first).decode().strip().split(", ")
+    # The patterns start after the first blank line
+    start = re.search(rb"\n\s*?\n", buf).end()
+    return towel_list, start
 
-    return towels, patterns
 
+def load_towels():
+    with mapped() as buf:
+        return parse_towels(buf)
 
-def part1():
-    towels, patterns = load_data()
+
+def use_towels(towel_list):
+    global towels, towelpattern
+    towels = towel_list
     # Let the built-in regex engine do the heavy lifting of building and
     # searching the automaton for me... I'll probably have to do this myself
     # for part 2
     towelpattern = re.compile("(?:" + "|".join(towels) + ")+")
-    valid = []
-    for pat in patterns:
-        if towelpattern.fullmatch(pat):
-            valid.append(pat)
+    # counts for the last set of towels don't apply to these ones
+    num_matches.cache_clear()
+
+
+def is_possible(pattern):
+    return 1 if towelpattern.fullmatch(pattern) else 0
+
 
-    print(f"Number of possible patterns: {len(valid)}")
-    return towels, valid
+# hello functools my old friend...  The cache lives for the whole of each
+# worker process, so patterns that share a suffix reuse each other's counts
+# whichever chunk of the input they're in.
+@memo
+def num_matches(pattern):
+    """
+    Count how many ways the pattern can be formed from the towels.
+    """
+    # Termination condition - if we've stripped off prefixes for the entire
+    # pattern then by the time we reach here we have found _one_ way to match
+    if pattern == "":
+        return 1
+
+    # Otherwise, add up the total matches that we would get for the shorter
+    # pattern obtained by stripping off each possible towel prefix
+    total = 0
+    for t in towels:
+        if pattern.startswith(t):
+            total += num_matches(pattern[len(t) :])
+
+    return total
 
 
-def part2(towels, patterns):
+def count_patterns(fn, text: Optional[str] = None):
     """
-    Given a set of towels and a set of patterns that we know are possible (from part 1),
-    count how many ways each pattern can be formed from the given towels.
+    Total of ``fn`` over the patterns of ``text``, or of the input file if
+    no text is given.
     """
+    towel_list, start = load_towels() if text is None else parse_towels(text.encode())
+    # the patterns are independent, so check them in parallel
+    return map_reduce(fn, text, start=start, initial=0, initializer=use_towels, initargs=(towel_list,))
 
-    # hello functools my old friend...
-    @cache
-    def num_matches(pattern):
-        # Termination condition - if we've stripped off prefixes for the entire
-        # pattern then by the time we reach here we have found _one_ way to match
-        if pattern == "":
-            return 1
 
-        # Otherwise, add up the total matches that we would get for the shorter
-        # pattern obtained by stripping off each possible towel prefix
-        total = 0
-        for t in towels:
-            if pattern.startswith(t):
-                total += num_matches(pattern[len(t) :])
+def solve(text: str):
+    return count_patterns(is_possible, text), count_patterns(num_matches, text)
+
+
+def part1():
+    possible = count_patterns(is_possible)
+    print(f"Number of possible patterns: {possible}")
+    return possible
 
-        return total
 
-    print(f"Total ways to match: {sum(num_matches(p) for p in patterns)}")
+def part2():
+    # patterns that aren't possible have no ways to match, so there's no need
+    # to filter them out first
+    total = count_patterns(num_matches)
+    print(f"Total ways to match: {total}")
+    return total
 
 
 if __name__ == "__main__":
-    towels, valid = part1()
-    part2(towels, valid)
+    part1()
+    part2()
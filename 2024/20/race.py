@@ -1,75 +1,97 @@
-from aoc_common.grid import Cell
+from aoc_common import input_path
+from aoc_common.cache import cached_parse
+from aoc_common.grid import Cell, Grid
 
+# The longest cheat we need to consider (part 2).  The grid is padded with a
+# border of walls this wide, so every cell within cheating distance of the
+# track has a valid flat index and we never need any bounds checks.
+MAX_CHEAT = 20
 
-def load_data():
-    with open("input", "r") as f:
-        grid = [l.strip() for l in f]
-
-    start = end = None
-    # Find the start and end, changing their character in the grid to "."
-    # to simplify the later comparisons
-    for r in range(len(grid)):
-        l = grid[r]
-        if (start_col := l.find("S")) >= 0:
-            start = Cell(r, start_col)
-            grid[r] = l = l.replace("S", ".")
-
-        if (end_col := l.find("E")) >= 0:
-            end = Cell(r, end_col)
-            grid[r] = l = l.replace("E", ".")
-
-    if not start or not end:
+
+@cached_parse
+def parse_track(text: str):
+    grid = Grid.from_lines(text.splitlines(), pad=MAX_CHEAT, sentinel="#")
+    starts = grid.find("S")
+    ends = grid.find("E")
+    if not starts or not ends:
         raise ValueError("Invalid track")
 
-    # We know there is exactly one route from start to end, trace along
-    # the route storing the distance-from-start for every "." cell we hit.
-    track: dict[Cell, int] = {start: 0}
+    # Work in flat int positions rather than Cells - this is a hot loop in
+    # cheats_up_to and ints are much cheaper to add and compare than tuples
+    index = grid.flat_index
+    start = index.encode(starts[0])
+    end = index.encode(ends[0])
+    cells = grid.flat_bytes()
+    # Change the start and end characters to "." to simplify the later
+    # comparisons
+    cells[start] = cells[end] = ord(".")
+
+    # We know there is exactly one route from start to end, trace along the
+    # route storing the distance-from-start for every "." cell we hit.  track
+    # is indexed by flat position, and is -1 for anything not on the track.
+    track = [-1] * index.size
+    track[start] = 0
+    route = [start]
     cur = start
     prev = None
     distance = 0
     while cur != end:
         distance += 1
         prev, cur = cur, next(
-            n for n in cur.neighbours() if n.of(grid) == "." and n != prev
+            n for n in index.neighbours(cur) if cells[n] == ord(".") and n != prev
         )
         track[cur] = distance
+        route.append(cur)
+
+    return grid, track, route
+
+
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_track(f.read())
 
-    return grid, track, start, end
 
+def cheats_up_to(grid: Grid, track: list[int], route: list[int], distance: int, saving: int):
+    index = grid.flat_index
 
-def cheats_up_to(distance: int, saving: int):
-    grid, track, start, end = load_data()
-    valid_rows = range(len(grid))
-    valid_cols = range(len(grid[0]))
+    # All the offsets within Manhattan metric "distance" of the origin, paired
+    # with their Manhattan distance from it
+    offsets = [
+        (index.offset(Cell(r, c)), abs(r) + abs(c))
+        for r in range(-distance, distance + 1)
+        for c in range(abs(r) - distance, -abs(r) + distance + 1)
+    ]
 
-    cheats = [0 for _ in range(len(track))]
-    for origin, origin_dist in track.items():
+    cheats = [0 for _ in range(len(route))]
+    for origin_dist, origin in enumerate(route):
         # Look at all cells within Manhattan metric "distance" of origin that are
         # (a) on the track but (b) further away via the track than they would be
-        # via the cheat route
-        for r in range(-distance, distance + 1):
-            if origin.row + r not in valid_rows:
-                continue
-            for c in range(abs(r) - distance, -abs(r) + distance + 1):
-                if origin.col + c not in valid_cols:
-                    continue
-                cell = origin + Cell(r, c)
-                # Manhattan distance from origin to this cell
-                d_from_o = abs(r) + abs(c)
-                if (
-                    cell.of(grid) == "."
-                    and track.get(cell, -1) > origin_dist + d_from_o
-                ):
-                    # This is a shortcut whose saving is the difference between the
-                    # distance from origin to endpoint via the racetrack and via the
-                    # cheat path
-                    cheats[track[cell] - origin_dist - d_from_o] += 1
-
-    print(f"Shortcuts saving >={saving}: {sum(cheats[saving:])}")
+        # via the cheat route - cells off the track have distance -1 so they
+        # never count
+        for offset, d_from_o in offsets:
+            # This is a shortcut if its saving - the difference between the
+            # distance from origin to endpoint via the racetrack and via the
+            # cheat path - is positive
+            cheat_saving = track[origin + offset] - origin_dist - d_from_o
+            if cheat_saving > 0:
+                cheats[cheat_saving] += 1
+
+    return sum(cheats[saving:])
+
+
+def solve(text: str):
+    race = parse_track(text)
+    return cheats_up_to(*race, 2, 100), cheats_up_to(*race, MAX_CHEAT, 100)
+
+
+def part1():
+    return cheats_up_to(*load_data(), 2, 100)
+
+
+def part2():
+    return cheats_up_to(*load_data(), MAX_CHEAT, 100)
 
 
 if __name__ == "__main__":
-    # Part 1
-    cheats_up_to(2, 100)
-    # Part 2
-    cheats_up_to(20, 100)
+    print(f"Shortcuts saving >=100: {part1()}")
+    print(f"Shortcuts saving >=100: {part2()}")
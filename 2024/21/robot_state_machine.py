@@ -7,9 +7,10 @@
 
 import itertools
 from typing import NamedTuple
-from functools import cache
 
-from aoc_common.heapdict import heapdict
+from aoc_common import input_path
+from aoc_common.memo import memo
+from aoc_common.search import shortest_paths
 
 DIRECTION_BUTTONS = "A^<v>"
 # DIRECTION_MOVES[from][press] is the button you end up on if you were on "from" and
@@ -42,7 +43,7 @@ class State(NamedTuple):
     numbers: str
 
 
-@cache
+@memo
 def next_state(state: State, button: str):
     if button == "A":
         # A doesn't move anything on this layer but it might advance the next layer(s)
@@ -76,63 +77,42 @@ def next_state(state: State, button: str):
     return State(state.arrows, NUMBER_MOVES[state.numbers][button])
 
 
+def parse_codes(text: str) -> list[str]:
+    return [l.strip() for l in text.splitlines()]
+
+
 def load_data():
-    with open("input", "r") as f:
-        return [l.strip() for l in f]
-
-
-def cheapest_path(start, end):
-    # Dijkstra to find the shortest path from start to end
-
-    # Use a heapdict for the unvisited list so the next node to be processed
-    # is always the one with the lowest cost path from the start
-    open_list = heapdict()
-    # closed_list is the set of nodes we have completely visited
-    closed_list: set[State] = set()
-    # costs is the total cost of the cheapest path so far found to each node
-    # (including the fully visited ones)
-    costs: dict[State, int] = {}
-    pred = {}
-
-    # Initial conditions - we're starting from the start node, and its
-    # distance from the start node is (obviously) zero
-    open_list[start] = 0
-    costs[start] = 0
-
-    while len(open_list):
-        node, dist_node = open_list.popitem()
-        closed_list.add(node)
-
-        if node == end:
-            # we have reached the goal
-            presses = []
-            while node != start:
-                presses.append(pred[node][0])
-                node = pred[node][1]
-
-            path = "".join(reversed(presses))
-            print(f"Path from {start} to {end}: {path}")
-            return path
-
-        for button in DIRECTION_BUTTONS:
-            child = next_state(node, button)
-            if child is None or child in closed_list:
-                continue
-            child_cost = costs[node] + 1
-            if child not in costs or child_cost < costs[child]:
-                # either a cheaper path than we previously found, or a node
-                # we've not seen before
-                costs[child] = child_cost
-                pred[child] = (button, node)
-                open_list[child] = costs[child]
-
-    # we never found a path to the goal
-    raise ValueError(f"No path from {start} to {end}")
-
-
-def cost(robots: int):
-    codes = load_data()
+    with open(input_path(), "r") as f:
+        return parse_codes(f.read())
+
+
+def cheapest_path(start, end, debug=False):
+    # Every button press costs 1, so a breadth-first search finds the
+    # shortest path from start to end
+    def neighbours(node: State):
+        return [
+            child
+            for button in DIRECTION_BUTTONS
+            if (child := next_state(node, button)) is not None
+        ]
+
+    result = shortest_paths(start, neighbours, goal=end, weights="unit")
+
+    if result.goal is None:
+        # we never found a path to the goal
+        raise ValueError(f"No path from {start} to {end}")
+
+    # recover the button that was pressed for each step along the path
+    path = "".join(
+        next(b for b in DIRECTION_BUTTONS if next_state(s1, b) == s2)
+        for s1, s2 in itertools.pairwise(result.path())
+    )
+    if debug:
+        print(f"Path from {start} to {end}: {path}")
+    return path
 
+
+def cost(codes: list[str], robots: int, debug=False):
     total_presses = 0
     total_cost = 0
     for code in codes:
@@ -142,17 +122,26 @@ def cost(robots: int):
 
         for state1, state2 in itertools.pairwise(required_states):
             code_presses = (
-                len(cheapest_path(state1, state2)) + 1
+                len(cheapest_path(state1, state2, debug)) + 1
             )  # +1 for pressing the final A
             total_presses += code_presses
             total_cost += code_presses * int(code[:3])
 
-    print(f"minimum number of button presses to open door: {total_presses}")
-    print(f"Total complexity: {total_cost}")
+    if debug:
+        print(f"minimum number of button presses to open door: {total_presses}")
+    return total_cost
+
+
+def solve(text: str):
+    return (cost(parse_codes(text), 2),)
+
+
+def part1():
+    return cost(load_data(), 2, debug=True)
+
+
+# Part 2 - this algorithm is intractable for cost(25)
 
 
 if __name__ == "__main__":
-    # Part 1
-    cost(2)
-    # Part 2 - this algorithm is intractable
-    # cost(25)
+    print(f"Total complexity: {part1()}")
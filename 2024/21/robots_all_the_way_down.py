@@ -7,8 +7,9 @@
 #
 
 import itertools
-from functools import cache
 
+from aoc_common import input_path
+from aoc_common.memo import memo
 from aoc_common.grid import Cell
 
 DIRECTION_BUTTONS = "^A<v>"
@@ -83,22 +84,28 @@ def keypad_paths(
 # Memoized versions of keypad_paths for the two keypads
 
 
-@cache
+@memo
 def numpad_paths(last_button: str, next_button: str) -> tuple[str, ...]:
     return keypad_paths(last_button, next_button, NUMPAD_POSITIONS)
 
 
-@cache
+@memo
 def dirpad_paths(last_button: str, next_button: str) -> tuple[str, ...]:
     return keypad_paths(last_button, next_button, DIRPAD_POSITIONS)
 
 
+def parse_codes(text: str) -> list[str]:
+    return [l.strip() for l in text.splitlines()]
+
+
 def load_data():
-    with open("input", "r") as f:
-        return [l.strip() for l in f]
+    with open(input_path(), "r") as f:
+        return parse_codes(f.read())
 
 
-@cache
+# This table only depends on the layout of the directional keypad, so it's
+# kept between runs
+@memo(persist=True)
 def dir_move_cost(from_key: str, to_key: str, num_robots: int) -> int:
     """
     Given a chain of ``num_robots`` robots pressing directional keypads, the
@@ -127,7 +134,7 @@ def dir_move_cost(from_key: str, to_key: str, num_robots: int) -> int:
     )
 
 
-@cache
+@memo
 def number_move_cost(from_key: str, to_key: str, num_robots: int) -> int:
     """
     Given a chain of ``num_robots`` robots pressing directional keypads, the
@@ -147,9 +154,7 @@ def number_move_cost(from_key: str, to_key: str, num_robots: int) -> int:
     )
 
 
-def cost(num_robots: int):
-    codes = load_data()
-
+def cost(codes: list[str], num_robots: int, debug=False):
     total_presses = 0
     total_cost = 0
     for code in codes:
@@ -160,12 +165,24 @@ def cost(num_robots: int):
         total_presses += this_code_cost
         total_cost += int(code[:3]) * this_code_cost
 
-    print(f"minimum number of button presses to open door: {total_presses}")
-    print(f"Total complexity: {total_cost}")
+    if debug:
+        print(f"minimum number of button presses to open door: {total_presses}")
+    return total_cost
+
+
+def solve(text: str):
+    codes = parse_codes(text)
+    return cost(codes, 2), cost(codes, 25)
+
+
+def part1():
+    return cost(load_data(), 2, debug=True)
+
+
+def part2():
+    return cost(load_data(), 25, debug=True)
 
 
 if __name__ == "__main__":
-    # part 1
-    cost(2)
-    # part 2
-    cost(25)
+    print(f"Total complexity: {part1()}")
+    print(f"Total complexity: {part2()}")
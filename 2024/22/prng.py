@@ -2,10 +2,16 @@ import operator
 from collections import defaultdict
 from itertools import islice
 
+from aoc_common import input_path
+
+
+def parse_seeds(text: str) -> list[int]:
+    return [int(line) for line in text.split()]
+
 
 def load_data():
-    with open("input", "r") as f:
-        return [int(line) for line in f]
+    with open(input_path(), "r") as f:
+        return parse_seeds(f.read())
 
 
 def prng(n: int) -> int:
@@ -19,21 +25,21 @@ def prng(n: int) -> int:
     return n
 
 
-def part1():
-    seeds = load_data()
-
+def total_2000th(seeds: list[int]) -> int:
     total = 0
     for seed in seeds:
         for n in range(2000):
             seed = prng(seed)
         total += seed
 
-    print(f"Total of 2000th numbers: {total}")
-
+    return total
 
-def part2():
-    seeds = load_data()
 
+def best_sequence(seeds: list[int]) -> tuple[tuple[int, int, int, int], int]:
+    """
+    The sequence of four price changes that gets the most bananas, and how
+    many it gets.
+    """
     all_prices = defaultdict(int)
 
     for seed in seeds:
@@ -63,8 +69,25 @@ def part2():
         for seq, price in this_buyer_prices.items():
             all_prices[seq] += price
 
-    max_bananas = max(all_prices.items(), key=operator.itemgetter(1))
-    print(f"Max obtainable bananas: {max_bananas}")
+    return max(all_prices.items(), key=operator.itemgetter(1))
+
+
+def part1():
+    total = total_2000th(load_data())
+    print(f"Total of 2000th numbers: {total}")
+    return total
+
+
+def part2():
+    best = best_sequence(load_data())
+    print(f"Max obtainable bananas: {best}")
+    # the answer is the number of bananas, not the sequence
+    return best[1]
+
+
+def solve(text: str):
+    seeds = parse_seeds(text)
+    return total_2000th(seeds), best_sequence(seeds)[1]
 
 
 if __name__ == "__main__":
@@ -2,10 +2,11 @@ import time
 from collections import defaultdict
 from itertools import combinations
 
+from aoc_common import input_path
 
-def load_data():
-    with open("input", "r") as f:
-        edges = [tuple(sorted(l.strip().split("-"))) for l in f]
+
+def parse_network(text: str):
+    edges = [tuple(sorted(l.strip().split("-"))) for l in text.splitlines()]
 
     neighbours = defaultdict(set)
     for a, b in edges:
@@ -15,8 +16,12 @@ def load_data():
     return neighbours
 
 
-def lan_party():
-    neighbours = load_data()
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_network(f.read())
+
+
+def lan_party(neighbours, debug=False):
     all_cliques = set()
     t_cliques = set()
     for n1, nbr in neighbours.items():
@@ -27,8 +32,9 @@ def lan_party():
                 if any(n[0] == "t" for n in clique):
                     t_cliques.add(clique)
 
-    print(f"Total number of 3-cliques: {len(all_cliques)}")
-    print(f"Number of 3-cliques that contain a t node: {len(t_cliques)}")
+    if debug:
+        print(f"Total number of 3-cliques: {len(all_cliques)}")
+        print(f"Number of 3-cliques that contain a t node: {len(t_cliques)}")
 
     # now repeatedly attempt to extend each n-clique to one or more n+1 cliques.
     # This naive algorithm is probably exponential in the number of nodes, it takes
@@ -58,11 +64,21 @@ def lan_party():
 
     # at this point, last_cliques only contains cliques of maximum size
     final_clique = next(iter(last_cliques))
-    print(f"Max clique size: {len(final_clique)}")
-    print(f"Number of cliques of this size: {len(last_cliques)}")
-    print(f"Time taken: {end - start:.2f} sec")
-    print(",".join(final_clique))
+    if debug:
+        print(f"Max clique size: {len(final_clique)}")
+        print(f"Number of cliques of this size: {len(last_cliques)}")
+        print(f"Time taken: {end - start:.2f} sec")
+        print(",".join(final_clique))
+    return len(t_cliques), ",".join(final_clique)
+
+
+def solve(text: str):
+    return lan_party(parse_network(text))
+
+
+def main():
+    return lan_party(load_data(), debug=True)
 
 
 if __name__ == "__main__":
-    lan_party()
\ No newline at end of file
+    main()
\ No newline at end of file
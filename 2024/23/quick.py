@@ -1,31 +1,48 @@
-import networkx as nx
-from networkx.algorithms.clique import enumerate_all_cliques
+from aoc_common import input_path
+from aoc_common.lazy import lazy_import
 
+nx = lazy_import("networkx")
 
-def load_data():
+
+def parse_network(text: str):
     G = nx.Graph()
-    with open("input", "r") as f:
-        G.add_edges_from(tuple(l.strip().split("-")) for l in f)
+    G.add_edges_from(tuple(l.strip().split("-")) for l in text.splitlines())
 
     return G
 
 
-def using_networkx():
-    G = load_data()
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_network(f.read())
+
+
+def using_networkx(G, debug=False):
 
     three_cliques_with_t = 0
-    for clique in enumerate_all_cliques(G):
+    for clique in nx.enumerate_all_cliques(G):
         if len(clique) != 3:
             continue
         if any(n[0] == "t" for n in clique):
             three_cliques_with_t += 1
 
-    print(f"Numer of 3-cliques containing a t-node: {three_cliques_with_t}")
+    if debug:
+        print(f"Numer of 3-cliques containing a t-node: {three_cliques_with_t}")
     # The final value of clique at the end of the loop will be the largest clique
     # in the graph - the problem wording implies there is only one clique of this
     # size
-    print(f"Password (members of largest clique): {','.join(sorted(clique))}")
+    password = ",".join(sorted(clique))
+    if debug:
+        print(f"Password (members of largest clique): {password}")
+    return three_cliques_with_t, password
+
+
+def solve(text: str):
+    return using_networkx(parse_network(text))
+
+
+def main():
+    return using_networkx(load_data(), debug=True)
 
 
 if __name__ == "__main__":
-    using_networkx()
+    main()
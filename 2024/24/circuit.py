@@ -1,6 +1,8 @@
 from collections import defaultdict
 from dataclasses import dataclass
 
+from aoc_common import input_path
+
 
 @dataclass
 class Gate:
@@ -57,59 +59,71 @@ class Output(Gate):
         return self.mask == self.target_mask
 
     def run(self):
-        print(f"final value: {self.output}")
         return []
 
 
-def load_data():
-    with open("input", "r") as f:
-        inputs = {}
-        for line in f:
-            line = line.strip()
-            if not line:
-                break
-            fields = line.split(": ")
-            inputs[fields[0]] = bool(int(fields[1]))
-
-        in_gates = {name: Gate(name, val, val, "AND", []) for name, val in inputs.items()}
-        gates = in_gates.copy()
-        out_gates = {}
-        links = defaultdict(list)
-        for line in f:
-            (a, op, b, _, name) = line.strip().split(maxsplit=4)
-            g = Gate(name, None, None, op, [])
-            gates[name] = g
-            if name.startswith("z"):
-                out_gates[name] = g
-            if name in inputs:
-                in_gates[name] = g
-            links[a].append((g, "a"))
-            links[b].append((g, "b"))
-
-        # connect the dots
-        for name, outputs in links.items():
-            gates[name].outputs = outputs
-
-        output = Output("z", None, None, "OUT", [])
-        target_mask = 0
-        for name, gate in out_gates.items():
-            gate.outputs.append((output, name))
-            target_mask |= 1 << int(name[1:])
-
-        output.target_mask = target_mask
+def parse_circuit(text: str):
+    lines = iter(text.splitlines())
+    inputs = {}
+    for line in lines:
+        line = line.strip()
+        if not line:
+            break
+        fields = line.split(": ")
+        inputs[fields[0]] = bool(int(fields[1]))
+
+    in_gates = {name: Gate(name, val, val, "AND", []) for name, val in inputs.items()}
+    gates = in_gates.copy()
+    out_gates = {}
+    links = defaultdict(list)
+    for line in lines:
+        (a, op, b, _, name) = line.strip().split(maxsplit=4)
+        g = Gate(name, None, None, op, [])
+        gates[name] = g
+        if name.startswith("z"):
+            out_gates[name] = g
+        if name in inputs:
+            in_gates[name] = g
+        links[a].append((g, "a"))
+        links[b].append((g, "b"))
+
+    # connect the dots
+    for name, outputs in links.items():
+        gates[name].outputs = outputs
+
+    output = Output("z", None, None, "OUT", [])
+    target_mask = 0
+    for name, gate in out_gates.items():
+        gate.outputs.append((output, name))
+        target_mask |= 1 << int(name[1:])
+
+    output.target_mask = target_mask
 
     return in_gates, gates, output
 
 
-def part1():
-    in_gates, gates, output = load_data()
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_circuit(f.read())
+
 
+def simulate(in_gates, gates, output):
     ready_gates = list(in_gates.values())
     while ready_gates:
         g = ready_gates.pop(0)
         ready_children = g.run()
         ready_gates.extend(ready_children)
 
+    return output.output
+
+
+def solve(text: str):
+    return (simulate(*parse_circuit(text)),)
+
+
+def part1():
+    return simulate(*load_data())
+
 
 if __name__ == "__main__":
-    part1()
\ No newline at end of file
+    print(f"final value: {part1()}")
\ No newline at end of file
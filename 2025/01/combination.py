@@ -1,8 +1,11 @@
-def main():
-    with open("input", "r") as f:
-        actions = [(-1 if line[0] == "L" else 1) * int(line[1:]) for line in f]
+from aoc_common import input_path
+
+
+def parse_actions(text: str) -> list[int]:
+    return [(-1 if line[0] == "L" else 1) * int(line[1:]) for line in text.splitlines() if line]
 
-    # part 1
+
+def zeros_landed_on(actions: list[int]) -> int:
     pos = 50
     zeros = 0
     for action in actions:
@@ -10,9 +13,10 @@ def main():
         if pos == 0:
             zeros += 1
 
-    print(f"number of zeros (part 1): {zeros}")
+    return zeros
+
 
-    # part 2
+def zeros_passed(actions: list[int]) -> int:
     pos = 50
     zeros = 0
     for action in actions:
@@ -35,7 +39,22 @@ def main():
             ):
                 zeros += 1
 
-    print(f"number of times passing zero (part 2): {zeros}")
+    return zeros
+
+
+def solve(text: str):
+    actions = parse_actions(text)
+    return zeros_landed_on(actions), zeros_passed(actions)
+
+
+def main():
+    with open(input_path(), "r") as f:
+        actions = parse_actions(f.read())
+
+    landed, passed = zeros_landed_on(actions), zeros_passed(actions)
+    print(f"number of zeros (part 1): {landed}")
+    print(f"number of times passing zero (part 2): {passed}")
+    return landed, passed
 
 
 if __name__ == "__main__":
@@ -4,6 +4,8 @@ from itertools import combinations
 from typing import Iterable, Literal
 from time import perf_counter
 
+from aoc_common import input_path
+
 # Prime numbers under 50 - this will cover all cases for numbers with up
 # to 100 digits...
 small_primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
@@ -151,32 +153,54 @@ def sum_repeats(l: str, r: str, length: int) -> int:
     return (((rl * (rl + 1)) - ((ll - 1) * ll)) // 2) * repeat_factor
 
 
-def main():
-    with open("input", "r") as f:
-        data = [tuple(pair.split("-", maxsplit=1)) for pair in f.readline().strip().split(",")]
+def parse_ranges(text: str) -> list[tuple[str, str]]:
+    return [tuple(pair.split("-", maxsplit=1)) for pair in text.strip().split(",")]
+
+
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_ranges(f.readline())
+
 
+def half_repeats(data: list[tuple[str, str]]) -> int:
     # Part 1: just the cases where the number splits into exactly two halves
-    start_time = perf_counter()
     total_repeated = 0
     for start, end in data:
         for l, r in equal_magnitude_ranges(start, end):
             length, remainder = divmod(len(l), 2)
             if remainder == 0:
                 total_repeated += sum_repeats(l, r, length)
+    return total_repeated
 
-    print(f"Part 1: {total_repeated=}")
-    print(f"Time: {perf_counter() - start_time}")
 
+def all_repeats(data: list[tuple[str, str]]) -> int:
     # Part 2: all possible_splits combined using the IEP
-    start_time = perf_counter()
     total_repeated = 0
     for start, end in data:
         for l, r in equal_magnitude_ranges(start, end):
             for length, plusminus in possible_splits(len(l)):
                 total_repeated += sum_repeats(l, r, length) * plusminus
+    return total_repeated
+
 
-    print(f"Part 2: {total_repeated=}")
+def solve(text: str):
+    data = parse_ranges(text)
+    return half_repeats(data), all_repeats(data)
+
+
+def main():
+    data = load_data()
+
+    start_time = perf_counter()
+    part1 = half_repeats(data)
+    print(f"Part 1: total_repeated={part1}")
+    print(f"Time: {perf_counter() - start_time}")
+
+    start_time = perf_counter()
+    part2 = all_repeats(data)
+    print(f"Part 2: total_repeated={part2}")
     print(f"Time: {perf_counter() - start_time}")
+    return part1, part2
 
 
 if __name__ == "__main__":
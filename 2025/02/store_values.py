@@ -19,13 +19,20 @@
 
 from time import perf_counter
 
+from aoc_common import input_path
+
+
+def parse_ranges(text: str) -> list[tuple[str, str]]:
+    return [tuple(pair.split("-", maxsplit=1)) for pair in text.strip().split(",")]
+
+
+def load_data():
+    with open(input_path(), "r") as f:
+        return parse_ranges(f.readline())
 
-def main():
-    with open("input", "r") as f:
-        data = [tuple(pair.split("-", maxsplit=1)) for pair in f.readline().strip().split(",")]
 
+def half_repeats(data: list[tuple[str, str]]) -> int:
     # Part 1 for completeness - just the splits into two halves
-    start_time = perf_counter()
     dups = set()
     for start, end in data:
         for i in range(int(start), int(end) + 1):
@@ -36,12 +43,11 @@ def main():
                     # Debugging
                     print(f"start: {start}, end: {end}, i: {i}")
                 dups.add(i)
+    return sum(dups)
 
-    print(f"Part 1: total_repeated={sum(dups)}")
-    print(f"Time: {perf_counter() - start_time}")
 
+def all_repeats(data: list[tuple[str, str]]) -> int:
     # Part 2 - all possible repeats
-    start_time = perf_counter()
     dups = set()
     for start, end in data:
         for i in range(int(start), int(end) + 1):
@@ -51,9 +57,27 @@ def main():
                     # Debugging
                     print(f"start: {start}, end: {end}, i: {i}")
                 dups.add(i)
+    return sum(dups)
+
 
-    print(f"Part 2: total_repeated={sum(dups)}")
+def solve(text: str):
+    data = parse_ranges(text)
+    return half_repeats(data), all_repeats(data)
+
+
+def main():
+    data = load_data()
+
+    start_time = perf_counter()
+    part1 = half_repeats(data)
+    print(f"Part 1: total_repeated={part1}")
+    print(f"Time: {perf_counter() - start_time}")
+
+    start_time = perf_counter()
+    part2 = all_repeats(data)
+    print(f"Part 2: total_repeated={part2}")
     print(f"Time: {perf_counter() - start_time}")
+    return part1, part2
 
 
 if __name__ == "__main__":
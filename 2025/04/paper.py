@@ -1,64 +1,61 @@
-from typing import Iterable
+from aoc_common.bitgrid import BitGrid
+from aoc_common.grid import Grid
 
-from aoc_common.grid import Cell
 
-
-def load_input():
-    with open("input", "r") as f:
-        lines = [[c for c in l.strip()] for l in f]
-
-    return lines, range(len(lines)), range(len(lines[0]))
+def parse_grid(text: str) -> Grid:
+    return Grid.from_lines(text.splitlines(), pad=1, sentinel=".")
 
 
-def accessible_cells(grid: list[list[str]], vr, vc, search_set: Iterable[Cell]) -> list[Cell]:
-    accessible = []
-    for c in search_set:
-        if grid @ c == "@":
-            nbr = sum(
-                1 if grid @ nbr == "@" else 0
-                for nbr in c.neighbours(valid_rows=vr, valid_cols=vc, include_diagonal=True)
-            )
-            if nbr < 4:
-                accessible.append(c)
-    return accessible
+def load_input():
+    return Grid.from_file(pad=1, sentinel=".")
 
 
-def remove_rolls(grid: list[list[str]], cells: Iterable[Cell]) -> None:
-    for cell in cells:
-        cell.set(grid, "x")
+def accessible_cells(rolls: BitGrid) -> BitGrid:
+    """
+    The rolls that have fewer than four neighbouring rolls.
+    """
+    return rolls & rolls.neighbour_counts(include_diagonal=True).fewer_than(4)
 
 
-def main():
-    grid, vr, vc = load_input()
-    # Start with a scan of the whole grid
-    seeds = (Cell(r, c) for r in vr for c in vc)
+def remove_rolls(grid: Grid, debug=False):
+    rolls = BitGrid.from_mask(grid.mask("@"))
     total_removed = 0
+    first_removed = None
     i = 0
     while True:
         i += 1
-        accessible = accessible_cells(grid, vr, vc, seeds)
-        if not accessible:
-            # no more cells can be accessed from the current seeds - we're done
-            print(f"Iteration {i} removed no more cells - finished")
+        # Every iteration is a whole-grid scan, but it's a few dozen big-int
+        # operations on the bitboard rather than a Python loop over the
+        # cells, so there's no need to track which cells are worth re-checking
+        accessible = accessible_cells(rolls)
+        removed = accessible.count()
+        if not removed:
+            # no more cells can be accessed - we're done
+            if debug:
+                print(f"Iteration {i} removed no more cells - finished")
             break
-        total_removed += len(accessible)
-        remove_rolls(grid, accessible)
-        # Print the running total - iteration 1 is the part 1 answer
-        print(f"Iteration {i} removed {len(accessible)} cells, {total_removed} removed in total so far")
+        total_removed += removed
+        if first_removed is None:
+            first_removed = removed
+        rolls -= accessible
+        if debug:
+            # Print the running total - iteration 1 is the part 1 answer
+            print(f"Iteration {i} removed {removed} cells, {total_removed} removed in total so far")
 
-        # Optimisation:
-        # in each subsequent iteration we only need to check the cells that are
-        # neighbours of the ones we removed this time around - the accessibility
-        # or otherwise of cells that are _not_ neighbours of something we just
-        # removed will not have been affected by this iteration; if they're
-        # accessible now then they were accessible before, and would already
-        # have been removed in a previous step.
-        seeds = set()
-        seeds.update(*(c.neighbours(vr, vc, True) for c in accessible))
+    if debug:
+        print("Final grid")
+        grid.view[grid.mask("@") & ~rolls.to_mask()] = ord("x")
+        print(grid)
+        print(f"Total removed cells: {total_removed}")
+    return first_removed, total_removed
 
-    print("Final grid")
-    print("\n".join("".join(row) for row in grid))
-    print(f"Total removed cells: {total_removed}")
+
+def solve(text: str):
+    return remove_rolls(parse_grid(text))
+
+
+def main():
+    return remove_rolls(load_input(), debug=True)
 
 
 if __name__ == "__main__":
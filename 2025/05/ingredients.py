@@ -1,43 +1,47 @@
-from black import ranges
+import numpy as np
+
+from aoc_common import input_path
+from aoc_common.intervals import IntervalSet
+
+
+def parse_inventory(text: str):
+    lines = iter(text.splitlines())
+    ranges = []
+    for line in lines:
+        line = line.strip()
+        if line == "":
+            break
+        start, end = line.split("-")
+        ranges.append(range(int(start), int(end) + 1))  # +1 to make the end inclusive
+
+    # remaining lines are the available IDs
+    available = np.array([int(l) for l in lines], dtype=np.int64)
+
+    # the interval set amalgamates overlapping and adjacent ranges (this is
+    # not necessary for part 1, but it is for part 2)
+    return IntervalSet(ranges), available
 
 
 def load_input():
-    with open("input", "r") as f:
-        ranges = []
-        for line in f:
-            line = line.strip()
-            if line == "":
-                break
-            start, end = line.split("-")
-            ranges.append(range(int(start), int(end) + 1))  # +1 to make the end inclusive
-
-        # remaining lines are the available IDs
-        available = [int(l) for l in f]
-
-    # amalgamate overlapping and adjacent ranges (this is not
-    # necessary for part 1, but it is for part 2):
-    ranges.sort(key=lambda r: r.start)
-    i = 0
-    while i < len(ranges) - 1:
-        r_i, r_j = ranges[i], ranges[i + 1]
-        if r_i.stop < r_j.start:
-            # there's at least 1 number not included in either range
-            i += 1
-        else:
-            # this range overlaps or butts right up to the next one;
-            # replace both ranges with a single range spanning the
-            # whole interval
-            ranges[i : i + 2] = [range(r_i.start, max(r_i.stop, r_j.stop))]
-
-    return ranges, available
+    with open(input_path(), "r") as f:
+        return parse_inventory(f.read())
+
+
+def fresh_ingredients(fresh: IntervalSet, ids: np.ndarray):
+    return np.count_nonzero(fresh.contains_many(ids)), fresh.size
+
+
+def solve(text: str):
+    return fresh_ingredients(*parse_inventory(text))
 
 
 def main():
-    ranges, ids = load_input()
+    available_fresh, possible_fresh = fresh_ingredients(*load_input())
     print("Part 1: number of available ingredients that are fresh")
-    print(sum(1 for i in ids if any(i in r for r in ranges)))
+    print(available_fresh)
     print("Part 2: number of possible IDs that are fresh")
-    print(sum(len(r) for r in ranges))
+    print(possible_fresh)
+    return available_fresh, possible_fresh
 
 
 if __name__ == "__main__":
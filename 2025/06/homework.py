@@ -3,6 +3,8 @@ from functools import reduce
 from itertools import zip_longest
 from typing import Callable
 
+from aoc_common import input_path
+
 # Mapping from operator character to the corresponding function
 # and identity value for that operator
 OPS = {
@@ -17,11 +19,10 @@ def col_slice(col_indices, i):
     # else slice to one place before the start of the next column
     return slice(col_indices[i], col_indices[i + 1] - 1)
 
-def load_input() -> list[tuple[tuple[Callable[[int, int], int], int], list[str]]]:
-    with open("input", "r") as f:
-        # only strip the trailing newline, not other leading and trailing
-        # whitespace since that is significant for part 2
-        lines = [l.strip("\n") for l in f]
+def parse_problems(text: str) -> list[tuple[tuple[Callable[[int, int], int], int], list[str]]]:
+    # only split off the newlines, not other leading and trailing whitespace
+    # since that is significant for part 2
+    lines = text.splitlines()
 
     arglines = lines[:-1]
     opline = lines[-1]
@@ -46,16 +47,21 @@ def load_input() -> list[tuple[tuple[Callable[[int, int], int], int], list[str]]
     return list(zip([OPS[op] for op in operators], args))
 
 
-def main():
-    problems = load_input()
+def load_input() -> list[tuple[tuple[Callable[[int, int], int], int], list[str]]]:
+    with open(input_path(), "r") as f:
+        return parse_problems(f.read())
+
 
+def human_total(problems) -> int:
     # part 1 - read the numbers from left to right, top to bottom
     total = 0
     for (op, unit), args in problems:
         total += reduce(op, (int(a) for a in args), unit)
 
-    print(f"Human numbers {total=}")
+    return total
+
 
+def cephalopod_total(problems) -> int:
     # part 2 - read the numbers down the columns - the problem statement says
     # we're supposed to read the columns from right to left but + and * are
     # commutative and associative so working LTR gives the same answer
@@ -69,7 +75,21 @@ def main():
         transposed_args = ["".join(chars) for chars in zip_longest(*args, fillvalue=" ")]
         total += reduce(op, (int(a) for a in transposed_args), unit)
 
-    print(f"Cephalopod numbers {total=}")
+    return total
+
+
+def solve(text: str):
+    problems = parse_problems(text)
+    return human_total(problems), cephalopod_total(problems)
+
+
+def main():
+    problems = load_input()
+    human = human_total(problems)
+    print(f"Human numbers total={human}")
+    cephalopod = cephalopod_total(problems)
+    print(f"Cephalopod numbers total={cephalopod}")
+    return human, cephalopod
 
 
 if __name__ == "__main__":
@@ -1,25 +1,31 @@
-def load_input():
+from aoc_common import input_path
+
+
+def parse_manifold(text: str):
     # We don't need to represent the whole grid, all we care about
     # is the column position of the beam source, and the set of
     # column positions for each row of splitters
     start_col: int = -1
     splitters: list[set[int]] = []
-    with open("input", "r") as f:
-        for line in f:
-            if (s := line.find("S")) >= 0:
-                start_col = s
-            elif "^" in line:
-                splitter_cols = set()
-                c = -1
-                while (c := line.find("^", c + 1)) >= 0:
-                    splitter_cols.add(c)
-                splitters.append(splitter_cols)
+    for line in text.splitlines():
+        if (s := line.find("S")) >= 0:
+            start_col = s
+        elif "^" in line:
+            splitter_cols = set()
+            c = -1
+            while (c := line.find("^", c + 1)) >= 0:
+                splitter_cols.add(c)
+            splitters.append(splitter_cols)
 
     return start_col, splitters
 
 
-def main():
-    start_col, splitters = load_input()
+def load_input():
+    with open(input_path(), "r") as f:
+        return parse_manifold(f.read())
+
+
+def beam_splits(start_col: int, splitters: list[set[int]]):
     # How many splitters have the beams encountered in total
     total_splits = 0
     # Which columns have a beam at this point in the descent
@@ -58,8 +64,18 @@ def main():
                 timelines[splitter - 1] = routes_to_left + routes_to_here
                 timelines[splitter + 1] = routes_to_right + routes_to_here
 
+    return total_splits, sum(timelines.values())
+
+
+def solve(text: str):
+    return beam_splits(*parse_manifold(text))
+
+
+def main():
+    total_splits, total_timelines = beam_splits(*load_input())
     print(f"{total_splits=}")
-    print(f"Total timelines: {sum(timelines.values())}")
+    print(f"Total timelines: {total_timelines}")
+    return total_splits, total_timelines
 
 
 if __name__ == "__main__":
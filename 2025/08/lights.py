@@ -1,22 +1,32 @@
+import itertools
 import operator
 from functools import reduce
 
+from aoc_common.parse import parse_ints, read_ints
+from aoc_common.unionfind import DisjointSet, union_until
 
-def load_input():
-    with open("input", "r") as f:
-        return [tuple(int(i) for i in l.split(",")) for l in f]
 
+def parse_boxes(text: str) -> list[tuple[int, int, int]]:
+    return [tuple(box) for box in parse_ints(text, columns=3).tolist()]
 
-def part1_output(unique_circuits: dict[int, set[int]]):
-    # sort unique circuits by size
-    unique = list(unique_circuits.values())
-    unique.sort(key=len, reverse=True)
 
-    print(f"Product of 3 largest after 1000 connections: {reduce(operator.mul, (len(c) for c in unique[:3]), 1)}")
+def load_input():
+    return [tuple(box) for box in read_ints(columns=3).tolist()]
 
 
-def main():
-    boxes = load_input()
+def largest_product(circuits: DisjointSet) -> int:
+    # sort circuit sizes, largest first
+    sizes = circuits.component_sizes()
+    sizes.sort(reverse=True)
+    return reduce(operator.mul, sizes[:3], 1)
+
+
+def connect(boxes: list[tuple[int, int, int]]) -> tuple[int, tuple[int, int, int]]:
+    """
+    The product of the sizes of the three largest circuits after the first
+    1000 connections, and the connection that finally links every box into
+    one circuit, as ``(i, j, squared distance)``.
+    """
     squared_distances: list[tuple[int, int, int]] = []
     for i in range(len(boxes) - 1):
         xi, yi, zi = boxes[i]
@@ -27,43 +37,43 @@ def main():
 
     squared_distances.sort(key=operator.itemgetter(2))
 
-    # Initially each box is its own singleton circuit
-    circuits: list[set[int]] = [{i} for i in range(len(boxes))]
-    unique_circuits: dict[int, set[int]] = {id(c): c for c in circuits}
-    # iterate over the connections from closes to furthest and merge the
-    # circuits on each side of the connection - when two indices i and j
-    # are part of the same circuit, then circuits[i] and circuits[j]
-    # are *the same set object* (not just sets with the same members)
-    for n, (i, j, d_ij) in enumerate(squared_distances):
-        c_i = circuits[i]
-        c_j = circuits[j]
-        # First check if i and j are already in the same circuit - they might
-        # be if this link creates a loop in an already-existing circuit
-        if c_i is not c_j:
-            # this link joins two circuits - add the elements of circuit i
-            # to circuit j's set
-            c_j.update(c_i)
-            # drop the old i circuit
-            del unique_circuits[id(c_i)]
-            # and update the old references to circuit i's set to make them
-            # point at the merged set instead
-            for member_i in c_i:
-                circuits[member_i] = c_j
-
-        if n == 999:
-            # done the first thousand - this is where we stop for part 1
-            part1_output(unique_circuits)
-
-        if len(unique_circuits) == 1:
-            # everything is one circuit - we're finished
-            break
-
-    # we've linked everything into one circuit, so the current
-    # values of i and j coming out of the loop are the last two
-    # boxes we connected in order to reach that state - multiply
-    # their x coords to get the final answer
+    # Initially each box is its own singleton circuit.  Work through the
+    # connections from closest to furthest merging the circuits on each side
+    # of the connection - the union-find structure takes care of connections
+    # that would create a loop in an already-existing circuit
+    circuits = DisjointSet(len(boxes))
+    connections = iter(squared_distances)
+
+    # make the first thousand connections - this is where we stop for part 1
+    last = union_until(circuits, itertools.islice(connections, 1000))
+    product = largest_product(circuits)
+    if last is None:
+        # carry on until everything is one circuit
+        last = union_until(circuits, connections)
+    return product, last
+
+
+def solve(text: str):
+    boxes = parse_boxes(text)
+    product, (i, j, _) = connect(boxes)
+    # the last connection we made is between the last two boxes we connected
+    # in order to get everything into one circuit - multiply their x coords
+    # to get the final answer
+    return product, boxes[i][0] * boxes[j][0]
+
+
+def main():
+    boxes = load_input()
+    product, last = connect(boxes)
+    print(f"Product of 3 largest after 1000 connections: {product}")
+
+    # we've linked everything into one circuit, so the last connection we
+    # made is between the last two boxes we connected in order to reach that
+    # state - multiply their x coords to get the final answer
+    i, j, _ = last
     print(f"last connection was box {i} at {boxes[i]} to box {j} at {boxes[j]}")
     print(f"product of x coords = {boxes[i][0] * boxes[j][0]}")
+    return product, boxes[i][0] * boxes[j][0]
 
 
 if __name__ == "__main__":
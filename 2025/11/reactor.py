@@ -1,17 +1,23 @@
 import itertools
-from functools import cache
 
 import networkx
 
+from aoc_common import input_path
+from aoc_common.memo import memo
 
-def load_input():
-    with open("input", "r") as f:
-        lines = [l.strip().split(": ") for l in f]
+
+def parse_devices(text: str):
+    lines = [l.strip().split(": ") for l in text.splitlines()]
 
     edges = [(l[0], t) for l in lines for t in l[1].split()]
     return edges, lines
 
 
+def load_input():
+    with open(input_path(), "r") as f:
+        return parse_devices(f.read())
+
+
 def graph_to_dot(lines):
     """
     Convert the graph input format into a graphviz file suitable
@@ -34,7 +40,7 @@ def graph_to_dot(lines):
 def count_routes(edges, start, end, via=()):
     g = networkx.DiGraph(edges)
 
-    @cache
+    @memo
     def routes(a, b):
         """
         Memoized recursive function to calculate the number of routes
@@ -61,16 +67,37 @@ def count_routes(edges, start, end, via=()):
     for n1, n2 in itertools.pairwise([start, *via, end]):
         product *= routes(n1, n2)
 
-    print(product)
+    return product
+
+
+def routes_from_you(graph_edges):
+    return count_routes(graph_edges, "you", "out")
+
+
+def problem_routes(graph_edges):
+    # in my input fft is before dac in all possible paths
+    return count_routes(graph_edges, "svr", "out", ("fft", "dac"))
+
+
+def solve(text: str):
+    graph_edges, _ = parse_devices(text)
+    return routes_from_you(graph_edges), problem_routes(graph_edges)
+
+
+def part1():
+    graph_edges, _ = load_input()
+    return routes_from_you(graph_edges)
+
+
+def part2():
+    graph_edges, _ = load_input()
+    return problem_routes(graph_edges)
 
 
 if __name__ == "__main__":
-    graph_edges, input_lines = load_input()
     # visualise the graph so we can work out whether our input has
     # fft before dac or dac before fft
-    # graph_to_dot(input_lines)
+    # graph_to_dot(load_input()[1])
 
-    # Part 1
-    count_routes(graph_edges, "you", "out")
-    # Part 2 - in my input fft is before dac in all possible paths
-    count_routes(graph_edges, "svr", "out", ("fft", "dac"))
+    print(part1())
+    print(part2())
@@ -1,27 +1,33 @@
 import re
 
+from aoc_common import input_path
+
 region_re = re.compile(r"(\d+)x(\d+): (.*)")
 
-def load_input():
+def parse_presents(text: str):
     shapes: list[list[str]] = []
     regions = []
-    with open("input", "r") as f:
-        for line in f:
-            line = line.strip()
-            if line.endswith(":"):
-                cur_shape = []
-                while (l := f.readline().strip()):
-                    cur_shape.append(l)
-                shapes.append(cur_shape)
-            else:
-                w, h, counts = region_re.match(line).groups()
-                regions.append((int(w), int(h), tuple(int(c) for c in counts.split())))
+    lines = iter(text.splitlines())
+    for line in lines:
+        line = line.strip()
+        if line.endswith(":"):
+            cur_shape = []
+            while (l := next(lines, "").strip()):
+                cur_shape.append(l)
+            shapes.append(cur_shape)
+        else:
+            w, h, counts = region_re.match(line).groups()
+            regions.append((int(w), int(h), tuple(int(c) for c in counts.split())))
 
     return shapes, regions
 
 
-def main():
-    shapes, regions = load_input()
+def load_input():
+    with open(input_path(), "r") as f:
+        return parse_presents(f.read())
+
+
+def count_fitting(shapes, regions, debug=False):
     covered_areas = [sum(l.count("#") for l in s) for s in shapes]
 
     fitting_regions = 0
@@ -40,14 +46,25 @@ def main():
         if sum(area * num for area, num in zip(covered_areas, counts)) >= w * h:
             continue
 
-        print(f"Line {n} cannot be solved by the tests so far")
+        if debug:
+            print(f"Line {n} cannot be solved by the tests so far")
 
         # Next I was going to try combinations, like in my input two 1s, two 2s,
         # or a 1 and a 2 together can fit into a 3x4 region, two 3s will fit into
         # a 4x4, one 0 and one 4 can fit into 3x5, etc. etc.  But I tried
         # submitting the trivial answer first and it said that one was right...
 
-    print(fitting_regions)
+    return fitting_regions
+
+
+def solve(text: str):
+    return (count_fitting(*parse_presents(text)),)
+
+
+def main():
+    fitting = count_fitting(*load_input(), debug=True)
+    print(fitting)
+    return fitting
 
 
 if __name__ == "__main__":
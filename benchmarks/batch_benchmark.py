@@ -0,0 +1,61 @@
+"""
+Compare solving a corpus of generated inputs for a day by running the script
+cold for each one (a fresh ``python day.py`` per input) against the batch
+executor, both in-process and across a pool of workers.
+
+Usage: python batch_benchmark.py [inputs] [jobs] [scale]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from aoc_common.batch import run_batch
+from aoc_common.gen import generate
+from aoc_common.runner import discover, find_root
+
+DAYS = ("2024/01", "2025/01", "2025/08")
+
+
+def timed(fn) -> tuple[float, object]:
+    start = perf_counter()
+    result = fn()
+    return perf_counter() - start, result
+
+
+def main(inputs: int = 16, jobs: int = 4, scale: int = 1):
+    root = find_root(Path(__file__).parent)
+    with tempfile.TemporaryDirectory() as tmp:
+        for day in DAYS:
+            files = []
+            for seed in range(inputs):
+                path = Path(tmp) / f"{day.replace('/', '-')}-{seed:03}.txt"
+                path.write_text(generate(day, scale, seed))
+                files.append(path)
+
+            for sol in discover(root, [day]):
+                def cold():
+                    return {str(f): subprocess.run([sys.executable, str(sol.path)], cwd=sol.path.parent,
+                                                   capture_output=True, check=True,
+                                                   env=dict(os.environ, AOC_INPUT=str(f))).returncode
+                            for f in files}
+
+                def batch(n):
+                    return {r.input: r for r in run_batch(sol, files, n)}
+
+                cold_time, _ = timed(cold)
+                serial_time, serial = timed(lambda: batch(1))
+                pool_time, pooled = timed(lambda: batch(jobs))
+                print(f"{sol.id:30} {inputs} inputs  cold {cold_time:.3f}s"
+                      f"  batch {serial_time:.3f}s (x{cold_time / serial_time:.2f})"
+                      f"  -j{jobs} {pool_time:.3f}s (x{cold_time / pool_time:.2f})")
+                if any(r.error for r in serial.values()) or \
+                        {k: r.answers for k, r in serial.items()} != {k: r.answers for k, r in pooled.items()}:
+                    raise AssertionError(f"{sol.id}: pooled answers differ from in-process answers")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
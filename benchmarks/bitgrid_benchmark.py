@@ -0,0 +1,83 @@
+"""
+Compare a set of Cells against a BitGrid as the state of a grid automaton,
+using the 2023/21 step (every reachable point spreads to its open
+neighbours) on a random garden repeated in every direction.
+
+Usage: python bitgrid_benchmark.py [garden_size] [steps] [repeats]
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from aoc_common.bitgrid import BitGrid
+from aoc_common.grid import Cell
+
+
+def make_garden(size: int, seed: int = 2023) -> list[str]:
+    rng = random.Random(seed)
+    rows = [["#" if rng.random() < 0.15 else "." for _ in range(size)] for _ in range(size)]
+    rows[size // 2][size // 2] = "S"
+    return ["".join(row) for row in rows]
+
+
+def with_sets(matrix: list[str], steps: int) -> list[int]:
+    """
+    The 2023/21 solution before bitboards.
+    """
+    rows = len(matrix)
+    cols = len(matrix[0])
+    points = {Cell(rows // 2, cols // 2)}
+    counts = []
+    for _ in range(steps):
+        new_points = set()
+        for p in points:
+            if matrix[(p.row - 1) % rows][p.col % cols] != "#":
+                new_points.add(Cell(p.row - 1, p.col))
+            if matrix[p.row % rows][(p.col - 1) % cols] != "#":
+                new_points.add(Cell(p.row, p.col - 1))
+            if matrix[(p.row + 1) % rows][p.col % cols] != "#":
+                new_points.add(Cell(p.row + 1, p.col))
+            if matrix[p.row % rows][(p.col + 1) % cols] != "#":
+                new_points.add(Cell(p.row, p.col + 1))
+        points = new_points
+        counts.append(len(points))
+    return counts
+
+
+def with_bitgrid(matrix: list[str], steps: int) -> list[int]:
+    rows = len(matrix)
+    cols = len(matrix[0])
+    copies = 2 * (steps // min(rows, cols) + 1) + 1
+    garden = ~BitGrid.from_lines(matrix, "#").tile(copies, copies)
+    middle = copies // 2
+    points = BitGrid.from_cells(garden.rows, garden.cols, [(rows // 2 + middle * rows, cols // 2 + middle * cols)])
+    counts = []
+    for _ in range(steps):
+        points = points.spread() & garden
+        counts.append(points.count())
+    return counts
+
+
+def main(size: int = 131, steps: int = 200, repeats: int = 3):
+    matrix = make_garden(size)
+    results = {}
+    for name, fn in {"set of Cells": with_sets, "BitGrid": with_bitgrid}.items():
+        timings = []
+        for _ in range(repeats):
+            start = perf_counter()
+            counts = fn(matrix, steps)
+            timings.append(perf_counter() - start)
+        results[name] = (counts, min(timings))
+
+    base_time = results["set of Cells"][1]
+    for name, (counts, best) in results.items():
+        print(f"{name:13} {counts[-1]} points after {steps} steps  best of {repeats}: {best:.4f}s "
+              f"(x{base_time / best:.2f})")
+
+    if len({tuple(r[0]) for r in results.values()}) != 1:
+        raise AssertionError("Representations disagree")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,126 @@
+"""
+Benchmark the integer-priority queues (BucketQueue and RadixHeap) against the
+comparison-based heaps, by running the real 2023 day 17 (crucible) and 2024
+day 16 (reindeer) solutions on synthetic grids of increasing size.
+
+The scale factors multiply the number of *cells* in the grid relative to the
+real puzzle inputs (141x141 for both days), so 100x is a 1410x1410 grid.  The
+big sizes take a long time in pure Python, pass a smaller list of scales to
+skip them.
+
+Usage: python bucket_queue_benchmark.py [scales] [queues]
+e.g.   python bucket_queue_benchmark.py 1,10 indexed,bucket,radix
+"""
+
+import contextlib
+import io
+import math
+import os
+import random
+import runpy
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+REPO = Path(__file__).resolve().parent.parent
+REAL_SIZE = 141
+
+
+def crucible_input(size: int, rng: random.Random) -> str:
+    return "\n".join(
+        "".join(str(rng.randint(1, 9)) for _ in range(size)) for _ in range(size)
+    ) + "\n"
+
+
+def reindeer_input(size: int, rng: random.Random) -> str:
+    """
+    Random maze in the style of 2024 day 16 - a spanning tree carved out by a
+    randomised depth-first search, with some extra walls knocked through so
+    there are loops and therefore several competing routes.
+    """
+    if size % 2 == 0:
+        size += 1
+    grid = [["#"] * size for _ in range(size)]
+    stack = [(size - 2, 1)]
+    grid[size - 2][1] = "."
+    while stack:
+        r, c = stack[-1]
+        options = [
+            (r + dr, c + dc)
+            for dr, dc in ((0, 2), (2, 0), (0, -2), (-2, 0))
+            if 0 < r + dr < size - 1 and 0 < c + dc < size - 1 and grid[r + dr][c + dc] == "#"
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc = rng.choice(options)
+        grid[(r + nr) // 2][(c + nc) // 2] = "."
+        grid[nr][nc] = "."
+        stack.append((nr, nc))
+
+    for _ in range(size * size // 20):
+        r = rng.randrange(1, size - 1)
+        c = rng.randrange(1, size - 1)
+        if (r % 2) != (c % 2):
+            grid[r][c] = "."
+
+    grid[size - 2][1] = "S"
+    grid[1][size - 2] = "E"
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def run_day(script: Path, input_text: str, call):
+    """
+    Load the given solution script with ``input_text`` as its input file and
+    return the time taken by ``call(module_globals)``, plus its result.
+    """
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        Path(tmp, "input").write_text(input_text)
+        os.chdir(tmp)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()) as out:
+                mod = runpy.run_path(str(script), run_name="benchmark")
+                start = perf_counter()
+                result = call(mod)
+                elapsed = perf_counter() - start
+        finally:
+            os.chdir(cwd)
+    return elapsed, result if result is not None else out.getvalue().splitlines()[0]
+
+
+def main(scales=(1, 10, 100), queues=("indexed", "lazy", "bucket", "radix")):
+    for scale in scales:
+        size = round(REAL_SIZE * math.sqrt(scale))
+        rng = random.Random(scale)
+        crucible_text = crucible_input(size, rng)
+        reindeer_text = reindeer_input(size, rng)
+        days = [
+            (
+                "2023/17 crucible",
+                REPO / "2023" / "17" / "crucible.py",
+                crucible_text,
+                lambda mod, q: mod["cheapest_path"](mod["parse_city"](crucible_text), 4, 10, q),
+            ),
+            (
+                "2024/16 reindeer",
+                REPO / "2024" / "16" / "reindeer.py",
+                reindeer_text,
+                lambda mod, q: mod["cheapest_path"](*mod["parse_maze"](reindeer_text), queue=q),
+            ),
+        ]
+        for label, script, input_text, fn in days:
+            print(f"{label} at {scale}x ({size}x{size})")
+            for q in queues:
+                elapsed, result = run_day(script, input_text, lambda mod: fn(mod, q))
+                print(f"  {q:8} {elapsed:9.3f}s  {result}")
+
+
+if __name__ == "__main__":
+    kwargs = {}
+    if len(sys.argv) > 1:
+        kwargs["scales"] = [int(s) for s in sys.argv[1].split(",")]
+    if len(sys.argv) > 2:
+        kwargs["queues"] = sys.argv[2].split(",")
+    main(**kwargs)
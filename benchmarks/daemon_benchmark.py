@@ -0,0 +1,75 @@
+"""
+Compare running small days cold (a fresh ``python day.py`` each time)
+against running them in the warm worker daemon, both through its command
+line client and as a bare request from an already-running process.  The
+daemon is started on a temporary socket for the benchmark, and the inputs
+are generated.
+
+Usage: python daemon_benchmark.py [repeats] [scale]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from aoc_common import daemon
+from aoc_common.gen import generate
+from aoc_common.runner import discover, find_root
+
+DAYS = ("2024/01", "2025/01", "2025/08")
+
+
+def best_of(repeats: int, fn) -> tuple[float, object]:
+    timings = []
+    for _ in range(repeats):
+        start = perf_counter()
+        result = fn()
+        timings.append(perf_counter() - start)
+    return min(timings), result
+
+
+def main(repeats: int = 5, scale: int = 1):
+    root = find_root(Path(__file__).parent)
+    with tempfile.TemporaryDirectory() as tmp:
+        sock = Path(tmp) / "daemon.sock"
+        env = dict(os.environ, AOC_DAEMON_SOCKET=str(sock))
+        try:
+            start_time, _ = best_of(1, lambda: daemon.start(sock))
+            print(f"daemon ready after {start_time:.3f}s")
+            for day in DAYS:
+                input_file = Path(tmp) / day.replace("/", "-")
+                try:
+                    input_file.write_text(generate(day, scale))
+                except KeyError:
+                    continue
+                for sol in discover(root, [day]):
+                    def cold():
+                        proc = subprocess.run([sys.executable, str(sol.path)], cwd=sol.path.parent, capture_output=True,
+                                              text=True, env=dict(os.environ, AOC_INPUT=str(input_file)))
+                        return proc.stdout.splitlines()
+
+                    def client():
+                        return subprocess.run([sys.executable, "-m", "aoc_common.daemon", "run", "-q", "--input",
+                                               str(input_file), sol.id], env=env, capture_output=True).returncode
+
+                    def warm():
+                        response = daemon.run_report([sol.id], root, input_file, path=sock)
+                        return [line for p in response["results"][0]["phases"] for line in p["output"]]
+
+                    cold_time, cold_output = best_of(repeats, cold)
+                    client_time, status = best_of(repeats, client)
+                    warm_time, warm_output = best_of(repeats, warm)
+                    print(f"{sol.id:30} cold {cold_time:.4f}s  client {client_time:.4f}s (x{cold_time / client_time:.2f})"
+                          f"  request {warm_time:.4f}s (x{cold_time / warm_time:.2f})")
+                    # scripts that run their own __main__ in the runner print the same as when run cold
+                    if status or warm_output != cold_output:
+                        raise AssertionError(f"{sol.id}: daemon output differs from a cold run")
+        finally:
+            daemon.stop(sock)
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,156 @@
+"""
+Compare the connectivity approaches the solutions used before DisjointSet
+against union-find:
+
+- merging circuits by copying set members across and repointing every
+  member (the old 2025/08), on a random stream of edges
+- labelling garden regions by repeated scan-and-flood-fill (the old
+  2024/12), on a random grid of plot labels
+
+Usage: python disjoint_set_benchmark.py [nodes] [grid_size] [repeats]
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from aoc_common.grid import Cell, Grid
+from aoc_common.unionfind import DisjointSet, union_until
+
+
+def random_edges(n: int, seed: int = 2025) -> list[tuple[int, int]]:
+    """
+    Enough random edges to (almost certainly) connect ``n`` nodes, followed
+    by a chain through all of them so the stream always ends up connected.
+    """
+    rng = random.Random(seed)
+    edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(n * 6)]
+    edges.extend((i, i + 1) for i in range(n - 1))
+    return edges
+
+
+def set_merging(n: int, edges) -> tuple[int, int]:
+    """
+    Sets shared between their members, as 2025/08 used to do it.  Returns
+    the position of the edge that connected everything, and its node.
+    """
+    circuits = [{i} for i in range(n)]
+    unique = n
+    for e, (i, j) in enumerate(edges):
+        c_i = circuits[i]
+        c_j = circuits[j]
+        if c_i is not c_j:
+            c_j.update(c_i)
+            unique -= 1
+            for member in c_i:
+                circuits[member] = c_j
+            if unique == 1:
+                return e, i
+    raise AssertionError("Edges did not connect everything")
+
+
+def disjoint_set(n: int, edges) -> tuple[int, int]:
+    ds = DisjointSet(n)
+    # make the edge positions available without changing what union_until sees
+    edge = union_until(ds, ((i, j, e) for e, (i, j) in enumerate(edges)))
+    return edge[2], edge[0]
+
+
+def make_garden(size: int, seed: int = 2024) -> Grid:
+    """
+    Random garden where each plot usually copies the label of the one above
+    or to the left, so it has a mix of large and small regions.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for r in range(size):
+        row = []
+        for c in range(size):
+            x = rng.random()
+            if x < 0.4 and r:
+                row.append(rows[-1][c])
+            elif x < 0.8 and c:
+                row.append(row[-1])
+            else:
+                row.append(rng.choice("ABCDEFGH"))
+        rows.append(row)
+    return Grid.from_lines(("".join(row) for row in rows), pad=1, sentinel=".")
+
+
+def flood_fill_regions(grid: Grid) -> list[int]:
+    """
+    Region areas found by scanning for an unvisited plot and flood filling
+    from it, as 2024/12 used to do it.
+    """
+    lines = grid.lines(padded=True)
+    visited = [[ch == "." for ch in row] for row in lines]
+    areas = []
+    for r in range(len(lines)):
+        for c in range(len(lines[0])):
+            if visited[r][c]:
+                continue
+            label = lines[r][c]
+            frontier = {Cell(r, c)}
+            area = 0
+            while frontier:
+                cell = frontier.pop()
+                cell.set(visited, True)
+                area += 1
+                for nbr in cell.neighbours():
+                    if nbr.of(lines) == label and not nbr.of(visited):
+                        frontier.add(nbr)
+            areas.append(area)
+    return sorted(areas)
+
+
+def union_find_regions(grid: Grid) -> list[int]:
+    labels = grid.data.ravel().tolist()
+    stride = grid.stride
+    regions = DisjointSet(len(labels))
+    plots = [i for i in grid.flat_index.all_cells() if labels[i] != ord(".")]
+    for i in plots:
+        if labels[i] == labels[i + 1]:
+            regions.union(i, i + 1)
+        if labels[i] == labels[i + stride]:
+            regions.union(i, i + stride)
+    return sorted(regions.sizes[i] for i in plots if regions.find(i) == i)
+
+
+def best_time(fn, args, repeats: int):
+    timings = []
+    for _ in range(repeats):
+        start = perf_counter()
+        result = fn(*args)
+        timings.append(perf_counter() - start)
+    return result, min(timings)
+
+
+def compare(title: str, candidates, args, repeats: int):
+    print(title)
+    results = {name: best_time(fn, args, repeats) for name, fn in candidates.items()}
+    base_time = next(iter(results.values()))[1]
+    for name, (_, best) in results.items():
+        print(f"  {name:16} best of {repeats}: {best:.4f}s (x{base_time / best:.2f})")
+    if len({repr(r[0]) for r in results.values()}) != 1:
+        raise AssertionError("Approaches disagree")
+
+
+def main(nodes: int = 20_000, grid_size: int = 400, repeats: int = 3):
+    edges = random_edges(nodes)
+    compare(
+        f"Connecting {nodes} nodes with up to {len(edges)} edges",
+        {"set merging": set_merging, "DisjointSet": disjoint_set},
+        (nodes, edges),
+        repeats,
+    )
+    grid = make_garden(grid_size)
+    compare(
+        f"Labelling the regions of a {grid_size}x{grid_size} garden",
+        {"flood fill": flood_fill_regions, "DisjointSet": union_find_regions},
+        (grid,),
+        repeats,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,80 @@
+"""
+Compare Cell tuples against flat int positions as the coordinate encoding for
+a grid search.  The same flood fill code runs with a CellIndex and with a
+FlatIndex, to show the time and memory saved by not allocating a namedtuple
+for every step.
+
+Usage: python flat_index_benchmark.py [grid_size] [repeats]
+"""
+
+import random
+import sys
+import tracemalloc
+from time import perf_counter
+
+from aoc_common.grid import CellIndex, Grid
+
+
+def make_grid(size: int, seed: int = 2024) -> Grid:
+    rng = random.Random(seed)
+    return Grid.from_lines(
+        ("".join("#" if rng.random() < 0.25 else "." for _ in range(size)) for _ in range(size)),
+        pad=1,
+        sentinel="#",
+    )
+
+
+def flood_fill(grid: Grid, index) -> int:
+    """
+    Distance from the top left to every reachable open cell, written purely
+    against the index interface so it works with either encoding.  Returns
+    the sum of the distances as a checksum.  (Grid accepts both Cells and
+    flat ints as indexes.)
+    """
+    start = index.encode(next(c for c in grid.find(".")))
+    distances = {start: 0}
+    frontier = [start]
+    while frontier:
+        next_frontier = []
+        for pos in frontier:
+            d = distances[pos] + 1
+            for n in index.neighbours(pos):
+                if n not in distances and grid[n] == ".":
+                    distances[n] = d
+                    next_frontier.append(n)
+        frontier = next_frontier
+    return sum(distances.values())
+
+
+def measure(grid: Grid, index, repeats: int):
+    timings = []
+    for _ in range(repeats):
+        start = perf_counter()
+        result = flood_fill(grid, index)
+        timings.append(perf_counter() - start)
+
+    tracemalloc.start()
+    flood_fill(grid, index)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, min(timings), peak
+
+
+def main(size: int = 500, repeats: int = 3):
+    grid = make_grid(size)
+    encodings = {
+        "Cell": CellIndex(grid.rows, grid.cols, grid.pad),
+        "flat int": grid.flat_index,
+    }
+    results = {name: measure(grid, index, repeats) for name, index in encodings.items()}
+    base_time, base_peak = results["Cell"][1:]
+    for name, (checksum, best, peak) in results.items():
+        print(f"{name:9} checksum={checksum}  best of {repeats}: {best:.4f}s (x{base_time / best:.2f})  "
+              f"peak traced memory: {peak / 1e6:.2f}MB (x{base_peak / peak:.2f} smaller)")
+
+    if len({r[0] for r in results.values()}) != 1:
+        raise AssertionError("Encodings disagree")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,80 @@
+"""
+Measure how long each solution script takes to start - that is, to execute
+the module (which runs all its imports) without running any parts - using
+``python -X importtime`` in a fresh interpreter per script.  Shows the total
+import time and the heaviest top-level imports, slowest scripts first.
+Scripts whose imports fail (e.g. a dependency that isn't installed) are
+listed with the error.
+
+Usage: python import_benchmark.py [repeats] [selector ...]
+
+where the selectors are as for the runner (``2023``, ``2023/24`` ...).
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from aoc_common.runner import discover, find_root
+
+# Written to stderr just before the script is executed, so that the
+# interpreter's own startup imports can be skipped
+MARKER = "--- aoc import benchmark ---"
+
+LOADER = f"""
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location("aoc_startup", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+sys.modules["aoc_startup"] = module
+sys.stderr.write({MARKER!r} + "\\n")
+spec.loader.exec_module(module)
+"""
+
+
+def import_times(path: Path) -> tuple[dict[str, float], str]:
+    """
+    Cumulative import time in ms of each top-level import made by the
+    script, and any error.
+    """
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", LOADER, str(path)],
+                          capture_output=True, text=True, cwd=path.parent)
+    lines = proc.stderr.split(MARKER + "\n", 1)[-1].splitlines()
+    times = {}
+    for line in lines:
+        # import time:  <self us> | <cumulative us> | <name, indented by nesting>
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        if not cumulative_us.strip().isdigit():
+            # the header line
+            continue
+        if name[1:2] != " ":
+            times[name.strip()] = int(cumulative_us) / 1000
+    error = ""
+    if proc.returncode:
+        error = next((l for l in reversed(proc.stderr.splitlines()) if l and not l.startswith("import time:")), "")
+    return times, error
+
+
+def main(repeats: int = 1, *selectors: str):
+    root = find_root(Path(__file__).parent)
+    results = []
+    for sol in discover(root, selectors):
+        best, error = None, ""
+        for _ in range(repeats):
+            times, error = import_times(sol.path)
+            if best is None or sum(times.values()) < sum(best.values()):
+                best = times
+        results.append((sum(best.values()), sol.id, best, error))
+
+    for total, name, times, error in sorted(results, key=lambda r: -r[0]):
+        heaviest = sorted(times.items(), key=lambda t: -t[1])[:3]
+        detail = ", ".join(f"{n} {t:.1f}ms" for n, t in heaviest)
+        status = f"  ERROR {error}" if error else ""
+        print(f"{name:40} {total:8.1f}ms  [{detail}]{status}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    repeats = int(args.pop(0)) if args and args[0].isdigit() else 1
+    main(repeats, *args)
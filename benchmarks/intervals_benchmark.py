@@ -0,0 +1,71 @@
+"""
+Compare ways of testing many IDs for membership of a set of ranges, as in
+2025/05: scanning every range for each ID, bisecting the sorted starts for
+each ID, and IntervalSet.contains_many doing all the bisects in numpy.
+
+Usage: python intervals_benchmark.py [ranges] [ids] [repeats]
+"""
+
+import random
+import sys
+from bisect import bisect_right
+from time import perf_counter
+
+import numpy as np
+
+from aoc_common.intervals import IntervalSet
+
+
+def make_ranges(n: int, seed: int = 2025) -> list[range]:
+    rng = random.Random(seed)
+    starts = [rng.randrange(10**12) for _ in range(n)]
+    return [range(s, s + rng.randrange(1, 10**10)) for s in starts]
+
+
+def scan(ranges: list[range], ids: np.ndarray) -> int:
+    return sum(1 for i in ids.tolist() if any(i in r for r in ranges))
+
+
+def bisect_each(ranges: list[range], ids: np.ndarray) -> int:
+    merged = IntervalSet(ranges)
+    starts, stops = merged.starts.tolist(), merged.stops.tolist()
+    count = 0
+    for i in ids.tolist():
+        j = bisect_right(starts, i) - 1
+        if j >= 0 and i < stops[j]:
+            count += 1
+    return count
+
+
+def vectorised(ranges: list[range], ids: np.ndarray) -> int:
+    return int(np.count_nonzero(IntervalSet(ranges).contains_many(ids)))
+
+
+def main(n_ranges: int = 200, n_ids: int = 1_000_000, repeats: int = 3):
+    ranges = make_ranges(n_ranges)
+    ids = np.random.default_rng(2025).integers(0, 10**12, n_ids)
+    approaches = {"scan": scan, "bisect": bisect_each, "contains_many": vectorised}
+    if n_ids > 100_000:
+        # scanning is hopeless at this size - time it on a sample and scale up
+        print("(scan timed on the first 100000 ids and scaled up)")
+
+    results = {}
+    for name, fn in approaches.items():
+        sample = ids[:100_000] if name == "scan" else ids
+        timings = []
+        for _ in range(repeats):
+            start = perf_counter()
+            count = fn(ranges, sample)
+            timings.append((perf_counter() - start) * len(ids) / len(sample))
+        results[name] = (count, min(timings), len(sample))
+
+    base_time = results["scan"][1]
+    for name, (count, best, size) in results.items():
+        print(f"{name:14} {count} of {size} ids in range  best of {repeats}: {best:.4f}s (x{base_time / best:.2f})")
+
+    if results["bisect"][0] != results["contains_many"][0]:
+        raise AssertionError("Approaches disagree")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
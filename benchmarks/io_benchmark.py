@@ -0,0 +1,93 @@
+"""
+Compare reading a big input in text mode against aoc_common.io's mapped
+reader, for time and for peak Python memory (the mapping itself is paged in
+by the operating system and doesn't count).  The input is a random
+"corrupted program" shaped like 2024/03, which is scanned with a regex, and
+then split into lines.
+
+Usage: python io_benchmark.py [megabytes] [repeats]
+"""
+
+import os
+import random
+import re
+import sys
+import tempfile
+import tracemalloc
+from time import perf_counter
+
+from aoc_common.io import lines, mapped
+
+MUL = r"mul\((\d{1,3}),(\d{1,3})\)"
+
+
+def make_input(path: str, megabytes: int, seed: int = 2024):
+    rng = random.Random(seed)
+    noise = ["do()", "don't()", "mul(4*", "xmul[3,7]", "what()", "mul ( 2 , 4 )", "%&!@^", "\n"]
+    with open(path, "w") as f:
+        for _ in range(megabytes):
+            block = []
+            size = 0
+            while size < 1 << 20:
+                if rng.random() < 0.3:
+                    piece = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+                else:
+                    piece = rng.choice(noise)
+                block.append(piece)
+                size += len(piece)
+            f.write("".join(block))
+
+
+def regex_text(path: str) -> int:
+    with open(path, "r") as f:
+        program = f.read()
+    return sum(int(m[1]) * int(m[2]) for m in re.finditer(MUL, program))
+
+
+def regex_mapped(path: str) -> int:
+    with mapped(path) as program:
+        return sum(int(m[1]) * int(m[2]) for m in re.finditer(MUL.encode(), program))
+
+
+def lines_text(path: str) -> int:
+    with open(path, "r") as f:
+        return sum(len(line.rstrip("\n")) for line in f)
+
+
+def lines_mapped(path: str) -> int:
+    with mapped(path) as buf:
+        return sum(len(line) for line in lines(buf))
+
+
+def measure(fn, path: str, repeats: int) -> tuple[object, float, int]:
+    timings = []
+    for _ in range(repeats):
+        start = perf_counter()
+        result = fn(path)
+        timings.append(perf_counter() - start)
+    tracemalloc.start()
+    fn(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, min(timings), peak
+
+
+def main(megabytes: int = 64, repeats: int = 3):
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        make_input(path, megabytes)
+        for task, variants in {"regex": (regex_text, regex_mapped), "lines": (lines_text, lines_mapped)}.items():
+            results = [measure(fn, path, repeats) for fn in variants]
+            base_time = results[0][1]
+            for fn, (result, best, peak) in zip(variants, results):
+                print(f"{fn.__name__:13} {megabytes}MB  best of {repeats}: {best:.4f}s (x{base_time / best:.2f})"
+                      f"  peak {peak / (1 << 20):8.2f}MB")
+            if len({result for result, _, _ in results}) != 1:
+                raise AssertionError(f"{task}: readers disagree")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,62 @@
+"""
+Compare the days that use aoc_common.parallel run in a single process
+(``AOC_JOBS=1``) against a pool of workers, on generated inputs.  The
+speedup is bounded by the number of CPUs - on a single CPU machine this only
+measures the overhead of the pool.
+
+Usage: python parallel_benchmark.py [jobs] [scale] [repeats]
+"""
+
+import os
+import sys
+from pathlib import Path
+from time import perf_counter
+
+from aoc_common.gen import generate
+from aoc_common.parallel import JOBS_ENV
+from aoc_common.runner import discover, find_root, load_module, solution_context
+
+DAYS = ("2024/02", "2024/07/equations", "2025/03")
+
+
+def best_of(repeats: int, fn) -> tuple[float, object]:
+    timings = []
+    for _ in range(repeats):
+        start = perf_counter()
+        result = fn()
+        timings.append(perf_counter() - start)
+    return min(timings), result
+
+
+def with_jobs(jobs: int, fn):
+    old = os.environ.get(JOBS_ENV)
+    os.environ[JOBS_ENV] = str(jobs)
+    try:
+        return fn()
+    finally:
+        if old is None:
+            del os.environ[JOBS_ENV]
+        else:
+            os.environ[JOBS_ENV] = old
+
+
+def main(jobs: int = 4, scale: int = 4, repeats: int = 3):
+    root = find_root(Path(__file__).parent)
+    print(f"{os.cpu_count()} CPUs")
+    for day in DAYS:
+        text = generate(day[:7], scale)
+        for sol in discover(root, [day]):
+            # the pool needs the script to still be loaded to send its
+            # functions to the workers
+            with solution_context(sol, sol.default_input):
+                solve = load_module(sol.path)["solve"]
+                serial_time, serial = best_of(repeats, lambda: with_jobs(1, lambda: solve(text)))
+                pool_time, pooled = best_of(repeats, lambda: with_jobs(jobs, lambda: solve(text)))
+            print(f"{sol.id:30} scale {scale}  serial {serial_time:.4f}s  -j{jobs} {pool_time:.4f}s"
+                  f" (x{serial_time / pool_time:.2f})")
+            if serial != pooled:
+                raise AssertionError(f"{sol.id}: pooled answers {pooled} differ from serial {serial}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
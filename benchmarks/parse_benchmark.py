@@ -0,0 +1,61 @@
+"""
+Compare reading the integers out of an input line by line in Python against
+aoc_common.parse, on a random file shaped like 2024/14 (four signed numbers
+per line with punctuation round them).
+
+Usage: python parse_benchmark.py [lines] [repeats]
+"""
+
+import os
+import random
+import re
+import sys
+import tempfile
+from time import perf_counter
+
+from aoc_common.parse import read_ints
+
+
+def make_input(path: str, lines: int, seed: int = 2024):
+    rng = random.Random(seed)
+    with open(path, "w") as f:
+        for _ in range(lines):
+            f.write(f"p={rng.randrange(101)},{rng.randrange(103)} v={rng.randrange(-99, 100)},{rng.randrange(-99, 100)}\n")
+
+
+def with_regex(path: str) -> list[list[int]]:
+    digits = re.compile(r"-?\d+")
+    with open(path, "r") as f:
+        return [[int(m.group()) for m in digits.finditer(line)] for line in f]
+
+
+def with_read_ints(path: str) -> list[list[int]]:
+    return read_ints(path, columns=4).tolist()
+
+
+def main(lines: int = 1_000_000, repeats: int = 3):
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        make_input(path, lines)
+        results = {}
+        for name, fn in {"regex": with_regex, "read_ints": with_read_ints}.items():
+            timings = []
+            for _ in range(repeats):
+                start = perf_counter()
+                values = fn(path)
+                timings.append(perf_counter() - start)
+            results[name] = (values, min(timings))
+    finally:
+        os.remove(path)
+
+    base_time = results["regex"][1]
+    for name, (values, best) in results.items():
+        print(f"{name:9} {len(values)} lines  best of {repeats}: {best:.4f}s (x{base_time / best:.2f})")
+
+    if results["regex"][0] != results["read_ints"][0]:
+        raise AssertionError("Parsers disagree")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,77 @@
+"""
+Micro-benchmark comparing the priority queues in aoc_common.pq against the
+original heapdict, running the same Dijkstra search over a random grid of
+digit weights (much like 2023 day 17) with each of them.
+
+Usage: python pq_benchmark.py [grid_size] [repeats]
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from aoc_common.heapdict import heapdict
+from aoc_common.pq import IndexedHeap, LazyHeap
+
+
+def make_grid(size: int, seed: int = 2023) -> list[list[int]]:
+    rng = random.Random(seed)
+    return [[rng.randint(1, 9) for _ in range(size)] for _ in range(size)]
+
+
+def dijkstra(grid: list[list[int]], queue_type) -> int:
+    """
+    Cost of the cheapest path from top left to bottom right of the grid,
+    using the same open_list/closed_list/costs structure as the solutions.
+    """
+    rows = len(grid)
+    cols = len(grid[0])
+    end = (rows - 1, cols - 1)
+    open_list = queue_type()
+    closed_list = set()
+    costs = {(0, 0): 0}
+    open_list[(0, 0)] = 0
+
+    while len(open_list):
+        node, cost_node = open_list.popitem()
+        if node == end:
+            return cost_node
+        closed_list.add(node)
+        r, c = node
+        for child in ((r, c + 1), (r + 1, c), (r, c - 1), (r - 1, c)):
+            if child in closed_list or not (0 <= child[0] < rows and 0 <= child[1] < cols):
+                continue
+            child_cost = cost_node + grid[child[0]][child[1]]
+            if child not in costs or child_cost < costs[child]:
+                costs[child] = child_cost
+                open_list[child] = child_cost
+
+    raise ValueError("No path")
+
+
+def main(size: int = 300, repeats: int = 5):
+    grid = make_grid(size)
+    results = {}
+    for name, queue_type in (
+        ("heapdict", heapdict),
+        ("IndexedHeap", IndexedHeap),
+        ("LazyHeap", LazyHeap),
+    ):
+        timings = []
+        for _ in range(repeats):
+            start = perf_counter()
+            answer = dijkstra(grid, queue_type)
+            timings.append(perf_counter() - start)
+        results[name] = (answer, min(timings))
+
+    baseline = results["heapdict"][1]
+    for name, (answer, best) in results.items():
+        print(f"{name:12} answer={answer}  best of {repeats}: {best:.4f}s  "
+              f"speedup x{baseline / best:.2f}")
+
+    if len({answer for answer, _ in results.values()}) != 1:
+        raise AssertionError("Queues disagree on the shortest path cost")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
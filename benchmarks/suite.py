@@ -0,0 +1,330 @@
+"""
+Benchmark suite for all the solutions.
+
+Each solution is run in its own worker process, a few times to warm up and
+then ``--repeats`` more times, via aoc_common.runner.  For each one the suite
+records the median and 95th percentile of the run time (and the median of
+each phase) plus the worker's peak RSS, and compares them against a stored
+baseline, flagging anything that has got slower or bigger by more than
+``--threshold``.
+
+The ``compare`` command instead runs groups of alternative implementations
+of the same day against each other on the same input, and the ``scale``
+command runs solutions on synthetic inputs from aoc_common.gen at increasing
+scales and fits an empirical complexity curve to the timings.
+
+Usage:
+
+    python suite.py run [selector ...] [--repeats N] [--warmup N]
+                        [--baseline FILE] [--threshold F] [--update]
+    python suite.py compare [group ...] [--repeats N] [--warmup N]
+    python suite.py scale [selector ...] [--scales S ...] [--timeout T]
+
+Selectors are as for the runner (``2023``, ``2023/18``, ``2023/18/lagoon``).
+Days without an input file are skipped.  ``run`` exits with status 1 if there
+are any regressions, so it can be used as a CI gate.
+"""
+
+import argparse
+import json
+import math
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from aoc_common import gen
+from aoc_common.runner import Solution, discover, find_root, normalise_selector, run_solution
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+# Alternative implementations of the same day, to race against each other.
+# Note the lagoon variants don't all solve the same parts: lagoon.py is part
+# 1 by flood fill, big_lagoon.py part 2 by polygon area, and general_lagoon.py
+# both parts by polygon area.
+COMPARISONS = {
+    "2023/18": ["2023/18/lagoon", "2023/18/big_lagoon", "2023/18/general_lagoon"],
+    "2024/07": ["2024/07/equations", "2024/07/equations_reversed"],
+    "2024/23": ["2024/23/own_implementation", "2024/23/quick"],
+    "2025/02": ["2025/02/store_values", "2025/02/product_ids"],
+}
+
+# Changes smaller than this are noise, however large they are relatively
+MIN_SECONDS = 0.005
+
+# Candidate growth rates for the complexity fit, as functions of the scale
+COMPLEXITY_CLASSES = {
+    "O(log n)": lambda n: np.log2(n) + 1,
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * (np.log2(n) + 1),
+    "O(n^2)": lambda n: n**2,
+    "O(n^3)": lambda n: n**3,
+}
+
+
+def peak_rss() -> int:
+    """
+    Peak resident set size of this process, in bytes.
+    """
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def sample(path: str, input_file: Optional[str], warmup: int, repeats: int) -> dict:
+    """
+    Run a solution ``warmup + repeats`` times in this process and return the
+    timings of the last ``repeats`` runs.  This is what the worker processes
+    run.
+    """
+    root = find_root(Path(path).parent)
+    (solution,) = [s for s in discover(root) if s.path == Path(path).resolve()]
+    runs = []
+    for i in range(warmup + repeats):
+        result = run_solution(solution, input_file and Path(input_file))
+        if result.skipped or result.error:
+            return {"skipped": result.skipped, "error": result.error}
+        if i >= warmup:
+            runs.append(result)
+    return {
+        "times": [r.wall for r in runs],
+        "phases": {p.name: [r.phase(p.name).wall for r in runs] for p in runs[0].phases},
+        "output": [line for p in runs[0].phases for line in p.output],
+        "peak_rss": peak_rss(),
+    }
+
+
+def measure(solution: Solution, input_file: Optional[Path], warmup: int, repeats: int,
+            timeout: Optional[float] = None) -> dict:
+    """
+    Benchmark a solution in a fresh worker process, so the peak RSS is its
+    own, and summarise the timings.
+    """
+    input_arg = str(input_file.resolve()) if input_file else ""
+    try:
+        proc = subprocess.run(
+            [sys.executable, __file__, "sample", str(solution.path), input_arg, str(warmup), str(repeats)],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return {"error": f"timed out after {timeout}s"}
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit {proc.returncode}"}
+    raw = json.loads(proc.stdout)
+    if "times" not in raw:
+        return raw
+
+    return {
+        "median": statistics.median(raw["times"]),
+        "p95": percentile(raw["times"], 95),
+        "peak_rss": raw["peak_rss"],
+        "repeats": repeats,
+        "phases": {name: statistics.median(times) for name, times in raw["phases"].items()},
+        "output": raw["output"],
+    }
+
+
+def percentile(values: list[float], pct: int) -> float:
+    if len(values) < 2:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def fit_complexity(scales: list[float], times: list[float]) -> tuple[float, str]:
+    """
+    Fit the timings at each scale to ``t = a * n^k`` to get an empirical
+    exponent ``k``, and to ``t = a + b * f(n)`` for each of the
+    COMPLEXITY_CLASSES to find the closest match (by relative error, so the
+    small scales count as much as the big ones).
+    """
+    n = np.array(scales, dtype=float)
+    t = np.array(times, dtype=float)
+    exponent = float(np.polyfit(np.log(n), np.log(t), 1)[0])
+
+    best, best_error = None, math.inf
+    for name, f in COMPLEXITY_CLASSES.items():
+        # weighted least squares for the constant overhead and the growth term
+        design = np.column_stack((np.ones_like(n), f(n))) / t[:, None]
+        (a, b), *_ = np.linalg.lstsq(design, np.ones_like(t), rcond=None)
+        if b <= 0:
+            continue
+        error = float(np.sum((design @ (a, b) - 1) ** 2))
+        if error < best_error:
+            best, best_error = name, error
+    return exponent, best or "O(1)"
+
+
+def regressions(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Descriptions of everything in ``current`` that is worse than in
+    ``baseline`` by more than ``threshold`` (as a fraction).
+    """
+    found = []
+    for name, stats in current.items():
+        base = baseline.get(name)
+        if not base or "median" not in stats or "median" not in base:
+            continue
+        for key, minimum in (("median", MIN_SECONDS), ("p95", MIN_SECONDS), ("peak_rss", 1 << 20)):
+            old, new = base[key], stats[key]
+            if new > old * (1 + threshold) and new - old > minimum:
+                found.append(f"{name}: {key} {format_value(key, old)} -> {format_value(key, new)} "
+                             f"(+{(new / old - 1) * 100:.0f}%)")
+    return found
+
+
+def format_value(key: str, value: float) -> str:
+    return f"{value / 2**20:.1f}MB" if key == "peak_rss" else f"{value:.4f}s"
+
+
+def format_stats(stats: dict) -> str:
+    if "median" not in stats:
+        return f"SKIPPED ({stats['skipped']})" if stats.get("skipped") else f"ERROR {stats.get('error')}"
+    phases = "  ".join(f"{name} {t:.3f}s" for name, t in stats["phases"].items())
+    return (f"median {stats['median']:.4f}s  p95 {stats['p95']:.4f}s  "
+            f"rss {format_value('peak_rss', stats['peak_rss'])}  [{phases}]")
+
+
+def load_baseline(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())["solutions"]
+
+
+def save_baseline(path: Path, results: dict, args):
+    existing = load_baseline(path)
+    # keep results for anything we didn't run this time
+    existing.update({name: stats for name, stats in results.items() if "median" in stats})
+    data = {
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "warmup": args.warmup,
+        "repeats": args.repeats,
+        "solutions": dict(sorted(existing.items())),
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def run(args):
+    root = find_root()
+    baseline = load_baseline(args.baseline)
+    results = {}
+    for solution in discover(root, args.selectors):
+        stats = measure(solution, args.input, args.warmup, args.repeats)
+        results[solution.id] = stats
+        print(f"{solution.id:40} {format_stats(stats)}")
+
+    found = regressions(results, baseline, args.threshold)
+    if baseline:
+        print(f"\n{len(found)} regression(s) against {args.baseline} at {args.threshold:.0%} threshold")
+        for line in found:
+            print(f"  {line}")
+    if args.update:
+        save_baseline(args.baseline, results, args)
+        print(f"Baseline written to {args.baseline}")
+    return 1 if found else 0
+
+
+def compare(args):
+    root = find_root()
+    groups = args.groups or list(COMPARISONS)
+    for group in groups:
+        if group not in COMPARISONS:
+            raise SystemExit(f"Unknown comparison {group}, choose from {', '.join(COMPARISONS)}")
+        print(f"== {group}")
+        solutions = discover(root, COMPARISONS[group])
+        results = {s.id: measure(s, args.input, args.warmup, args.repeats) for s in solutions}
+        timed = [stats["median"] for stats in results.values() if "median" in stats]
+        fastest = min(timed) if timed else None
+        for name, stats in results.items():
+            relative = f"  (x{stats['median'] / fastest:.2f})" if "median" in stats else ""
+            print(f"{name:40} {format_stats(stats)}{relative}")
+            for line in stats.get("output", []):
+                print(f"    {line}")
+
+
+def scale(args):
+    root = find_root()
+    selectors = [normalise_selector(s) for s in args.selectors]
+    # a selector can be a whole year, a day, or a script within a day
+    days = [d for d in gen.available()
+            if not selectors or any(d == s or d.startswith(s + "/") or s.startswith(d + "/") for s in selectors)]
+    curves = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for day in days:
+            print(f"== {day}")
+            inputs = {}
+            for sc in args.scales:
+                inputs[sc] = Path(tmp) / f"{day.replace('/', '_')}_{sc}"
+                inputs[sc].write_text(gen.generate(day, sc, args.seed))
+
+            scripts = [s for s in selectors if s.startswith(day + "/")] or [day]
+            for solution in discover(root, scripts):
+                points = []
+                for sc in args.scales:
+                    stats = measure(solution, inputs[sc], args.warmup, args.repeats, args.timeout)
+                    print(f"{solution.id:32} x{sc:<8g} {format_stats(stats)}")
+                    if "median" not in stats:
+                        # too slow (or broken) - no point going bigger
+                        break
+                    points.append((sc, stats["median"], stats["peak_rss"]))
+
+                curves[solution.id] = {"points": points}
+                if len(points) >= 3:
+                    exponent, best = fit_complexity([p[0] for p in points], [p[1] for p in points])
+                    curves[solution.id].update(exponent=exponent, fit=best)
+                    print(f"{solution.id:32} time ~ n^{exponent:.2f}, closest fit {best}")
+                else:
+                    print(f"{solution.id:32} not enough points to fit a curve")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(curves, indent=2) + "\n")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "sample":
+        # internal: running as a worker process
+        path, input_file, warmup, repeats = sys.argv[2:]
+        print(json.dumps(sample(path, input_file or None, int(warmup), int(repeats))))
+        return 0
+
+    parser = argparse.ArgumentParser(description="Benchmark the solutions")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="benchmark solutions and check against the baseline")
+    run_parser.add_argument("selectors", nargs="*", help="years, days or scripts, default everything")
+    run_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    run_parser.add_argument("--threshold", type=float, default=0.10, help="fractional slowdown to flag")
+    run_parser.add_argument("--update", action="store_true", help="save these results as the new baseline")
+    run_parser.set_defaults(func=run)
+    compare_parser = commands.add_parser("compare", help="race alternative implementations against each other")
+    compare_parser.add_argument("groups", nargs="*", help=f"any of {', '.join(COMPARISONS)}, default all")
+    compare_parser.set_defaults(func=compare)
+    for p in (run_parser, compare_parser):
+        p.add_argument("--repeats", type=int, default=5)
+        p.add_argument("--warmup", type=int, default=1)
+        p.add_argument("--input", type=Path, help="input file to use instead of each day's own")
+    scale_parser = commands.add_parser("scale", help="fit complexity curves using generated inputs")
+    scale_parser.add_argument("selectors", nargs="*", help=f"days or scripts, default all of {', '.join(gen.available())}")
+    scale_parser.add_argument("--scales", type=float, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    scale_parser.add_argument("--seed", type=int, default=0)
+    scale_parser.add_argument("--timeout", type=float, default=60, help="give up on a solution after this long")
+    scale_parser.add_argument("--repeats", type=int, default=1)
+    scale_parser.add_argument("--warmup", type=int, default=0)
+    scale_parser.add_argument("--json", metavar="FILE", help="also write the curves as JSON to FILE")
+    scale_parser.set_defaults(func=scale)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1,16 @@
-__version__ = "0.1"
\ No newline at end of file
+import os
+
+__version__ = "0.1"
+
+# Environment variable that overrides the location of the puzzle input
+INPUT_ENV = "AOC_INPUT"
+
+
+def input_path() -> str:
+    """
+    Path of the puzzle input file.  Normally this is just ``input`` in the
+    current directory, but it can be overridden by setting the ``AOC_INPUT``
+    environment variable, which is how the runner points a solution at an
+    input somewhere else.
+    """
+    return os.environ.get(INPUT_ENV, "input")
@@ -0,0 +1,188 @@
+"""
+Run one day's solution over a whole corpus of inputs.
+
+Every solution can be used as a ``solve(text) -> answers`` callable, via
+``solver``:
+
+- days that define their own ``solve(text)`` function (every day that has
+  answers) are pure - they take the text of an input, and return a tuple of
+  the answers to each part without printing anything or touching the
+  filesystem
+- a script without one gets ``run_script_fallback``, which writes the text
+  to a temporary file and runs the script on it with the runner (see
+  aoc_common.runner).  The answers are what its part functions (or ``main``)
+  return, with ``runner.MISSING`` for any part that returns nothing.  This
+  is only kept for the scripts that can't be split into parse and solve
+  steps, such as the visualisation-only ones, and new days should define
+  ``solve`` instead
+
+``run_batch`` runs a day over many inputs, in a pool of worker processes if
+``jobs > 1``, and yields the results as each one finishes rather than in
+input order.  Each worker loads the solution once and reuses it for all the
+inputs it's given, so imports, the results of pure memoized functions
+(see aoc_common.memo) and the parsed inputs of ``@cached_parse`` functions
+(see aoc_common.cache) stay warm from one input to the next.  The fallback
+reloads the script for every input, so only shares what's imported.
+
+Usage::
+
+    python -m aoc_common.batch DAY INPUT... [-j JOBS] [--json]
+
+where DAY is a selector for a single script (``2024/01`` or
+``2024/07/equations``) and each INPUT is a file or a directory of input
+files.  ``--json`` writes a JSON object per line for each input as it
+finishes.
+"""
+
+import argparse
+import functools
+import json
+import os
+import sys
+import tempfile
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Iterable, Iterator, Optional
+
+from aoc_common.runner import MODULE_NAME, Solution, discover, find_root, load_module, plain, run_solution
+from aoc_common.runner import solution_context
+
+# A solve function - the text of an input to the answers for each part
+Solver = Callable[[str], tuple]
+
+
+@dataclass
+class BatchResult:
+    input: str
+    answers: list = field(default_factory=list)
+    wall: float = 0.0
+    error: Optional[str] = None
+
+
+def solver(solution: Solution) -> Solver:
+    """
+    A ``solve(text)`` function for a solution - its own if it has one,
+    otherwise ``run_script_fallback``.
+    """
+    try:
+        with solution_context(solution, solution.default_input):
+            module = load_module(solution.path)
+            loaded = sys.modules[MODULE_NAME]
+    except Exception:
+        # some scripts read their input as they're imported, so can only be
+        # run as scripts
+        module = {}
+    solve = module.get("solve")
+    if callable(solve):
+        # keep the module registered for as long as its solve function is in
+        # use, so anything defined in it can still be pickled (to send to an
+        # aoc_common.parallel pool, say)
+        sys.modules[MODULE_NAME] = loaded
+        return solve
+
+    return functools.partial(run_script_fallback, solution)
+
+
+def run_script_fallback(solution: Solution, text: str) -> tuple:
+    """
+    The answers from running a script without a ``solve`` function on
+    ``text``, by way of a temporary input file.
+    """
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        result = run_solution(solution, Path(path))
+    finally:
+        os.remove(path)
+    if result.error:
+        raise RuntimeError(result.error)
+    return tuple(result.answers())
+
+
+def input_files(paths: Iterable[Path]) -> list[Path]:
+    """
+    The given files, plus the files in the given directories (not including
+    hidden ones), in order.
+    """
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(p for p in path.iterdir() if p.is_file() and not p.name.startswith(".")))
+        else:
+            files.append(path)
+    return files
+
+
+# The solve function of this worker process
+_solve: Optional[Solver] = None
+
+
+def _init_worker(solution: Solution):
+    global _solve
+    _solve = solver(solution)
+
+
+def _solve_file(path: str) -> BatchResult:
+    result = BatchResult(path)
+    start = perf_counter()
+    try:
+        result.answers = plain(list(_solve(Path(path).read_text())))
+    except Exception as e:
+        result.error = "".join(traceback.format_exception_only(type(e), e)).strip()
+    result.wall = perf_counter() - start
+    return result
+
+
+def run_batch(solution: Solution, inputs: Iterable[Path], jobs: int = 1) -> Iterator[BatchResult]:
+    """
+    Solve each of the input files, yielding the results as they finish.
+    """
+    inputs = [str(p) for p in inputs]
+    if jobs <= 1 or len(inputs) <= 1:
+        _init_worker(solution)
+        for path in inputs:
+            yield _solve_file(path)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(solution,)) as pool:
+        for future in as_completed([pool.submit(_solve_file, path) for path in inputs]):
+            yield future.result()
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m aoc_common.batch",
+                                     description="Run one day's solution over many inputs")
+    parser.add_argument("day", help="the script to run, e.g. 2024/01 or 2024/07/equations")
+    parser.add_argument("inputs", nargs="+", type=Path, help="input files, or directories of them")
+    parser.add_argument("--root", type=Path, help="repository root (default: found from the current directory)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parser.add_argument("--json", action="store_true", help="write a line of JSON per input")
+    args = parser.parse_args(argv)
+
+    root = (args.root or find_root()).resolve()
+    solutions = discover(root, [args.day])
+    if len(solutions) != 1:
+        names = ", ".join(s.id for s in solutions) or "none"
+        parser.error(f"{args.day} must match exactly one script (matches: {names})")
+    inputs = input_files(args.inputs)
+
+    errors = 0
+    start = perf_counter()
+    for result in run_batch(solutions[0], inputs, args.jobs):
+        errors += result.error is not None
+        if args.json:
+            print(json.dumps(asdict(result)), flush=True)
+        else:
+            outcome = f"ERROR {result.error}" if result.error else "  ".join(map(str, result.answers))
+            print(f"{result.input:40} {result.wall:8.3f}s  {outcome}", flush=True)
+    if not args.json:
+        print(f"{len(inputs)} inputs in {perf_counter() - start:.3f}s, {errors} errors", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
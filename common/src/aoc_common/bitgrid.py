@@ -0,0 +1,292 @@
+"""
+Bitboards - a whole boolean grid packed into a single Python int.
+
+Cellular automaton style puzzles update every cell of a grid at once from
+its neighbours.  Stored as one bit per cell, row-major (bit ``r * cols + c``
+is cell ``(r, c)``), moving every cell of the grid one step in a direction
+is a single shift of the int, and combining grids is a single ``&``, ``|``
+or ``^``, each of which runs in C over machine words - so a step of the
+automaton is a handful of big-int operations however many cells there are.
+
+::
+
+    open = ~BitGrid.from_lines(lines, "#")
+    reached = BitGrid.from_cells(open.rows, open.cols, [start])
+    for _ in range(64):
+        reached = reached.spread() & open
+    reached.count()
+
+Shifts either drop the cells that fall off the edge of the grid, or with
+``wrap=True`` bring them back in on the opposite side (for puzzles set on a
+torus, or an infinitely repeated tile).  Neighbour counts are computed with
+bit-sliced adders (see ``BitCounts``), so "cells with fewer than 4
+neighbours" is also a few dozen whole-grid operations.
+"""
+
+from typing import Iterable, Iterator, Sequence
+
+import numpy as np
+
+from aoc_common.grid import Direction
+
+
+class BitGrid:
+    __slots__ = ("rows", "cols", "bits", "_masks")
+
+    def __init__(self, rows: int, cols: int, bits: int = 0, _masks=None):
+        self.rows = rows
+        self.cols = cols
+        # (all cells, first column) - shared between grids of the same shape
+        self._masks = _masks or _shape_masks(rows, cols)
+        self.bits = bits & self._masks[0]
+
+    def _new(self, bits: int) -> "BitGrid":
+        # skip the masking in __init__ for results that can't stray outside the grid
+        grid = BitGrid.__new__(BitGrid)
+        grid.rows, grid.cols, grid._masks, grid.bits = self.rows, self.cols, self._masks, bits
+        return grid
+
+    @classmethod
+    def from_mask(cls, mask: "np.ndarray") -> "BitGrid":
+        """
+        Build a grid from a 2D boolean array.
+        """
+        mask = np.asarray(mask, dtype=bool)
+        rows, cols = mask.shape
+        packed = np.packbits(mask.ravel(), bitorder="little").tobytes()
+        return cls(rows, cols, int.from_bytes(packed, "little"))
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], chars: str) -> "BitGrid":
+        """
+        Build a grid from lines of text, with the cells containing any of
+        ``chars`` set.
+        """
+        lines = [l.rstrip("\n") for l in lines]
+        lines = [l for l in lines if l]
+        codes = np.frombuffer("".join(lines).encode("latin-1"), dtype=np.uint8).reshape(len(lines), -1)
+        return cls.from_mask(np.isin(codes, np.frombuffer(chars.encode("latin-1"), dtype=np.uint8)))
+
+    @classmethod
+    def from_cells(cls, rows: int, cols: int, cells: Iterable[Sequence[int]]) -> "BitGrid":
+        bits = 0
+        for r, c in cells:
+            bits |= 1 << (r * cols + c)
+        return cls(rows, cols, bits)
+
+    def to_mask(self) -> "np.ndarray":
+        size = self.rows * self.cols
+        data = np.frombuffer(self.bits.to_bytes((size + 7) // 8, "little"), dtype=np.uint8)
+        return np.unpackbits(data, count=size, bitorder="little").astype(bool).reshape(self.rows, self.cols)
+
+    # Combining grids
+
+    def _check(self, other: "BitGrid"):
+        if (self.rows, self.cols) != (other.rows, other.cols):
+            raise ValueError(f"Grid shapes differ: {self.rows}x{self.cols} and {other.rows}x{other.cols}")
+
+    def __and__(self, other: "BitGrid") -> "BitGrid":
+        self._check(other)
+        return self._new(self.bits & other.bits)
+
+    def __or__(self, other: "BitGrid") -> "BitGrid":
+        self._check(other)
+        return self._new(self.bits | other.bits)
+
+    def __xor__(self, other: "BitGrid") -> "BitGrid":
+        self._check(other)
+        return self._new(self.bits ^ other.bits)
+
+    def __sub__(self, other: "BitGrid") -> "BitGrid":
+        """
+        The cells set in this grid but not in ``other``.
+        """
+        self._check(other)
+        return self._new(self.bits & ~other.bits)
+
+    def __invert__(self) -> "BitGrid":
+        return self._new(self.bits ^ self._masks[0])
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BitGrid):
+            return NotImplemented
+        return (self.rows, self.cols, self.bits) == (other.rows, other.cols, other.bits)
+
+    def __hash__(self) -> int:
+        return hash((self.rows, self.cols, self.bits))
+
+    # Querying
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __contains__(self, cell: Sequence[int]) -> bool:
+        r, c = cell
+        return 0 <= r < self.rows and 0 <= c < self.cols and (self.bits >> (r * self.cols + c)) & 1 == 1
+
+    def count(self) -> int:
+        """
+        The number of cells that are set.
+        """
+        return self.bits.bit_count()
+
+    def row_counts(self) -> list[int]:
+        """
+        The number of cells that are set in each row.
+        """
+        row = (1 << self.cols) - 1
+        return [((self.bits >> (r * self.cols)) & row).bit_count() for r in range(self.rows)]
+
+    def cells(self) -> Iterator[tuple[int, int]]:
+        """
+        The ``(row, col)`` of every cell that is set, in row-major order.
+        """
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            yield divmod(low.bit_length() - 1, self.cols)
+            bits ^= low
+
+    # Moving
+
+    def shifted(self, direction: Sequence[int], wrap: bool = False) -> "BitGrid":
+        """
+        The grid with every cell moved by ``direction`` (a ``(rows, cols)``
+        vector, such as a ``Direction``), so cell ``c`` of the result is cell
+        ``c - direction`` of this grid.  Cells that move off the edge are
+        dropped, or if ``wrap`` is set come back in on the opposite side.
+        """
+        dr, dc = direction
+        rows, cols = self.rows, self.cols
+        everything, first_col = self._masks
+        bits = self.bits
+        if dc and wrap:
+            k = dc % cols
+            if k:
+                # cells moving off the right hand side come back in the k
+                # columns on the left
+                left = first_col * ((1 << k) - 1)
+                bits = (((bits << k) & ~left) | ((bits >> (cols - k)) & left)) & everything
+        elif abs(dc) >= cols:
+            bits = 0
+        elif dc > 0:
+            # cells moving off the right hand side end up in the first dc
+            # columns of the next row down, so clear those
+            bits = (bits << dc) & ~(first_col * ((1 << dc) - 1)) & everything
+        elif dc < 0:
+            # similarly for the last -dc columns of the row above
+            bits = (bits >> -dc) & ~(first_col * ((1 << -dc) - 1) << (cols + dc))
+        if dr and wrap:
+            k = (dr % rows) * cols
+            bits = ((bits << k) | (bits >> (rows * cols - k))) & everything
+        elif dr > 0:
+            bits = (bits << (dr * cols)) & everything
+        elif dr < 0:
+            bits >>= -dr * cols
+        return self._new(bits)
+
+    def spread(self, include_diagonal: bool = False, wrap: bool = False) -> "BitGrid":
+        """
+        The cells next to any cell that is set (not including the set cells
+        themselves, unless they're next to another one).
+        """
+        bits = 0
+        for d in (Direction.DIAGONAL if include_diagonal else Direction.STRAIGHT):
+            bits |= self.shifted(d, wrap).bits
+        return self._new(bits)
+
+    def neighbour_counts(self, include_diagonal: bool = False, wrap: bool = False) -> "BitCounts":
+        """
+        For every cell, the number of its neighbours that are set.
+        """
+        return BitCounts(self, (self.shifted(d, wrap) for d in (Direction.DIAGONAL if include_diagonal
+                                                                else Direction.STRAIGHT)))
+
+    def tile(self, down: int, across: int) -> "BitGrid":
+        """
+        A bigger grid made of ``down`` x ``across`` copies of this one.
+        """
+        row_mask = (1 << self.cols) - 1
+        wide_cols = self.cols * across
+        bits = 0
+        for r in range(self.rows):
+            row = (self.bits >> (r * self.cols)) & row_mask
+            # repeat the row across - a multiplication by 1 + 2^cols + 2^2cols + ...
+            bits |= (row * _repeat(1, self.cols, across)) << (r * wide_cols)
+        return BitGrid(self.rows * down, wide_cols, bits * _repeat(1, self.rows * wide_cols, down))
+
+    def __str__(self) -> str:
+        mask = self.to_mask()
+        return "\n".join("".join("#" if x else "." for x in row) for row in mask)
+
+    def __repr__(self) -> str:
+        return f"BitGrid({self.rows}, {self.cols}, {self.count()} set)"
+
+
+class BitCounts:
+    """
+    Bit-sliced counts - ``planes[i]`` is a grid of bit ``i`` of each cell's
+    count, so adding another grid into the counts is a ripple-carry adder
+    made of whole-grid ``^`` and ``&`` operations, and comparisons against a
+    constant work down the planes from the top bit.
+    """
+
+    def __init__(self, like: BitGrid, grids: Iterable[BitGrid] = ()):
+        self._like = like
+        self.planes: list[int] = []
+        for grid in grids:
+            self.add(grid)
+
+    def add(self, grid: BitGrid):
+        carry = grid.bits
+        for i, plane in enumerate(self.planes):
+            if not carry:
+                break
+            self.planes[i], carry = plane ^ carry, plane & carry
+        if carry:
+            self.planes.append(carry)
+
+    def equal(self, k: int) -> BitGrid:
+        return self._compare(k)[1]
+
+    def fewer_than(self, k: int) -> BitGrid:
+        return self._compare(k)[0]
+
+    def at_least(self, k: int) -> BitGrid:
+        return ~self.fewer_than(k)
+
+    def _compare(self, k: int) -> tuple[BitGrid, BitGrid]:
+        """
+        Grids of the cells whose count is less than ``k``, and equal to it.
+        """
+        everything = self._like._masks[0]
+        if k >> len(self.planes):
+            # k is bigger than any count could be
+            return self._like._new(everything), self._like._new(0)
+        less, equal = 0, everything
+        for i in reversed(range(len(self.planes))):
+            plane = self.planes[i]
+            if (k >> i) & 1:
+                less |= equal & ~plane
+                equal &= plane
+            else:
+                equal &= ~plane
+        return self._like._new(less & everything), self._like._new(equal)
+
+
+def _repeat(value: int, width: int, times: int) -> int:
+    """
+    ``value`` (which must fit in ``width`` bits) repeated ``times`` times,
+    ``width`` bits apart.
+    """
+    return value * (((1 << (width * times)) - 1) // ((1 << width) - 1))
+
+
+_shape_cache: dict[tuple[int, int], tuple[int, int]] = {}
+
+
+def _shape_masks(rows: int, cols: int) -> tuple[int, int]:
+    masks = _shape_cache.get((rows, cols))
+    if masks is None:
+        masks = _shape_cache[rows, cols] = ((1 << (rows * cols)) - 1, _repeat(1, cols, rows))
+    return masks
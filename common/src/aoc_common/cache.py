@@ -0,0 +1,225 @@
+"""
+Cache for parsed puzzle inputs.
+
+Decorate an input loader (``load_data``, ``parse_input``, ...) with
+``@cached_input`` and its result is stored on disk keyed by a hash of the
+input file's contents, so repeat runs - and second parts that call the loader
+again - skip the parsing entirely::
+
+    @cached_input
+    def parse_input():
+        with open(input_path(), "r") as f:
+            ...
+
+``@cached_parse`` does the same for a pure parse function that takes the
+text of the input as its first argument, keyed by that text rather than by
+the input file, so a ``solve(text)`` function (see aoc_common.batch) gets the
+same benefit - and a batch worker keeps the parsed inputs it has seen warm in
+memory from one call to the next::
+
+    @cached_parse
+    def parse_almanac(text: str):
+        ...
+
+Results are stored as ``.npz`` if they are a numpy array or a tuple of
+arrays, and pickled otherwise.  Every call returns a fresh copy, so callers
+are free to mutate what they get back just as they could with an uncached
+loader.
+
+The loader's source file modification time is part of the cache key, so
+changing the parsing code invalidates its cached results (the stale entries
+are left to be evicted).  The cache directory is capped in size, evicting
+the least recently used entries first, and can be configured with
+environment variables:
+
+- ``AOC_CACHE_DIR`` - where to keep the cache (default ``~/.cache/aoc``)
+- ``AOC_CACHE_MAX_BYTES`` - size cap for the directory (default 256MB)
+- ``AOC_NO_CACHE`` - set to anything non-empty to bypass the cache
+"""
+
+import functools
+import hashlib
+import inspect
+import io
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Callable, Optional, TypeVar
+
+from aoc_common import input_path
+from aoc_common.lazy import is_loaded, lazy_import
+
+# only needed for array results
+np = lazy_import("numpy")
+
+CACHE_DIR_ENV = "AOC_CACHE_DIR"
+MAX_BYTES_ENV = "AOC_CACHE_MAX_BYTES"
+DISABLE_ENV = "AOC_NO_CACHE"
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+T = TypeVar("T")
+
+# Serialised results already seen by this process, so the second part of a
+# puzzle doesn't even need to go to disk.  Maps key -> (suffix, serialised
+# bytes)
+_memory: dict[str, tuple[str, bytes]] = {}
+
+
+def cache_dir() -> Path:
+    return Path(os.environ.get(CACHE_DIR_ENV) or Path.home() / ".cache" / "aoc")
+
+
+def max_bytes() -> int:
+    return int(os.environ.get(MAX_BYTES_ENV) or DEFAULT_MAX_BYTES)
+
+
+def _is_array(value) -> bool:
+    # if numpy hasn't been imported yet (by anything), nothing can be an array
+    return is_loaded(np) and isinstance(value, np.ndarray) and value.dtype != object
+
+
+def _serialise(value) -> tuple[str, bytes]:
+    buf = io.BytesIO()
+    if _is_array(value) or (isinstance(value, tuple) and value and all(_is_array(v) for v in value)):
+        arrays = value if isinstance(value, tuple) else (value,)
+        np.savez(buf, __tuple__=isinstance(value, tuple), **{f"arr_{i}": a for i, a in enumerate(arrays)})
+        return ".npz", buf.getvalue()
+
+    pickle.dump(value, buf, protocol=pickle.HIGHEST_PROTOCOL)
+    return ".pkl", buf.getvalue()
+
+
+def _deserialise(suffix: str, data: bytes):
+    if suffix == ".npz":
+        with np.load(io.BytesIO(data)) as npz:
+            arrays = tuple(npz[f"arr_{i}"] for i in range(len(npz.files) - 1))
+            return arrays if bool(npz["__tuple__"]) else arrays[0]
+
+    return pickle.loads(data)
+
+
+def _read_entry(key: str) -> Optional[tuple[str, bytes]]:
+    for suffix in (".pkl", ".npz"):
+        path = cache_dir() / f"{key}{suffix}"
+        try:
+            data = path.read_bytes()
+        except OSError:
+            continue
+        # touch it so eviction sees it as recently used
+        os.utime(path)
+        return suffix, data
+    return None
+
+
+def _write_entry(key: str, suffix: str, data: bytes):
+    directory = cache_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    # write to a temporary file and rename, so concurrent runs never see a
+    # partially written entry
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, directory / f"{key}{suffix}")
+    evict(max_bytes())
+
+
+def evict(limit: int):
+    """
+    Delete the least recently used entries until the cache directory is no
+    bigger than ``limit`` bytes.
+    """
+    try:
+        entries = [(e.stat().st_mtime, e.stat().st_size, e) for e in cache_dir().iterdir()
+                   if e.suffix in (".pkl", ".npz")]
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries, key=lambda e: e[0]):
+        if total <= limit:
+            break
+        entry.unlink(missing_ok=True)
+        total -= size
+
+
+def clear():
+    """
+    Remove everything from the cache, on disk and in memory.
+    """
+    _memory.clear()
+    evict(0)
+
+
+def _cached(fn: Callable[..., T], content: Callable[[tuple], tuple[bytes, tuple]]) -> Callable[..., T]:
+    """
+    Wrap ``fn`` to cache its results keyed by the source of ``fn``, and the
+    input bytes and remaining arguments that ``content`` gives for the
+    arguments of each call.
+    """
+    source = Path(inspect.getsourcefile(fn) or fn.__code__.co_filename).resolve()
+    # the module name is part of the key because pickled classes are stored by
+    # module - a script run directly has classes in __main__, so can't share
+    # entries with the same script run via the runner
+    identity = f"{source}:{fn.__module__}:{fn.__qualname__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if os.environ.get(DISABLE_ENV):
+            return fn(*args, **kwargs)
+        try:
+            data, rest = content(args)
+            mtime = source.stat().st_mtime
+        except OSError:
+            # let the loader report the missing file in its own way
+            return fn(*args, **kwargs)
+
+        digest = hashlib.sha256(data)
+        digest.update(f"{identity}:{mtime}:{rest!r}:{sorted(kwargs.items())!r}".encode())
+        key = digest.hexdigest()
+
+        entry = _memory.get(key) or _read_entry(key)
+        if entry is not None:
+            try:
+                value = _deserialise(*entry)
+            except Exception:
+                # corrupt, or refers to a class that no longer exists - parse
+                # again and overwrite it
+                pass
+            else:
+                _memory[key] = entry
+                return value
+
+        value = fn(*args, **kwargs)
+        try:
+            suffix, data = _serialise(value)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # not everything can be pickled - just don't cache it
+            return value
+        _memory[key] = (suffix, data)
+        try:
+            _write_entry(key, suffix, data)
+        except OSError:
+            # a read-only or full disk just means no caching
+            pass
+        return value
+
+    return wrapper
+
+
+def cached_input(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorator for input loaders that caches their results by input content.
+    Any arguments to the loader become part of the cache key, so they must
+    have a stable ``repr``.
+    """
+    return _cached(fn, lambda args: (Path(input_path()).read_bytes(), args))
+
+
+def cached_parse(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorator for parse functions that take the input text as their first
+    argument, caching their results by that text.  Any other arguments become
+    part of the cache key, so they must have a stable ``repr``.
+    """
+    return _cached(fn, lambda args: (args[0].encode() if isinstance(args[0], str) else bytes(args[0]), args[1:]))
@@ -0,0 +1,147 @@
+"""
+Coordinate compression for rectilinear polygons on a grid.
+
+Puzzles like 2023/18 and 2025/09 describe a polygon by its corners, with
+coordinates far too large to fill in cell by cell.  Only the rows and
+columns that contain a corner matter, so each axis is compressed to those
+coordinates, alternating with one "gap" slot standing for all the rows (or
+columns) between two consecutive ones::
+
+    coordinates     3        10   11         40
+    slots           0    1    2  3  4    5    6
+    weights         1    6    1  0  1    28   1
+
+Every slot has a weight, the number of real rows or columns it stands for
+(which may be 0 for the gap between adjacent coordinates).  The polygon
+becomes a small boolean mask over the compressed grid, and a prefix-sum
+table of the weights of the cells inside it then answers "how many real
+cells of this rectangle are inside the polygon" - and so "is this rectangle
+entirely inside" - in O(1), for a single rectangle or whole arrays of them.
+
+::
+
+    polygon = CompressedPolygon(corners)
+    polygon.area                                # real cells inside, boundary included
+    r0, c0 = polygon.index(top_left)
+    r1, c1 = polygon.index(bottom_right)
+    polygon.contains_rect(r0, c0, r1, c1)
+
+Building the mask and table is O(R * C) in time and memory for R distinct
+rows and C distinct columns among the corners, after which queries are
+constant time.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+
+class CompressedAxis:
+    def __init__(self, coords):
+        """
+        Compress the distinct values of ``coords``.
+        """
+        self.coords = np.unique(np.asarray(coords, dtype=np.int64))
+        if len(self.coords) == 0:
+            raise ValueError("Cannot compress an empty axis")
+        self.weights = np.ones(2 * len(self.coords) - 1, dtype=np.int64)
+        # The "gap" between each coordinate and the next
+        self.weights[1::2] = np.diff(self.coords) - 1
+        # offsets[i] is the real coordinate of the start of slot i, relative
+        # to the first coordinate
+        self.offsets = np.concatenate(([0], np.cumsum(self.weights)))
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def index(self, values):
+        """
+        The slot of each of ``values``, which must be among the compressed
+        coordinates.
+        """
+        return 2 * np.searchsorted(self.coords, values)
+
+    def span(self, first, last):
+        """
+        Total weight of the slots from ``first`` to ``last`` inclusive.
+        """
+        return self.offsets[np.asarray(last) + 1] - self.offsets[first]
+
+
+class CompressedPolygon:
+    def __init__(self, corners: Sequence[Sequence[int]]):
+        """
+        Compress the polygon with the given ``(row, col)`` corners, in order
+        round the boundary (either way round).  Each corner must share a row
+        or a column with the next, and the last joins back to the first.
+        """
+        corners = np.asarray(corners, dtype=np.int64).reshape(-1, 2)
+        self.rows = CompressedAxis(corners[:, 0])
+        self.cols = CompressedAxis(corners[:, 1])
+        # The corners in compressed coordinates
+        self.corners = np.stack((self.rows.index(corners[:, 0]), self.cols.index(corners[:, 1])), axis=1)
+
+        shape = (len(self.rows), len(self.cols))
+        self.boundary = np.zeros(shape, dtype=bool)
+        # Boundary cells with an edge leading down out of them - crossing one
+        # of these on the way along a row takes us in or out of the polygon
+        downward = np.zeros(shape, dtype=bool)
+        for (r0, c0), (r1, c1) in zip(self.corners.tolist(), np.roll(self.corners, -1, axis=0).tolist()):
+            if r0 == r1:
+                self.boundary[r0, min(c0, c1):max(c0, c1) + 1] = True
+            elif c0 == c1:
+                self.boundary[min(r0, r1):max(r0, r1) + 1, c0] = True
+                downward[min(r0, r1):max(r0, r1), c0] = True
+            else:
+                raise ValueError(f"Edge from {(r0, c0)} to {(r1, c1)} is not horizontal or vertical")
+
+        # A cell is inside if it's on the boundary, or if an odd number of
+        # downward edges have been crossed to its left
+        crossings = np.logical_xor.accumulate(downward, axis=1)
+        self.inside = self.boundary.copy()
+        self.inside[:, 1:] |= crossings[:, :-1]
+
+        # prefix[r, c] is the number of real cells inside the polygon in the
+        # compressed rows before r and columns before c
+        weighted = np.outer(self.rows.weights, self.cols.weights) * self.inside
+        self.prefix = np.zeros((shape[0] + 1, shape[1] + 1), dtype=np.int64)
+        np.cumsum(np.cumsum(weighted, axis=0), axis=1, out=self.prefix[1:, 1:])
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.inside.shape
+
+    @property
+    def area(self) -> int:
+        """
+        The number of real cells inside the polygon, including the boundary.
+        """
+        return int(self.prefix[-1, -1])
+
+    def index(self, cell):
+        """
+        The compressed ``(row, col)`` of a real cell, or arrays of them for
+        an ``(n, 2)`` array of cells.  The coordinates must be among those of
+        the corners.
+        """
+        cell = np.asarray(cell, dtype=np.int64)
+        return self.rows.index(cell[..., 0]), self.cols.index(cell[..., 1])
+
+    def area_within(self, r0, c0, r1, c1):
+        """
+        The number of real cells inside the polygon in the compressed
+        rectangle from ``(r0, c0)`` to ``(r1, c1)`` inclusive.  Works on
+        scalars or (broadcast) arrays of rectangles.
+        """
+        p = self.prefix
+        r1 = np.asarray(r1) + 1
+        c1 = np.asarray(c1) + 1
+        return p[r1, c1] - p[r0, c1] - p[r1, c0] + p[r0, c0]
+
+    def contains_rect(self, r0, c0, r1, c1):
+        """
+        Whether the compressed rectangle from ``(r0, c0)`` to ``(r1, c1)``
+        inclusive lies entirely inside the polygon.  Works on scalars or
+        (broadcast) arrays of rectangles.
+        """
+        return self.area_within(r0, c0, r1, c1) == self.rows.span(r0, r1) * self.cols.span(c0, c1)
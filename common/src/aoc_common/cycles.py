@@ -0,0 +1,186 @@
+"""
+Cycle detection for simulations that are run for far more steps than could
+ever be simulated, e.g. "what does the platform look like after a billion
+spins".
+
+Every deterministic simulation with finitely many states eventually repeats
+itself: after ``start`` steps it enters a cycle of ``length`` states that it
+then goes round forever.  Once the cycle length is known, the state after
+any number of steps is the same as the state a multiple of ``length`` steps
+earlier, so only O(start + length) steps ever need simulating.
+
+- ``fast_forward`` runs a simulation to step N.  It only ever holds the
+  current state, plus the keys of a bounded number of earlier states, falling
+  back on Brent's algorithm for cycles too long to remember, so the step
+  function is free to update the state in place and memory is bounded however
+  long the run-in or cycle is.
+- ``find_cycle`` finds the exact start and length of the cycle, for
+  simulations whose states are values (the step returns a new state).
+- ``Zobrist`` fingerprints grid states as 64-bit ints, which are cheap to
+  compare and to update incrementally as cells change.
+- ``crt`` combines cycles of different lengths, for questions like "when are
+  all these cycles at a given point at the same time".
+
+Comparisons are made on ``key(state)`` (by default the state itself), so
+states can be compared by fingerprint - with 64-bit fingerprints the chance
+of being fooled by a collision is negligible for any feasible run.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Hashable, Iterable, Optional, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+# Number of states whose keys fast_forward remembers
+DEFAULT_HISTORY = 1 << 16
+
+
+def _identity(x):
+    return x
+
+
+@dataclass(frozen=True)
+class Cycle:
+    # number of steps before the first state that is part of the cycle
+    start: int
+    length: int
+
+    def equivalent_step(self, n: int) -> int:
+        """
+        The first step whose state is the same as that after ``n`` steps.
+        """
+        if n < self.start:
+            return n
+        return self.start + (n - self.start) % self.length
+
+
+def find_cycle(state: T, step: Callable[[T], T], key: Callable[[T], Hashable] = _identity) -> Cycle:
+    """
+    Brent's algorithm - find the length of the cycle by keeping one state
+    fixed while the other runs ahead, moving the fixed one up to the runner
+    at each power of two, then find where the cycle starts by running two
+    states ``length`` steps apart from the beginning until they meet.
+
+    ``step`` must return a new state rather than modifying its argument, as
+    two states are live at once.
+    """
+    power = length = 1
+    tortoise = key(state)
+    hare = step(state)
+    while key(hare) != tortoise:
+        if power == length:
+            tortoise = key(hare)
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+
+    tortoise = hare = state
+    for _ in range(length):
+        hare = step(hare)
+    start = 0
+    while key(tortoise) != key(hare):
+        tortoise = step(tortoise)
+        hare = step(hare)
+        start += 1
+
+    return Cycle(start, length)
+
+
+def fast_forward(state: T, step: Callable[[T], T], n: int, key: Callable[[T], Hashable] = _identity,
+                 history: int = DEFAULT_HISTORY) -> T:
+    """
+    The state after ``n`` steps.  ``step`` may either return a new state or
+    update the state in place (and return it).
+
+    This runs until the cycle is spotted, at which point the current state
+    is somewhere in the cycle, so it repeats every ``length`` steps from then
+    on and only the remainder of the steps to ``n`` modulo the length still
+    need to be run.  The keys of the first ``history`` states are remembered,
+    so short cycles are spotted the first time a state repeats; beyond that
+    Brent's algorithm (which may take up to about twice as many steps) keeps
+    the memory bounded however long the run-in or cycle is.
+    """
+    power = length = 1
+    remembered = key(state)
+    seen = {remembered: 0}
+    for i in range(1, n + 1):
+        state = step(state)
+        k = key(state)
+        if k == remembered:
+            break
+        if (previous := seen.get(k)) is not None:
+            length = i - previous
+            break
+        if len(seen) < history:
+            seen[k] = i
+        if power == length:
+            remembered = k
+            power *= 2
+            length = 0
+        length += 1
+    else:
+        # got to n before the cycle showed up
+        return state
+
+    for _ in range((n - i) % length):
+        state = step(state)
+    return state
+
+
+class Zobrist:
+    """
+    Zobrist hashing of grids: every (cell, value) pair gets a random 64-bit
+    number, and the fingerprint of a grid is the XOR of the numbers for the
+    value of each cell.  As XOR is its own inverse, changing one cell changes
+    the fingerprint by XORing out the old number and in the new one, so a
+    simulation that moves a few things per step can keep the fingerprint up
+    to date without rescanning the grid.
+
+    Grids are arrays of small non-negative ints (bools, or codes below
+    ``values``).
+    """
+
+    def __init__(self, shape, values: int = 2, seed: int = 0):
+        self.shape = tuple(np.atleast_1d(shape))
+        size = int(np.prod(self.shape))
+        self.table = np.random.default_rng(seed).integers(0, 2**64, size=(size, values), dtype=np.uint64)
+        self._cells = np.arange(size)
+
+    def hash(self, grid) -> int:
+        """
+        Fingerprint of a whole grid.
+        """
+        values = np.asarray(grid).ravel().astype(np.intp)
+        return int(np.bitwise_xor.reduce(self.table[self._cells, values]))
+
+    def update(self, fingerprint: int, index: int, old: int, new: int) -> int:
+        """
+        The fingerprint after changing the cell at flat ``index`` from ``old``
+        to ``new``.
+        """
+        row = self.table[index]
+        return fingerprint ^ int(row[old]) ^ int(row[new])
+
+
+def crt(residues: Iterable[int], moduli: Iterable[int]) -> Optional[tuple[int, int]]:
+    """
+    Solve ``x = residues[i] (mod moduli[i])`` for all ``i``, where the moduli
+    need not be coprime.  Returns ``(x, m)`` with ``0 <= x < m``, where ``m``
+    is the lcm of the moduli and the solutions are exactly ``x + k*m``, or
+    None if there is no solution.
+    """
+    x, m = 0, 1
+    for a, n in zip(residues, moduli):
+        # find k with x + k*m = a (mod n), i.e. k*m = a - x (mod n)
+        g = math.gcd(m, n)
+        if (a - x) % g:
+            return None
+        k = (a - x) // g * pow(m // g, -1, n // g) % (n // g)
+        x += k * m
+        m = m // g * n
+        x %= m
+    return x, m
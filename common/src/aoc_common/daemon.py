@@ -0,0 +1,342 @@
+"""
+A warm worker process that runs solutions without paying for interpreter
+startup and imports each time.
+
+Starting Python, importing numpy (and networkx, sympy or scipy where they're
+used) and importing aoc_common takes longer than many whole solutions do.
+The daemon does all that once and then waits on a Unix socket.  For each
+run request it forks, so every run starts from the same freshly-imported
+state and nothing one solution does can leak into the next, and the child
+runs the solutions with the runner (see aoc_common.runner) and sends back
+the results as JSON - the same report as ``runner --json``.
+
+Usage::
+
+    python -m aoc_common.daemon start [--preload MODULES]
+    python -m aoc_common.daemon run [--input FILE] [--json FILE] [selector ...]
+    python -m aoc_common.daemon status
+    python -m aoc_common.daemon stop
+
+``serve`` runs the daemon in the foreground instead of ``start``ing it in
+the background.  The socket is ``$AOC_DAEMON_SOCKET``, or ``daemon.sock`` in
+the parsed input cache directory (see aoc_common.cache).  As well as all of
+aoc_common, it preloads numpy, networkx, sympy and scipy.optimize (or the
+comma-separated modules in ``$AOC_DAEMON_PRELOAD``), skipping any that
+aren't installed.
+
+Requests and responses are single lines of JSON, one of each per
+connection: ``{"op": "run", "root": ..., "selectors": [...], "input": ...,
+"profile": ...}``, ``{"op": "ping"}`` or ``{"op": "stop"}``.  Anything that
+can reach the socket can run code as the daemon's user, so it is created
+readable and writable by its owner only.
+"""
+
+import argparse
+import atexit
+import importlib
+import io
+import json
+import os
+import pkgutil
+import signal
+import socket
+import subprocess
+import sys
+import time
+import traceback
+from pathlib import Path
+from time import perf_counter
+from typing import Iterable, Optional
+
+import aoc_common
+from aoc_common.cache import cache_dir
+from aoc_common.lazy import lazy_import
+
+# The client side has to start quickly or there's no point, so it doesn't
+# import any of the solution machinery it doesn't need to
+profile = lazy_import("aoc_common.profile")
+runner = lazy_import("aoc_common.runner")
+
+SOCKET_ENV = "AOC_DAEMON_SOCKET"
+PRELOAD_ENV = "AOC_DAEMON_PRELOAD"
+
+DEFAULT_PRELOAD = ("numpy", "networkx", "sympy", "scipy.optimize")
+
+# How long start waits for a new daemon to answer
+START_TIMEOUT = 30.0
+
+
+def socket_path() -> Path:
+    return Path(os.environ.get(SOCKET_ENV) or cache_dir() / "daemon.sock")
+
+
+def preload(modules: Iterable[str]) -> tuple[list[str], list[str]]:
+    """
+    Import all of aoc_common and the given modules.  Returns the modules
+    that were imported and those that couldn't be.
+    """
+    loaded, missing = [], []
+    names = [f"aoc_common.{m.name}" for m in pkgutil.iter_modules(aoc_common.__path__) if m.name != "__main__"]
+    for name in (*names, *modules):
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            missing.append(name)
+        else:
+            loaded.append(name)
+    return loaded, missing
+
+
+def _read_message(conn: socket.socket) -> dict:
+    with conn.makefile("rb") as f:
+        line = f.readline()
+    if not line:
+        raise ConnectionError("Connection closed without a message")
+    return json.loads(line)
+
+
+def _send_message(conn: socket.socket, message: dict):
+    conn.sendall(json.dumps(message).encode() + b"\n")
+
+
+def _run(message: dict) -> dict:
+    """
+    Handle a run request - this is called in a forked child.
+    """
+    profile.configure(message.get("profile"))
+    root = Path(message["root"]) if message.get("root") else runner.find_root(Path(message["cwd"]))
+    solutions = runner.discover(root, message.get("selectors", ()))
+    input_file = message.get("input")
+    results = [runner.run_solution(sol, Path(input_file) if input_file else None) for sol in solutions]
+    # the human-readable version too, so the client needn't import the runner
+    text = io.StringIO()
+    for result in results:
+        runner.print_result(result, not message.get("quiet"), text)
+    return {**runner.report(results), "text": text.getvalue()}
+
+
+def serve(path: Optional[Path] = None, modules: Optional[Iterable[str]] = None):
+    """
+    Run the daemon in this process until it's asked to stop.
+    """
+    path = path or socket_path()
+    if modules is None:
+        modules = [m for m in os.environ.get(PRELOAD_ENV, "").split(",") if m] or DEFAULT_PRELOAD
+    start = perf_counter()
+    loaded, missing = preload(modules)
+    preload_time = perf_counter() - start
+
+    if path.exists():
+        if ping(path) is not None:
+            raise RuntimeError(f"A daemon is already listening on {path}")
+        # left behind by a daemon that didn't shut down cleanly
+        path.unlink()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o077)
+    try:
+        server.bind(str(path))
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    # children are never waited for, so have the kernel reap them
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    status = {
+        "pid": os.getpid(),
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "preload_time": preload_time,
+        "preloaded": loaded,
+        "missing": missing,
+    }
+    print(f"Listening on {path} (preloaded {len(loaded)} modules in {preload_time:.3f}s)", file=sys.stderr)
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    message = _read_message(conn)
+                except (ConnectionError, ValueError):
+                    continue
+                op = message.get("op")
+                if op == "ping":
+                    _send_message(conn, status)
+                elif op == "stop":
+                    _send_message(conn, {"stopped": os.getpid()})
+                    break
+                elif op == "run":
+                    if os.fork() == 0:
+                        # the child handles the request on its copy of the
+                        # connection while the parent goes back to waiting
+                        try:
+                            server.close()
+                            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                            try:
+                                response = _run(message)
+                            except Exception as e:
+                                response = {"error": "".join(traceback.format_exception(type(e), e, e.__traceback__))}
+                            _send_message(conn, response)
+                        finally:
+                            # exit without unwinding back into this loop, but
+                            # still flush anything (like the memo store) that
+                            # the run registered to save at exit
+                            atexit._run_exitfuncs()
+                            os._exit(0)
+                else:
+                    _send_message(conn, {"error": f"Unknown request {op!r}"})
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
+
+
+def request(message: dict, path: Optional[Path] = None) -> dict:
+    """
+    Send a request to the daemon and return its response.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(str(path or socket_path()))
+        _send_message(conn, message)
+        return _read_message(conn)
+
+
+def ping(path: Optional[Path] = None) -> Optional[dict]:
+    """
+    The daemon's status, or None if there isn't one running.
+    """
+    try:
+        return request({"op": "ping"}, path)
+    except (OSError, ValueError):
+        return None
+
+
+def run_report(selectors: Iterable[str] = (), root: Optional[Path] = None, input_file: Optional[Path] = None,
+               profile_modes: Optional[str] = None, quiet: bool = False, path: Optional[Path] = None) -> dict:
+    """
+    Run solutions in the daemon, returning the runner's JSON report plus the
+    human-readable version as ``"text"``.  The root defaults to the one
+    found from the current directory, as for the runner.
+    """
+    response = request({
+        "op": "run",
+        "root": str(Path(root).resolve()) if root else None,
+        "cwd": os.getcwd(),
+        "selectors": list(selectors),
+        "input": str(Path(input_file).resolve()) if input_file else None,
+        "profile": profile_modes,
+        "quiet": quiet,
+    }, path)
+    if "error" in response:
+        raise RuntimeError(f"Daemon failed: {response['error']}")
+    return response
+
+
+def run(selectors: Iterable[str] = (), root: Optional[Path] = None, input_file: Optional[Path] = None,
+        profile_modes: Optional[str] = None, path: Optional[Path] = None) -> list["runner.RunResult"]:
+    """
+    Run solutions in the daemon, as ``runner.run_all`` would in this process.
+    """
+    response = run_report(selectors, root, input_file, profile_modes, path=path)
+    return [runner.RunResult.from_dict(r) for r in response["results"]]
+
+
+def start(path: Optional[Path] = None, modules: Optional[Iterable[str]] = None) -> dict:
+    """
+    Start a daemon in the background, and wait for it to be ready.
+    """
+    path = path or socket_path()
+    status = ping(path)
+    if status is not None:
+        return status
+
+    cmd = [sys.executable, "-m", "aoc_common.daemon", "--socket", str(path), "serve"]
+    if modules is not None:
+        cmd += ["--preload", ",".join(modules)]
+    log = path.with_suffix(".log")
+    log.parent.mkdir(parents=True, exist_ok=True)
+    with open(log, "ab") as f:
+        proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=f, stderr=f, start_new_session=True)
+
+    deadline = perf_counter() + START_TIMEOUT
+    while perf_counter() < deadline:
+        status = ping(path)
+        if status is not None:
+            return status
+        if proc.poll() is not None:
+            raise RuntimeError(f"Daemon exited with status {proc.returncode}, see {log}")
+        time.sleep(0.05)
+    raise RuntimeError(f"Daemon didn't start within {START_TIMEOUT}s, see {log}")
+
+
+def stop(path: Optional[Path] = None) -> bool:
+    """
+    Stop the daemon, if there is one.  Returns whether there was.
+    """
+    try:
+        request({"op": "stop"}, path)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m aoc_common.daemon",
+                                     description="Run solutions in a warm, preloaded worker process")
+    parser.add_argument("--socket", type=Path, help=f"socket to use (default {socket_path()})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, help in (("serve", "run the daemon in the foreground"), ("start", "start the daemon in the background")):
+        cmd = commands.add_parser(name, help=help)
+        cmd.add_argument("--preload", help="comma-separated modules to import up front, as well as aoc_common")
+    commands.add_parser("stop", help="stop the daemon")
+    commands.add_parser("status", help="show whether the daemon is running, and what it has preloaded")
+    run_cmd = commands.add_parser("run", help="run solutions in the daemon")
+    run_cmd.add_argument("selectors", nargs="*", help="years, days or scripts to run, as for the runner")
+    run_cmd.add_argument("--root", type=Path, help="repository root (default: found from the current directory)")
+    run_cmd.add_argument("--input", type=Path, help="input file to use instead of each day's own 'input'")
+    run_cmd.add_argument("--json", metavar="FILE", help="write the results as JSON to FILE ('-' for stdout)")
+    run_cmd.add_argument("-q", "--quiet", action="store_true", help="don't show the solutions' output")
+    run_cmd.add_argument("--profile", nargs="?", const="1", metavar="MODES",
+                         help="record profiling phases, as for the runner")
+    args = parser.parse_args(argv)
+
+    path = args.socket or socket_path()
+    if args.command in ("serve", "start"):
+        modules = args.preload.split(",") if args.preload else None
+        if args.command == "serve":
+            serve(path, modules)
+        else:
+            status = start(path, modules)
+            print(f"Daemon {status['pid']} listening on {path}")
+    elif args.command == "stop":
+        if not stop(path):
+            print(f"No daemon listening on {path}", file=sys.stderr)
+            return 1
+    elif args.command == "status":
+        status = ping(path)
+        if status is None:
+            print(f"No daemon listening on {path}")
+            return 1
+        print(f"Daemon {status['pid']} listening on {path} since {status['started']}")
+        print(f"Preloaded in {status['preload_time']:.3f}s: {', '.join(status['preloaded'])}")
+        if status["missing"]:
+            print(f"Not installed: {', '.join(status['missing'])}")
+    elif args.command == "run":
+        if ping(path) is None:
+            print(f"No daemon listening on {path} - start one with 'python -m aoc_common.daemon start'",
+                  file=sys.stderr)
+            return 2
+        response = run_report(args.selectors, args.root, args.input, args.profile, args.quiet, path)
+        human = sys.stderr if args.json == "-" else sys.stdout
+        human.write(response.pop("text"))
+        if args.json:
+            data = json.dumps(response, indent=2)
+            if args.json == "-":
+                print(data)
+            else:
+                Path(args.json).write_text(data + "\n")
+        return 1 if any(r["error"] for r in response["results"]) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+"""
+Write a generated input to stdout or a file.
+
+Usage: python -m aoc_common.gen DAY [--scale S] [--seed N] [-o FILE]
+       python -m aoc_common.gen --list
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from aoc_common.gen import available, generate
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc_common.gen", description="Generate a scaled puzzle input")
+    parser.add_argument("day", nargs="?", help="day to generate, e.g. 2023/11")
+    parser.add_argument("--scale", type=float, default=1, help="size relative to a real input")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", type=Path, help="file to write (default stdout)")
+    parser.add_argument("--list", action="store_true", help="list the days with generators")
+    args = parser.parse_args(argv)
+
+    if args.list or not args.day:
+        print("\n".join(available()))
+        return 0
+
+    text = generate(args.day, args.scale, args.seed)
+    if args.output:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
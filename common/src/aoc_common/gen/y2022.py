@@ -0,0 +1,357 @@
+import json
+import math
+import random
+import string
+
+from aoc_common.gen import generator, scaled
+
+
+@generator("2022/01")
+def calorie_counting(scale: float, rng: random.Random) -> str:
+    elves = []
+    for _ in range(scaled(250, scale)):
+        elves.append("\n".join(str(rng.randint(1000, 70000)) for _ in range(rng.randint(1, 15))))
+    return "\n\n".join(elves) + "\n"
+
+
+@generator("2022/02")
+def strategy_guide(scale: float, rng: random.Random) -> str:
+    return "".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}\n" for _ in range(scaled(2500, scale)))
+
+
+@generator("2022/03")
+def rucksacks(scale: float, rng: random.Random) -> str:
+    # Each group of three elves shares exactly one badge item, and each elf
+    # has exactly one item in both compartments: give the elves of a group
+    # disjoint sets of other items, and split each elf's set between its
+    # compartments apart from the one duplicate
+    lines = []
+    for _ in range(scaled(100, scale)):
+        badge = rng.choice(string.ascii_letters)
+        others = [c for c in string.ascii_letters if c != badge]
+        rng.shuffle(others)
+        for elf in range(3):
+            pool = others[17 * elf:17 * (elf + 1)]
+            duplicate, left_only, right_only = pool[0], pool[1:9], pool[9:]
+            size = rng.randint(8, 24)
+            badge_left = rng.random() < 0.5
+            halves = []
+            for only, has_badge in ((left_only, badge_left), (right_only, not badge_left)):
+                items = [duplicate] + ([badge] if has_badge else [])
+                items += rng.choices(only, k=size - len(items))
+                rng.shuffle(items)
+                halves.append("".join(items))
+            lines.append("".join(halves))
+    return "\n".join(lines) + "\n"
+
+
+@generator("2022/04")
+def section_pairs(scale: float, rng: random.Random) -> str:
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        a, b = sorted(rng.randint(1, 99) for _ in range(2))
+        c, d = sorted(rng.randint(1, 99) for _ in range(2))
+        lines.append(f"{a}-{b},{c}-{d}")
+    return "\n".join(lines) + "\n"
+
+
+@generator("2022/05")
+def crate_stacks(scale: float, rng: random.Random) -> str:
+    # Never move a stack's last crate, so every stack has a crate on top at
+    # the end
+    stacks = [[rng.choice(string.ascii_uppercase) for _ in range(rng.randint(1, 8))] for _ in range(9)]
+    height = max(map(len, stacks))
+    lines = []
+    for level in range(height - 1, -1, -1):
+        lines.append(" ".join(f"[{s[level]}]" if level < len(s) else "   " for s in stacks).rstrip())
+    lines.append(" ".join(f" {i + 1} " for i in range(len(stacks))))
+    lines.append("")
+
+    sizes = [len(s) for s in stacks]
+    for _ in range(scaled(500, scale)):
+        src = rng.choice([i for i, size in enumerate(sizes) if size > 1])
+        dst = rng.choice([i for i in range(len(sizes)) if i != src])
+        count = rng.randint(1, min(sizes[src] - 1, 30))
+        sizes[src] -= count
+        sizes[dst] += count
+        lines.append(f"move {count} from {src + 1} to {dst + 1}")
+    return "\n".join(lines) + "\n"
+
+
+@generator("2022/06")
+def datastream(scale: float, rng: random.Random) -> str:
+    # Only three different letters until the start-of-packet marker, and
+    # only thirteen until the start-of-message marker, so the markers are
+    # where they're planted
+    size = scaled(4096, scale, minimum=64)
+    packet, message = size // 4, size * 3 // 4
+    letters = list(string.ascii_lowercase)
+    rng.shuffle(letters)
+    data = rng.choices(letters[:3], k=packet) + rng.sample(letters, 4)
+    data += rng.choices(letters[:13], k=message - len(data)) + rng.sample(letters, 14)
+    data += rng.choices(letters, k=size - len(data))
+    return "".join(data) + "\n"
+
+
+@generator("2022/07")
+def terminal_output(scale: float, rng: random.Random) -> str:
+    # A random directory tree whose files add up to between 40M and 70M, so
+    # there's some space left but not enough
+    children: list[list[int]] = [[]]
+    names = ["/"]
+    depth = [0]
+    for _ in range(scaled(180, scale)):
+        parent = rng.choice([d for d in range(len(names)) if depth[d] < 10])
+        taken = {names[c] for c in children[parent]}
+        name = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8)))
+        if name in taken:
+            continue
+        children[parent].append(len(names))
+        children.append([])
+        names.append(name)
+        depth.append(depth[parent] + 1)
+
+    files: list[list[tuple[str, int]]] = [[] for _ in names]
+    weights = [rng.random() ** 4 for _ in range(scaled(300, scale))]
+    total = rng.randint(42_000_000, 68_000_000)
+    for weight in weights:
+        directory = rng.randrange(len(names))
+        name = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8)))
+        if rng.random() < 0.5:
+            name += "." + "".join(rng.choices(string.ascii_lowercase, k=3))
+        if name in {n for n, _ in files[directory]} or name in {names[c] for c in children[directory]}:
+            continue
+        files[directory].append((name, max(1, int(total * weight / sum(weights)))))
+
+    lines = []
+
+    def visit(d: int):
+        lines.append("$ ls")
+        entries = [f"dir {names[c]}" for c in children[d]] + [f"{size} {name}" for name, size in files[d]]
+        rng.shuffle(entries)
+        lines.extend(entries)
+        for c in children[d]:
+            lines.append(f"$ cd {names[c]}")
+            visit(c)
+            lines.append("$ cd ..")
+
+    lines.append("$ cd /")
+    visit(0)
+    return "\n".join(lines) + "\n"
+
+
+@generator("2022/08")
+def tree_heights(scale: float, rng: random.Random) -> str:
+    size = scaled(99, math.sqrt(scale), minimum=3)
+    return "".join("".join(rng.choices("0123456789", k=size)) + "\n" for _ in range(size))
+
+
+@generator("2022/09")
+def rope_moves(scale: float, rng: random.Random) -> str:
+    return "".join(f"{rng.choice('LRUD')} {rng.randint(1, 20)}\n" for _ in range(scaled(2000, scale)))
+
+
+@generator("2022/10")
+def cpu_program(scale: float, rng: random.Random) -> str:
+    # Only the first 240 cycles matter, which takes about 140 instructions.
+    # Keep the sprite on the screen, so there's something to see.
+    lines = []
+    x = 1
+    for _ in range(scaled(140, scale)):
+        if rng.random() < 0.3:
+            lines.append("noop")
+        else:
+            add = rng.choice([n for n in range(-20, 21) if n and 0 <= x + n < 40])
+            x += add
+            lines.append(f"addx {add}")
+    return "\n".join(lines) + "\n"
+
+
+@generator("2022/11")
+def monkeys(scale: float, rng: random.Random) -> str:
+    # The test divisors are distinct primes, and only one monkey squares its
+    # worry levels, as in the real inputs
+    count = 8
+    divisors = rng.sample([2, 3, 5, 7, 11, 13, 17, 19, 23], count)
+    squarer = rng.randrange(count)
+    blocks = []
+    for m in range(count):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, scaled(8, scale))))
+        if m == squarer:
+            op = "old * old"
+        elif rng.random() < 0.3:
+            op = f"old * {rng.randint(2, 19)}"
+        else:
+            op = f"old + {rng.randint(1, 8)}"
+        if_true, if_false = rng.sample([t for t in range(count) if t != m], 2)
+        blocks.append(f"Monkey {m}:\n"
+                      f"  Starting items: {items}\n"
+                      f"  Operation: new = {op}\n"
+                      f"  Test: divisible by {divisors[m]}\n"
+                      f"    If true: throw to monkey {if_true}\n"
+                      f"    If false: throw to monkey {if_false}\n")
+    return "\n".join(blocks)
+
+
+@generator("2022/12")
+def heightmap(scale: float, rng: random.Random) -> str:
+    # Heights rise by at most one per column along one row from S to E, so
+    # there's always a way up; everywhere else is random around that
+    rows = scaled(41, math.sqrt(scale), minimum=3)
+    cols = scaled(171, math.sqrt(scale), minimum=26)
+    road = rng.randrange(rows)
+    lines = []
+    for r in range(rows):
+        line = []
+        for c in range(cols):
+            base = c * 26 // cols
+            height = base if r == road else min(25, max(0, base + rng.randint(-4, 1)))
+            line.append(chr(ord("a") + height))
+        lines.append(line)
+    lines[road][0] = "S"
+    lines[road][-1] = "E"
+    return "".join("".join(line) + "\n" for line in lines)
+
+
+def _packet_order(left, right):
+    # True, False, or None if the two packets can't be told apart
+    if isinstance(left, int) and isinstance(right, int):
+        return None if left == right else left < right
+    left = left if isinstance(left, list) else [left]
+    right = right if isinstance(right, list) else [right]
+    for a, b in zip(left, right):
+        if (order := _packet_order(a, b)) is not None:
+            return order
+    return None if len(left) == len(right) else len(left) < len(right)
+
+
+@generator("2022/13")
+def packets(scale: float, rng: random.Random) -> str:
+    def packet(depth=0):
+        items = []
+        for _ in range(rng.randint(0, 5)):
+            if depth < 4 and rng.random() < 0.3:
+                items.append(packet(depth + 1))
+            else:
+                items.append(rng.randint(0, 10))
+        return items
+
+    def distinct_packet(*others):
+        # every pair, and every packet and the divider packets, must be in a
+        # definite order
+        while True:
+            p = packet()
+            if all(_packet_order(p, other) is not None for other in others):
+                return p
+
+    pairs = []
+    for _ in range(scaled(150, scale)):
+        left = distinct_packet([[2]], [[6]])
+        right = distinct_packet([[2]], [[6]], left)
+        pairs.append(f"{json.dumps(left, separators=(',', ':'))}\n{json.dumps(right, separators=(',', ':'))}\n")
+    return "\n".join(pairs)
+
+
+@generator("2022/14")
+def rock_paths(scale: float, rng: random.Random) -> str:
+    # Cups and other paths of alternating horizontal and vertical lines below
+    # the sand source, with some repeated as in the real inputs
+    depth = scaled(170, math.sqrt(scale), minimum=20)
+    paths = []
+    for _ in range(scaled(150, scale)):
+        if paths and rng.random() < 0.4:
+            paths.append(rng.choice(paths))
+            continue
+        x, y = 500 + rng.randint(-depth // 4, depth // 4), rng.randint(13, depth)
+        if rng.random() < 0.5:
+            # a cup that sand can pile up in
+            bottom, width = min(depth, y + rng.randint(2, 10)), rng.randint(3, 12)
+            paths.append(f"{x},{y} -> {x},{bottom} -> {x + width},{bottom} -> {x + width},{y}")
+            continue
+        corners = [(x, y)]
+        horizontal = rng.random() < 0.5
+        for _ in range(rng.randint(1, 5)):
+            step = rng.randint(1, 10) * rng.choice((-1, 1))
+            if horizontal:
+                x += step
+            else:
+                y = min(depth, max(13, y + step))
+                if y == corners[-1][1]:
+                    y += 1 if y < depth else -1
+            corners.append((x, y))
+            horizontal = not horizontal
+        paths.append(" -> ".join(f"{x},{y}" for x, y in corners))
+    return "\n".join(paths) + "\n"
+
+
+@generator("2022/15")
+def sensors(scale: float, rng: random.Random) -> str:
+    # Part 2 needs exactly one uncovered cell in the search area, so choose
+    # that gap first.  A lattice of diamonds of radius r centred on the
+    # points (i r, j r) with i + j even covers the whole plane; each one is
+    # made a little bigger, but shrunk to stop short of the gap where it
+    # would reach it.  That leaves cells within 2r of the gap possibly
+    # uncovered, so four more sensors at (+-a, +-a) from the gap with radius
+    # 2a - 1 (a > r) cover everything within 2a - 1 of it, except the gap.
+    limit = 4_000_000
+    gap_x, gap_y = rng.randint(0, limit), rng.randint(0, limit)
+    step = max(2, int(limit / math.sqrt(2 * scaled(25, scale))))
+    off_x, off_y = rng.randrange(step), rng.randrange(step)
+
+    sensors = []
+    for i in range(-1, limit // step + 2):
+        for j in range(-1, limit // step + 2):
+            if (i + j) % 2:
+                continue
+            x, y = off_x + i * step, off_y + j * step
+            # skip the ones whose diamond can't reach the search area
+            outside = max(0, -x, x - limit) + max(0, -y, y - limit)
+            to_gap = abs(x - gap_x) + abs(y - gap_y)
+            radius = min(step + rng.randint(1, step // 8 + 1), to_gap - 1)
+            if outside <= radius and radius > 0:
+                sensors.append((x, y, radius))
+    a = step + rng.randint(1, step // 4 + 1)
+    for dx, dy in ((-1, -1), (-1, 1), (1, -1), (1, 1)):
+        sensors.append((gap_x + dx * a, gap_y + dy * a, 2 * a - 1))
+    rng.shuffle(sensors)
+
+    lines = []
+    for x, y, radius in sensors:
+        # the closest beacon is anywhere on the edge of the sensor's diamond
+        dx = rng.randint(-radius, radius)
+        dy = (radius - abs(dx)) * rng.choice((-1, 1))
+        lines.append(f"Sensor at x={x}, y={y}: closest beacon is at x={x + dx}, y={y + dy}")
+    return "\n".join(lines) + "\n"
+
+
+@generator("2022/16")
+def valves(scale: float, rng: random.Random) -> str:
+    # A connected tunnel network of valves, about a quarter of which have a
+    # non-zero flow rate (at most 15, which is all part 2 can handle), and
+    # AA has none
+    names = ["AA"]
+    while len(names) < scaled(60, scale, minimum=4):
+        name = "".join(rng.choices(string.ascii_uppercase, k=2))
+        if name not in names:
+            names.append(name)
+    tunnels = {name: set() for name in names}
+    for i in range(1, len(names)):
+        other = names[rng.randrange(i)]
+        tunnels[names[i]].add(other)
+        tunnels[other].add(names[i])
+    for _ in range(len(names) // 3):
+        a, b = rng.sample(names, 2)
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+    working = set(rng.sample(names[1:], min(15, len(names) // 4)))
+
+    lines = []
+    for name in rng.sample(names, len(names)):
+        flow = rng.randint(3, 25) if name in working else 0
+        targets = sorted(tunnels[name])
+        rng.shuffle(targets)
+        if len(targets) == 1:
+            lines.append(f"Valve {name} has flow rate={flow}; tunnel leads to valve {targets[0]}")
+        else:
+            lines.append(f"Valve {name} has flow rate={flow}; tunnels lead to valves {', '.join(targets)}")
+    return "\n".join(lines) + "\n"
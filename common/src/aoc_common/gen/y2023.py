@@ -0,0 +1,570 @@
+import math
+import random
+import string
+
+from aoc_common.gen import generator, scaled
+
+
+_DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+@generator("2023/01")
+def calibration(scale: float, rng: random.Random) -> str:
+    # Letters with digits and spelt-out digits mixed in, at least one of
+    # them a real digit so part 1 has an answer for every line
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        tokens = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 6)):
+            kind = rng.random()
+            if kind < 0.3:
+                tokens.append(str(rng.randint(1, 9)))
+            elif kind < 0.6:
+                tokens.append(rng.choice(_DIGIT_WORDS))
+            else:
+                tokens.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        rng.shuffle(tokens)
+        lines.append("".join(tokens))
+    return "\n".join(lines) + "\n"
+
+
+@generator("2023/02")
+def cube_games(scale: float, rng: random.Random) -> str:
+    lines = []
+    for game in range(1, scaled(100, scale) + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {colour}" for colour in colours))
+        lines.append(f"Game {game}: {'; '.join(draws)}")
+    return "\n".join(lines) + "\n"
+
+
+@generator("2023/03")
+def engine_schematic(scale: float, rng: random.Random) -> str:
+    # Numbers are always separated by at least one dot or symbol, so each
+    # run of digits is one number
+    size = scaled(140, math.sqrt(scale), minimum=10)
+    lines = []
+    for _ in range(size):
+        row = ""
+        while len(row) < size:
+            kind = rng.random()
+            if kind < 0.1 and not row[-1:].isdigit():
+                row += str(rng.randint(1, 999))
+            elif kind < 0.14:
+                row += rng.choice("*****#+$/=%@&-")
+            else:
+                row += "."
+        lines.append(row[:size])
+    return "\n".join(lines) + "\n"
+
+
+@generator("2023/04")
+def scratchcards(scale: float, rng: random.Random) -> str:
+    lines = []
+    for card in range(1, scaled(200, scale) + 1):
+        matches = min(rng.randint(0, 10) for _ in range(3))
+        numbers = rng.sample(range(1, 100), 35 - matches)
+        winning = numbers[:10]
+        mine = numbers[10:] + winning[:matches]
+        rng.shuffle(mine)
+        lines.append(
+            f"Card {card:3d}: {' '.join(f'{n:2d}' for n in winning)} | {' '.join(f'{n:2d}' for n in mine)}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+_ALMANAC_MAPS = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+
+
+@generator("2023/05")
+def almanac(scale: float, rng: random.Random) -> str:
+    # Each map cuts the numbers below 2**32 into pieces and lays them out
+    # again in a shuffled order, so neither the sources nor the destinations
+    # of its ranges overlap
+    limit = 2 ** 32
+    seeds = []
+    for _ in range(scaled(10, scale)):
+        start = rng.randrange(limit // 2)
+        seeds += [start, rng.randint(1, limit // 20)]
+    blocks = [f"seeds: {' '.join(map(str, seeds))}\n"]
+    for src, dest in zip(_ALMANAC_MAPS, _ALMANAC_MAPS[1:]):
+        cuts = [0] + sorted(rng.sample(range(1, limit), scaled(30, scale))) + [limit]
+        pieces = list(zip(cuts, cuts[1:]))
+        rng.shuffle(pieces)
+        lines = [f"{src}-to-{dest} map:"]
+        dest_start = 0
+        for start, stop in pieces:
+            lines.append(f"{dest_start} {start} {stop - start}")
+            dest_start += stop - start
+        blocks.append("\n".join(lines) + "\n")
+    return "\n".join(blocks)
+
+
+@generator("2023/06")
+def boat_races(scale: float, rng: random.Random) -> str:
+    # Always four races whatever the scale: with the spaces taken out, more
+    # would make part 2's one race too long for floating point.  The
+    # records are beaten by some but not all button times, as are those of
+    # the one long race
+    while True:
+        times = [rng.randint(40, 99) for _ in range(4)]
+        records = [rng.randint(t * t // 8, t * t // 4 - 1) for t in times]
+        time, record = (int("".join(map(str, values))) for values in (times, records))
+        if record < time * time // 4:
+            break
+    return (f"Time:      {'  '.join(f'{t:4d}' for t in times)}\n"
+            f"Distance:  {'  '.join(f'{r:4d}' for r in records)}\n")
+
+
+@generator("2023/07")
+def camel_cards(scale: float, rng: random.Random) -> str:
+    # Draw each hand from a few ranks so that pairs, full houses and the
+    # rest all turn up; no two hands are the same
+    hands = []
+    seen = set()
+    while len(hands) < scaled(1000, scale):
+        ranks = rng.sample("23456789TJQKA", rng.randint(1, 5))
+        hand = "".join(rng.choice(ranks) for _ in range(5))
+        if hand not in seen:
+            seen.add(hand)
+            hands.append(f"{hand} {rng.randint(1, 1000)}")
+    return "\n".join(hands) + "\n"
+
+
+@generator("2023/08")
+def haunted_network(scale: float, rng: random.Random) -> str:
+    # Each ghost goes round a loop whose length is the (prime) number of
+    # instructions times a prime of its own, passing its Z node once on
+    # each time round - the way the real inputs are built.  Following the
+    # instructions always takes the next node of the loop; the other
+    # direction points anywhere, as it's never taken
+    length = min(p for p in (11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47) if p >= scaled(23, scale, minimum=11))
+    instructions = "".join(rng.choice("LR") for _ in range(length))
+    loops = rng.sample([41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97], 6)
+    letters = string.ascii_uppercase + string.digits
+    names = [a + b + c for a in letters for b in letters for c in letters if c not in "AZ"]
+    names = iter(rng.sample(names, length * sum(loops)))
+    prefixes = [a + b for a in letters for b in letters if a + b not in ("AA", "ZZ")]
+    prefixes = ["AA"] + rng.sample(prefixes, len(loops) - 1)
+    starts = [prefix + "A" for prefix in prefixes]
+    ends = ["ZZZ"] + [prefix + "Z" for prefix in prefixes[1:]]
+
+    loops = [[end] + [next(names) for _ in range(length * loop - 1)] for end, loop in zip(ends, loops)]
+    everything = [name for loop in loops for name in loop]
+    network = []
+    for start, loop in zip(starts, loops):
+        for i, node in enumerate(loop):
+            step = [rng.choice(everything)] * 2
+            step[instructions[i % length] == "R"] = loop[(i + 1) % len(loop)]
+            network.append((node, step))
+            if i == 0:
+                # starting from the A node is the same as starting from the Z
+                network.append((start, step))
+    rng.shuffle(network)
+    return instructions + "\n\n" + "".join(f"{node} = ({left}, {right})\n" for node, (left, right) in network)
+
+
+@generator("2023/09")
+def oasis_report(scale: float, rng: random.Random) -> str:
+    # Each history is a polynomial in the step number - a sum of binomial
+    # coefficients with small weights - so its differences reach zero
+    lines = []
+    for _ in range(scaled(200, scale)):
+        weights = [rng.randint(-9, 9) for _ in range(rng.randint(1, 8))]
+        values = [sum(w * math.comb(x, k) for k, w in enumerate(weights)) for x in range(21)]
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines) + "\n"
+
+
+def _random_tree(size: int, count: int, rng: random.Random) -> set[tuple[int, int]]:
+    """
+    The cells of a random tree joining ``count`` nodes of a size x size grid
+    of nodes, drawn on a (2 * size - 1) square grid: the nodes at even
+    coordinates and the edges between them at the cells in between.
+    """
+    cells = {(0, 0)}
+    frontier = [((0, 0), (0, 1)), ((0, 0), (1, 0))]
+    nodes = 1
+    while frontier and nodes < count:
+        (r, c), (dr, dc) = frontier.pop(rng.randrange(len(frontier)))
+        node = (r + 2 * dr, c + 2 * dc)
+        if node in cells or not (0 <= node[0] < 2 * size - 1 and 0 <= node[1] < 2 * size - 1):
+            continue
+        cells.add((r + dr, c + dc))
+        cells.add(node)
+        nodes += 1
+        frontier += [(node, step) for step in ((0, 1), (1, 0), (0, -1), (-1, 0))]
+    return cells
+
+
+@generator("2023/10")
+def pipe_maze(scale: float, rng: random.Random) -> str:
+    # The loop is the outline of a random tree drawn with cells two wide,
+    # so it's always one closed loop that never touches itself, with the
+    # middles of the tree's cells inside it.  Corners of those cells are the
+    # cells of the output, and the outline runs between corners with a tree
+    # cell on one side only
+    nodes = scaled(35, math.sqrt(scale), minimum=2)
+    tree = _random_tree(nodes, nodes * nodes * 2 // 3, rng)
+    size = 4 * nodes - 1
+    pipes = {
+        frozenset(((-1, 0), (1, 0))): "|", frozenset(((0, -1), (0, 1))): "-",
+        frozenset(((-1, 0), (0, 1))): "L", frozenset(((-1, 0), (0, -1))): "J",
+        frozenset(((1, 0), (0, -1))): "7", frozenset(((1, 0), (0, 1))): "F",
+    }
+    grid = [[rng.choice("|-LJ7F.") for _ in range(size)] for _ in range(size)]
+    loop = []
+    for r in range(size):
+        for c in range(size):
+            # whether the four cells around corner (r, c) are in the tree,
+            # clockwise from the top left
+            around = [((r + dr) // 2, (c + dc) // 2) in tree for dr, dc in ((-1, -1), (-1, 0), (0, 0), (0, -1))]
+            exits = []
+            if around[0] != around[1]:
+                exits.append((-1, 0))
+            if around[1] != around[2]:
+                exits.append((0, 1))
+            if around[2] != around[3]:
+                exits.append((1, 0))
+            if around[3] != around[0]:
+                exits.append((0, -1))
+            if exits:
+                grid[r][c] = pipes[frozenset(exits)]
+                loop.append((r, c))
+
+    start = rng.choice(loop)
+    r, c = start
+    # nothing but the loop itself may lead into the start
+    for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        if 0 <= r + dr < size and 0 <= c + dc < size and (r + dr, c + dc) not in loop:
+            grid[r + dr][c + dc] = "."
+    grid[r][c] = "S"
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator("2023/11")
+def galaxies(scale: float, rng: random.Random) -> str:
+    # Real inputs are 140x140 with ~440 galaxies and a few empty rows and
+    # columns, so keep the same density as the number of galaxies grows
+    size = scaled(140, math.sqrt(scale), minimum=4)
+    count = min(scaled(440, scale), size * size // 2)
+    empty_rows = set(rng.sample(range(size), size // 20))
+    empty_cols = set(rng.sample(range(size), size // 20))
+    rows = [r for r in range(size) if r not in empty_rows]
+    cols = [c for c in range(size) if c not in empty_cols]
+
+    cells = set()
+    while len(cells) < count:
+        cells.add((rng.choice(rows), rng.choice(cols)))
+
+    grid = [["."] * size for _ in range(size)]
+    for r, c in cells:
+        grid[r][c] = "#"
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator("2023/12")
+def spring_records(scale: float, rng: random.Random) -> str:
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        runs = [rng.randint(1, 6) for _ in range(rng.randint(1, 6))]
+        while sum(runs) + len(runs) - 1 > 20:
+            runs.pop()
+        gaps = [0] + [1] * (len(runs) - 1) + [0]
+        for _ in range(rng.randint(0, 20 - sum(runs) - len(runs) + 1)):
+            gaps[rng.randrange(len(gaps))] += 1
+        springs = "." * gaps[0] + "".join("#" * run + "." * gap for run, gap in zip(runs, gaps[1:]))
+        record = "".join("?" if rng.random() < 0.5 else spring for spring in springs)
+        lines.append(f"{record} {','.join(map(str, runs))}")
+    return "\n".join(lines) + "\n"
+
+
+def _mirror_lines(pattern: list[list[int]]) -> list[int]:
+    """
+    How many cells differ across each possible horizontal mirror line of a
+    pattern, for lines 1 to len(pattern) - 1.
+    """
+    diffs = []
+    for n in range(1, len(pattern)):
+        pairs = zip(reversed(pattern[:n]), pattern[n:])
+        diffs.append(sum(a != b for above, below in pairs for a, b in zip(above, below)))
+    return diffs
+
+
+@generator("2023/13")
+def mirror_patterns(scale: float, rng: random.Random) -> str:
+    # Each pattern is symmetric about one row and one column; the mirror row
+    # is off centre, so some rows have no reflection, and flipping a cell in
+    # one of those rows leaves the row mirror clean and puts one smudge on
+    # the column mirror.  Keep only the patterns with no other line that's
+    # clean or has one smudge, and transpose half of them
+    patterns = []
+    while len(patterns) < scaled(100, scale):
+        rows, cols = rng.randint(7, 17), rng.randint(7, 17)
+        row_mirror = rng.choice([a for a in range(1, rows) if 2 * a != rows])
+        col_mirror = rng.randrange(1, cols)
+        table = [[rng.randrange(2) for _ in range(cols)] for _ in range(rows)]
+
+        def canonical(i, mirror, size):
+            other = 2 * mirror - 1 - i
+            return min(i, other) if 0 <= other < size else i
+
+        pattern = [[table[canonical(r, row_mirror, rows)][canonical(c, col_mirror, cols)] for c in range(cols)]
+                   for r in range(rows)]
+        r = rng.choice([r for r in range(rows) if not 0 <= 2 * row_mirror - 1 - r < rows])
+        c = rng.choice([c for c in range(cols) if 0 <= 2 * col_mirror - 1 - c < cols])
+        pattern[r][c] ^= 1
+        if rng.random() < 0.5:
+            pattern = [list(col) for col in zip(*pattern)]
+
+        diffs = _mirror_lines(pattern) + _mirror_lines([list(col) for col in zip(*pattern)])
+        if diffs.count(0) == 1 and diffs.count(1) == 1:
+            patterns.append("\n".join("".join(".#"[cell] for cell in row) for row in pattern))
+    return "\n\n".join(patterns) + "\n"
+
+
+@generator("2023/14")
+def rock_platform(scale: float, rng: random.Random) -> str:
+    size = scaled(100, math.sqrt(scale), minimum=4)
+    return "".join(
+        "".join(rng.choices("O#.", weights=(2, 1, 7), k=size)) + "\n" for _ in range(size)
+    )
+
+
+@generator("2023/15")
+def init_sequence(scale: float, rng: random.Random) -> str:
+    # Labels come from a pool smaller than the number of steps so that
+    # lenses get replaced and removed again
+    labels = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6))) for _ in range(scaled(500, scale))]
+    steps = []
+    for _ in range(scaled(4000, scale)):
+        label = rng.choice(labels)
+        steps.append(f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}")
+    return ",".join(steps) + "\n"
+
+
+@generator("2023/16")
+def mirror_contraption(scale: float, rng: random.Random) -> str:
+    size = scaled(110, math.sqrt(scale), minimum=4)
+    return "".join(
+        "".join(rng.choices(".\\/-|", weights=(36, 1, 1, 1, 1), k=size)) + "\n" for _ in range(size)
+    )
+
+
+@generator("2023/17")
+def heat_loss_map(scale: float, rng: random.Random) -> str:
+    size = scaled(141, math.sqrt(scale), minimum=11)
+    return "".join("".join(str(rng.randint(1, 9)) for _ in range(size)) + "\n" for _ in range(size))
+
+
+@generator("2023/19")
+def part_workflows(scale: float, rng: random.Random) -> str:
+    # The workflows form a tree from "in", so every part ends up accepted or
+    # rejected
+    count = scaled(550, scale)
+    names = ["in"]
+    seen = {"in"}
+    workflows = []
+    for name in names:
+        targets = []
+        for _ in range(rng.randint(2, 4)):
+            if len(names) < count and rng.random() < 0.6:
+                target = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 3)))
+                if target not in seen:
+                    seen.add(target)
+                    names.append(target)
+                    targets.append(target)
+                    continue
+            targets.append(rng.choice("AR"))
+        steps = [f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{target}" for target in targets[:-1]]
+        workflows.append(f"{name}{{{','.join(steps + targets[-1:])}}}")
+    rng.shuffle(workflows)
+    parts = [
+        "{" + ",".join(f"{var}={rng.randint(1, 4000)}" for var in "xmas") + "}" for _ in range(scaled(200, scale))
+    ]
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts) + "\n"
+
+
+_PRIMES_4K = [n for n in range(3701, 4096, 2) if all(n % d for d in range(3, 64, 2))]
+
+
+@generator("2023/20")
+def pulse_modules(scale: float, rng: random.Random) -> str:
+    # Built the same way as the real inputs: the broadcaster starts a
+    # number of 12 bit counters made of flip-flops, each of which resets
+    # itself through a conjunction when it reaches its own prime, which
+    # sets off a chain of conjunctions down to rx
+    counters = scaled(4, scale)
+    pool = [a + b for a in string.ascii_lowercase for b in string.ascii_lowercase if a + b != "rx"]
+    names = iter(rng.sample(pool, counters * 14 + 1))
+    final = next(names)
+    modules = [("broadcaster", []), (f"&{final}", ["rx"])]
+    for prime in rng.sample(_PRIMES_4K, counters):
+        flip_flops = [next(names) for _ in range(12)]
+        hub, inverter = next(names), next(names)
+        modules[0][1].append(flip_flops[0])
+        hub_outputs = [inverter, flip_flops[0]]
+        for bit, flip_flop in enumerate(flip_flops):
+            outputs = flip_flops[bit + 1:bit + 2]
+            if prime >> bit & 1:
+                outputs.append(hub)
+            elif bit:
+                hub_outputs.append(flip_flop)
+            rng.shuffle(outputs)
+            modules.append((f"%{flip_flop}", outputs))
+        rng.shuffle(hub_outputs)
+        modules.append((f"&{hub}", hub_outputs))
+        modules.append((f"&{inverter}", [final]))
+    rng.shuffle(modules)
+    return "".join(f"{module} -> {', '.join(outputs)}\n" for module, outputs in modules)
+
+
+@generator("2023/21")
+def garden_plots(scale: float, rng: random.Random) -> str:
+    # Rocks scattered at random, apart from on the start's row and column,
+    # which are clear as in the real inputs
+    half = scaled(65, math.sqrt(scale), minimum=3)
+    size = 2 * half + 1
+    grid = [["#" if rng.random() < 0.12 else "." for _ in range(size)] for _ in range(size)]
+    for i in range(size):
+        grid[half][i] = grid[i][half] = "."
+    grid[half][half] = "S"
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator("2023/22")
+def falling_bricks(scale: float, rng: random.Random) -> str:
+    # The solution assumes a 10x10 footprint, so only the height grows with
+    # the number of bricks; no two bricks overlap
+    count = scaled(1250, scale)
+    filled = set()
+    bricks = []
+    while len(bricks) < count:
+        x, y, z = rng.randrange(10), rng.randrange(10), rng.randint(1, count // 4 + 2)
+        axis = rng.randrange(3)
+        end = [x, y, z]
+        end[axis] += rng.randint(0, 4)
+        if end[0] > 9 or end[1] > 9:
+            continue
+        cubes = {(i, j, k) for i in range(x, end[0] + 1) for j in range(y, end[1] + 1) for k in range(z, end[2] + 1)}
+        if cubes & filled:
+            continue
+        filled |= cubes
+        bricks.append(f"{x},{y},{z}~{end[0]},{end[1]},{end[2]}")
+    return "\n".join(bricks) + "\n"
+
+
+def _gaps(count: int, rng: random.Random) -> list[int]:
+    positions = [rng.randint(5, 8)]
+    for _ in range(count - 1):
+        positions.append(positions[-1] + rng.randint(12, 30))
+    return positions
+
+
+@generator("2023/23")
+def hiking_trails(scale: float, rng: random.Random) -> str:
+    # A lattice of junctions joined by one-wide paths going right and down,
+    # like the real inputs' - every way out of a junction is a slope, so the
+    # paths only go downhill for part 1.  Most paths make a detour to one
+    # side part way along, so they're not all the same length
+    junctions = scaled(6, math.sqrt(scale), minimum=2)
+    rows, cols = _gaps(junctions, rng), _gaps(junctions, rng)
+    height, width = rows[-1] + rng.randint(6, 9), cols[-1] + rng.randint(6, 9)
+    grid = [["#"] * width for _ in range(height)]
+
+    def corridor(r, c, dr, dc, length, detour=True):
+        # the detour keeps at least two cells from the paths around it
+        start = stop = depth = 0
+        if detour and rng.random() < 0.8:
+            start = rng.randint(5, length - 7)
+            stop = rng.randint(start + 2, length - 5)
+            depth = rng.choice([-3, -2, -1, 1, 2, 3])
+        for k in range(length + 1):
+            if not start < k < stop:
+                grid[r + k * dr][c + k * dc] = "."
+        step = 1 if depth > 0 else -1
+        for k in (start, stop):
+            for side in range(step, depth + step, step):
+                grid[r + k * dr + side * dc][c + k * dc + side * dr] = "."
+        for k in range(start, stop + 1) if depth else ():
+            grid[r + k * dr + depth * dc][c + k * dc + depth * dr] = "."
+
+    for i, r in enumerate(rows):
+        for j, c in enumerate(cols):
+            if j + 1 < len(cols):
+                corridor(r, c, 0, 1, cols[j + 1] - c)
+            if i + 1 < len(rows):
+                corridor(r, c, 1, 0, rows[i + 1] - r)
+    # from the start down to the first junction, and from the last to the end
+    corridor(0, 1, 1, 0, rows[0], detour=False)
+    corridor(rows[0], 1, 0, 1, cols[0] - 1, detour=False)
+    corridor(rows[-1], cols[-1], 0, 1, width - 2 - cols[-1], detour=False)
+    corridor(rows[-1], width - 2, 1, 0, height - 1 - rows[-1], detour=False)
+
+    for r in range(1, height - 1):
+        for c in range(1, width - 1):
+            if grid[r][c] == "." and [grid[r - 1][c], grid[r + 1][c], grid[r][c - 1], grid[r][c + 1]].count("#") < 2:
+                for dr, dc, slope in ((0, -1, ">"), (0, 1, ">"), (-1, 0, "v"), (1, 0, "v")):
+                    if grid[r + dr][c + dc] == ".":
+                        grid[r + dr][c + dc] = slope
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def _skyline(columns: int, width, height, rng: random.Random) -> list[tuple[str, int]]:
+    """
+    Moves around a "skyline" polygon - a flat bottom edge with ``columns``
+    columns of random width and height above it - which is always a closed
+    loop that never crosses itself.  Always 2 * columns + 2 moves long.
+    """
+    widths = [width() for _ in range(columns)]
+    heights = [height()]
+    while len(heights) < columns:
+        h = height()
+        if h != heights[-1]:
+            heights.append(h)
+
+    moves = [("R", sum(widths)), ("U", heights[-1])]
+    for i in range(columns - 1, 0, -1):
+        moves.append(("L", widths[i]))
+        step = heights[i - 1] - heights[i]
+        moves.append(("U" if step > 0 else "D", abs(step)))
+    moves.append(("L", widths[0]))
+    moves.append(("D", heights[0]))
+    return moves
+
+
+@generator("2023/18")
+def dig_plan(scale: float, rng: random.Random) -> str:
+    columns = scaled(330, scale, minimum=2)
+    part1 = _skyline(columns, lambda: rng.randint(1, 10), lambda: rng.randint(2, 60), rng)
+    # the "colours" are the part 2 instructions - distances in 5 hex digits,
+    # followed by the direction as a digit
+    part2 = _skyline(columns, lambda: rng.randint(1, 0xFFFF), lambda: rng.randint(1, 0xFFFFF), rng)
+    hex_dirs = {"R": 0, "D": 1, "L": 2, "U": 3}
+    return "".join(
+        f"{d1} {n1} (#{n2:05x}{hex_dirs[d2]})\n" for (d1, n1), (d2, n2) in zip(part1, part2)
+    )
+
+
+@generator("2023/24")
+def hailstones(scale: float, rng: random.Random) -> str:
+    # Throw a rock first, then place every hailstone so the rock hits it at
+    # a distinct time - so part 2 has its promised solution
+    rock = [rng.randint(100_000_000_000_000, 400_000_000_000_000) for _ in range(3)]
+    rock_v = [rng.randint(-300, 300) for _ in range(3)]
+    times = rng.sample(range(1, 1_000_000_000_000), scaled(300, scale, minimum=13))
+    lines = []
+    for t in times:
+        v = []
+        for rv in rock_v:
+            # velocities are non-zero, and differ from the rock's so the
+            # relative motion is never parallel to an axis
+            dv = 0
+            while dv == 0 or dv == rv:
+                dv = rng.randint(-500, 500)
+            v.append(dv)
+        p = [r + t * (rv - dv) for r, rv, dv in zip(rock, rock_v, v)]
+        lines.append(f"{p[0]}, {p[1]}, {p[2]} @ {v[0]}, {v[1]}, {v[2]}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,451 @@
+import math
+import random
+import string
+from itertools import combinations
+
+from aoc_common.gen import generator, scaled
+
+
+@generator("2024/01")
+def location_lists(scale: float, rng: random.Random) -> str:
+    count = scaled(1000, scale)
+    left = [rng.randint(10000, 99999) for _ in range(count)]
+    # the right list reuses some of the left values so the similarity score
+    # has something to count
+    right = [rng.choice(left) if rng.random() < 0.3 else rng.randint(10000, 99999) for _ in range(count)]
+    return "".join(f"{a}   {b}\n" for a, b in zip(left, right))
+
+
+@generator("2024/02")
+def reports(scale: float, rng: random.Random) -> str:
+    # ~1000 reports of 5-8 levels that mostly rise or fall steadily, with the
+    # odd bad step so that some are only safe with the dampener and some
+    # aren't safe at all
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        direction = rng.choice((-1, 1))
+        levels = [rng.randint(10, 90)]
+        for _ in range(rng.randint(4, 7)):
+            step = rng.randint(1, 3) if rng.random() < 0.9 else rng.choice((0, 4, 5, -2))
+            levels.append(levels[-1] + direction * step)
+        lines.append(" ".join(str(v) for v in levels))
+    return "\n".join(lines) + "\n"
+
+
+_NEAR_MISSES = ["mul(4*", "mul(6,9!", "?(12,34)", "mul ( 2 , 4 )", "mul[3,7]", "mul(1234,5)", "do_not()", "don't"]
+
+
+@generator("2024/03")
+def corrupted_memory(scale: float, rng: random.Random) -> str:
+    # Real mul, do and don't instructions among junk and things that nearly
+    # look like instructions
+    lines = []
+    for _ in range(6):
+        parts = []
+        for _ in range(scaled(120, scale)):
+            kind = rng.random()
+            if kind < 0.6:
+                parts.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+            elif kind < 0.7:
+                parts.append(rng.choice(["do()", "don't()"]))
+            elif kind < 0.8:
+                parts.append(rng.choice(_NEAR_MISSES))
+            parts.append("".join(rng.choices(string.punctuation + "whatfromselect ", k=rng.randint(0, 12))))
+        lines.append("".join(parts))
+    return "\n".join(lines) + "\n"
+
+
+@generator("2024/04")
+def word_search(scale: float, rng: random.Random) -> str:
+    size = scaled(140, scale ** 0.5, minimum=4)
+    return "".join("".join(rng.choices("XMAS", k=size)) + "\n" for _ in range(size))
+
+
+@generator("2024/05")
+def print_queue(scale: float, rng: random.Random) -> str:
+    # There's a rule for every pair of pages, all consistent with one order
+    # of the pages, and about half the updates are already in that order
+    pages = rng.sample(range(11, 100), 49)
+    rules = [f"{a}|{b}" for a, b in combinations(pages, 2)]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(scaled(200, scale)):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+@generator("2024/06")
+def guard_map(scale: float, rng: random.Random) -> str:
+    # Random obstructions hardly ever keep the guard on the map for long, so
+    # lay them out for it to walk an outward spiral, each side at least two
+    # longer than the one before it on the same side so that it never runs
+    # into an earlier obstruction, until it walks off the map.  Extra
+    # obstructions anywhere it never stepped don't change its route
+    size = scaled(130, scale ** 0.5, minimum=8)
+    grid = [["."] * size for _ in range(size)]
+    row, col = rng.randrange(size // 3, size * 2 // 3), rng.randrange(size // 3, size * 2 // 3)
+    grid[row][col] = "^"
+    dr, dc = -1, 0
+    visited = {(row, col)}
+    sides = [rng.randint(1, 6), rng.randint(1, 6)]
+    run = 0
+    while 0 <= row + dr < size and 0 <= col + dc < size:
+        if run == sides[-2]:
+            grid[row + dr][col + dc] = "#"
+            sides.append(sides[-2] + rng.randint(2, 6))
+            dr, dc = dc, -dr
+            run = 0
+        else:
+            row, col = row + dr, col + dc
+            visited.add((row, col))
+            run += 1
+
+    for r in range(size):
+        for c in range(size):
+            if (r, c) not in visited and rng.random() < 0.03:
+                grid[r][c] = "#"
+    return "\n".join("".join(line) for line in grid) + "\n"
+
+
+@generator("2024/07")
+def equations(scale: float, rng: random.Random) -> str:
+    lines = []
+    for _ in range(scaled(850, scale)):
+        numbers = [rng.randint(1, 999) for _ in range(rng.randint(2, 12))]
+        if rng.random() < 0.5:
+            # solvable - build the target from the numbers
+            target = numbers[0]
+            for n in numbers[1:]:
+                op = rng.randrange(3)
+                target = target + n if op == 0 else target * n if op == 1 else int(f"{target}{n}")
+        else:
+            target = rng.randint(1, 10 ** rng.randint(3, 15))
+        lines.append(f"{target}: {' '.join(str(n) for n in numbers)}")
+    return "\n".join(lines) + "\n"
+
+
+_FREQUENCIES = string.digits + string.ascii_uppercase + string.ascii_lowercase
+
+
+@generator("2024/08")
+def antenna_map(scale: float, rng: random.Random) -> str:
+    size = scaled(50, scale ** 0.5, minimum=8)
+    grid = [["."] * size for _ in range(size)]
+    cells = rng.sample([(r, c) for r in range(size) for c in range(size)], min(size * size // 2, scaled(200, scale)))
+    kinds = rng.sample(_FREQUENCIES, rng.randint(30, 45))
+    for i, (r, c) in enumerate(cells):
+        grid[r][c] = kinds[i % len(kinds)]
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator("2024/10")
+def topographic_map(scale: float, rng: random.Random) -> str:
+    # Rolling hills from a few random waves, steep enough that the height
+    # mostly changes by one from cell to cell and there are trails to find
+    size = scaled(55, scale ** 0.5, minimum=8)
+    waves = [(rng.uniform(0.1, 0.35), rng.uniform(0, 2 * math.pi), rng.uniform(0, 2 * math.pi)) for _ in range(4)]
+    lines = []
+    for r in range(size):
+        heights = []
+        for c in range(size):
+            height = 3 * sum(math.sin(k * (r * math.cos(angle) + c * math.sin(angle)) + phase)
+                             for k, angle, phase in waves)
+            heights.append(str(int(height) % 10))
+        lines.append("".join(heights))
+    return "\n".join(lines) + "\n"
+
+
+@generator("2024/09")
+def disk_map(scale: float, rng: random.Random) -> str:
+    # alternating file and gap lengths, starting and ending with a file
+    files = scaled(10000, scale)
+    digits = []
+    for i in range(files):
+        if i:
+            digits.append(rng.randint(0, 9))
+        digits.append(rng.randint(1, 9))
+    return "".join(str(d) for d in digits) + "\n"
+
+
+@generator("2024/11")
+def stones(scale: float, rng: random.Random) -> str:
+    return " ".join(str(rng.randint(0, 10 ** rng.randint(1, 7))) for _ in range(scaled(8, scale))) + "\n"
+
+
+@generator("2024/12")
+def garden_regions(scale: float, rng: random.Random) -> str:
+    # Grow regions out from random seeds all at once, taking a random cell
+    # from the edge of any region each time, so they come out ragged; the
+    # same plant can be in more than one region
+    size = scaled(140, scale ** 0.5, minimum=4)
+    grid = [[""] * size for _ in range(size)]
+    frontier = []
+    for _ in range(max(1, size * size // 30)):
+        frontier.append((rng.randrange(size), rng.randrange(size), rng.choice(string.ascii_uppercase)))
+    while frontier:
+        i = rng.randrange(len(frontier))
+        frontier[i], frontier[-1] = frontier[-1], frontier[i]
+        r, c, plant = frontier.pop()
+        if grid[r][c]:
+            continue
+        grid[r][c] = plant
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= nr < size and 0 <= nc < size and not grid[nr][nc]:
+                frontier.append((nr, nc, plant))
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator("2024/13")
+def claw_machines(scale: float, rng: random.Random) -> str:
+    # About half the prizes can be won by part 1's rules; the buttons never
+    # move the claw in the same direction as each other
+    machines = []
+    while len(machines) < scaled(320, scale):
+        a = (rng.randint(10, 99), rng.randint(10, 99))
+        b = (rng.randint(10, 99), rng.randint(10, 99))
+        if a[0] * b[1] == a[1] * b[0]:
+            continue
+        if rng.random() < 0.5:
+            presses = rng.randint(1, 100), rng.randint(1, 100)
+            prize = [presses[0] * a[i] + presses[1] * b[i] for i in range(2)]
+        else:
+            prize = [rng.randint(1000, 20000) for _ in range(2)]
+        machines.append(f"Button A: X+{a[0]}, Y+{a[1]}\n"
+                        f"Button B: X+{b[0]}, Y+{b[1]}\n"
+                        f"Prize: X={prize[0]}, Y={prize[1]}\n")
+    return "\n".join(machines)
+
+
+@generator("2024/14")
+def robot_positions(scale: float, rng: random.Random) -> str:
+    # The robots are placed where they'll be at some secret step - most
+    # of them drawing a framed Christmas tree, the rest anywhere - and then
+    # wound back to where they'd have to start to get there
+    rows, cols = 103, 101
+    step = rng.randrange(rows * cols)
+    top, left = rng.randrange(rows - 33), rng.randrange(cols - 31)
+    picture = [(top, left + c) for c in range(31)] + [(top + 32, left + c) for c in range(31)]
+    picture += [(top + r, left) for r in range(1, 32)] + [(top + r, left + 30) for r in range(1, 32)]
+    for r in range(2, 30):
+        half = min(r // 2, 13)
+        picture += [(top + r, left + 15 + c) for c in range(-half, half + 1) if rng.random() < 0.6]
+    cells = picture + [(rng.randrange(rows), rng.randrange(cols)) for _ in range(scaled(500, scale) - len(picture))]
+    lines = []
+    for r, c in cells:
+        vr, vc = rng.choice((-1, 1)) * rng.randint(1, 99), rng.choice((-1, 1)) * rng.randint(1, 99)
+        lines.append(f"p={(c - step * vc) % cols},{(r - step * vr) % rows} v={vc},{vr}")
+    return "\n".join(lines) + "\n"
+
+
+@generator("2024/15")
+def warehouse(scale: float, rng: random.Random) -> str:
+    # A walled warehouse that's roughly half boxes with a few loose walls,
+    # then the robot's moves, 1000 to a line
+    size = scaled(50, scale ** 0.5, minimum=6)
+    grid = [["#"] * size for _ in range(size)]
+    for r in range(1, size - 1):
+        for c in range(1, size - 1):
+            roll = rng.random()
+            grid[r][c] = "#" if roll < 0.05 else "O" if roll < 0.5 else "."
+    grid[rng.randrange(1, size - 1)][rng.randrange(1, size - 1)] = "@"
+    moves = "".join(rng.choices("<>^v", k=scaled(20000, scale)))
+    return ("\n".join("".join(row) for row in grid) + "\n\n"
+            + "".join(moves[i:i + 1000] + "\n" for i in range(0, len(moves), 1000)))
+
+
+# (k1, k2, bxc operand) for which the day 17 program shape below has a
+# seed that makes it print itself
+_QUINE_CONSTANTS = [
+    (0, 4, 2), (0, 4, 5), (0, 7, 7), (1, 5, 0), (1, 5, 1), (1, 5, 2), (1, 5, 3), (1, 5, 4),
+    (1, 5, 5), (1, 5, 6), (1, 5, 7), (2, 3, 0), (2, 3, 1), (2, 3, 2), (2, 3, 3), (2, 3, 4),
+    (2, 3, 7), (3, 5, 4), (3, 5, 5), (5, 6, 1), (5, 6, 2), (5, 6, 3), (5, 6, 7), (7, 4, 3),
+]
+
+
+@generator("2024/17")
+def chronospatial_program(scale: float, rng: random.Random) -> str:
+    # The solution's part 2 relies on the program having the same shape as
+    # the real inputs (see the day's README), so only the constants change
+    k1, k2, x = rng.choice(_QUINE_CONSTANTS)
+    program = [2, 4, 1, k1, 7, 5, 1, k2, 4, x, 5, 5, 0, 3, 3, 0]
+    return (f"Register A: {rng.randrange(1 << 40, 1 << 48)}\n"
+            "Register B: 0\nRegister C: 0\n\n"
+            f"Program: {','.join(str(i) for i in program)}\n")
+
+
+def _maze(cells: int, rng: random.Random) -> list[list[str]]:
+    """
+    A perfect maze (exactly one route between any two places) of
+    ``cells`` x ``cells`` rooms, as a grid of ``2 * cells + 1`` square with
+    the rooms on the odd rows and columns.
+    """
+    size = 2 * cells + 1
+    grid = [["#"] * size for _ in range(size)]
+    grid[1][1] = "."
+    stack = [(1, 1)]
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc) for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                   if 0 < r + dr < size and 0 < c + dc < size and grid[r + dr][c + dc] == "#"]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc = rng.choice(options)
+        grid[(r + nr) // 2][(c + nc) // 2] = grid[nr][nc] = "."
+        stack.append((nr, nc))
+    return grid
+
+
+@generator("2024/16")
+def reindeer_maze(scale: float, rng: random.Random) -> str:
+    # A perfect maze with a few walls knocked through, so there's more than
+    # one way round and some routes cost the same as each other
+    grid = _maze(scaled(70, scale ** 0.5, minimum=3), rng)
+    size = len(grid)
+    for _ in range(size * size // 50):
+        r, c = rng.randrange(1, size - 1), rng.randrange(1, size - 1)
+        if (r + c) % 2:
+            grid[r][c] = "."
+    grid[size - 2][1] = "S"
+    grid[1][size - 2] = "E"
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator("2024/18")
+def falling_bytes(scale: float, rng: random.Random) -> str:
+    # The memory space is always 71 x 71, so only the number of bytes that
+    # fall scales; they land on distinct cells, never the start or the exit
+    cells = [(x, y) for y in range(71) for x in range(71) if 0 < x + y < 140]
+    rng.shuffle(cells)
+    return "".join(f"{x},{y}\n" for x, y in cells[:min(scaled(3450, scale, minimum=1100), len(cells))])
+
+
+@generator("2024/19")
+def towel_patterns(scale: float, rng: random.Random) -> str:
+    # Patterns strung together from the towels, about half of them with one
+    # stripe changed afterwards so they may no longer be possible.  There
+    # are no plain white or black towels and the rest are fairly long, so
+    # not everything can be patched up.
+    towels = {"r", "g", "u"}
+    while len(towels) < 150:
+        towels.add("".join(rng.choices("wubrg", k=rng.randint(3, 8))))
+    towels = sorted(towels)
+    patterns = []
+    for _ in range(scaled(400, scale)):
+        pattern = ""
+        while len(pattern) < rng.randint(40, 60):
+            pattern += rng.choice(towels)
+        if rng.random() < 0.5:
+            i = rng.randrange(len(pattern))
+            pattern = pattern[:i] + rng.choice("wubrg") + pattern[i + 1:]
+        patterns.append(pattern)
+    return ", ".join(towels) + "\n\n" + "\n".join(patterns) + "\n"
+
+
+@generator("2024/20")
+def race_track(scale: float, rng: random.Random) -> str:
+    # The one route through a perfect maze from corner to corner, with every
+    # other room and passage walled up, so it's a single winding track
+    grid = _maze(scaled(70, scale ** 0.5, minimum=3), rng)
+    size = len(grid)
+    start, end = (1, 1), (size - 2, size - 2)
+    previous = {start: None}
+    queue = [start]
+    for r, c in queue:
+        for cell in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if grid[cell[0]][cell[1]] == "." and cell not in previous:
+                previous[cell] = (r, c)
+                queue.append(cell)
+    track = [["#"] * size for _ in range(size)]
+    cell = end
+    while cell:
+        track[cell[0]][cell[1]] = "."
+        cell = previous[cell]
+    track[start[0]][start[1]] = "S"
+    track[end[0]][end[1]] = "E"
+    return "\n".join("".join(row) for row in track) + "\n"
+
+
+@generator("2024/21")
+def door_codes(scale: float, rng: random.Random) -> str:
+    return "".join(f"{rng.randrange(1000):03d}A\n" for _ in range(scaled(5, scale)))
+
+
+@generator("2024/22")
+def buyers(scale: float, rng: random.Random) -> str:
+    return "".join(f"{rng.randrange(1, 1 << 24)}\n" for _ in range(scaled(2000, scale)))
+
+
+@generator("2024/23")
+def lan_party(scale: float, rng: random.Random) -> str:
+    # Real inputs have 520 computers each connected to 13 others, with a
+    # single largest clique of 13.  Names are two letters while there are
+    # enough of them to go round, longer after that.
+    count = scaled(520, scale, minimum=20)
+    length = 2
+    while 26**length < 2 * count:
+        length += 1
+    names = set()
+    while len(names) < count:
+        names.add("".join(rng.choices(string.ascii_lowercase, k=length)))
+    names = sorted(names)
+
+    edges = set()
+    clique = rng.sample(names, min(13, count))
+    edges.update(combinations(sorted(clique), 2))
+    for _ in range(count * 13 // 2 - len(edges)):
+        a, b = sorted(rng.sample(names, 2))
+        edges.add((a, b))
+
+    edges = sorted(edges)
+    rng.shuffle(edges)
+    return "".join(f"{a}-{b}\n" if rng.random() < 0.5 else f"{b}-{a}\n" for a, b in edges)
+
+
+@generator("2024/24")
+def adder_circuit(scale: float, rng: random.Random) -> str:
+    # A ripple-carry adder of two 45 bit numbers with the gates listed in a
+    # random order - each bit but the first has two XORs, two ANDs and an
+    # OR, wired up through randomly named internal wires
+    bits = scaled(45, scale, minimum=2)
+    names = set()
+    while len(names) < 5 * bits:
+        # nothing internal can look like an input or output wire
+        names.add(rng.choice("abcdefghijklmnopqrstuvw") + "".join(rng.choices(string.ascii_lowercase, k=2)))
+    names = sorted(names)
+    rng.shuffle(names)
+    names = iter(names)
+    carry = next(names)
+    gates = ["x00 XOR y00 -> z00", f"x00 AND y00 -> {carry}"]
+    for i in range(1, bits):
+        half_sum, half_carry, full_carry = next(names), next(names), next(names)
+        gates += [
+            f"x{i:02d} XOR y{i:02d} -> {half_sum}",
+            f"{half_sum} XOR {carry} -> z{i:02d}",
+            f"y{i:02d} AND x{i:02d} -> {half_carry}",
+            f"{carry} AND {half_sum} -> {full_carry}",
+        ]
+        # the last carry is the top bit of the sum
+        carry = f"z{bits:02d}" if i == bits - 1 else next(names)
+        gates.append(f"{half_carry} OR {full_carry} -> {carry}")
+    rng.shuffle(gates)
+    wires = [f"{xy}{i:02d}: {rng.randint(0, 1)}" for xy in "xy" for i in range(bits)]
+    return "\n".join(wires) + "\n\n" + "\n".join(gates) + "\n"
+
+
+@generator("2024/25")
+def locks_and_keys(scale: float, rng: random.Random) -> str:
+    # Five pin columns of height 0-5; locks have the top row filled, keys
+    # the bottom
+    schematics = []
+    for _ in range(scaled(500, scale)):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        rows = ["".join("#" if h > row else "." for h in heights) for row in range(5)]
+        if rng.random() < 0.5:
+            schematics.append(["#####", *rows, "....."])
+        else:
+            schematics.append([".....", *reversed(rows), "#####"])
+    return "\n".join("\n".join(s) + "\n" for s in schematics)
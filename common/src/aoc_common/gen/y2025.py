@@ -0,0 +1,208 @@
+import random
+import string
+
+from aoc_common.gen import generator, scaled
+
+
+@generator("2025/01")
+def dial_rotations(scale: float, rng: random.Random) -> str:
+    # ~4000 turns of the safe dial, mostly less than a full turn of 100
+    count = scaled(4000, scale)
+    return "".join(f"{rng.choice('LR')}{rng.randint(1, 999) if rng.random() < 0.1 else rng.randint(1, 99)}\n"
+                   for _ in range(count))
+
+
+@generator("2025/02")
+def product_id_ranges(scale: float, rng: random.Random) -> str:
+    # ~30 disjoint ranges of IDs up to 10 digits, covering about two million
+    # IDs in total at scale 1
+    count = 30
+    total = scaled(2_000_000, scale, minimum=count)
+    widths = [max(1, round(w)) for w in (rng.expovariate(count / total) for _ in range(count))]
+    starts = sorted(rng.sample(range(10, 9_000_000_000), count))
+    ranges = []
+    floor = 10
+    for start, width in zip(starts, widths):
+        start = max(start, floor)
+        ranges.append(f"{start}-{start + width - 1}")
+        floor = start + width + 1
+    rng.shuffle(ranges)
+    return ",".join(ranges) + "\n"
+
+
+@generator("2025/03")
+def battery_banks(scale: float, rng: random.Random) -> str:
+    # ~200 banks of 100 batteries with joltages 1-9
+    return "".join("".join(rng.choice("123456789") for _ in range(100)) + "\n" for _ in range(scaled(200, scale)))
+
+
+@generator("2025/04")
+def paper_rolls(scale: float, rng: random.Random) -> str:
+    size = scaled(137, scale ** 0.5, minimum=3)
+    return "".join("".join("@" if rng.random() < 0.6 else "." for _ in range(size)) + "\n" for _ in range(size))
+
+
+@generator("2025/05")
+def ingredient_ranges(scale: float, rng: random.Random) -> str:
+    # ~190 fresh ranges that often overlap or touch each other, then ~1000
+    # ingredient IDs, some inside the ranges and some not
+    ranges = []
+    for _ in range(scaled(190, scale)):
+        if ranges and rng.random() < 0.3:
+            # start inside, or just after, one of the earlier ranges
+            start = rng.randint(*rng.choice(ranges)) + rng.randint(0, 1)
+        else:
+            start = rng.randint(1, 500_000_000_000_000)
+        ranges.append((start, start + rng.randint(0, 20_000_000_000_000)))
+    ids = []
+    for _ in range(scaled(1000, scale)):
+        if rng.random() < 0.5:
+            ids.append(rng.randint(*rng.choice(ranges)))
+        else:
+            ids.append(rng.randint(1, 520_000_000_000_000))
+    return "".join(f"{a}-{b}\n" for a, b in ranges) + "\n" + "".join(f"{i}\n" for i in ids)
+
+
+@generator("2025/06")
+def cephalopod_worksheet(scale: float, rng: random.Random) -> str:
+    # ~1000 problems of four numbers each side by side, with the operator
+    # under the left edge of each problem and a column of spaces between
+    # them.  The numbers in a problem are all lined up on the left or all on
+    # the right, and get longer or shorter going down, so that reading down
+    # the columns never finds a gap between digits.
+    rows = [[] for _ in range(5)]
+    for _ in range(scaled(1000, scale)):
+        numbers = sorted((str(rng.randint(1, 10 ** rng.randint(1, 4) - 1)) for _ in range(4)), key=len, reverse=rng.random() < 0.5)
+        width = max(len(n) for n in numbers)
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, n in zip(rows, numbers):
+            row.append(align(n, width))
+        rows[-1].append(rng.choice("+*").ljust(width))
+    return "".join(" ".join(row) + "\n" for row in rows)
+
+
+@generator("2025/07")
+def tachyon_manifold(scale: float, rng: random.Random) -> str:
+    # The beam enters at the middle of the top row, with a row of splitters
+    # on every other row below that, spreading out no faster than the beams
+    # can
+    levels = scaled(70, scale ** 0.5, minimum=2)
+    width = 2 * levels + 1
+    lines = ["." * levels + "S" + "." * levels, "." * width]
+    for level in range(levels):
+        row = ["."] * width
+        for col in range(levels - level, levels + level + 1, 2):
+            if rng.random() < 0.8:
+                row[col] = "^"
+        lines += ["".join(row), "." * width]
+    return "\n".join(lines) + "\n"
+
+
+@generator("2025/08")
+def junction_boxes(scale: float, rng: random.Random) -> str:
+    # part 1 makes 1000 connections, so make sure there are enough pairs
+    count = scaled(1000, scale, minimum=46)
+    return "".join(
+        f"{rng.randint(0, 99999)},{rng.randint(0, 99999)},{rng.randint(0, 99999)}\n" for _ in range(count)
+    )
+
+
+@generator("2025/09")
+def red_tiles(scale: float, rng: random.Random) -> str:
+    # The red tiles are the corners of a loop, given as "row,col" - a
+    # "skyline" with a flat bottom edge and columns of random width and
+    # height above it, so it never crosses itself.  Real inputs have ~500
+    # corners with coordinates up to 100000.
+    columns = scaled(250, scale, minimum=2)
+    floor = 100_000
+    widths = [rng.randint(2, 400) for _ in range(columns)]
+    heights = [rng.randint(1, floor - 1)]
+    while len(heights) < columns:
+        h = rng.randint(1, floor - 1)
+        if h != heights[-1]:
+            heights.append(h)
+
+    corners = [(floor, 0)]
+    col = 0
+    for width, height in zip(widths, heights):
+        corners.append((floor - height, col))
+        col += width
+        corners.append((floor - height, col))
+    corners.append((floor, col))
+    return "".join(f"{r},{c}\n" for r, c in corners)
+
+
+@generator("2025/10")
+def factory_machines(scale: float, rng: random.Random) -> str:
+    # ~170 machines with 4-10 lights and a handful of buttons each.  The
+    # target lights and joltages are what some random presses of the
+    # buttons would give, so both parts always have a solution.
+    lines = []
+    for _ in range(scaled(170, scale)):
+        lights = rng.randint(4, 10)
+        buttons = [sorted(rng.sample(range(lights), rng.randint(1, lights - 1))) for _ in range(rng.randint(3, 13))]
+        target = [False] * lights
+        for button in buttons:
+            if rng.random() < 0.5:
+                for light in button:
+                    target[light] = not target[light]
+        jolts = [0] * lights
+        for button in buttons:
+            presses = rng.randint(0, 30)
+            for light in button:
+                jolts[light] += presses
+        lines.append(
+            "[" + "".join("#" if t else "." for t in target) + "] "
+            + " ".join("(" + ",".join(str(i) for i in b) + ")" for b in buttons)
+            + " {" + ",".join(str(j) for j in jolts) + "}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+@generator("2025/11")
+def reactor_devices(scale: float, rng: random.Random) -> str:
+    # Layers of devices, each wired to a few devices in the next few layers
+    # down, so there are no loops.  svr is at the top and out at the bottom,
+    # with fft, you and dac at a third, half and two thirds of the way down.
+    layers = scaled(30, scale, minimum=6)
+    names = set()
+    while len(names) < 8 * layers:
+        names.add("".join(rng.choices(string.ascii_lowercase, k=3)))
+    names = sorted(names - {"svr", "fft", "you", "dac", "out"})
+    rng.shuffle(names)
+    devices = [names[8 * i:8 * i + rng.randint(3, 8)] for i in range(layers)]
+    devices[0][0] = "svr"
+    devices[layers // 3][0] = "fft"
+    devices[layers // 2][-1] = "you"
+    devices[2 * layers // 3][0] = "dac"
+    devices.append(["out"])
+    lines = []
+    for i, layer in enumerate(devices[:-1]):
+        below = [d for later in devices[i + 1:i + 4] for d in later]
+        for device in layer:
+            lines.append(f"{device}: " + " ".join(rng.sample(below, min(len(below), rng.randint(1, 4)))))
+    return "\n".join(lines) + "\n"
+
+
+@generator("2025/12")
+def present_regions(scale: float, rng: random.Random) -> str:
+    # Six 3x3 present shapes, then ~1000 regions that either have a 3x3
+    # square for every present or not even enough area for them
+    shapes = []
+    while len(shapes) < 6:
+        shape = ["".join(rng.choice("#.") for _ in range(3)) for _ in range(3)]
+        if shape[1][1] == "#" and "".join(shape).count("#") >= 5:
+            shapes.append(shape)
+    areas = ["".join(shape).count("#") for shape in shapes]
+    lines = [f"{i}:\n" + "\n".join(shape) + "\n" for i, shape in enumerate(shapes)]
+    for _ in range(scaled(1000, scale)):
+        w, h = rng.randint(35, 50), rng.randint(35, 50)
+        if rng.random() < 0.5:
+            total = rng.randint(1, (w // 3) * (h // 3))
+        else:
+            total = w * h // min(areas) + 1
+        counts = [0] * 6
+        for _ in range(total):
+            counts[rng.randrange(6)] += 1
+        lines.append(f"{w}x{h}: " + " ".join(str(c) for c in counts))
+    return "\n".join(lines) + "\n"
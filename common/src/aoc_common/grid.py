@@ -1,5 +1,12 @@
 from collections import namedtuple
-from typing import TypeVar, Sequence, MutableSequence
+from numbers import Integral
+from typing import Iterable, MutableSequence, Optional, Sequence, TypeVar
+
+from aoc_common import input_path
+from aoc_common.lazy import lazy_import
+
+# only needed for Grid and csr_neighbours, not Cell and Direction
+np = lazy_import("numpy")
 
 T = TypeVar("T")
 
@@ -82,4 +89,349 @@ class Direction:
     STRAIGHT = [EAST, SOUTH, WEST, NORTH]
     DIAGONAL = [EAST, SE, SOUTH, SW, WEST, NW, NORTH, NE]
     HORIZONTAL = [EAST, WEST]
-    VERTICAL = [NORTH, SOUTH]
\ No newline at end of file
+    VERTICAL = [NORTH, SOUTH]
+
+
+class CellIndex:
+    """
+    The "encoding" where cells are just ``Cell`` tuples - this exists so that
+    code written against the ``FlatIndex`` interface can be switched back to
+    ``Cell`` coordinates (e.g. for debugging) by swapping the index object.
+    """
+
+    STRAIGHT = Direction.STRAIGHT
+    DIAGONAL = Direction.DIAGONAL
+
+    def __init__(self, rows: int, cols: int, pad: int = 0):
+        self.rows = rows
+        self.cols = cols
+        self.pad = pad
+
+    def encode(self, cell: Cell) -> Cell:
+        return cell
+
+    def decode(self, pos: Cell) -> Cell:
+        return pos
+
+    def offset(self, direction: Cell) -> Cell:
+        return direction
+
+    def neighbours(self, pos: Cell, include_diagonal: bool = False) -> list[Cell]:
+        return [pos + d for d in (self.DIAGONAL if include_diagonal else self.STRAIGHT)]
+
+    def in_bounds(self, pos: Cell) -> bool:
+        return 0 <= pos.row < self.rows and 0 <= pos.col < self.cols
+
+    def all_cells(self) -> Iterable[Cell]:
+        return (Cell(r, c) for r in range(self.rows) for c in range(self.cols))
+
+
+class FlatIndex:
+    """
+    Encode the cells of a ``rows`` x ``cols`` grid, surrounded by a border of
+    ``pad`` cells, as plain ints ``(row + pad) * stride + (col + pad)``.
+    Directions become int offsets, so moving is a single int addition with no
+    tuple allocation, and ints hash much faster than ``Cell`` tuples.
+
+    As long as you never step more than ``pad`` cells outside the grid in one
+    go, every position you can reach is a distinct valid index, so neighbour
+    lookups need no bounds checks - the border cells act as sentinels.  This
+    is the same layout as ``Grid.data``, so a ``FlatIndex`` position indexes
+    straight into ``grid.data.flat`` (or the bytes from ``Grid.flat_bytes``).
+    """
+
+    def __init__(self, rows: int, cols: int, pad: int = 1):
+        self.rows = rows
+        self.cols = cols
+        self.pad = pad
+        self.stride = cols + 2 * pad
+        self.size = self.stride * (rows + 2 * pad)
+        # Precomputed offset tables, in the same order as the Direction lists
+        self.STRAIGHT = [self.offset(d) for d in Direction.STRAIGHT]
+        self.DIAGONAL = [self.offset(d) for d in Direction.DIAGONAL]
+
+    def encode(self, cell: Cell) -> int:
+        return (cell[0] + self.pad) * self.stride + cell[1] + self.pad
+
+    def decode(self, pos: int) -> Cell:
+        r, c = divmod(pos, self.stride)
+        return Cell(r - self.pad, c - self.pad)
+
+    def offset(self, direction: Cell) -> int:
+        """
+        Int offset equivalent to the given direction (or any ``Cell`` vector)
+        """
+        return direction[0] * self.stride + direction[1]
+
+    def neighbours(self, pos: int, include_diagonal: bool = False) -> list[int]:
+        return [pos + d for d in (self.DIAGONAL if include_diagonal else self.STRAIGHT)]
+
+    def in_bounds(self, pos: int) -> bool:
+        """
+        Whether the position is inside the real grid rather than the border
+        """
+        r, c = divmod(pos, self.stride)
+        return self.pad <= r < self.rows + self.pad and self.pad <= c < self.cols + self.pad
+
+    def all_cells(self) -> Iterable[int]:
+        """
+        Every position inside the real grid, in row-major order
+        """
+        for r in range(self.pad, self.rows + self.pad):
+            yield from range(r * self.stride + self.pad, r * self.stride + self.pad + self.cols)
+
+
+def grid_adjacency(
+    passable: "np.ndarray",
+    pad: int = 1,
+    include_diagonal: bool = False,
+    weights: Optional["np.ndarray"] = None,
+) -> "CSR":
+    """
+    Build the adjacency of a grid graph once, in compressed sparse row form,
+    so that repeated searches over the same grid can walk plain arrays rather
+    than calling ``Cell.neighbours`` and re-checking bounds for every node.
+
+    The nodes are the flat positions of ``FlatIndex(rows, cols, pad)`` (so the
+    same layout as ``Grid.data``), and there is an edge from every passable
+    cell to each of its passable straight (or diagonal, if requested)
+    neighbours.  Cells in the padding are never passable.
+
+    :param passable: boolean array of shape ``(rows, cols)``, true for cells
+      that can be entered
+    :param pad: width of the border, as for ``FlatIndex`` - at least 1, or
+      steps off the end of a row would wrap round onto the next
+    :param include_diagonal: whether diagonal steps are edges too
+    :param weights: optional array of shape ``(rows, cols)`` giving the cost
+      of *entering* each cell, which becomes the weight of every edge into it.
+      If omitted all edges have weight 1 and the CSR has no weights.
+    :return: ``CSR`` with ``int32`` arrays
+    """
+    from aoc_common.search import CSR
+
+    if pad < 1:
+        raise ValueError(f"grid_adjacency needs a border of at least 1 cell, not {pad}")
+    rows, cols = passable.shape
+    index = FlatIndex(rows, cols, pad)
+    padded = np.zeros((rows + 2 * pad, cols + 2 * pad), dtype=bool)
+    padded[pad:pad + rows, pad:pad + cols] = passable
+    flat_passable = padded.ravel()
+    # flat positions of all the passable cells (none of these are in the
+    # padding, so adding any single step offset stays inside the array)
+    sources = np.flatnonzero(flat_passable)
+
+    src_parts = []
+    dst_parts = []
+    for offset in (index.DIAGONAL if include_diagonal else index.STRAIGHT):
+        dst = sources + offset
+        ok = flat_passable[dst]
+        src_parts.append(sources[ok])
+        dst_parts.append(dst[ok])
+
+    src = np.concatenate(src_parts)
+    dst = np.concatenate(dst_parts)
+    # group the edges by source node, keeping the direction order within
+    # each node's neighbour list
+    order = np.argsort(src, kind="stable")
+    src = src[order]
+    dst = dst[order]
+
+    indptr = np.zeros(index.size + 1, dtype=np.int32)
+    np.cumsum(np.bincount(src, minlength=index.size), out=indptr[1:])
+    edge_weights = None
+    if weights is not None:
+        padded_weights = np.zeros(padded.shape, dtype=np.int32)
+        padded_weights[pad:pad + rows, pad:pad + cols] = weights
+        edge_weights = padded_weights.ravel()[dst]
+
+    return CSR(indptr, dst.astype(np.int32), edge_weights)
+
+
+class Grid:
+    """
+    Dense rectangular grid of single-character cells, stored as a 2D ``uint8``
+    numpy array of the character codes with a border of ``pad`` sentinel cells
+    all the way round.  Cells are addressed by ``Cell`` coordinates relative
+    to the *original* (unpadded) grid, so ``Cell(0, 0)`` is the top left
+    character of the input and ``Cell(-1, -1)`` is the sentinel diagonally
+    outside it, or by flat int index into the padded array (see ``index``).
+
+    The point of this over ``list[str]`` is that whole-grid questions like
+    "how many neighbours of each cell are rolls of paper" become a handful of
+    numpy operations rather than a Python loop over every cell.
+    """
+
+    def __init__(self, data: "np.ndarray", pad: int = 1, sentinel: str = "."):
+        """
+        Wrap an existing padded ``uint8`` array - normally you would use
+        ``from_lines`` or ``from_file`` rather than calling this directly.
+        """
+        self.data = data
+        self.pad = pad
+        self.sentinel = sentinel
+        self.rows = data.shape[0] - 2 * pad
+        self.cols = data.shape[1] - 2 * pad
+        # Flat int encoding of the cells, matching the layout of data
+        self.flat_index = FlatIndex(self.rows, self.cols, pad)
+        # distance between vertically adjacent cells in flat index terms
+        self.stride = data.shape[1]
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], pad: int = 1, sentinel: str = ".") -> "Grid":
+        """
+        Build a grid from lines of text, extending any short lines with the
+        sentinel character to make it rectangular, and adding a border of
+        ``pad`` sentinels all round.
+        """
+        lines = [l.rstrip("\r\n") for l in lines]
+        while lines and not lines[-1]:
+            lines.pop()
+        width = max((len(l) for l in lines), default=0)
+        data = np.full((len(lines) + 2 * pad, width + 2 * pad), ord(sentinel), dtype=np.uint8)
+        for r, l in enumerate(lines):
+            data[r + pad, pad:pad + len(l)] = np.frombuffer(l.encode("latin-1"), dtype=np.uint8)
+        return cls(data, pad, sentinel)
+
+    @classmethod
+    def from_file(cls, filename: Optional[str] = None, pad: int = 1, sentinel: str = ".") -> "Grid":
+        """
+        Build a grid from a file, by default the puzzle input (see
+        ``aoc_common.input_path``).
+        """
+        with open(filename or input_path(), "r") as f:
+            return cls.from_lines(f, pad, sentinel)
+
+    def copy(self) -> "Grid":
+        return Grid(self.data.copy(), self.pad, self.sentinel)
+
+    @property
+    def view(self) -> "np.ndarray":
+        """
+        The unpadded part of the grid, as a (writable) view onto ``data``.
+        """
+        p = self.pad
+        return self.data[p:p + self.rows, p:p + self.cols]
+
+    @property
+    def valid_rows(self) -> range:
+        return range(self.rows)
+
+    @property
+    def valid_cols(self) -> range:
+        return range(self.cols)
+
+    def index(self, cell: Cell) -> int:
+        """
+        Flat index of the given cell in the padded array.
+        """
+        return self.flat_index.encode(cell)
+
+    def cell(self, index: int) -> Cell:
+        """
+        Inverse of ``index``.
+        """
+        return self.flat_index.decode(index)
+
+    def flat_bytes(self) -> bytearray:
+        """
+        Copy of the whole padded grid as a ``bytearray``, indexed by flat
+        index - indexing this from Python is much faster than indexing the
+        numpy array one element at a time.
+        """
+        return bytearray(self.data.tobytes())
+
+    def __getitem__(self, cell) -> str:
+        """
+        ``grid[cell]`` or ``grid[flat_index]`` is the character at that cell
+        """
+        if isinstance(cell, Integral):
+            return chr(self.data.flat[cell])
+        return chr(self.data[cell[0] + self.pad, cell[1] + self.pad])
+
+    def __setitem__(self, cell, ch: str) -> None:
+        if isinstance(cell, Integral):
+            self.data.flat[cell] = ord(ch)
+        else:
+            self.data[cell[0] + self.pad, cell[1] + self.pad] = ord(ch)
+
+    def __contains__(self, cell: Cell) -> bool:
+        """
+        Whether the given cell is inside the (unpadded) grid
+        """
+        return 0 <= cell[0] < self.rows and 0 <= cell[1] < self.cols
+
+    def mask(self, chars: str) -> "np.ndarray":
+        """
+        Boolean array (the shape of the unpadded grid) that is ``True`` where
+        the cell holds any of the given characters.
+        """
+        if len(chars) == 1:
+            return self.view == ord(chars)
+        return np.isin(self.view, np.frombuffer(chars.encode("latin-1"), dtype=np.uint8))
+
+    def find(self, chars: str) -> list[Cell]:
+        """
+        All the cells holding any of the given characters, in row-major order.
+        """
+        return [Cell(int(r), int(c)) for r, c in zip(*np.nonzero(self.mask(chars)))]
+
+    def shift(self, direction: Cell, fill: Optional[str] = None) -> "np.ndarray":
+        """
+        The unpadded grid contents moved one step in the given direction, i.e.
+        ``result[c]`` is what was at ``c - direction``.  Cells that move in
+        from outside take their values from the padding where there is enough
+        of it, or are ``fill`` (default the sentinel) beyond that.
+        """
+        dr, dc = direction
+        p = self.pad
+        if abs(dr) <= p and abs(dc) <= p:
+            return self.data[p - dr:p - dr + self.rows, p - dc:p - dc + self.cols]
+        out = np.full((self.rows, self.cols), ord(fill or self.sentinel), dtype=self.data.dtype)
+        src = self.view
+        out[max(dr, 0):self.rows + min(dr, 0), max(dc, 0):self.cols + min(dc, 0)] = \
+            src[max(-dr, 0):self.rows + min(-dr, 0), max(-dc, 0):self.cols + min(-dc, 0)]
+        return out
+
+    def neighbour_counts(self, chars: str, include_diagonal: bool = False) -> "np.ndarray":
+        """
+        For every cell in the (unpadded) grid, count how many of its four (or
+        eight, with ``include_diagonal``) neighbours hold any of the given
+        characters.  Neighbours in the padding count too, if the sentinel is
+        one of ``chars``, and with no padding the cells beyond the edge are
+        taken to be sentinels, as for ``shift``.
+        """
+        padded = self.data == ord(chars) if len(chars) == 1 else \
+            np.isin(self.data, np.frombuffer(chars.encode("latin-1"), dtype=np.uint8))
+        p = self.pad
+        if p < 1:
+            padded = np.pad(padded, 1 - p, constant_values=self.sentinel in chars)
+            p = 1
+        counts = np.zeros((self.rows, self.cols), dtype=np.uint8)
+        for dr, dc in (Direction.DIAGONAL if include_diagonal else Direction.STRAIGHT):
+            counts += padded[p + dr:p + dr + self.rows, p + dc:p + dc + self.cols]
+        return counts
+
+    def adjacency(
+        self,
+        passable,
+        include_diagonal: bool = False,
+        weights: Optional["np.ndarray"] = None,
+    ) -> "CSR":
+        """
+        CSR adjacency over this grid's flat positions - see ``grid_adjacency``.
+        ``passable`` is either a string of the characters that can be entered
+        or a boolean array the shape of the unpadded grid.
+        """
+        if isinstance(passable, str):
+            passable = self.mask(passable)
+        return grid_adjacency(passable, self.pad, include_diagonal, weights)
+
+    def lines(self, padded: bool = False) -> list[str]:
+        """
+        The grid as a list of strings, one per row, with or without the border.
+        """
+        arr = self.data if padded else self.view
+        return [row.tobytes().decode("latin-1") for row in arr]
+
+    def __str__(self):
+        return "\n".join(self.lines())
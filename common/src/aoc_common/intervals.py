@@ -0,0 +1,216 @@
+"""
+Sets of integers stored as sorted, disjoint half-open intervals.
+
+An ``IntervalSet`` holds two parallel int64 arrays ``starts`` and ``stops``,
+sorted by start, where interval ``i`` covers ``starts[i] <= x < stops[i]``
+(the same convention as ``range``).  Intervals that overlap or touch are
+always coalesced, so every set has exactly one representation, and the
+intervals never overlap.
+
+::
+
+    fresh = IntervalSet(range(a, b + 1) for a, b in pairs)
+    17 in fresh                     # O(log n) bisect on the starts
+    fresh.contains_many(ids)        # boolean array, one bisect per id in numpy
+    fresh.size                      # number of integers covered
+    fresh | other, fresh & other, fresh - other
+
+The set operations work on the boundaries of both sets at once, so they are
+O((n + m) log(n + m)) numpy operations rather than Python loops over the
+intervals.
+"""
+
+from typing import Iterable, Iterator, Union
+
+import numpy as np
+
+Interval = Union[range, tuple[int, int]]
+
+
+def _normalise(starts: np.ndarray, stops: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sort the intervals, drop empty ones, and coalesce any that overlap or
+    touch.
+    """
+    keep = starts < stops
+    starts, stops = starts[keep], stops[keep]
+    if len(starts) == 0:
+        return starts, stops
+    order = np.argsort(starts, kind="stable")
+    starts, stops = starts[order], stops[order]
+    # furthest point reached by any interval so far - an interval begins a
+    # new run only if it starts beyond that
+    reach = np.maximum.accumulate(stops)
+    new_run = np.empty(len(starts), dtype=bool)
+    new_run[0] = True
+    np.greater(starts[1:], reach[:-1], out=new_run[1:])
+    first = np.flatnonzero(new_run)
+    last = np.append(first[1:] - 1, len(starts) - 1)
+    return starts[first], reach[last]
+
+
+class IntervalSet:
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        """
+        Build a set from any mix of ``range`` objects (which must have step
+        1) and ``(start, stop)`` pairs, in any order, overlapping or not.
+        """
+        pairs = [(r.start, r.stop) if isinstance(r, range) else r for r in intervals]
+        bounds = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+        self.starts, self.stops = _normalise(bounds[:, 0], bounds[:, 1])
+
+    @classmethod
+    def from_arrays(cls, starts, stops) -> "IntervalSet":
+        """
+        Build a set from arrays of starts and (exclusive) stops, which need
+        not be sorted or disjoint.
+        """
+        result = cls.__new__(cls)
+        result.starts, result.stops = _normalise(np.asarray(starts, dtype=np.int64),
+                                                 np.asarray(stops, dtype=np.int64))
+        return result
+
+    @classmethod
+    def _from_normalised(cls, starts: np.ndarray, stops: np.ndarray) -> "IntervalSet":
+        result = cls.__new__(cls)
+        result.starts, result.stops = starts, stops
+        return result
+
+    def __len__(self) -> int:
+        """
+        The number of separate intervals (see ``size`` for the number of
+        integers covered).
+        """
+        return len(self.starts)
+
+    def __bool__(self) -> bool:
+        return len(self.starts) > 0
+
+    def __iter__(self) -> Iterator[range]:
+        return (range(a, b) for a, b in zip(self.starts.tolist(), self.stops.tolist()))
+
+    def __getitem__(self, i: int) -> range:
+        return range(int(self.starts[i]), int(self.stops[i]))
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return np.array_equal(self.starts, other.starts) and np.array_equal(self.stops, other.stops)
+
+    @property
+    def size(self) -> int:
+        """
+        The number of integers in the set.
+        """
+        return int((self.stops - self.starts).sum())
+
+    @property
+    def min(self) -> int:
+        return int(self.starts[0])
+
+    @property
+    def max(self) -> int:
+        return int(self.stops[-1]) - 1
+
+    def __contains__(self, x: int) -> bool:
+        i = int(np.searchsorted(self.starts, x, side="right")) - 1
+        return i >= 0 and x < self.stops[i]
+
+    def contains_many(self, values) -> np.ndarray:
+        """
+        Boolean array of whether each of ``values`` is in the set.
+        """
+        values = np.asarray(values, dtype=np.int64)
+        i = np.searchsorted(self.starts, values, side="right") - 1
+        if len(self.stops) == 0:
+            return np.zeros(values.shape, dtype=bool)
+        return (i >= 0) & (values < self.stops[np.maximum(i, 0)])
+
+    def update(self, intervals: Iterable[Interval]):
+        """
+        Add the given intervals to this set, coalescing as necessary.
+        """
+        extra = IntervalSet(intervals)
+        self.starts, self.stops = _normalise(np.concatenate((self.starts, extra.starts)),
+                                             np.concatenate((self.stops, extra.stops)))
+
+    def add(self, start: int, stop: int):
+        self.update([(start, stop)])
+
+    def _combine(self, other: "IntervalSet", op) -> "IntervalSet":
+        """
+        Apply a boolean operator to membership of the two sets.  Between any
+        two consecutive boundaries of either set, membership of both sets is
+        constant, so it's enough to test the left hand end of each of those
+        elementary intervals.
+        """
+        bounds = np.unique(np.concatenate((self.starts, self.stops, other.starts, other.stops)))
+        if len(bounds) < 2:
+            return IntervalSet()
+        lefts = bounds[:-1]
+        keep = op(self.contains_many(lefts), other.contains_many(lefts))
+        return IntervalSet.from_arrays(lefts[keep], bounds[1:][keep])
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        return IntervalSet._from_normalised(*_normalise(np.concatenate((self.starts, other.starts)),
+                                                        np.concatenate((self.stops, other.stops))))
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        return self._combine(other, np.logical_and)
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        return self._combine(other, lambda a, b: a & ~b)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def issubset(self, other: "IntervalSet") -> bool:
+        return not self.difference(other)
+
+    __le__ = issubset
+
+    def overlaps(self, other: "IntervalSet") -> bool:
+        return bool(self.intersection(other))
+
+    def shift(self, offset: int) -> "IntervalSet":
+        """
+        Every member of this set plus ``offset``.
+        """
+        return IntervalSet._from_normalised(self.starts + offset, self.stops + offset)
+
+
+def first_uncovered(starts, stops, lo: int, hi: int) -> np.ndarray:
+    """
+    Batch query over many sets of intervals at once: ``starts`` and ``stops``
+    are 2D arrays with one set of half-open intervals per row (in any order,
+    and they may overlap or be empty).  Returns, for each row, the smallest
+    integer in ``[lo, hi)`` not covered by any of that row's intervals, or
+    ``hi`` if they cover all of it.
+
+    This is the same sort-and-sweep as coalescing an IntervalSet, done along
+    the rows of the arrays, so there's no Python-level work per row.
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    stops = np.asarray(stops, dtype=np.int64)
+    # move empty intervals after all the others, and make them reach nowhere
+    empty = starts >= stops
+    starts = np.where(empty, hi, starts)
+    stops = np.where(empty, lo, stops)
+    order = np.argsort(starts, axis=1)
+    starts = np.take_along_axis(starts, order, axis=1)
+    stops = np.take_along_axis(stops, order, axis=1)
+
+    # covered[:, j] is how far coverage from lo reaches using intervals
+    # before j (if it's contiguous that far), and the first j where the next
+    # interval starts beyond that is the first gap
+    n = len(starts)
+    covered = np.maximum(np.maximum.accumulate(stops, axis=1), lo)
+    covered = np.concatenate((np.full((n, 1), lo), covered), axis=1)
+    following = np.concatenate((starts, np.full((n, 1), hi)), axis=1)
+    gap = following > covered
+    first_gap = covered[np.arange(n), gap.argmax(axis=1)]
+    return np.where(gap.any(axis=1), np.minimum(first_gap, hi), hi)
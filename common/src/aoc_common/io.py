@@ -0,0 +1,144 @@
+"""
+Reading inputs as bytes, straight out of a memory-mapped file.
+
+Opening the input in text mode means decoding every byte and allocating a
+new ``str`` per line, and ``f.read()`` holds a second, decoded copy of the
+whole file in memory.  That's nothing for a real input, but it's most of the
+time (and twice the memory) for a scaled one of a few GB.  ``mapped`` maps
+the file into memory instead, so the operating system pages it in as it's
+read and nothing is copied::
+
+    with mapped() as buf:               # the puzzle input, by default
+        for line in lines(buf):         # zero-copy memoryview slices
+            ...
+        for m in finditer(r"mul\\((\\d+),(\\d+)\\)", buf):
+            total += int(m[1]) * int(m[2])
+
+Everything here works on bytes: ``re`` can scan the mapping directly given
+a bytes pattern (``finditer`` and ``findall`` encode ``str`` patterns for
+you), the groups of the matches are ``bytes``, and ``int()`` accepts those
+as they are.  A ``memoryview`` line needs ``bytes(line)`` (which copies just
+that line) before it can be passed to ``int()`` or decoded, but it can be
+compared, indexed and iterated over as it is.
+
+``chunks`` splits a buffer into pieces of roughly a given size that always
+end at a line boundary (or a blank line, for inputs made of records
+separated by blank lines), so big inputs can be processed a piece at a time,
+or handed out to several processes by offset with ``boundaries``.
+
+Memoryviews and matches into the mapping are only valid inside the ``with``
+block.  If any of them are still around when it ends, the mapping is left
+for the garbage collector to close instead.
+"""
+
+import mmap
+import re
+from contextlib import contextmanager
+from typing import Iterator, Optional, Union
+
+from aoc_common import input_path
+
+# Anything that can be searched and sliced like bytes
+Buffer = Union[bytes, bytearray, mmap.mmap]
+
+# Default size of the pieces from ``chunks``
+CHUNK_SIZE = 1 << 20
+
+LINE = b"\n"
+RECORD = b"\n\n"
+
+
+@contextmanager
+def mapped(filename: Optional[str] = None) -> Iterator[Buffer]:
+    """
+    Map a file, by default the puzzle input (see ``aoc_common.input_path``),
+    read-only into memory.  An empty file gives ``b""``, as it can't be
+    mapped.
+    """
+    with open(filename or input_path(), "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap refuses zero-length files
+            yield b""
+            return
+    try:
+        yield buf
+    finally:
+        try:
+            buf.close()
+        except BufferError:
+            # something still has a view into the mapping, so leave closing
+            # it to the garbage collector
+            pass
+
+
+def lines(buf: Buffer, start: int = 0, end: Optional[int] = None) -> Iterator[memoryview]:
+    """
+    The lines of ``buf[start:end]``, without their newlines, as memoryviews
+    into the buffer.  A final newline doesn't start another (empty) line.
+    """
+    view = memoryview(buf)
+    end = len(buf) if end is None else end
+    pos = start
+    while pos < end:
+        newline = buf.find(LINE, pos, end)
+        if newline < 0:
+            yield view[pos:end]
+            return
+        yield view[pos:newline]
+        pos = newline + 1
+
+
+def boundaries(buf: Buffer, size: int = CHUNK_SIZE, sep: bytes = LINE, start: int = 0) -> list[tuple[int, int]]:
+    """
+    ``(start, end)`` offsets splitting ``buf[start:]`` into pieces of at
+    least ``size`` bytes (apart from the last), each ending just after an
+    occurrence of ``sep``, so that no line (or record, with ``sep=RECORD``)
+    is split between two pieces.
+    """
+    if size < 1:
+        raise ValueError(f"Chunk size must be positive, not {size}")
+    bounds = []
+    while start < len(buf):
+        # the first separator finishing at or after start + size
+        found = buf.find(sep, max(start, start + size - len(sep)))
+        end = len(buf) if found < 0 else found + len(sep)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def chunks(buf: Buffer, size: int = CHUNK_SIZE, sep: bytes = LINE) -> Iterator[memoryview]:
+    """
+    The pieces of ``buf`` given by ``boundaries``, as memoryviews.
+    """
+    view = memoryview(buf)
+    for start, end in boundaries(buf, size, sep):
+        yield view[start:end]
+
+
+def _bytes_pattern(pattern: Union[str, bytes, re.Pattern], flags: int) -> re.Pattern:
+    if isinstance(pattern, re.Pattern):
+        if isinstance(pattern.pattern, str):
+            return re.compile(pattern.pattern.encode(), pattern.flags & ~re.UNICODE)
+        return pattern
+    if isinstance(pattern, str):
+        pattern = pattern.encode()
+    return re.compile(pattern, flags)
+
+
+def finditer(pattern: Union[str, bytes, re.Pattern], buf: Buffer, flags: int = 0) -> Iterator[re.Match]:
+    """
+    ``re.finditer`` over a buffer, first turning a ``str`` pattern into the
+    equivalent bytes one.
+    """
+    return _bytes_pattern(pattern, flags).finditer(buf)
+
+
+def findall(pattern: Union[str, bytes, re.Pattern], buf: Buffer, flags: int = 0) -> list:
+    """
+    ``re.findall`` over a buffer, first turning a ``str`` pattern into the
+    equivalent bytes one.
+    """
+    return _bytes_pattern(pattern, flags).findall(buf)
@@ -0,0 +1,86 @@
+"""
+Lazy imports, for heavy dependencies that only some of a script needs.
+
+Importing networkx, sympy or scipy takes a large fraction of a second, which
+is paid every time a script starts even if the part being run never touches
+them.  ``lazy_import`` returns a stand-in module straight away, and only
+imports the real one the first time one of its attributes is used::
+
+    nx = lazy_import("networkx")
+    optimize = lazy_import("scipy.optimize")
+
+    def part2():
+        graph = nx.Graph()            # networkx is imported here
+        optimize.milp(...)
+
+After that first use the stand-in has all the real module's attributes
+copied into it, so looking things up on it is as fast as on the module
+itself.  Attributes the module sets later (such as submodules imported
+afterwards) are still found, just more slowly.
+
+A missing dependency only raises ``ModuleNotFoundError`` when it's first
+used, so the parts of a script that don't need it still run.  Use
+``from x import y`` style names as ``module.y`` at the point of use, as
+binding ``y`` at import time would have to import the module to find it.
+"""
+
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """
+    Stand-in for a module that hasn't been imported yet.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            # the import system makes concurrent first uses wait for each
+            # other, and copying the attributes twice does no harm
+            module = importlib.import_module(self.__name__)
+            # from now on, most lookups find the attribute directly
+            self.__dict__.update(vars(module))
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, name: str):
+        if name.startswith("__") and name.endswith("__") and name not in ("__all__", "__version__", "__file__",
+                                                                          "__path__"):
+            # don't import just for introspection such as copy/pickle probing
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    The module called ``name`` if it has already been imported, or else a
+    ``LazyModule`` that imports it when first used.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+def is_loaded(module: types.ModuleType) -> bool:
+    """
+    Whether a module returned by ``lazy_import`` has actually been imported -
+    by anyone, not just through this proxy, so ``is_loaded(np)`` is true
+    once anything has imported numpy.
+    """
+    if not isinstance(module, LazyModule):
+        return True
+    return module.__dict__["_lazy_module"] is not None or module.__name__ in sys.modules
@@ -0,0 +1,238 @@
+"""
+A ledger of the known-good answers for each solution and input, and of how
+long the solution takes to find them.
+
+Refactoring a day for speed is only any use if the answers don't change, and
+comparing printed output by eye doesn't scale to a whole year.  The ledger
+(``answers.json`` at the top of the repository, or wherever ``AOC_LEDGER``
+says) maps each solution to the SHA-256 of each input it's been checked
+against - the inputs themselves aren't stored - and holds the verified
+answers and the timings for that input::
+
+    {
+      "2024/01/list_distance": {
+        "5b0e...": {
+          "answers": [1882714, 19437052],
+          "perf": {"best": 0.0021, "last": 0.0023, "runs": 4}
+        }
+      }
+    }
+
+The answers are whatever ``solve(text)`` returns for days that have it, or
+otherwise what the part functions (or ``main``) return - see
+aoc_common.batch and aoc_common.runner.  Only answers that were returned
+are ever recorded: a part that returns nothing is an error, as whatever it
+printed can't be told apart from its other output.
+
+Usage::
+
+    python -m aoc_common.ledger [selector ...] [--record] [--accept] [--generate [SCALE]]
+
+runs every matching solution on its input and checks its answers against
+the ledger, printing a line per solution:
+
+- ``ok`` - same answers as recorded, with the time against the best time
+  recorded, marked ``SLOWER`` if it's more than ``SLOWER`` times that
+- ``FAIL`` - different answers; ``--accept`` replaces the recorded answers
+  with the new ones, for when the old ones were wrong
+- ``new`` - no answers recorded for this input yet; ``--record`` adds them
+- ``ERROR`` - the solution failed, or some part didn't return an answer
+- ``skipped`` - no input
+
+Timings are recorded for every solution whose answers are (now) in the
+ledger, and the exit status is non-zero if anything failed, so this one
+command checks a change for correctness and speed.  ``--generate`` checks
+against generated inputs (see aoc_common.gen) rather than the days' own
+inputs, for the days that have generators.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Optional
+
+from aoc_common.lazy import lazy_import
+from aoc_common.runner import MISSING, Solution, discover, find_root, plain
+
+# only needed for checking
+batch = lazy_import("aoc_common.batch")
+gen = lazy_import("aoc_common.gen")
+
+LEDGER_ENV = "AOC_LEDGER"
+LEDGER_NAME = "answers.json"
+
+# How much slower than its best time a solution can be before it's flagged
+SLOWER = 1.5
+
+
+@dataclass
+class Check:
+    solution: str
+    input: str
+    digest: str = ""
+    # "ok", "fail", "new", "error" or "skipped"
+    status: str = "skipped"
+    answers: list = field(default_factory=list)
+    expected: Optional[list] = None
+    wall: float = 0.0
+    best: Optional[float] = None
+    error: Optional[str] = None
+
+
+def input_digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def ledger_path(root: Path) -> Path:
+    return Path(os.environ.get(LEDGER_ENV) or root / LEDGER_NAME)
+
+
+def load(path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save(ledger: dict[str, dict[str, Any]], path: Path):
+    """
+    Write the ledger, replacing the old one in one go so an interrupted run
+    can't leave it half written.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".ledger-")
+    with os.fdopen(fd, "w") as f:
+        json.dump(ledger, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def check(solution: Solution, text: str, name: str, ledger: dict[str, dict[str, Any]]) -> Check:
+    """
+    Solve one input and compare the answers with the ledger's.
+    """
+    result = Check(solution.id, name, input_digest(text))
+    entry = ledger.get(solution.id, {}).get(result.digest)
+    solve = batch.solver(solution)
+    start = perf_counter()
+    try:
+        result.answers = plain(list(solve(text)))
+    except Exception as e:
+        result.status = "error"
+        result.error = "".join(traceback.format_exception_only(type(e), e)).strip()
+        return result
+    finally:
+        result.wall = perf_counter() - start
+
+    missing = [str(i) for i, answer in enumerate(result.answers, 1) if answer is None or answer == MISSING]
+    if missing or not result.answers:
+        result.status = "error"
+        result.error = f"no answer returned for part {', '.join(missing) or '1'}"
+        return result
+    if entry is None:
+        result.status = "new"
+    else:
+        result.expected = entry["answers"]
+        result.best = entry.get("perf", {}).get("best")
+        result.status = "ok" if result.answers == result.expected else "fail"
+    return result
+
+
+def record(ledger: dict[str, dict[str, Any]], result: Check, new: bool = False, accept: bool = False) -> bool:
+    """
+    Update the ledger with the result of a check - its timing if it passed,
+    and its answers as well if they're new (and ``new`` is set) or they
+    failed (and ``accept`` is set).  Returns whether the ledger changed.
+    """
+    if result.status == "new" and new or result.status == "fail" and accept:
+        entry = ledger.setdefault(result.solution, {})[result.digest] = {"answers": result.answers}
+    elif result.status == "ok":
+        entry = ledger[result.solution][result.digest]
+    else:
+        return False
+
+    perf = entry.setdefault("perf", {})
+    perf["best"] = round(min(result.wall, perf.get("best", result.wall)), 6)
+    perf["last"] = round(result.wall, 6)
+    perf["runs"] = perf.get("runs", 0) + 1
+    return True
+
+
+def inputs(solution: Solution, input_file: Optional[Path], scale: Optional[float]) -> Optional[tuple[str, str]]:
+    """
+    The name and text of the input to check a solution against, if it has
+    one.
+    """
+    if scale is not None:
+        day = f"{solution.year}/{solution.day:02d}"
+        if day not in gen.available():
+            return None
+        return f"generated {day} x{scale:g}", gen.generate(day, scale)
+    path = Path(input_file or solution.default_input)
+    if not path.is_file():
+        return None
+    return str(path), path.read_text()
+
+
+def print_check(result: Check, file=sys.stdout):
+    status = result.status.upper() if result.status in ("fail", "error") else result.status
+    line = f"{result.solution:40} {status:7}"
+    if result.status == "skipped":
+        print(f"{line}  (no input)", file=file)
+        return
+    line += f" {result.wall:8.3f}s"
+    if result.best:
+        ratio = result.wall / result.best
+        line += f"  best {result.best:.3f}s (x{ratio:.2f}){'  SLOWER' if ratio > SLOWER else ''}"
+    print(line, file=file)
+    if result.status == "fail":
+        print(f"    expected {result.expected}", file=file)
+        print(f"    got      {result.answers}", file=file)
+    elif result.status == "error":
+        print(f"    {result.error}", file=file)
+    elif result.status == "new":
+        print(f"    answers  {result.answers}", file=file)
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m aoc_common.ledger",
+                                     description="Check solutions' answers against the ledger, and record timings")
+    parser.add_argument("selectors", nargs="*", help="years, days or scripts to check (default everything)")
+    parser.add_argument("--root", type=Path, help="repository root (default: found from the current directory)")
+    parser.add_argument("--ledger", type=Path,
+                        help=f"ledger file (default: {LEDGER_NAME} in the root, or ${LEDGER_ENV})")
+    parser.add_argument("--input", type=Path, help="input file to use instead of each day's own 'input'")
+    parser.add_argument("--generate", nargs="?", type=float, const=1.0, metavar="SCALE",
+                        help="check against generated inputs of the given scale (default 1)")
+    parser.add_argument("--record", action="store_true", help="record the answers for inputs not in the ledger yet")
+    parser.add_argument("--accept", action="store_true", help="replace recorded answers that don't match")
+    args = parser.parse_args(argv)
+
+    root = (args.root or find_root()).resolve()
+    path = args.ledger or ledger_path(root)
+    ledger = load(path)
+
+    counts: dict[str, int] = {}
+    changed = False
+    for sol in discover(root, args.selectors):
+        given = inputs(sol, args.input, args.generate)
+        result = check(sol, given[1], given[0], ledger) if given else Check(sol.id, "")
+        print_check(result)
+        counts[result.status] = counts.get(result.status, 0) + 1
+        changed |= record(ledger, result, args.record, args.accept)
+
+    if changed:
+        save(ledger, path)
+    print(", ".join(f"{n} {status}" for status, n in sorted(counts.items())), file=sys.stderr)
+    return 1 if counts.get("fail") or counts.get("error") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""
+Bounded, instrumented memoization.
+
+A drop-in replacement for ``functools.cache`` that
+
+- evicts the least recently used entries once it holds ``maxsize`` results
+  (``maxsize=None`` for unbounded, if you really mean it)
+- counts hits, misses and evictions, and tracks the current and peak number
+  of entries
+- can compute a compact cache key from the arguments with ``key=...``, so
+  e.g. a recursion over slices of a string can be keyed on the slice offset
+  rather than holding on to every slice
+
+::
+
+    @memo(maxsize=100_000, key=lambda s, i: i)
+    def count(s, i):
+        ...
+
+    count.stats        # MemoStats(name='count', hits=..., misses=..., ...)
+    count.cache_clear()
+
+With ``persist=True`` results are also stored on disk (see
+aoc_common.memostore), so later runs start with the results of earlier ones.
+Only use this for pure functions whose arguments determine the result -
+anything that depends on global state such as the puzzle input needs that
+state passed in as arguments.  Results are keyed by ``version`` as well as
+the arguments; by default that's a hash of the function's code.
+
+If the ``AOC_MEMO_REPORT`` environment variable is set, a table of the
+statistics for every memoized function is printed to stderr when the
+process exits.
+"""
+
+import atexit
+import functools
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+REPORT_ENV = "AOC_MEMO_REPORT"
+
+DEFAULT_MAXSIZE = 1 << 20
+
+# Stats for every memoized function created in this process, in order of
+# creation - functions memoized inside another function get a new entry each
+# time they're created
+_registry: list["MemoStats"] = []
+
+
+@dataclass
+class MemoStats:
+    name: str
+    maxsize: Optional[int]
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    peak_size: int = 0
+    # misses in memory that were found in the persistent store
+    stored_hits: int = 0
+
+    @property
+    def calls(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.calls if self.calls else 0.0
+
+
+def interned(*args):
+    """
+    Key function that interns any string arguments, so equal strings built
+    separately share a single copy in the cache.
+    """
+    return tuple(sys.intern(a) if isinstance(a, str) else a for a in args)
+
+
+def code_version(code) -> str:
+    """
+    Hash of a code object (including any functions nested in it), to use as
+    the default version of persisted results.
+    """
+    digest = hashlib.sha256(code.co_code)
+    for const in code.co_consts:
+        digest.update(code_version(const).encode() if hasattr(const, "co_code") else repr(const).encode())
+    digest.update(repr(code.co_names).encode())
+    return digest.hexdigest()[:16]
+
+
+def persistent_name(fn: Callable) -> str:
+    """
+    Name to store a function's results under - its source file relative to
+    the day directory, plus its qualified name, so it's the same however the
+    script is run.
+    """
+    path = Path(fn.__code__.co_filename)
+    return f"{'/'.join(path.parts[-3:])}:{fn.__qualname__}"
+
+
+def memo(fn: Optional[Callable] = None, *, maxsize: Optional[int] = DEFAULT_MAXSIZE,
+         key: Optional[Callable] = None, name: Optional[str] = None,
+         persist: bool = False, version: Optional[str] = None):
+    """
+    Memoize ``fn``, keeping at most ``maxsize`` results.  Can be used bare
+    (``@memo``) or with arguments (``@memo(maxsize=1000)``).
+
+    ``key``, if given, is called with the same arguments as ``fn`` and must
+    return a hashable key that identifies the result.  Otherwise the key is
+    the positional arguments (plus any keyword arguments).
+
+    ``persist`` and ``version`` control the on-disk tier described above.
+    """
+    if fn is None:
+        return functools.partial(memo, maxsize=maxsize, key=key, name=name, persist=persist, version=version)
+
+    cache = {} if maxsize is None else OrderedDict()
+    stats = MemoStats(name or fn.__qualname__, maxsize)
+    _registry.append(stats)
+    missing = object()
+    # the persisted results, loaded on the first call
+    stored: Optional[dict[str, bytes]] = None
+
+    if persist:
+        from aoc_common.memostore import canonical_key, default_store
+
+        store = default_store()
+        store_name = persistent_name(fn)
+        store_version = version or code_version(fn.__code__)
+
+    # local aliases, as this wrapper is on the hot path of recursive solvers
+    cache_get = cache.get
+    move_to_end = None if maxsize is None else cache.move_to_end
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        nonlocal stored
+        if key is not None:
+            k = key(*args, **kwargs)
+        elif kwargs:
+            k = (args, tuple(sorted(kwargs.items())))
+        else:
+            k = args
+
+        result = cache_get(k, missing)
+        if result is not missing:
+            stats.hits += 1
+            if move_to_end is not None:
+                move_to_end(k)
+            return result
+
+        if persist:
+            if stored is None:
+                stored = store.load(store_name, store_version)
+            text = canonical_key(k)
+            data = stored.get(text)
+            if data is not None:
+                result = pickle.loads(data)
+                stats.stored_hits += 1
+            else:
+                result = fn(*args, **kwargs)
+                store.add(store_name, store_version, text, result)
+        else:
+            result = fn(*args, **kwargs)
+        cache[k] = result
+        stats.misses += 1
+        size = len(cache)
+        if maxsize is not None and size > maxsize:
+            cache.popitem(last=False)
+            stats.evictions += 1
+            size -= 1
+        stats.size = size
+        if size > stats.peak_size:
+            stats.peak_size = size
+        return result
+
+    def cache_clear():
+        """
+        Drop all the cached results.  The hit and miss counts are kept, so
+        they still cover the whole run.
+        """
+        cache.clear()
+        stats.size = 0
+
+    wrapper.stats = stats
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+
+def report(file=None):
+    """
+    Print a table of the statistics of all the memoized functions, combining
+    the entries for functions with the same name.
+    """
+    combined: dict[str, MemoStats] = {}
+    for s in _registry:
+        c = combined.setdefault(s.name, MemoStats(s.name, s.maxsize))
+        c.hits += s.hits
+        c.misses += s.misses
+        c.evictions += s.evictions
+        c.stored_hits += s.stored_hits
+        c.size += s.size
+        c.peak_size = max(c.peak_size, s.peak_size)
+
+    file = file or sys.stderr
+    print(f"{'memoized function':40} {'calls':>10} {'hit rate':>8} {'from disk':>9} {'evictions':>10} "
+          f"{'size':>9} {'peak':>9} {'maxsize':>9}", file=file)
+    for s in combined.values():
+        print(f"{s.name:40} {s.calls:10} {s.hit_rate:8.1%} {s.stored_hits:9} {s.evictions:10} {s.size:9} "
+              f"{s.peak_size:9} {s.maxsize if s.maxsize is not None else '-':>9}", file=file)
+
+
+@atexit.register
+def _report_at_exit():
+    if os.environ.get(REPORT_ENV) and _registry:
+        report()
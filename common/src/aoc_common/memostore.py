@@ -0,0 +1,216 @@
+"""
+Persistent sqlite store for memoized results, so expensive pure subproblems
+don't have to be recomputed on every run.
+
+This is the tier underneath ``@memo(persist=True)`` (see aoc_common.memo).
+Results are keyed by the function's name, a version (by default a hash of the
+function's code, so editing the function starts a fresh table) and a
+canonical text form of the arguments, and the values are pickled.  The first
+call of a persisted function loads its whole table, so warm runs start with
+the in-memory cache effectively primed; new results are written back in
+batches and when the process exits.
+
+The database lives at ``$AOC_MEMO_DB``, or ``memo.sqlite`` in the parsed
+input cache directory (see aoc_common.cache) if that's not set.
+
+Usage::
+
+    python -m aoc_common.memostore list
+    python -m aoc_common.memostore show 2024/11/stonebreaker.py:num_stones [--limit N]
+    python -m aoc_common.memostore prune [--function F] [--older-than DAYS] [--stale]
+    python -m aoc_common.memostore size
+"""
+
+import argparse
+import atexit
+import os
+import pickle
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from aoc_common.cache import cache_dir
+
+DB_ENV = "AOC_MEMO_DB"
+
+# Write pending results once there are this many of them
+FLUSH_THRESHOLD = 10_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS memo (
+    function TEXT NOT NULL,
+    version TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (function, version, key)
+)
+"""
+
+
+def db_path() -> Path:
+    return Path(os.environ.get(DB_ENV) or cache_dir() / "memo.sqlite")
+
+
+def canonical_key(obj) -> str:
+    """
+    Text form of a cache key that is the same from one run to the next.  Most
+    things can just use their repr, but the iteration order of sets (and so
+    their repr) depends on string hashing, which is randomised per process.
+    """
+    if isinstance(obj, (set, frozenset)):
+        return f"{type(obj).__name__}({{{', '.join(sorted(canonical_key(o) for o in obj))}}})"
+    if isinstance(obj, dict):
+        items = sorted(f"{canonical_key(k)}: {canonical_key(v)}" for k, v in obj.items())
+        return f"{type(obj).__name__}({{{', '.join(items)}}})"
+    if isinstance(obj, (tuple, list)):
+        return f"{type(obj).__name__}({', '.join(canonical_key(o) for o in obj)})"
+    return repr(obj)
+
+
+class MemoStore:
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or db_path())
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending: list[tuple[str, str, str, bytes, float]] = []
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # generous timeout, as parallel runs may all be writing at exit
+            self._conn = sqlite3.connect(self.path, timeout=60)
+            self._conn.execute(SCHEMA)
+        return self._conn
+
+    def load(self, function: str, version: str) -> dict[str, bytes]:
+        """
+        All the stored results for one version of a function, as pickled
+        values keyed by canonical key text.
+        """
+        rows = self.conn.execute("SELECT key, value FROM memo WHERE function = ? AND version = ?",
+                                 (function, version))
+        return dict(rows)
+
+    def add(self, function: str, version: str, key: str, value):
+        self._pending.append((function, version, key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), time.time()))
+        if len(self._pending) >= FLUSH_THRESHOLD:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO memo VALUES (?, ?, ?, ?, ?)", self._pending)
+        self._pending.clear()
+
+    def summary(self) -> list[tuple[str, str, int, int, float]]:
+        """
+        ``(function, version, entries, bytes, last written)`` for every stored
+        function version.
+        """
+        return self.conn.execute(
+            "SELECT function, version, COUNT(*), SUM(LENGTH(key) + LENGTH(value)), MAX(created) "
+            "FROM memo GROUP BY function, version ORDER BY function, MAX(created)"
+        ).fetchall()
+
+    def entries(self, function: str, limit: int) -> list[tuple[str, str, object]]:
+        rows = self.conn.execute(
+            "SELECT version, key, value FROM memo WHERE function = ? ORDER BY created DESC LIMIT ?",
+            (function, limit),
+        )
+        return [(version, key, pickle.loads(value)) for version, key, value in rows]
+
+    def prune(self, function: Optional[str] = None, older_than: Optional[float] = None,
+              stale: bool = False) -> int:
+        """
+        Delete entries for ``function`` (default all functions) that were
+        written more than ``older_than`` seconds ago, and/or (if ``stale``)
+        that belong to any version of their function other than the most
+        recently written.  Returns the number of entries deleted.
+        """
+        conditions, params = [], []
+        if function is not None:
+            conditions.append("function = ?")
+            params.append(function)
+        if older_than is not None:
+            conditions.append("created < ?")
+            params.append(time.time() - older_than)
+
+        deleted = 0
+        with self.conn:
+            if stale:
+                # the current version of each function is the one written most
+                # recently, and summary() lists those last
+                latest = {f: version for f, version, *_ in self.summary()}
+                for f, version in latest.items():
+                    where = " AND ".join(conditions + ["function = ?", "version != ?"])
+                    deleted += self.conn.execute(f"DELETE FROM memo WHERE {where}", [*params, f, version]).rowcount
+            else:
+                where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+                deleted = self.conn.execute(f"DELETE FROM memo {where}", params).rowcount
+        self.conn.execute("VACUUM")
+        return deleted
+
+
+_default: Optional[MemoStore] = None
+
+
+def default_store() -> MemoStore:
+    """
+    The process-wide store used by ``@memo(persist=True)``, flushed at exit.
+    """
+    global _default
+    if _default is None:
+        _default = MemoStore()
+        atexit.register(_default.flush)
+    return _default
+
+
+def format_bytes(n: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f}{unit}" if unit == "B" else f"{n:.1f}{unit}"
+        n /= 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc_common.memostore",
+                                     description="Inspect and maintain the persistent memo store")
+    parser.add_argument("--db", type=Path, help=f"database to use (default {db_path()})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list the stored functions and versions")
+    show = commands.add_parser("show", help="show the most recent entries for a function")
+    show.add_argument("function")
+    show.add_argument("--limit", type=int, default=20)
+    prune = commands.add_parser("prune", help="delete entries")
+    prune.add_argument("--function", help="only entries for this function")
+    prune.add_argument("--older-than", type=float, metavar="DAYS", help="only entries older than this")
+    prune.add_argument("--stale", action="store_true", help="only entries from superseded versions")
+    commands.add_parser("size", help="show the size of the store")
+    args = parser.parse_args(argv)
+
+    store = MemoStore(args.db)
+    if args.command == "list":
+        for function, version, count, size, created in store.summary():
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(created))
+            print(f"{function:50} {version:16} {count:9} entries {format_bytes(size):>9}  {when}")
+    elif args.command == "show":
+        for version, key, value in store.entries(args.function, args.limit):
+            print(f"[{version}] {key} -> {value!r:.200}")
+    elif args.command == "prune":
+        older_than = args.older_than * 86400 if args.older_than is not None else None
+        if args.function is None and older_than is None and not args.stale:
+            parser.error("prune needs at least one of --function, --older-than or --stale")
+        print(f"Deleted {store.prune(args.function, older_than, args.stale)} entries")
+    elif args.command == "size":
+        rows = store.summary()
+        print(f"{store.path}: {format_bytes(store.path.stat().st_size if store.path.exists() else 0)} on disk, "
+              f"{sum(r[2] for r in rows)} entries in {len(rows)} function versions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Map-reduce over the lines (or blank-line separated records) of an input,
+across a pool of worker processes.
+
+Plenty of days boil down to "do something expensive to every line and add
+up the results", and the lines are independent of each other.
+``map_reduce`` splits the input into chunks at line (or record) boundaries
+(see aoc_common.io), has a pool of workers run a function over every record
+in each chunk and combine the results with a reducer, and then combines the
+results of the chunks, in order::
+
+    total = map_reduce(count_ways)                  # count_ways(line) for each line of the input, summed
+    simple, damped = map_reduce(check_report, text) # tuples of results are summed element by element
+    best = map_reduce(score, sep=RECORD, reducer=max, jobs=8, chunk_size=1 << 16)
+
+The records are passed to the function as ``str`` without the newlines that
+separate them (but otherwise untouched), and empty ones are skipped.  The default reducer is ``add``,
+which adds numbers and adds up tuples element by element.
+
+When the input is a file (by default the puzzle input), each worker maps it
+and reads just the chunks it's given, so the input itself is never copied
+between processes.  Text or bytes given directly are split up and the chunks
+are sent to the workers.
+
+Each worker process lasts for the whole ``map_reduce`` call, so any state
+it builds up carries over from one chunk to the next: the results of
+memoized functions, or whatever ``initializer(*initargs)`` sets up once at
+the start (such as the towels that every pattern in 2024/19 is matched
+against).  With
+``jobs=1``, or if there's only one chunk, everything runs in this process
+instead, initializer included, and there's no pool at all.
+
+Starting a pool costs tens of milliseconds, which is more than most whole
+puzzle inputs take to solve, so the default is one job - everything in this
+process - unless the ``AOC_JOBS`` environment variable says otherwise (say,
+``AOC_JOBS=$(nproc)`` for generated inputs many times the usual size).  A
+pool is also only worth it with more than one chunk per worker, so inputs
+smaller than ``MIN_POOL_SIZE`` bytes are always run in this process.
+
+The pool forks where that's possible, so ``fn``, ``reducer`` and
+``initializer`` can be defined in the solution script itself - they're sent
+to the workers by name, so they must be module-level functions (or
+``functools.partial`` objects wrapping them), not lambdas or closures.
+"""
+
+import multiprocessing
+import operator
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+from aoc_common import input_path
+from aoc_common.io import LINE, RECORD, Buffer, boundaries, mapped
+
+# Environment variable that overrides the default number of workers
+JOBS_ENV = "AOC_JOBS"
+
+# Size of the chunks when none is given - aim for a few chunks per worker,
+# so one slow chunk doesn't hold everyone up, but don't bother splitting
+# inputs any smaller than this
+MIN_CHUNK_SIZE = 4096
+CHUNKS_PER_JOB = 4
+
+# Inputs smaller than this never start a pool
+MIN_POOL_SIZE = 64 * 1024
+
+
+def add(a, b):
+    """
+    ``a + b``, or for tuples the tuple of the sums of their elements.
+    """
+    if isinstance(a, tuple):
+        return tuple(map(operator.add, a, b))
+    return a + b
+
+
+def records(data: Union[Buffer, str], sep: bytes = LINE) -> Iterator[str]:
+    """
+    The non-empty records of ``data`` separated by ``sep``, without any
+    line endings left at either end (from a final record ending in a single
+    newline, extra blank lines between records, or ``\\r\\n`` line endings).
+    """
+    text = data if isinstance(data, str) else bytes(data).decode()
+    for record in text.split(sep.decode()):
+        record = record.strip("\r\n")
+        if record:
+            yield record
+
+
+def default_jobs() -> int:
+    """
+    The number of worker processes to use when it isn't given.
+    """
+    return int(os.environ.get(JOBS_ENV, 0)) or 1
+
+
+def _reduce(fn: Callable[[str], Any], reducer: Callable, items: Iterable[str]) -> tuple[bool, Any]:
+    # (whether there were any items, and the reduced result if so)
+    it = iter(items)
+    for first in it:
+        result = fn(first)
+        for item in it:
+            result = reducer(result, fn(item))
+        return True, result
+    return False, None
+
+
+def _init_worker(initializer: Optional[Callable], initargs: tuple):
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _map_chunk(fn: Callable, reducer: Callable, sep: bytes, source: Union[str, bytes], start: int, end: int):
+    if isinstance(source, bytes):
+        return _reduce(fn, reducer, records(source, sep))
+    # the name of a file - read just this chunk of it
+    with mapped(source) as buf:
+        chunk = buf[start:end]
+    return _reduce(fn, reducer, records(chunk, sep))
+
+
+def _pool_context():
+    # fork where we can, so the workers already have the solution script's
+    # functions and don't need to import anything
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def map_reduce(fn: Callable[[str], Any], data: Union[Buffer, str, None] = None, *, filename: Optional[str] = None,
+               reducer: Callable[[Any, Any], Any] = add, initial: Any = None, sep: bytes = LINE,
+               jobs: Optional[int] = None, chunk_size: Optional[int] = None,
+               initializer: Optional[Callable] = None, initargs: tuple = (), start: int = 0):
+    """
+    ``fn(record)`` for every record of ``data``, or of the file ``filename``
+    if no data is given (by default the puzzle input), combined with
+    ``reducer``, starting from ``initial`` if that's given.
+
+    ``start`` is an offset into the input to skip to first (the end of a
+    header section, say) - it should be at the start of a line.  It's an
+    error for there to be no records unless there's an ``initial`` value.
+    """
+    jobs = jobs or default_jobs()
+    if data is None:
+        filename = filename or input_path()
+    elif isinstance(data, str):
+        data = data.encode()
+
+    with mapped(filename) if data is None else nullcontext(data) as buf:
+        if chunk_size is None:
+            chunk_size = max(MIN_CHUNK_SIZE, -(-(len(buf) - start) // (jobs * CHUNKS_PER_JOB)))
+        bounds = boundaries(buf, chunk_size, sep, start)
+
+        if jobs <= 1 or len(bounds) <= 1 or len(buf) - start < MIN_POOL_SIZE:
+            _init_worker(initializer, initargs)
+            partials = [_reduce(fn, reducer, records(buf[s:e], sep)) for s, e in bounds]
+        else:
+            if data is None:
+                tasks = [(filename, s, e) for s, e in bounds]
+            else:
+                tasks = [(bytes(buf[s:e]), s, e) for s, e in bounds]
+            with ProcessPoolExecutor(min(jobs, len(bounds)), mp_context=_pool_context(),
+                                     initializer=_init_worker, initargs=(initializer, initargs)) as pool:
+                futures = [pool.submit(_map_chunk, fn, reducer, sep, *task) for task in tasks]
+                partials = [f.result() for f in futures]
+
+    result = initial
+    found = initial is not None
+    for any_records, partial in partials:
+        if any_records:
+            result = reducer(result, partial) if found else partial
+            found = True
+    if not found:
+        raise ValueError("No records to reduce")
+    return result
@@ -0,0 +1,118 @@
+"""
+Bulk extraction of the integers from a puzzle input.
+
+Most inputs are a few numbers per line with some punctuation round them, and
+the usual ``re.finditer(r"-?\\d+", line)`` or ``int(x) for x in
+line.split()`` costs a Python-level ``int()`` call per number.  ``read_ints``
+instead finds every run of digits in the whole file at once with numpy and
+builds the values a digit position at a time, so a file of millions of
+numbers becomes an int64 array in a few dozen array operations::
+
+    read_ints()                 # every number in the input, as a 1D array
+    read_ints(columns=4)        # one row per line, checking every line has 4
+    read_ints(lines=True)       # list of one array per line, for ragged inputs
+
+A ``-`` immediately before a run of digits makes it negative, unless
+``signed=False`` (for inputs like ``3-7`` where the dash is a separator).
+
+Values that don't fit in int64 (more than 18 digits) can't be built in
+numpy, so if there are any, the whole input is parsed with a regex instead
+and the result is an array of ``dtype=object`` holding Python ints, with the
+same shape as it would otherwise have had.  Note that arithmetic on int64
+arrays wraps round silently, so for calculations whose intermediate values
+may exceed 2^63 (such as products of two 15-digit coordinates), convert the
+result to Python ints with ``.tolist()`` first.
+"""
+
+import re
+from typing import Optional, Union
+
+import numpy as np
+
+from aoc_common.io import Buffer, mapped
+
+# The most digits that always fit in an int64
+MAX_DIGITS = 18
+
+_SIGNED = re.compile(rb"-?\d+")
+_UNSIGNED = re.compile(rb"\d+")
+
+
+def _tokens(data: bytes, signed: bool) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The values of all the integers in ``data``, and the offset at which each
+    of them starts.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    is_digit = (buf >= ord("0")) & (buf <= ord("9"))
+    edges = np.diff(is_digit.astype(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    lengths = np.flatnonzero(edges == -1) - starts
+
+    if len(starts) and lengths.max() > MAX_DIGITS:
+        # too big for int64 - fall back to Python ints
+        matches = list((_SIGNED if signed else _UNSIGNED).finditer(data))
+        values = np.empty(len(matches), dtype=object)
+        values[:] = [int(m.group()) for m in matches]
+        # report where the digits start, as for the numpy version
+        starts = np.array([m.start() + (m.group()[:1] == b"-") for m in matches], dtype=np.intp)
+        return values, starts
+
+    # Horner's rule across all the numbers at once, one digit position at a
+    # time, only updating the numbers that have that many digits
+    values = np.zeros(len(starts), dtype=np.int64)
+    for k in range(int(lengths.max()) if len(starts) else 0):
+        active = lengths > k
+        values[active] = values[active] * 10 + (buf[starts[active] + k] - ord("0"))
+
+    if signed:
+        negative = np.zeros(len(starts), dtype=bool)
+        after_first = starts > 0
+        negative[after_first] = buf[starts[after_first] - 1] == ord("-")
+        values[negative] *= -1
+    return values, starts
+
+
+def parse_ints(data: Union[Buffer, str], columns: Optional[int] = None, lines: bool = False,
+               signed: bool = True) -> Union[np.ndarray, list[np.ndarray]]:
+    """
+    All the integers in ``data`` (text, bytes or a mapped file), as for
+    ``read_ints``.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    values, starts = _tokens(data, signed)
+    if columns is None and not lines:
+        return values
+
+    # which line each number is on, and how many numbers each line has
+    newlines = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == ord("\n"))
+    line_of = np.searchsorted(newlines, starts)
+    per_line = np.bincount(line_of, minlength=len(newlines) + 1)
+    if lines:
+        # blank lines at the end of the file don't count
+        last = np.flatnonzero(per_line)
+        if not len(last):
+            return []
+        return np.split(values, np.cumsum(per_line[:last[-1] + 1])[:-1])
+
+    wrong = np.flatnonzero((per_line != 0) & (per_line != columns))
+    if len(wrong):
+        raise ValueError(f"Line {wrong[0] + 1} has {per_line[wrong[0]]} numbers rather than {columns}")
+    return values.reshape(-1, columns)
+
+
+def read_ints(filename: Optional[str] = None, columns: Optional[int] = None, lines: bool = False,
+              signed: bool = True) -> Union[np.ndarray, list[np.ndarray]]:
+    """
+    All the integers in a file, by default the puzzle input (see
+    ``aoc_common.input_path``), in order.
+
+    With ``columns``, the result is a 2D array with a row for each line that
+    has any numbers on it, and it's an error for any of them not to have
+    exactly ``columns`` numbers.  With ``lines``, the result is a list of
+    1D arrays, one for every line (including empty arrays for lines without
+    any numbers, except at the end of the file).
+    """
+    with mapped(filename) as buf:
+        return parse_ints(buf, columns, lines, signed)
@@ -0,0 +1,499 @@
+"""
+Priority queues for the open lists of Dijkstra/A* style searches.
+
+These are drop-in replacements for ``heapdict`` as used by the various
+shortest-path solutions - ``pq[key] = priority`` adds a key or changes its
+priority, and ``popitem()`` removes and returns the ``(key, priority)`` pair
+with the lowest priority, or ``None`` if the queue is empty.
+
+The following implementations are provided:
+
+- ``IndexedHeap`` is a binary heap that stores the keys and priorities in two
+  parallel lists, plus a dict mapping each key to its current position in the
+  heap.  Changing the priority of a key that is already in the heap sifts it up
+  or down in place, rather than removing and re-adding it as heapdict does.
+- ``LazyHeap`` is a thin wrapper round ``heapq`` that never moves existing
+  entries - changing a priority just pushes a new entry and the old one is
+  discarded when it eventually reaches the top of the heap.  This does more
+  pushes but each one is a single C-level ``heappush`` call, which is usually
+  the fastest option when decrease-key is rare.
+- ``BucketQueue`` is a Dial-style bucket queue for small non-negative integer
+  priorities - one list of keys per priority value, with a cursor that scans
+  forward to the next non-empty bucket.  Pushes and pops are O(1) list
+  operations, there is no log-n sifting at all.
+- ``RadixHeap`` is a monotone radix heap for non-negative integer priorities
+  that can be large or sparse (e.g. 2024 day 16 where turns cost 1000).  It
+  requires that no key is ever pushed with a priority lower than the last one
+  popped, which holds for Dijkstra and for A* with a consistent heuristic.
+
+The last two only make sense when the priorities are ints, the first two work
+with any comparable priorities.  Of those two ``LazyHeap`` is the default: the
+sifting in ``IndexedHeap`` is Python code, and on the searches here it loses to
+the extra C-level pushes (see benchmarks/pq_benchmark.py).
+"""
+
+from heapq import heappush, heappop
+from itertools import count
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class IndexedHeap(Generic[K]):
+    """
+    Binary min-heap with an index from each key to its position, supporting
+    in-place decrease-key (and increase-key).
+    """
+
+    __slots__ = ("_keys", "_prios", "_pos")
+
+    def __init__(self, items=()):
+        # _keys[i] and _prios[i] are the key and priority of heap slot i
+        self._keys: list[K] = []
+        self._prios: list = []
+        # _pos[key] is the index of key's slot in the two arrays
+        self._pos: dict[K, int] = {}
+        for k, v in (items.items() if hasattr(items, "items") else items):
+            self[k] = v
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __bool__(self):
+        return bool(self._keys)
+
+    def __contains__(self, key):
+        return key in self._pos
+
+    def __iter__(self):
+        return iter(self._pos)
+
+    def __getitem__(self, key):
+        return self._prios[self._pos[key]]
+
+    def get(self, key, default=None):
+        i = self._pos.get(key)
+        return default if i is None else self._prios[i]
+
+    def clear(self):
+        self._keys.clear()
+        self._prios.clear()
+        self._pos.clear()
+
+    def __setitem__(self, key, priority):
+        i = self._pos.get(key)
+        if i is None:
+            # New key, add a slot at the end and sift it up
+            self._keys.append(key)
+            self._prios.append(priority)
+            self._sift_up(len(self._keys) - 1)
+        elif priority < self._prios[i]:
+            # decrease-key
+            self._prios[i] = priority
+            self._sift_up(i)
+        else:
+            # increase-key (or no change, in which case the sift is a no-op)
+            self._prios[i] = priority
+            self._sift_down(i)
+
+    def __delitem__(self, key):
+        i = self._pos.pop(key)
+        last_key = self._keys.pop()
+        last_prio = self._prios.pop()
+        if i < len(self._keys):
+            # Fill the hole with what was the last slot, and then move that
+            # whichever way it needs to go to restore the heap property
+            self._keys[i] = last_key
+            self._prios[i] = last_prio
+            self._pos[last_key] = i
+            self._sift_up(i)
+            self._sift_down(self._pos[last_key])
+
+    def popitem(self) -> Optional[tuple[K, object]]:
+        """
+        Remove and return the ``(key, priority)`` pair with the lowest
+        priority, or ``None`` if the heap is empty.
+        """
+        keys = self._keys
+        if not keys:
+            return None
+
+        prios = self._prios
+        top_key = keys[0]
+        top_prio = prios[0]
+        del self._pos[top_key]
+        last_key = keys.pop()
+        last_prio = prios.pop()
+        if keys:
+            keys[0] = last_key
+            prios[0] = last_prio
+            self._sift_down(0)
+        return top_key, top_prio
+
+    def peekitem(self) -> tuple[K, object]:
+        """
+        Return the ``(key, priority)`` pair with the lowest priority without
+        removing it, raising ``IndexError`` if the heap is empty.
+        """
+        return self._keys[0], self._prios[0]
+
+    def _sift_up(self, i):
+        # "Hole" technique - rather than swapping at every level we hold the
+        # moving entry aside, shuffle parents down into the hole, and write
+        # the entry into its final slot once
+        keys, prios, pos = self._keys, self._prios, self._pos
+        key = keys[i]
+        prio = prios[i]
+        while i:
+            parent = (i - 1) >> 1
+            if not prio < prios[parent]:
+                break
+            keys[i] = keys[parent]
+            prios[i] = prios[parent]
+            pos[keys[i]] = i
+            i = parent
+        keys[i] = key
+        prios[i] = prio
+        pos[key] = i
+
+    def _sift_down(self, i):
+        keys, prios, pos = self._keys, self._prios, self._pos
+        n = len(keys)
+        key = keys[i]
+        prio = prios[i]
+        while True:
+            child = (i << 1) + 1
+            if child >= n:
+                break
+            # pick the smaller of the two children
+            if child + 1 < n and prios[child + 1] < prios[child]:
+                child += 1
+            if not prios[child] < prio:
+                break
+            keys[i] = keys[child]
+            prios[i] = prios[child]
+            pos[keys[i]] = i
+            i = child
+        keys[i] = key
+        prios[i] = prio
+        pos[key] = i
+
+
+class LazyHeap(Generic[K]):
+    """
+    ``heapq``-based priority queue using lazy deletion - re-prioritising a key
+    pushes a fresh entry and leaves the old one in place to be skipped later.
+    """
+
+    __slots__ = ("_heap", "_live", "_counter")
+
+    def __init__(self, items=()):
+        # entries are (priority, sequence, key), the sequence number breaks
+        # ties so we never need to compare the keys themselves
+        self._heap: list[tuple[object, int, K]] = []
+        # current priority of every key that is genuinely in the queue
+        self._live: dict[K, object] = {}
+        self._counter = count()
+        for k, v in (items.items() if hasattr(items, "items") else items):
+            self[k] = v
+
+    def __len__(self):
+        return len(self._live)
+
+    def __bool__(self):
+        return bool(self._live)
+
+    def __contains__(self, key):
+        return key in self._live
+
+    def __iter__(self):
+        return iter(self._live)
+
+    def __getitem__(self, key):
+        return self._live[key]
+
+    def get(self, key, default=None):
+        return self._live.get(key, default)
+
+    def clear(self):
+        self._heap.clear()
+        self._live.clear()
+
+    def __setitem__(self, key, priority):
+        self._live[key] = priority
+        heappush(self._heap, (priority, next(self._counter), key))
+
+    def __delitem__(self, key):
+        # the heap entry stays where it is and will be skipped by popitem
+        del self._live[key]
+
+    def _prune(self):
+        """
+        Discard stale entries from the top of the heap until the top entry is
+        a live one (or the heap is empty).
+        """
+        heap, live = self._heap, self._live
+        while heap:
+            prio, _, key = heap[0]
+            if key in live and live[key] == prio:
+                return
+            heappop(heap)
+
+    def popitem(self) -> Optional[tuple[K, object]]:
+        """
+        Remove and return the ``(key, priority)`` pair with the lowest
+        priority, or ``None`` if the queue is empty.
+        """
+        heap, live = self._heap, self._live
+        while heap:
+            prio, _, key = heappop(heap)
+            if key in live and live[key] == prio:
+                del live[key]
+                return key, prio
+        return None
+
+    def peekitem(self) -> tuple[K, object]:
+        """
+        Return the ``(key, priority)`` pair with the lowest priority without
+        removing it, raising ``IndexError`` if the queue is empty.
+        """
+        self._prune()
+        prio, _, key = self._heap[0]
+        return key, prio
+
+
+class BucketQueue(Generic[K]):
+    """
+    Dial's bucket queue for small non-negative integer priorities, with lazy
+    deletion.  Priorities are normally expected to be monotone (never lower
+    than the last one popped) but if one is lower the cursor simply rewinds,
+    so the queue still returns the correct minimum (e.g. for A* where the
+    heuristic is admissible but not quite consistent).
+    """
+
+    __slots__ = ("_buckets", "_live", "_cursor")
+
+    def __init__(self, items=()):
+        # _buckets[p] is the list of keys pushed with priority p, which may
+        # include stale entries for keys that have since been re-prioritised
+        self._buckets: list[list[K]] = []
+        self._live: dict[K, int] = {}
+        # all buckets below the cursor are known to be empty
+        self._cursor = 0
+        for k, v in (items.items() if hasattr(items, "items") else items):
+            self[k] = v
+
+    def __len__(self):
+        return len(self._live)
+
+    def __bool__(self):
+        return bool(self._live)
+
+    def __contains__(self, key):
+        return key in self._live
+
+    def __iter__(self):
+        return iter(self._live)
+
+    def __getitem__(self, key):
+        return self._live[key]
+
+    def get(self, key, default=None):
+        return self._live.get(key, default)
+
+    def clear(self):
+        self._buckets.clear()
+        self._live.clear()
+        self._cursor = 0
+
+    def __setitem__(self, key, priority: int):
+        if priority < 0:
+            raise ValueError(f"BucketQueue priorities must be non-negative, got {priority}")
+        buckets = self._buckets
+        if priority >= len(buckets):
+            buckets.extend([] for _ in range(priority + 1 - len(buckets)))
+        buckets[priority].append(key)
+        self._live[key] = priority
+        if priority < self._cursor:
+            self._cursor = priority
+
+    def __delitem__(self, key):
+        del self._live[key]
+
+    def _advance(self) -> bool:
+        """
+        Move the cursor to the first bucket with a live entry at the end, and
+        return whether there is one.
+        """
+        buckets, live = self._buckets, self._live
+        if not live:
+            return False
+        cursor = self._cursor
+        while True:
+            bucket = buckets[cursor]
+            while bucket:
+                if live.get(bucket[-1]) == cursor:
+                    self._cursor = cursor
+                    return True
+                bucket.pop()
+            cursor += 1
+
+    def popitem(self) -> Optional[tuple[K, int]]:
+        """
+        Remove and return a ``(key, priority)`` pair with the lowest
+        priority, or ``None`` if the queue is empty.
+        """
+        # this is _advance() inlined, as popitem is the hottest path
+        buckets, live = self._buckets, self._live
+        if not live:
+            return None
+        cursor = self._cursor
+        while True:
+            bucket = buckets[cursor]
+            while bucket:
+                key = bucket.pop()
+                if live.get(key) == cursor:
+                    del live[key]
+                    self._cursor = cursor
+                    return key, cursor
+            cursor += 1
+
+    def peekitem(self) -> tuple[K, int]:
+        """
+        Return a ``(key, priority)`` pair with the lowest priority without
+        removing it, raising ``IndexError`` if the queue is empty.
+        """
+        if not self._advance():
+            raise IndexError("peek on an empty BucketQueue")
+        return self._buckets[self._cursor][-1], self._cursor
+
+
+class RadixHeap(Generic[K]):
+    """
+    Monotone radix heap for non-negative integer priorities, with lazy
+    deletion.  Entries are bucketed by the highest bit in which their priority
+    differs from the last priority popped, so each entry moves between buckets
+    at most once per bit of the priority range.
+    """
+
+    __slots__ = ("_buckets", "_live", "_last")
+
+    def __init__(self, items=()):
+        # _buckets[b] holds (priority, key) pairs where (priority ^ _last) has
+        # bit length b - bucket 0 is exactly the entries equal to _last
+        self._buckets: list[list[tuple[int, K]]] = [[]]
+        self._live: dict[K, int] = {}
+        self._last = 0
+        for k, v in (items.items() if hasattr(items, "items") else items):
+            self[k] = v
+
+    def __len__(self):
+        return len(self._live)
+
+    def __bool__(self):
+        return bool(self._live)
+
+    def __contains__(self, key):
+        return key in self._live
+
+    def __iter__(self):
+        return iter(self._live)
+
+    def __getitem__(self, key):
+        return self._live[key]
+
+    def get(self, key, default=None):
+        return self._live.get(key, default)
+
+    def clear(self):
+        self._buckets = [[]]
+        self._live.clear()
+        self._last = 0
+
+    def __setitem__(self, key, priority: int):
+        if priority < self._last:
+            raise ValueError(
+                f"RadixHeap is monotone, cannot push priority {priority} "
+                f"after popping {self._last}"
+            )
+        b = (priority ^ self._last).bit_length()
+        buckets = self._buckets
+        if b >= len(buckets):
+            buckets.extend([] for _ in range(b + 1 - len(buckets)))
+        buckets[b].append((priority, key))
+        self._live[key] = priority
+
+    def __delitem__(self, key):
+        del self._live[key]
+
+    def _refill(self) -> bool:
+        """
+        Ensure that bucket zero contains a live entry at the end, by
+        redistributing the lowest non-empty bucket if necessary.  Returns
+        whether there is any live entry at all.
+        """
+        buckets, live = self._buckets, self._live
+        zero = buckets[0]
+        while True:
+            while zero:
+                prio, key = zero[-1]
+                if live.get(key) == prio:
+                    return True
+                zero.pop()
+            if not live:
+                return False
+            # find the first non-empty bucket, throw away the stale entries,
+            # and re-bucket the rest relative to the smallest live priority
+            for b in range(1, len(buckets)):
+                if buckets[b]:
+                    break
+            else:
+                return False
+            entries = [e for e in buckets[b] if live.get(e[1]) == e[0]]
+            buckets[b] = []
+            if not entries:
+                continue
+            last = self._last = min(p for p, _ in entries)
+            for entry in entries:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+
+    def popitem(self) -> Optional[tuple[K, int]]:
+        """
+        Remove and return a ``(key, priority)`` pair with the lowest
+        priority, or ``None`` if the heap is empty.
+        """
+        if not self._refill():
+            return None
+        prio, key = self._buckets[0].pop()
+        del self._live[key]
+        return key, prio
+
+    def peekitem(self) -> tuple[K, int]:
+        """
+        Return a ``(key, priority)`` pair with the lowest priority without
+        removing it, raising ``IndexError`` if the heap is empty.
+        """
+        if not self._refill():
+            raise IndexError("peek on an empty RadixHeap")
+        prio, key = self._buckets[0][-1]
+        return key, prio
+
+
+# Names accepted by pqdict() and by the searches that let you pick a queue
+QUEUE_TYPES = {
+    "indexed": IndexedHeap,
+    "lazy": LazyHeap,
+    "bucket": BucketQueue,
+    "radix": RadixHeap,
+}
+
+
+def pqdict(kind: str = "lazy"):
+    """
+    Create an empty priority queue of the given kind - one of the keys of
+    ``QUEUE_TYPES``.
+    """
+    return QUEUE_TYPES[kind]()
+
+
+__all__ = ["IndexedHeap", "LazyHeap", "BucketQueue", "RadixHeap", "QUEUE_TYPES", "pqdict"]
@@ -0,0 +1,262 @@
+"""
+Per-phase profiling of solutions, switched on by an environment variable.
+
+Mark the interesting parts of a solution as phases, either by decorating a
+function or with a ``with`` block::
+
+    @phase("parse")
+    def load_data():
+        ...
+
+    with phase("simulate"):
+        ...
+
+With profiling off (the default) decorating a function returns the function
+itself, and a ``with phase(...)`` block costs one check of a global, so
+phases can be left in hot code.  Setting ``AOC_PROFILE`` switches it on, and
+its value is a comma-separated list of what to record:
+
+- anything at all (e.g. ``AOC_PROFILE=1``) - the number of calls, wall time
+  and CPU time of each phase
+- ``alloc`` - also the net number of memory blocks and bytes allocated
+  during the phase, using tracemalloc
+- ``cprofile`` - also a cProfile of each phase, written as a pstats file
+  (view with ``python -m pstats FILE``) to ``$AOC_PROFILE_DIR``, or
+  ``profiles`` in the parsed input cache directory (see aoc_common.cache)
+
+``alloc`` and ``cprofile`` slow everything down a lot, so don't compare
+their timings with plain ones.
+
+Phases nest, and are recorded by their path, so a ``parse`` phase called
+from a ``part2`` phase is ``part2/parse``.  A function that calls itself
+recursively is one phase, not a new nested phase each time round.  In
+``cprofile`` mode only one profiler can run at a time, so the calls made in
+a nested phase appear in its own profile and not in its parent's.
+
+The runner (aoc_common.runner) puts each of its own phases (``load``,
+``parse``, ``part1``, ...) inside a profiling phase, so every solution gets
+at least that level of detail, and includes the stats in its JSON report.
+Scripts run on their own print a table of the stats to stderr on exit.
+"""
+
+import atexit
+import functools
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter, process_time
+from typing import Callable, Optional
+
+from aoc_common.lazy import lazy_import
+
+# only needed in alloc and cprofile modes
+cProfile = lazy_import("cProfile")
+tracemalloc = lazy_import("tracemalloc")
+
+PROFILE_ENV = "AOC_PROFILE"
+DIR_ENV = "AOC_PROFILE_DIR"
+
+
+@dataclass(frozen=True)
+class Config:
+    alloc: bool = False
+    cprofile: bool = False
+
+
+@dataclass
+class PhaseStats:
+    name: str
+    calls: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+    # net memory blocks and bytes allocated, in alloc mode
+    blocks: Optional[int] = None
+    bytes: Optional[int] = None
+    # pstats file, in cprofile mode
+    profile: Optional[str] = None
+
+
+class _Frame:
+    __slots__ = ("name", "path", "depth", "wall", "cpu", "snapshot", "profiler")
+
+    def __init__(self, name: str, path: str):
+        self.name = name
+        self.path = path
+        # extra times a recursive phase has been entered
+        self.depth = 0
+        self.snapshot = None
+        self.profiler = None
+
+
+# None when profiling is off
+_config: Optional[Config] = None
+# phases currently running, innermost last
+_stack: list[_Frame] = []
+# stats for every phase since the last collect(), by path, in the order
+# they were first entered
+_stats: dict[str, PhaseStats] = {}
+_profilers: dict[str, "cProfile.Profile"] = {}
+
+
+def _snapshot() -> "tracemalloc.Snapshot":
+    # tracemalloc's own bookkeeping isn't part of any phase
+    return tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+
+
+def configure(spec: Optional[str]):
+    """
+    Switch profiling on or off, as for the value of ``AOC_PROFILE``.
+    Phase decorators only check this when they're applied, so set it before
+    importing the code to be profiled.
+    """
+    global _config
+    words = {w.strip().lower() for w in (spec or "").replace(",", " ").split()}
+    if not words or words == {"0"}:
+        _config = None
+        return
+    _config = Config(alloc="alloc" in words, cprofile="cprofile" in words)
+    if _config.alloc and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def enabled() -> bool:
+    return _config is not None
+
+
+class phase:
+    """
+    A profiling phase, used as a decorator or a context manager.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __call__(self, fn: Callable) -> Callable:
+        if _config is None:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with self:
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    def __enter__(self):
+        if _config is not None:
+            _enter(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        if _config is not None and _stack:
+            _exit()
+        return False
+
+
+def _enter(name: str):
+    parent = _stack[-1] if _stack else None
+    if parent is not None and parent.name == name:
+        parent.depth += 1
+        return
+
+    frame = _Frame(name, f"{parent.path}/{name}" if parent is not None else name)
+    _stats.setdefault(frame.path, PhaseStats(frame.path))
+    if _config.alloc and tracemalloc.is_tracing():
+        frame.snapshot = _snapshot()
+    if _config.cprofile:
+        if parent is not None and parent.profiler is not None:
+            parent.profiler.disable()
+        frame.profiler = _profilers.setdefault(frame.path, cProfile.Profile())
+        frame.profiler.enable()
+    _stack.append(frame)
+    frame.wall = perf_counter()
+    frame.cpu = process_time()
+
+
+def _exit():
+    frame = _stack[-1]
+    if frame.depth:
+        frame.depth -= 1
+        return
+
+    wall = perf_counter() - frame.wall
+    cpu = process_time() - frame.cpu
+    _stack.pop()
+    if frame.profiler is not None:
+        frame.profiler.disable()
+        parent = _stack[-1] if _stack else None
+        if parent is not None and parent.profiler is not None:
+            parent.profiler.enable()
+
+    stats = _stats[frame.path]
+    stats.calls += 1
+    stats.wall += wall
+    stats.cpu += cpu
+    if frame.snapshot is not None and tracemalloc.is_tracing():
+        after = _snapshot()
+        diffs = after.compare_to(frame.snapshot, "filename")
+        stats.blocks = (stats.blocks or 0) + sum(d.count_diff for d in diffs)
+        stats.bytes = (stats.bytes or 0) + sum(d.size_diff for d in diffs)
+
+
+def profile_dir() -> Path:
+    if os.environ.get(DIR_ENV):
+        return Path(os.environ[DIR_ENV])
+    from aoc_common.cache import cache_dir
+
+    return cache_dir() / "profiles"
+
+
+def collect(label: str = "") -> list[PhaseStats]:
+    """
+    The stats of every phase since the last ``collect`` (or ``reset``),
+    writing out any cProfiles as ``<label><phase path>.prof``.  Phases that
+    are still running are included up to their last exit.
+    """
+    if _profilers:
+        directory = profile_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        for path, profiler in _profilers.items():
+            dump = directory / f"{label}{path.replace('/', '.')}.prof"
+            profiler.dump_stats(dump)
+            _stats[path].profile = str(dump)
+    results = list(_stats.values())
+    reset()
+    return results
+
+
+def reset():
+    """
+    Forget the stats recorded so far.
+    """
+    _stats.clear()
+    _profilers.clear()
+    # running phases will record into fresh stats when they exit
+    for frame in _stack:
+        _stats[frame.path] = PhaseStats(frame.path)
+
+
+def report(stats: list[PhaseStats], file=None):
+    """
+    Print a table of phase stats.
+    """
+    file = file or sys.stderr
+    print(f"{'phase':40} {'calls':>8} {'wall':>10} {'cpu':>10} {'blocks':>10} {'bytes':>12}", file=file)
+    for s in stats:
+        print(f"{s.name:40} {s.calls:8} {s.wall:9.4f}s {s.cpu:9.4f}s {s.blocks if s.blocks is not None else '-':>10} "
+              f"{s.bytes if s.bytes is not None else '-':>12}", file=file)
+    for s in stats:
+        if s.profile:
+            print(f"profile of {s.name}: {s.profile}", file=file)
+
+
+@atexit.register
+def _report_at_exit():
+    if _config is not None and _stats:
+        report(collect(Path(sys.argv[0]).stem + "." if sys.argv and sys.argv[0] else ""))
+
+
+configure(os.environ.get(PROFILE_ENV))
@@ -0,0 +1,417 @@
+"""
+Run any of the solutions from one place, with timings.
+
+Every solution is a standalone ``YYYY/DD/<name>.py`` script that reads its
+input via ``aoc_common.input_path()``.  The runner discovers these scripts,
+points ``AOC_INPUT`` at the right input file, and runs each one in-process,
+timing separately:
+
+- ``load`` - executing the module itself (some days parse their input at
+  import time)
+- ``parse`` - calling the day's input loader (``load_data``, ``parse_input``,
+  etc.) on its own, if it has one that takes no arguments
+- ``part1``, ``part2`` (or ``main``) - calling each part function.  These
+  include their own call to the loader, as that's how the scripts are
+  written, so subtract ``parse`` if you want the pure solving time
+
+Scripts without part functions are just run as ``__main__`` in one ``main``
+phase.  Anything a phase prints is captured and included in the results, as
+is the answer each part function returns.  ``answers`` gives the answers of
+a run in a form that can be compared from one run to the next, with
+``MISSING`` in place of any part that didn't return its answer - see
+aoc_common.ledger.
+
+With ``--profile`` each of these phases is also a profiling phase (see
+aoc_common.profile), and the stats of those and of any phases marked in the
+solution itself are included in the results too.
+
+Usage::
+
+    python -m aoc_common.runner [options] [selector ...]
+
+where each selector is a year (``2023``), a day (``2023/18``) or a specific
+script (``2023/18/big_lagoon``), and the default is everything.  See
+``--help`` for the options.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import inspect
+import io
+import json
+import os
+import platform
+import re
+import runpy
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter, process_time
+from typing import Any, Iterable, Optional
+
+from aoc_common import INPUT_ENV, profile
+from aoc_common.profile import PhaseStats
+
+SOLUTION_PATTERN = re.compile(r"^(\d{4})/(\d{2})/([A-Za-z_]\w*)\.py$")
+
+# Names of the input loader functions used by the various days, in order of
+# preference
+LOADER_NAMES = (
+    "load_data",
+    "load_input",
+    "parse_input",
+    "read_input",
+    "input_matrix",
+    "input_lines",
+    "input_patterns",
+)
+
+# Part functions, in the order they should be run
+PART_NAMES = ("part1", "part2")
+
+# Module name the solution scripts are loaded as
+MODULE_NAME = "aoc_runner"
+
+# Stands in for the answer to a part that didn't return one
+MISSING = "<no answer returned>"
+
+
+@dataclass(frozen=True)
+class Solution:
+    year: int
+    day: int
+    name: str
+    path: Path
+
+    @property
+    def id(self) -> str:
+        return f"{self.year}/{self.day:02d}/{self.name}"
+
+    @property
+    def default_input(self) -> Path:
+        return self.path.parent / "input"
+
+
+@dataclass
+class Phase:
+    name: str
+    wall: float = 0.0
+    cpu: float = 0.0
+    output: list[str] = field(default_factory=list)
+    error: Optional[str] = None
+    # what a part function returned, as plain JSON-compatible values
+    answer: Any = None
+
+
+@dataclass
+class RunResult:
+    solution: str
+    input: str
+    phases: list[Phase] = field(default_factory=list)
+    wall: float = 0.0
+    error: Optional[str] = None
+    skipped: Optional[str] = None
+    # stats of the profiling phases, if profiling is on
+    profile: list[PhaseStats] = field(default_factory=list)
+
+    def phase(self, name: str) -> Optional[Phase]:
+        return next((p for p in self.phases if p.name == name), None)
+
+    def answers(self) -> list:
+        """
+        The answer to each part, in order - what each part function returned,
+        or ``MISSING`` if it returned nothing.  A ``main`` function returns a
+        tuple of the answers to all the parts.  A script that was just run as
+        ``__main__`` has the single answer ``MISSING``, as whatever it printed
+        can't be told apart from any other output.
+        """
+        answers = []
+        for p in self.phases:
+            if p.name == "main" and isinstance(p.answer, list):
+                answers.extend(p.answer)
+            elif p.name == "main" or p.name in PART_NAMES:
+                answers.append(MISSING if p.answer is None else p.answer)
+        return answers
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RunResult":
+        """
+        Rebuild a result from its ``asdict`` form, e.g. after a trip through
+        JSON.
+        """
+        data = dict(data)
+        data["phases"] = [Phase(**p) for p in data.get("phases", [])]
+        data["profile"] = [PhaseStats(**s) for s in data.get("profile", [])]
+        return cls(**data)
+
+
+def find_root(start: Optional[Path] = None) -> Path:
+    """
+    Find the top of the repository - the nearest directory at or above
+    ``start`` (default the current directory) that has year directories in it.
+    """
+    start = (start or Path.cwd()).resolve()
+    for d in (start, *start.parents):
+        if any(p.is_dir() and re.fullmatch(r"\d{4}", p.name) for p in d.iterdir()):
+            return d
+    return start
+
+
+def discover(root: Path, selectors: Iterable[str] = ()) -> list[Solution]:
+    """
+    All the solution scripts under ``root`` that match any of the selectors
+    (or all of them, if there are no selectors), in year/day/name order.
+    """
+    selectors = [normalise_selector(s) for s in selectors]
+    solutions = []
+    for path in root.glob("[0-9][0-9][0-9][0-9]/[0-9][0-9]/*.py"):
+        m = SOLUTION_PATTERN.match(path.relative_to(root).as_posix())
+        if not m:
+            continue
+        sol = Solution(int(m.group(1)), int(m.group(2)), m.group(3), path)
+        if not selectors or any(sol.id == s or sol.id.startswith(s + "/") for s in selectors):
+            solutions.append(sol)
+    return sorted(solutions, key=lambda s: (s.year, s.day, s.name))
+
+
+def normalise_selector(selector: str) -> str:
+    """
+    Accept ``2023/1`` as well as ``2023/01``, and ignore any trailing slash
+    or ``.py``.
+    """
+    parts = selector.strip("/").removesuffix(".py").split("/")
+    if len(parts) > 1 and parts[1].isdigit():
+        parts[1] = f"{int(parts[1]):02d}"
+    return "/".join(parts)
+
+
+@contextlib.contextmanager
+def solution_context(solution: Solution, input_file: Path):
+    """
+    Set up the environment a solution script expects - its input file, its
+    own directory as the working directory, and a clean ``sys.argv`` - and
+    put everything back afterwards.
+    """
+    old_env = os.environ.get(INPUT_ENV)
+    old_cwd = os.getcwd()
+    old_argv = sys.argv
+    os.environ[INPUT_ENV] = str(input_file)
+    os.chdir(solution.path.parent)
+    sys.argv = [str(solution.path)]
+    try:
+        yield
+    finally:
+        sys.modules.pop(MODULE_NAME, None)
+        sys.argv = old_argv
+        os.chdir(old_cwd)
+        if old_env is None:
+            del os.environ[INPUT_ENV]
+        else:
+            os.environ[INPUT_ENV] = old_env
+
+
+def plain(value):
+    """
+    An answer as plain JSON-compatible values - numpy scalars and arrays
+    become Python numbers and lists, and tuples (including namedtuples such
+    as ``Cell``) become lists.
+    """
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [plain(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): plain(v) for k, v in value.items()}
+    return value
+
+
+def timed(phase_name: str, fn, *args) -> tuple[Phase, object]:
+    """
+    Call ``fn(*args)``, capturing its output and timing it.
+    """
+    phase = Phase(phase_name)
+    out = io.StringIO()
+    result = None
+    wall_start = perf_counter()
+    cpu_start = process_time()
+    try:
+        with contextlib.redirect_stdout(out), profile.phase(phase_name):
+            result = fn(*args)
+            if inspect.isgenerator(result):
+                # loaders that are generators don't do any work until consumed
+                result = list(result)
+    except BaseException as e:
+        if isinstance(e, KeyboardInterrupt):
+            raise
+        phase.error = "".join(traceback.format_exception_only(type(e), e)).strip()
+    phase.wall = perf_counter() - wall_start
+    phase.cpu = process_time() - cpu_start
+    phase.output = out.getvalue().splitlines()
+    return phase, result
+
+
+def load_module(path: Path) -> dict:
+    """
+    Execute a solution script as a module, returning its namespace.  Unlike
+    ``runpy.run_path``, the module stays in ``sys.modules`` for the rest of
+    the run so that anything defined in it can be pickled (which the parsed
+    input cache relies on).
+    """
+    spec = importlib.util.spec_from_file_location(MODULE_NAME, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[MODULE_NAME] = module
+    spec.loader.exec_module(module)
+    return vars(module)
+
+
+def _no_args(fn) -> bool:
+    # whether fn can be called without any arguments
+    try:
+        params = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return all(p.default is not p.empty or p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD) for p in params)
+
+
+def _loader(module: dict):
+    for name in LOADER_NAMES:
+        fn = module.get(name)
+        if callable(fn) and _no_args(fn):
+            return fn
+    return None
+
+
+def run_solution(solution: Solution, input_file: Optional[Path] = None) -> RunResult:
+    """
+    Run a single solution script in this process, returning the timings and
+    output of each phase.
+    """
+    input_file = Path(input_file or solution.default_input).resolve()
+    result = RunResult(solution.id, str(input_file))
+    if not input_file.is_file():
+        result.skipped = f"no input file {input_file}"
+        return result
+
+    start = perf_counter()
+    profile.reset()
+    with solution_context(solution, input_file):
+        phase, module = timed("load", load_module, solution.path)
+        result.phases.append(phase)
+        if phase.error is None:
+            # part functions that need arguments are only called by the
+            # script's own main block
+            parts = [(name, fn) for name in PART_NAMES if callable(fn := module.get(name)) and _no_args(fn)]
+            if not parts and callable(fn := module.get("main")) and _no_args(fn):
+                parts = [("main", fn)]
+
+            if not parts:
+                # no part functions we can call, run the script's own main block
+                phase, _ = timed("main", runpy.run_path, str(solution.path), None, "__main__")
+                result.phases.append(phase)
+            else:
+                loader = _loader(module)
+                if loader is not None:
+                    phase, _ = timed("parse", loader)
+                    result.phases.append(phase)
+                for name, fn in parts:
+                    phase, answer = timed(name, fn)
+                    phase.answer = plain(answer)
+                    result.phases.append(phase)
+
+    result.wall = perf_counter() - start
+    if profile.enabled():
+        result.profile = profile.collect(f"{solution.id.replace('/', '-')}.")
+    result.error = next((f"{p.name}: {p.error}" for p in result.phases if p.error), None)
+    return result
+
+
+def run_all(solutions: list[Solution], input_file: Optional[Path] = None, jobs: int = 1):
+    """
+    Run all the given solutions, in a pool of ``jobs`` worker processes if
+    ``jobs > 1``.  Yields the ``RunResult``s in the same order as the
+    solutions.
+    """
+    if jobs <= 1 or len(solutions) <= 1:
+        for sol in solutions:
+            yield run_solution(sol, input_file)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(run_solution, solutions, [input_file] * len(solutions))
+
+
+def print_result(result: RunResult, show_output: bool = True, file=sys.stdout):
+    timings = "  ".join(f"{p.name} {p.wall:.3f}s" for p in result.phases)
+    status = f"  ERROR {result.error}" if result.error else ""
+    if result.skipped:
+        status = f"  SKIPPED ({result.skipped})"
+    print(f"{result.solution:40} {result.wall:8.3f}s  [{timings}]{status}", file=file)
+    if show_output:
+        for p in result.phases:
+            for line in p.output:
+                print(f"    {line}", file=file)
+    for s in result.profile:
+        alloc = f"  {s.blocks} blocks {s.bytes} bytes" if s.blocks is not None else ""
+        print(f"    profile {s.name}: {s.calls} calls  {s.wall:.4f}s wall  {s.cpu:.4f}s cpu{alloc}", file=file)
+
+
+def report(results: list[RunResult]) -> dict:
+    """
+    JSON-serialisable report of a set of runs, for the dashboards.
+    """
+    return {
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [asdict(r) for r in results],
+    }
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(prog="aoc", description="Run Advent of Code solutions with timings")
+    parser.add_argument("selectors", nargs="*", help="years, days or scripts to run, e.g. 2023 2024/16 2023/18/lagoon")
+    parser.add_argument("--root", type=Path, help="repository root (default: found from the current directory)")
+    parser.add_argument("--input", type=Path, help="input file to use instead of each day's own 'input'")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--json", metavar="FILE", help="write the results as JSON to FILE ('-' for stdout)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="don't show the solutions' output")
+    parser.add_argument("--list", action="store_true", help="just list the matching solutions")
+    parser.add_argument("--profile", nargs="?", const="1", metavar="MODES",
+                        help="record profiling phases, optionally with 'alloc' and/or 'cprofile' (comma-separated)")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        # in the environment as well, for worker processes
+        os.environ[profile.PROFILE_ENV] = args.profile
+        profile.configure(args.profile)
+
+    root = (args.root or find_root()).resolve()
+    solutions = discover(root, args.selectors)
+    if args.list:
+        for sol in solutions:
+            print(sol.id)
+        return 0
+
+    # if the JSON is going to stdout, send the human-readable report to stderr
+    human = sys.stderr if args.json == "-" else sys.stdout
+    results = []
+    for result in run_all(solutions, args.input, args.jobs):
+        print_result(result, not args.quiet, human)
+        results.append(result)
+
+    if args.json:
+        data = json.dumps(report(results), indent=2)
+        if args.json == "-":
+            print(data)
+        else:
+            Path(args.json).write_text(data + "\n")
+
+    return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,467 @@
+"""
+Shared graph search engine for the many shortest-path puzzles.
+
+All the searches here take a start node and a ``neighbours`` function giving
+the edges out of a node, and return a ``SearchResult`` holding the cost of
+the cheapest path found to every node reached, the predecessor links needed
+to reconstruct those paths, and some counters for profiling.  The
+``neighbours`` function returns an iterable of ``(child, cost)`` pairs for the
+weighted searches and of bare ``child`` nodes for the unit-weight ones (BFS),
+or you can pass a precomputed ``CSR`` adjacency instead of a function, in
+which case the nodes are the ints ``0 .. n-1``.
+
+``shortest_paths`` is the usual entry point - it picks the appropriate
+algorithm and queue for the kind of edge weights you tell it to expect:
+
+- ``"unit"`` - every edge costs 1, use plain breadth-first search
+- ``"01"`` - every edge costs 0 or 1, use a deque-based 0-1 BFS
+- ``"int"`` - small non-negative ints, use Dijkstra (or A*) with a
+  ``BucketQueue``
+- ``"any"`` - anything else, use Dijkstra (or A*) with a ``LazyHeap``
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Hashable, Iterable, NamedTuple, Optional, Sequence, TypeVar, Union
+
+from aoc_common.pq import pqdict
+
+N = TypeVar("N", bound=Hashable)
+
+
+class CSR(NamedTuple):
+    """
+    Compressed sparse row adjacency - the neighbours of node ``i`` are
+    ``indices[indptr[i]:indptr[i+1]]``, with the matching edge costs (if not
+    all 1) in the same slice of ``weights``.
+    """
+
+    indptr: Sequence[int]
+    indices: Sequence[int]
+    weights: Optional[Sequence[int]] = None
+
+    def as_lists(self) -> "CSR":
+        """
+        Copy of this adjacency with plain Python lists in place of any numpy
+        arrays.  Iterating lists from Python is much faster than iterating
+        numpy arrays element by element, so if you're going to run several
+        searches over the same adjacency, convert it once up front.
+        """
+        return CSR(*(a.tolist() if hasattr(a, "tolist") else a for a in self))
+
+    def neighbours(self, node: int):
+        start, end = self.indptr[node], self.indptr[node + 1]
+        return self.indices[start:end]
+
+    def weighted_neighbours(self, node: int):
+        start, end = self.indptr[node], self.indptr[node + 1]
+        if self.weights is None:
+            return ((n, 1) for n in self.indices[start:end])
+        return zip(self.indices[start:end], self.weights[start:end])
+
+
+@dataclass
+class SearchStats:
+    """
+    Counters for how much work a search did.
+    """
+
+    # number of nodes taken off the open list and expanded
+    expanded: int = 0
+    # number of entries added to the open list (including re-prioritising a
+    # node that was already there)
+    pushes: int = 0
+    # number of entries taken off the open list
+    pops: int = 0
+
+
+@dataclass
+class SearchResult(Generic[N]):
+    """
+    Outcome of a search.  ``costs`` maps every node reached to the cost of the
+    cheapest path found from the start.  ``predecessors`` maps every node
+    other than the start to the node before it on that cheapest path, or to
+    the ``set`` of all such nodes if the search was asked to track all
+    predecessors.  ``goal`` is the goal node that was reached, if any.
+    """
+
+    start: N
+    costs: dict[N, int]
+    predecessors: dict[N, Union[N, set[N]]]
+    goal: Optional[N] = None
+    stats: SearchStats = field(default_factory=SearchStats)
+
+    def _preds(self, node):
+        if node not in self.predecessors:
+            return ()
+        pred = self.predecessors[node]
+        return pred if isinstance(pred, set) else (pred,)
+
+    def path(self, node: Optional[N] = None) -> list[N]:
+        """
+        One of the cheapest paths from the start to the given node (or the
+        goal, if no node is given), as a list of nodes including both ends.
+
+        :raises ValueError: if the node was never reached
+        """
+        if node is None:
+            node = self.goal
+        if node is None or node not in self.costs:
+            raise ValueError(f"No path from {self.start} to {node}")
+        # with 0-cost edges the sets of all predecessors can have cycles, so
+        # search back through them rather than always taking the first
+        path = [node]
+        seen = {node}
+        choices = [iter(self._preds(node))]
+        while path[-1] != self.start:
+            for pred in choices[-1]:
+                if pred not in seen:
+                    seen.add(pred)
+                    path.append(pred)
+                    choices.append(iter(self._preds(pred)))
+                    break
+            else:
+                path.pop()
+                choices.pop()
+        path.reverse()
+        return path
+
+    def nodes_on_any_path(self, node: Optional[N] = None) -> set[N]:
+        """
+        The set of all nodes that appear on *any* cheapest path from the start
+        to the given node (or the goal) - this is only really useful when the
+        search was tracking all predecessors.
+        """
+        if node is None:
+            node = self.goal
+        if node is None or node not in self.costs:
+            raise ValueError(f"No path from {self.start} to {node}")
+        seen = {node}
+        frontier = [node]
+        while frontier:
+            n = frontier.pop()
+            pred = self.predecessors.get(n)
+            if pred is None:
+                continue
+            for p in (pred if isinstance(pred, set) else (pred,)):
+                if p not in seen:
+                    seen.add(p)
+                    frontier.append(p)
+        return seen
+
+
+Goal = Union[None, N, Callable[[N], bool]]
+
+
+def _goal_test(goal) -> Optional[Callable]:
+    if goal is None or callable(goal):
+        return goal
+    return lambda node: node == goal
+
+
+def _neighbour_fn(neighbours, weighted: bool):
+    if isinstance(neighbours, CSR):
+        if hasattr(neighbours.indices, "tolist"):
+            neighbours = neighbours.as_lists()
+        return neighbours.weighted_neighbours if weighted else neighbours.neighbours
+    return neighbours
+
+
+def bfs(
+    start: N,
+    neighbours: Union[Callable[[N], Iterable[N]], CSR],
+    goal: Goal = None,
+    all_predecessors: bool = False,
+) -> SearchResult[N]:
+    """
+    Breadth-first search where every edge costs 1.
+
+    :param start: the start node
+    :param neighbours: function returning the nodes adjacent to a given node,
+      or a ``CSR`` adjacency
+    :param goal: optional goal node, or predicate function on nodes - the
+      search stops once the goal is reached.  If omitted the search visits
+      every node reachable from ``start``.
+    :param all_predecessors: if true, track the set of all equally-cheap
+      predecessors of each node, rather than just the first one found
+    """
+    neighbours = _neighbour_fn(neighbours, False)
+    is_goal = _goal_test(goal)
+    costs = {start: 0}
+    predecessors = {}
+    stats = SearchStats(pushes=1)
+    result = SearchResult(start, costs, predecessors, stats=stats)
+
+    if is_goal and is_goal(start):
+        result.goal = start
+        return result
+
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        stats.pops += 1
+        node_cost = costs[node]
+        if result.goal is not None and node_cost >= costs[result.goal]:
+            # we're only still going to collect all the predecessors of the
+            # goal, and the whole layer before it has now been expanded
+            return result
+        stats.expanded += 1
+        child_cost = node_cost + 1
+        for child in neighbours(node):
+            child_prev = costs.get(child)
+            if child_prev is None:
+                costs[child] = child_cost
+                predecessors[child] = {node} if all_predecessors else node
+                if is_goal and result.goal is None and is_goal(child):
+                    result.goal = child
+                    if not all_predecessors:
+                        return result
+                queue.append(child)
+                stats.pushes += 1
+            elif all_predecessors and child_prev == child_cost:
+                predecessors[child].add(node)
+
+    return result
+
+
+def bfs_01(
+    start: N,
+    neighbours: Union[Callable[[N], Iterable[tuple[N, int]]], CSR],
+    goal: Goal = None,
+    all_predecessors: bool = False,
+) -> SearchResult[N]:
+    """
+    Shortest paths where every edge costs either 0 or 1, using a deque in
+    place of a priority queue - 0-cost children go on the front, 1-cost on
+    the back.  Parameters as for ``dijkstra``.
+    """
+    neighbours = _neighbour_fn(neighbours, True)
+    is_goal = _goal_test(goal)
+    costs = {start: 0}
+    predecessors = {}
+    closed = set()
+    stats = SearchStats(pushes=1)
+    result = SearchResult(start, costs, predecessors, stats=stats)
+
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        stats.pops += 1
+        if node in closed:
+            continue
+        closed.add(node)
+        stats.expanded += 1
+        node_cost = costs[node]
+        if is_goal and is_goal(node):
+            result.goal = node
+            if not all_predecessors:
+                return result
+        if result.goal is not None and node_cost > costs[result.goal]:
+            return result
+
+        for child, cost in neighbours(node):
+            child_cost = node_cost + cost
+            child_prev = costs.get(child)
+            if child_cost == child_prev and all_predecessors and child != start:
+                # this comes before the closed check - over a 0-cost edge an
+                # equally cheap predecessor can turn up after the child has
+                # been expanded
+                predecessors[child].add(node)
+            elif child in closed:
+                continue
+            elif child_prev is None or child_cost < child_prev:
+                costs[child] = child_cost
+                predecessors[child] = {node} if all_predecessors else node
+                if cost:
+                    queue.append(child)
+                else:
+                    queue.appendleft(child)
+                stats.pushes += 1
+
+    return result
+
+
+def dijkstra(
+    start: N,
+    neighbours: Union[Callable[[N], Iterable[tuple[N, int]]], CSR],
+    goal: Goal = None,
+    heuristic: Optional[Callable[[N], int]] = None,
+    all_predecessors: bool = False,
+    queue: str = "lazy",
+) -> SearchResult[N]:
+    """
+    Dijkstra's algorithm, or A* if a heuristic is supplied.
+
+    :param start: the start node
+    :param neighbours: function returning an iterable of ``(child, cost)``
+      pairs for the edges out of a given node, or a ``CSR`` adjacency
+    :param goal: optional goal node, or predicate function on nodes - the
+      search stops once the goal is reached.  If omitted the search visits
+      every node reachable from ``start``.
+    :param heuristic: optional A* heuristic giving a lower bound on the cost
+      from a node to the goal.  It must be consistent (never decrease by more
+      than the cost of an edge) if you want to use the "radix" queue.
+    :param all_predecessors: if true, track the set of all equally-cheap
+      predecessors of each node, rather than just the first one found
+    :param queue: which priority queue implementation to use, see
+      ``aoc_common.pq.QUEUE_TYPES``
+    """
+    neighbours = _neighbour_fn(neighbours, True)
+    is_goal = _goal_test(goal)
+    open_list = pqdict(queue)
+    closed = set()
+    costs = {start: 0}
+    predecessors = {}
+    stats = SearchStats(pushes=1)
+    result = SearchResult(start, costs, predecessors, stats=stats)
+
+    open_list[start] = heuristic(start) if heuristic else 0
+
+    while True:
+        item = open_list.popitem()
+        if item is None:
+            return result
+        node, f_node = item
+        stats.pops += 1
+        if result.goal is not None and f_node > costs[result.goal]:
+            # we're only still going to collect all the predecessors of the
+            # goal, and nothing else can be on a cheapest path to it now
+            return result
+        closed.add(node)
+        stats.expanded += 1
+        if is_goal and is_goal(node):
+            result.goal = node
+            if not all_predecessors:
+                return result
+
+        node_cost = costs[node]
+        for child, cost in neighbours(node):
+            child_cost = node_cost + cost
+            child_prev = costs.get(child)
+            if child_cost == child_prev and all_predecessors and child != start:
+                # before the closed check, as in bfs_01
+                predecessors[child].add(node)
+            elif child in closed:
+                continue
+            elif child_prev is None or child_cost < child_prev:
+                costs[child] = child_cost
+                predecessors[child] = {node} if all_predecessors else node
+                open_list[child] = child_cost + heuristic(child) if heuristic else child_cost
+                stats.pushes += 1
+
+
+def bidirectional_bfs(
+    start: N,
+    goal: N,
+    neighbours: Union[Callable[[N], Iterable[N]], CSR],
+    reverse_neighbours: Optional[Callable[[N], Iterable[N]]] = None,
+) -> SearchResult[N]:
+    """
+    Unit-weight shortest path between two specific nodes, searching forwards
+    from the start and backwards from the goal a layer at a time (always
+    growing the smaller frontier) until the two meet.  The result's ``costs``
+    and ``predecessors`` cover the forward search plus the nodes on the path,
+    so ``result.path()`` gives the full path from start to goal.
+
+    :param reverse_neighbours: function returning the nodes that have an edge
+      *to* a given node - defaults to ``neighbours``, i.e. an undirected graph
+    """
+    neighbours = _neighbour_fn(neighbours, False)
+    if reverse_neighbours is None:
+        reverse_neighbours = neighbours
+    stats = SearchStats(pushes=2)
+    fwd_costs, bwd_costs = {start: 0}, {goal: 0}
+    fwd_pred, bwd_succ = {}, {}
+    result = SearchResult(start, fwd_costs, fwd_pred, stats=stats)
+    if start == goal:
+        result.goal = goal
+        return result
+
+    fwd_frontier, bwd_frontier = [start], [goal]
+    meet = None
+    while fwd_frontier and bwd_frontier and meet is None:
+        forwards = len(fwd_frontier) <= len(bwd_frontier)
+        if forwards:
+            frontier, costs, links, other, nbrs = fwd_frontier, fwd_costs, fwd_pred, bwd_costs, neighbours
+        else:
+            frontier, costs, links, other, nbrs = bwd_frontier, bwd_costs, bwd_succ, fwd_costs, reverse_neighbours
+        next_frontier = []
+        for node in frontier:
+            stats.pops += 1
+            stats.expanded += 1
+            for child in nbrs(node):
+                if child in costs:
+                    continue
+                costs[child] = costs[node] + 1
+                links[child] = node
+                next_frontier.append(child)
+                stats.pushes += 1
+                if child in other:
+                    # meeting point - but keep expanding this layer in case
+                    # there's another meeting node that gives a shorter total
+                    if meet is None or costs[child] + other[child] < fwd_costs[meet] + bwd_costs[meet]:
+                        meet = child
+        if forwards:
+            fwd_frontier = next_frontier
+        else:
+            bwd_frontier = next_frontier
+
+    if meet is None:
+        return result
+
+    # stitch the backward half of the path onto the forward predecessors
+    node = meet
+    while node != goal:
+        nxt = bwd_succ[node]
+        fwd_pred[nxt] = node
+        fwd_costs[nxt] = fwd_costs[node] + 1
+        node = nxt
+    result.goal = goal
+    return result
+
+
+def shortest_paths(
+    start: N,
+    neighbours: Union[Callable, CSR],
+    goal: Goal = None,
+    weights: str = "any",
+    heuristic: Optional[Callable[[N], int]] = None,
+    all_predecessors: bool = False,
+    queue: Optional[str] = None,
+) -> SearchResult[N]:
+    """
+    Pick the fastest search strategy for the given kind of edge ``weights``
+    (see module docstring) and run it.  For ``"unit"`` weights ``neighbours``
+    returns bare nodes, for everything else it returns ``(child, cost)``
+    pairs.  Passing an explicit ``queue`` (or a ``heuristic``) always forces
+    Dijkstra/A* with that queue type, wrapping unit-weight neighbour functions
+    as necessary.
+    """
+    if queue is None and heuristic is None:
+        if weights == "unit":
+            return bfs(start, neighbours, goal, all_predecessors)
+        if weights == "01":
+            return bfs_01(start, neighbours, goal, all_predecessors)
+
+    if weights == "unit" and not isinstance(neighbours, CSR):
+        unit_neighbours = neighbours
+
+        def neighbours(node):
+            return ((n, 1) for n in unit_neighbours(node))
+
+    if queue is None:
+        queue = "lazy" if weights == "any" else "bucket"
+
+    return dijkstra(start, neighbours, goal, heuristic, all_predecessors, queue)
+
+
+__all__ = [
+    "CSR",
+    "SearchStats",
+    "SearchResult",
+    "bfs",
+    "bfs_01",
+    "dijkstra",
+    "bidirectional_bfs",
+    "shortest_paths",
+]
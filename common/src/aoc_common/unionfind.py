@@ -0,0 +1,96 @@
+"""
+Disjoint set (union-find) over the integers ``0 .. n-1``.
+
+The parent pointers and component sizes are kept in plain lists, so elements
+have to be ints - use a FlatIndex for grid cells, or number the items
+yourself.  Unions are by size and lookups use path halving, so any sequence
+of operations runs in effectively constant amortised time per operation.
+"""
+
+from typing import Iterable, Optional, Sequence
+
+
+class DisjointSet:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.sizes = [1] * n
+        # number of separate components
+        self.components = n
+
+    def __len__(self):
+        return len(self.parent)
+
+    def find(self, x: int) -> int:
+        """
+        The representative (root) of the component containing ``x``.
+        """
+        parent = self.parent
+        while (p := parent[x]) != x:
+            # path halving - point every other node on the path at its
+            # grandparent as we go
+            parent[x] = x = parent[p]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merge the components containing ``a`` and ``b``.  Returns whether
+        they were separate components before.
+        """
+        a = self.find(a)
+        b = self.find(b)
+        if a == b:
+            return False
+        sizes = self.sizes
+        if sizes[a] < sizes[b]:
+            a, b = b, a
+        self.parent[b] = a
+        sizes[a] += sizes[b]
+        self.components -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def size(self, x: int) -> int:
+        """
+        The number of elements in the component containing ``x``.
+        """
+        return self.sizes[self.find(x)]
+
+    def roots(self) -> list[int]:
+        """
+        The representatives of all the components.
+        """
+        return [x for x, p in enumerate(self.parent) if x == p]
+
+    def component_sizes(self) -> list[int]:
+        return [self.sizes[r] for r in self.roots()]
+
+    def groups(self) -> dict[int, list[int]]:
+        """
+        The members of each component, keyed by representative.
+        """
+        groups = {}
+        for x in range(len(self.parent)):
+            groups.setdefault(self.find(x), []).append(x)
+        return groups
+
+
+def union_until(ds: DisjointSet, edges: Iterable[Sequence[int]], components: int = 1) -> Optional[Sequence[int]]:
+    """
+    Union the pairs ``(a, b, ...)`` from ``edges`` in order (anything after
+    the first two elements is ignored, so weighted edges can be passed
+    as-is), stopping as soon as only ``components`` components remain.
+    Returns the edge whose union got there, or None if the edges ran out
+    first.
+
+    Only as much of ``edges`` is consumed as needed, so when it's an iterator
+    it can be carried on from afterwards - e.g. feed it an ``islice`` of the
+    first N edges, then the rest.
+    """
+    if ds.components <= components:
+        return None
+    for edge in edges:
+        if ds.union(edge[0], edge[1]) and ds.components <= components:
+            return edge
+    return None
@@ -0,0 +1,6 @@
+def pytest_addoption(parser):
+    parser.addoption(
+        "--record-perf",
+        action="store_true",
+        help="save the timings of the passing ledger checks to answers.json",
+    )
@@ -0,0 +1,51 @@
+import numpy as np
+
+from aoc_common import cache
+from aoc_common.lazy import LazyModule, is_loaded
+
+
+def test_lazy_module_loaded_elsewhere():
+    # numpy was imported above, not through this proxy
+    assert is_loaded(LazyModule("numpy"))
+    assert not is_loaded(LazyModule("aoc_common_no_such_module"))
+
+
+def test_arrays_stored_as_npz(monkeypatch):
+    monkeypatch.setattr(cache, "np", LazyModule("numpy"))
+    suffix, data = cache._serialise(np.arange(3))
+    assert suffix == ".npz"
+    assert cache._deserialise(suffix, data).tolist() == [0, 1, 2]
+
+    suffix, data = cache._serialise((np.zeros(2), np.ones(1)))
+    assert suffix == ".npz"
+    first, second = cache._deserialise(suffix, data)
+    assert first.tolist() == [0, 0] and second.tolist() == [1]
+
+
+def test_other_values_pickled():
+    suffix, data = cache._serialise({"a": [1, 2]})
+    assert suffix == ".pkl"
+    assert cache._deserialise(suffix, data) == {"a": [1, 2]}
+
+
+def test_cached_parse_keyed_by_text(monkeypatch, tmp_path):
+    monkeypatch.setenv(cache.CACHE_DIR_ENV, str(tmp_path))
+    monkeypatch.delenv(cache.DISABLE_ENV, raising=False)
+    monkeypatch.setattr(cache, "_memory", {})
+    calls = []
+
+    @cache.cached_parse
+    def parse(text, sep=","):
+        calls.append(text)
+        return [int(n) for n in text.split(sep)]
+
+    assert parse("1,2") == [1, 2]
+    assert parse("1,2") == [1, 2]
+    assert parse("3,4") == [3, 4]
+    assert parse("1;2", sep=";") == [1, 2]
+    assert calls == ["1,2", "3,4", "1;2"]
+
+    # still cached on disk once the in-memory copies are gone
+    monkeypatch.setattr(cache, "_memory", {})
+    assert parse("3,4") == [3, 4]
+    assert len(calls) == 3
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from aoc_common.grid import Cell, Grid, grid_adjacency
+
+LINES = ["#..", ".#.", "..#"]
+
+
+@pytest.mark.parametrize("pad", [0, 1, 2])
+def test_neighbour_counts_any_padding(pad):
+    grid = Grid.from_lines(LINES, pad=pad, sentinel=".")
+    assert grid.neighbour_counts("#").tolist() == [[0, 2, 0], [2, 0, 2], [0, 2, 0]]
+    assert grid.neighbour_counts("#", include_diagonal=True).tolist() == [[1, 2, 1], [2, 2, 2], [1, 2, 1]]
+
+
+def test_neighbour_counts_sentinel_beyond_edge():
+    grid = Grid.from_lines(LINES, pad=0, sentinel="#")
+    assert grid.neighbour_counts("#").tolist() == [[2, 3, 2], [3, 0, 3], [2, 3, 2]]
+
+
+def test_grid_adjacency_rejects_no_padding():
+    with pytest.raises(ValueError):
+        grid_adjacency(np.ones((2, 3), dtype=bool), pad=0)
+
+
+def test_grid_adjacency_does_not_wrap():
+    grid = Grid.from_lines(["...", "..."])
+    adjacency = grid.adjacency(".")
+    end_of_row = grid.index(Cell(0, 2))
+    assert sorted(adjacency.neighbours(end_of_row).tolist()) == [grid.index(Cell(0, 1)), grid.index(Cell(1, 2))]
+
+
+def test_flat_index_accepts_numpy_ints():
+    grid = Grid.from_lines(LINES)
+    pos = np.flatnonzero(grid.data == ord("#"))[0]
+    assert grid[pos] == "#"
+    assert grid[grid.cell(int(pos))] == "#"
+    grid[pos] = "x"
+    assert grid[Cell(0, 0)] == "x"
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pytest
+
+from aoc_common import ledger
+from aoc_common.runner import discover, find_root
+
+ROOT = find_root(Path(__file__).parent)
+LEDGER = ledger.load(ledger.ledger_path(ROOT))
+SOLUTIONS = {s.id: s for s in discover(ROOT)}
+
+
+@pytest.fixture(scope="session")
+def perf(request):
+    # the timings of the checks in this run, only written to the ledger (once,
+    # at the end) with --record-perf so a plain test run leaves it untouched
+    results = []
+    yield results
+    if request.config.getoption("--record-perf") and results:
+        for result in results:
+            ledger.record(LEDGER, result)
+        ledger.save(LEDGER, ledger.ledger_path(ROOT))
+
+
+@pytest.mark.parametrize("solution_id", sorted(LEDGER))
+def test_recorded_answers(solution_id, perf):
+    # the ledger's answers are for the generated inputs at scale 1, so a
+    # changed generator shows up as "new" here as well as a changed answer
+    solution = SOLUTIONS[solution_id]
+    name, text = ledger.inputs(solution, None, 1)
+    result = ledger.check(solution, text, name, LEDGER)
+    assert result.status == "ok", result.error or f"expected {result.expected}, got {result.answers}"
+    perf.append(result)
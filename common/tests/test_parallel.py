@@ -0,0 +1,26 @@
+from aoc_common.io import RECORD
+from aoc_common.parallel import JOBS_ENV, default_jobs, map_reduce, records
+
+
+def test_records_keep_whitespace():
+    assert list(records("  a b \n\n\tc\r\n")) == ["  a b ", "\tc"]
+    assert list(records("1\n2\n\n\n3\n", RECORD)) == ["1\n2", "3"]
+
+
+def test_default_jobs(monkeypatch):
+    monkeypatch.delenv(JOBS_ENV, raising=False)
+    assert default_jobs() == 1
+    monkeypatch.setenv(JOBS_ENV, "3")
+    assert default_jobs() == 3
+
+
+def line_stats(line):
+    return 1, len(line)
+
+
+def test_pool_matches_serial():
+    text = "".join(f"{'x' * (i % 50)} {i}\n" for i in range(5000))
+    serial = map_reduce(line_stats, text, jobs=1)
+    assert serial == (5000, sum(len(line) for line in text.splitlines()))
+    assert map_reduce(line_stats, text, jobs=2) == serial
+    assert map_reduce(len, text, jobs=2, initial=7) == serial[1] + 7
@@ -0,0 +1,49 @@
+import pytest
+
+from aoc_common.search import CSR, bfs, bfs_01, dijkstra, shortest_paths
+
+# s -1-> a -0-> t
+# s -1-> b -0-> t
+DIAMOND = {
+    "s": [("a", 1), ("b", 1)],
+    "a": [("t", 0)],
+    "b": [("t", 0)],
+    "t": [],
+}
+
+
+def diamond(node):
+    return DIAMOND[node]
+
+
+@pytest.mark.parametrize("search", [bfs_01, dijkstra])
+def test_zero_weight_diamond_all_predecessors(search):
+    result = search("s", diamond, all_predecessors=True)
+    assert result.costs == {"s": 0, "a": 1, "b": 1, "t": 1}
+    assert result.predecessors["t"] == {"a", "b"}
+    assert result.nodes_on_any_path("t") == {"s", "a", "b", "t"}
+
+
+@pytest.mark.parametrize("search", [bfs_01, dijkstra])
+def test_zero_weight_cycle_path(search):
+    graph = {"s": [("a", 0)], "a": [("b", 0)], "b": [("a", 0), ("t", 1)], "t": []}
+    result = search("s", graph.__getitem__, all_predecessors=True)
+    assert result.predecessors["a"] == {"s", "b"}
+    assert result.path("t") == ["s", "a", "b", "t"]
+
+
+def test_goal_stops_search():
+    line = {i: [i + 1] for i in range(10)}
+    result = bfs(0, line.__getitem__, goal=3)
+    assert result.goal == 3
+    assert result.path() == [0, 1, 2, 3]
+    assert 5 not in result.costs
+
+
+@pytest.mark.parametrize("weights", ["01", "int", "any"])
+def test_csr_weights(weights):
+    # 0 -> 1 (1), 0 -> 2 (0), 2 -> 1 (0)
+    adjacency = CSR([0, 2, 2, 3], [1, 2, 1], [1, 0, 0])
+    result = shortest_paths(0, adjacency, weights=weights)
+    assert result.costs == {0: 0, 1: 0, 2: 0}
+    assert result.path(1) == [0, 2, 1]